@@ -0,0 +1,54 @@
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from uuid import uuid4
+
+
+class FilesystemBlobStore:
+    """
+    Blobs as files under root, fanned out by the first bytes of the digest
+    (root/ab/cd/abcd....zst). Files are written under a temporary name and
+    renamed into place, and read through a memory map so the page cache is
+    shared between workers instead of copied into each process.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / f"{digest}.zst"
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def write(self, digest: str, data: bytes) -> None:
+        path = self.path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            with open(temporary, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    @contextmanager
+    def open(self, digest: str) -> Iterator[memoryview]:
+        with open(self.path(digest), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses empty files
+                yield memoryview(b"")
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def delete(self, digest: str) -> None:
+        self.path(digest).unlink(missing_ok=True)
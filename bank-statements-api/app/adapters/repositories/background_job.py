@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import delete, func, literal_column, or_, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
@@ -28,6 +30,15 @@ class SQLAlchemyBackgroundJobRepository(BackgroundJobRepository):
         """Get a background job by ID"""
         return self.db_session.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
 
+    def read_snapshot(self, job_id: UUID) -> Optional[BackgroundJob]:
+        """Load the current row without keeping a transaction open, for status polling"""
+        job = self.db_session.query(BackgroundJob).filter(BackgroundJob.id == job_id).populate_existing().first()
+        if job:
+            # Detached, the loaded attributes survive the commit that ends the read
+            self.db_session.expunge(job)
+        self.db_session.commit()
+        return job
+
     def get_all(self) -> List[BackgroundJob]:
         """Get all background jobs"""
         return self.db_session.query(BackgroundJob).order_by(BackgroundJob.created_at.desc()).all()
@@ -50,6 +61,28 @@ class SQLAlchemyBackgroundJobRepository(BackgroundJobRepository):
             .all()
         )
 
+    def find_pending_job(self, job_type: JobType, user_id: Optional[UUID]) -> Optional[BackgroundJob]:
+        return (
+            self.db_session.query(BackgroundJob)
+            .filter(
+                BackgroundJob.job_type == job_type,
+                BackgroundJob.user_id == user_id,
+                BackgroundJob.status == JobStatus.PENDING,
+            )
+            .first()
+        )
+
+    def find_job_created_since(self, job_type: JobType, user_id: Optional[UUID], since: datetime) -> Optional[BackgroundJob]:
+        return (
+            self.db_session.query(BackgroundJob)
+            .filter(
+                BackgroundJob.job_type == job_type,
+                BackgroundJob.user_id == user_id,
+                BackgroundJob.created_at >= since,
+            )
+            .first()
+        )
+
     def get_pending_jobs(self, limit: int = 10) -> List[BackgroundJob]:
         """Get pending jobs ordered by creation time"""
         return (
@@ -60,35 +93,102 @@ class SQLAlchemyBackgroundJobRepository(BackgroundJobRepository):
             .all()
         )
 
-    def claim_single_pending_job(
-        self,
-    ) -> Optional[BackgroundJob]:
-        """
-        Atomically claim a single pending job for processing.
-
-        Uses database-level locking with skip_locked to prevent race conditions.
-        If another process is already working on the oldest job, skips to the next one.
+    def claim_pending_jobs(self, worker_id: str, limit: int, lease_seconds: int) -> List[BackgroundJob]:
+        """Claim up to limit runnable pending jobs in one UPDATE ... RETURNING"""
+        now = datetime.now(timezone.utc)
+        claimable = (
+            select(BackgroundJob.id)
+            .where(
+                BackgroundJob.status == JobStatus.PENDING,
+                or_(BackgroundJob.run_after.is_(None), BackgroundJob.run_after <= now),
+            )
+            .order_by(BackgroundJob.created_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        jobs = (
+            self.db_session.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id.in_(claimable))
+                .values(
+                    status=JobStatus.IN_PROGRESS,
+                    started_at=now,
+                    locked_by=worker_id,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                )
+                .returning(BackgroundJob)
+                .execution_options(synchronize_session=False)
+            )
+            .scalars()
+            .all()
+        )
+        self.db_session.commit()
+        return sorted(jobs, key=lambda job: job.created_at)
 
-        Returns:
-            The claimed job with status changed to IN_PROGRESS, or None if no jobs available
-        """
-        # Find and lock the oldest pending job
-        job = (
-            self.db_session.query(BackgroundJob)
-            .filter(BackgroundJob.status == JobStatus.PENDING)
-            .order_by(BackgroundJob.created_at.asc())  # FIFO - oldest first
-            .with_for_update(skip_locked=True)  # Skip if locked by another process
-            .first()
+    def extend_lease(self, job_id: UUID, worker_id: str, lease_seconds: int) -> bool:
+        """Push the lease of a job still owned by worker_id"""
+        result = self.db_session.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.id == job_id,
+                BackgroundJob.status == JobStatus.IN_PROGRESS,
+                BackgroundJob.locked_by == worker_id,
+            )
+            .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
         )
+        self.db_session.commit()
+        return result.rowcount > 0
 
-        if job:
-            # Atomically mark as started
-            job.mark_started()
-            self.db_session.commit()
-            # Refresh the job object to ensure it stays attached to the session
-            self.db_session.refresh(job)
+    def release_expired_leases(self) -> Tuple[int, int]:
+        """Requeue or fail IN_PROGRESS jobs whose worker stopped renewing the lease"""
+        now = datetime.now(timezone.utc)
+        expired = [
+            BackgroundJob.status == JobStatus.IN_PROGRESS,
+            BackgroundJob.lease_expires_at < now,
+        ]
+        failed = self.db_session.execute(
+            update(BackgroundJob)
+            .where(*expired, BackgroundJob.retry_count >= BackgroundJob.max_retries)
+            .values(
+                status=JobStatus.FAILED,
+                completed_at=now,
+                lease_expires_at=None,
+                error_message="Worker lease expired and retries are exhausted",
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        requeued = self.db_session.execute(
+            update(BackgroundJob)
+            .where(*expired)
+            .values(
+                status=JobStatus.PENDING,
+                retry_count=BackgroundJob.retry_count + 1,
+                run_after=now,
+                started_at=None,
+                locked_by=None,
+                lease_expires_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db_session.commit()
+        return requeued, failed
 
-        return job
+    def get_queue_stats(self) -> List[Tuple[JobType, JobStatus, int, datetime]]:
+        """Count pending and in-progress jobs per type and status"""
+        rows = (
+            self.db_session.query(
+                BackgroundJob.job_type,
+                BackgroundJob.status,
+                func.count(BackgroundJob.id),
+                func.min(BackgroundJob.created_at),
+            )
+            .filter(BackgroundJob.status.in_([JobStatus.PENDING, JobStatus.IN_PROGRESS]))
+            .group_by(BackgroundJob.job_type, BackgroundJob.status)
+            .all()
+        )
+        return [tuple(row) for row in rows]
 
     def update(self, job: BackgroundJob) -> BackgroundJob:
         """Update a background job"""
@@ -96,6 +196,59 @@ class SQLAlchemyBackgroundJobRepository(BackgroundJobRepository):
         self.db_session.refresh(job)
         return job
 
+    def mark_started(self, job_id: UUID) -> Optional[BackgroundJob]:
+        return self._transition(
+            job_id,
+            [JobStatus.PENDING],
+            status=JobStatus.IN_PROGRESS,
+            started_at=datetime.now(timezone.utc),
+        )
+
+    def mark_completed(self, job_id: UUID, result: Optional[dict] = None) -> Optional[BackgroundJob]:
+        values = {"result": result} if result else {}
+        return self._transition(
+            job_id,
+            [JobStatus.IN_PROGRESS],
+            status=JobStatus.COMPLETED,
+            completed_at=datetime.now(timezone.utc),
+            lease_expires_at=None,
+            **values,
+        )
+
+    def mark_failed(self, job_id: UUID, error_message: Optional[str] = None) -> Optional[BackgroundJob]:
+        values = {"error_message": error_message} if error_message else {}
+        return self._transition(
+            job_id,
+            [JobStatus.PENDING, JobStatus.IN_PROGRESS],
+            status=JobStatus.FAILED,
+            completed_at=datetime.now(timezone.utc),
+            lease_expires_at=None,
+            **values,
+        )
+
+    def _transition(self, job_id: UUID, from_statuses: List[JobStatus], **values) -> Optional[BackgroundJob]:
+        """Apply values in one UPDATE ... RETURNING, only while the job is still in one of from_statuses"""
+        job = self.db_session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status.in_(from_statuses))
+            .values(**values)
+            .returning(BackgroundJob)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).scalar_one_or_none()
+        self.db_session.commit()
+        return job
+
+    def merge_progress(self, job_id: UUID, delta: dict) -> bool:
+        """Merge delta into the job's progress in a single UPDATE"""
+        result = self.db_session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id)
+            .values(progress=BackgroundJob.progress.op("||")(type_coerce(delta, JSONB)))
+            .execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+        return result.rowcount > 0
+
     def delete(self, job_id: UUID) -> bool:
         """Delete a background job"""
         job = self.get_by_id(job_id)
@@ -114,30 +267,26 @@ class SQLAlchemyBackgroundJobRepository(BackgroundJobRepository):
             .all()
         )
 
-    def cleanup_completed_jobs(self, days_old: int = 7) -> int:
-        """Clean up completed jobs older than specified days"""
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
-
-        # Find jobs to delete
-        jobs_to_delete = (
-            self.db_session.query(BackgroundJob)
-            .filter(
-                BackgroundJob.status.in_(
-                    [
-                        JobStatus.COMPLETED,
-                        JobStatus.FAILED,
-                        JobStatus.CANCELLED,
-                    ]
-                ),
-                BackgroundJob.completed_at < cutoff_date,
+    def delete_terminal_jobs(self, completed_before: datetime, limit: int) -> Tuple[int, int]:
+        """Delete up to limit finished jobs in one statement, returning how many and their size in bytes"""
+        candidates = (
+            select(BackgroundJob.id)
+            .where(
+                BackgroundJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]),
+                BackgroundJob.completed_at < completed_before,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        sizes = (
+            self.db_session.execute(
+                delete(BackgroundJob)
+                .where(BackgroundJob.id.in_(candidates.scalar_subquery()))
+                .returning(func.pg_column_size(literal_column(BackgroundJob.__tablename__)))
+                .execution_options(synchronize_session=False)
             )
+            .scalars()
             .all()
         )
-
-        # Delete them
-        count = len(jobs_to_delete)
-        for job in jobs_to_delete:
-            self.db_session.delete(job)
-
         self.db_session.commit()
-        return count
+        return len(sizes), sum(sizes)
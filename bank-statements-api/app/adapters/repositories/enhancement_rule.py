@@ -1,7 +1,9 @@
+from datetime import datetime, timezone
 from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, text
+from sqlalchemy import String, and_, exists, func, literal, or_, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import Session, joinedload
 
 from app.domain.models.category import Category
@@ -534,6 +536,10 @@ class SQLAlchemyEnhancementRuleRepository(EnhancementRuleRepository):
         self.db.refresh(rule)
         return rule
 
+    def save_all(self, rules: List[EnhancementRule]) -> None:
+        self.db.add_all(rules)
+        self.db.commit()
+
     def find_by_id(self, rule_id: UUID, user_id: UUID) -> Optional[EnhancementRule]:
         return (
             self.db.query(EnhancementRule)
@@ -557,6 +563,45 @@ class SQLAlchemyEnhancementRuleRepository(EnhancementRuleRepository):
             .first()
         )
 
+    def create_unmatched_rules(self, normalized_descriptions: List[str], user_id: UUID) -> int:
+        patterns = sorted({description for description in normalized_descriptions if description})
+        if not patterns:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        candidates = select(func.unnest(literal(patterns, ARRAY(String))).label("pattern")).subquery()
+        new_rules = select(
+            func.gen_random_uuid(),
+            literal(user_id, EnhancementRule.user_id.type),
+            candidates.c.pattern,
+            literal(MatchType.EXACT, EnhancementRule.match_type.type),
+            literal(EnhancementRuleSource.AUTO, EnhancementRule.source.type),
+            literal(now, EnhancementRule.created_at.type),
+            literal(now, EnhancementRule.updated_at.type),
+        ).where(
+            # A rule of any match type or source already covers the pattern
+            ~exists().where(
+                EnhancementRule.user_id == user_id,
+                EnhancementRule.normalized_description_pattern == candidates.c.pattern,
+            )
+        )
+        statement = (
+            insert(EnhancementRule).from_select(
+                ["id", "user_id", "normalized_description_pattern", "match_type", "source", "created_at", "updated_at"],
+                new_rules,
+            )
+            # A concurrent upload may create the same rules between the check and the insert
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "normalized_description_pattern", "match_type"],
+                index_where=text("source = 'AUTO'"),
+            )
+            # Counted from RETURNING: SQLAlchemy only keeps the rowcount of an UPDATE or DELETE
+            .returning(EnhancementRule.id)
+        )
+        created = len(self.db.execute(statement).all())
+        self.db.commit()
+        return created
+
     def delete(self, rule: EnhancementRule) -> None:
         self.db.delete(rule)
         self.db.commit()
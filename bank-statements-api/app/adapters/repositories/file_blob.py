@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.models.file_blob import FileBlob
+from app.domain.models.statement import Statement
+from app.domain.models.uploaded_file import UploadedFile
+from app.ports.repositories.file_blob import FileBlobRepository
+
+
+class SQLAlchemyFileBlobRepository(FileBlobRepository):
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def find(self, digest: str) -> Optional[FileBlob]:
+        return self.db_session.get(FileBlob, digest)
+
+    def touch(self, digest: str) -> bool:
+        result = self.db_session.execute(
+            update(FileBlob).where(FileBlob.digest == digest).values(last_used_at=func.now()),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount > 0
+
+    def add(self, blob: FileBlob) -> None:
+        now = datetime.now(timezone.utc)
+        statement = insert(FileBlob).values(
+            digest=blob.digest,
+            size=blob.size,
+            stored_size=blob.stored_size,
+            storage=blob.storage,
+            content=blob.content,
+            ref_count=0,
+            created_at=now,
+            last_used_at=now,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[FileBlob.digest],
+            set_={"last_used_at": statement.excluded.last_used_at},
+        )
+        self.db_session.execute(statement)
+
+    def read_content(self, digest: str) -> Optional[bytes]:
+        content = self.db_session.execute(select(FileBlob.content).where(FileBlob.digest == digest)).scalar()
+        return bytes(content) if content is not None else None
+
+    def delete_unreferenced(
+        self,
+        unused_before: datetime,
+        limit: int,
+        on_deleted: Callable[[List[FileBlob]], None],
+    ) -> List[FileBlob]:
+        # ref_count narrows the candidates through the partial index; the NOT EXISTS
+        # checks keep a blob whose count has drifted from being deleted under a reference
+        candidates = (
+            select(FileBlob.digest)
+            .where(
+                FileBlob.ref_count == 0,
+                FileBlob.last_used_at < unused_before,
+                ~exists().where(UploadedFile.blob_digest == FileBlob.digest),
+                ~exists().where(Statement.blob_digest == FileBlob.digest),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = self.db_session.execute(
+            delete(FileBlob)
+            .where(FileBlob.digest.in_(candidates.scalar_subquery()))
+            .returning(FileBlob.digest, FileBlob.size, FileBlob.stored_size, FileBlob.storage)
+        ).all()
+        deleted = [FileBlob(digest=row.digest, size=row.size, stored_size=row.stored_size, storage=row.storage) for row in rows]
+        try:
+            on_deleted(deleted)
+        except Exception:
+            self.db_session.rollback()
+            raise
+        self.db_session.commit()
+        return deleted
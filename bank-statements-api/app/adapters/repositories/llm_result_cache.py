@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.models.llm_result_cache import LLMResultCacheEntry
+from app.ports.repositories.llm_result_cache import LLMResultCacheRepository
+
+
+class SQLAlchemyLLMResultCacheRepository(LLMResultCacheRepository):
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def find_many(
+        self,
+        user_id: UUID,
+        kind: str,
+        patterns: List[str],
+        context_hash: str,
+        model: str,
+        now: datetime,
+    ) -> List[LLMResultCacheEntry]:
+        if not patterns:
+            return []
+        return (
+            self.db_session.query(LLMResultCacheEntry)
+            .filter(
+                LLMResultCacheEntry.user_id == user_id,
+                LLMResultCacheEntry.kind == kind,
+                LLMResultCacheEntry.context_hash == context_hash,
+                LLMResultCacheEntry.model == model,
+                LLMResultCacheEntry.pattern.in_(patterns),
+                LLMResultCacheEntry.expires_at > now,
+            )
+            .all()
+        )
+
+    def save_many(self, entries: List[LLMResultCacheEntry]) -> None:
+        if not entries:
+            return
+        rows = [
+            {
+                "user_id": entry.user_id,
+                "kind": entry.kind,
+                "pattern": entry.pattern,
+                "context_hash": entry.context_hash,
+                "model": entry.model,
+                "result": entry.result,
+                "confidence": entry.confidence,
+                "created_at": entry.created_at,
+                "expires_at": entry.expires_at,
+            }
+            for entry in entries
+        ]
+        statement = insert(LLMResultCacheEntry).values(rows)
+        statement = statement.on_conflict_do_update(
+            constraint="uq_llm_result_cache_key",
+            set_={
+                "result": statement.excluded.result,
+                "confidence": statement.excluded.confidence,
+                "created_at": statement.excluded.created_at,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        self.db_session.execute(statement)
+        self.db_session.commit()
+
+    def delete_for_user(self, user_id: UUID, kinds: Optional[List[str]] = None) -> int:
+        statement = delete(LLMResultCacheEntry).where(LLMResultCacheEntry.user_id == user_id)
+        if kinds:
+            statement = statement.where(LLMResultCacheEntry.kind.in_(kinds))
+        result = self.db_session.execute(statement)
+        self.db_session.commit()
+        return result.rowcount
+
+    def delete_expired(self, now: datetime) -> int:
+        result = self.db_session.execute(delete(LLMResultCacheEntry).where(LLMResultCacheEntry.expires_at <= now))
+        self.db_session.commit()
+        return result.rowcount
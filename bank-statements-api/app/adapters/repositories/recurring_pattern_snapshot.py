@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import exists, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.domain.models.recurring_pattern_snapshot import RecurringPatternSnapshot
+from app.domain.models.transaction import Transaction
+from app.domain.models.user import User
+from app.domain.models.user_data_version import UserDataVersion
+from app.ports.repositories.recurring_pattern_snapshot import RecurringPatternSnapshotRepository
+
+
+class SQLAlchemyRecurringPatternSnapshotRepository(RecurringPatternSnapshotRepository):
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def get(self, user_id: UUID) -> Optional[RecurringPatternSnapshot]:
+        return self.db_session.get(RecurringPatternSnapshot, user_id)
+
+    def save(self, snapshot: RecurringPatternSnapshot) -> None:
+        statement = insert(RecurringPatternSnapshot).values(
+            user_id=snapshot.user_id,
+            data_version=snapshot.data_version,
+            patterns=snapshot.patterns,
+            computed_at=snapshot.computed_at,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[RecurringPatternSnapshot.user_id],
+            set_={
+                "data_version": statement.excluded.data_version,
+                "patterns": statement.excluded.patterns,
+                "computed_at": statement.excluded.computed_at,
+            },
+        )
+        self.db_session.execute(statement)
+        self.db_session.commit()
+
+    def find_user_ids_to_refresh(self, computed_before: datetime) -> List[UUID]:
+        rows = (
+            self.db_session.query(User.id)
+            .outerjoin(RecurringPatternSnapshot, RecurringPatternSnapshot.user_id == User.id)
+            .outerjoin(UserDataVersion, UserDataVersion.user_id == User.id)
+            .filter(exists().where(Transaction.user_id == User.id))
+            .filter(
+                or_(
+                    RecurringPatternSnapshot.user_id.is_(None),
+                    RecurringPatternSnapshot.computed_at < computed_before,
+                    RecurringPatternSnapshot.data_version < UserDataVersion.version,
+                )
+            )
+            .all()
+        )
+        return [user_id for (user_id,) in rows]
@@ -1,12 +1,13 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import delete, func, insert, literal, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.domain.models.account import Account
 from app.domain.models.statement import Statement
 from app.domain.models.transaction import Transaction
+from app.domain.models.uploaded_file import UploadedFile
 from app.ports.repositories.statement import StatementRepository
 
 
@@ -19,18 +20,33 @@ class SqlAlchemyStatementRepository(StatementRepository):
         account_id: UUID,
         filename: str,
         file_type: str,
-        content: bytes,
+        blob_digest: str,
     ) -> Statement:
         statement = Statement(
             account_id=account_id,
             filename=filename,
             file_type=file_type,
-            content=content,
+            blob_digest=blob_digest,
         )
         self.session.add(statement)
         self.session.flush()
         return statement
 
+    def save_from_uploaded_file(self, account_id: UUID, uploaded_file_id: UUID) -> Statement:
+        # The statement refers to the upload's blob, so the file itself is not copied
+        source = select(
+            literal(account_id).label("account_id"),
+            UploadedFile.filename,
+            UploadedFile.file_type,
+            UploadedFile.blob_digest,
+        ).where(UploadedFile.id == uploaded_file_id)
+        statement_id = self.session.execute(
+            insert(Statement)
+            .from_select(["account_id", "filename", "file_type", "blob_digest"], source)
+            .returning(Statement.id)
+        ).scalar_one()
+        return self.session.get(Statement, statement_id)
+
     def find_by_id(self, statement_id: UUID, user_id: UUID) -> Optional[Statement]:
         return (
             self.session.query(Statement)
@@ -58,15 +74,14 @@ class SqlAlchemyStatementRepository(StatementRepository):
         )
 
     def delete(self, statement_id: UUID, user_id: UUID) -> None:
-        statement = (
-            self.session.query(Statement)
-            .join(Account, Statement.account_id == Account.id)
-            .filter(Statement.id == statement_id, Account.user_id == user_id)
-            .first()
+        # A plain DELETE, so the ORM does not load the statement's transactions to unlink them
+        self.session.execute(
+            delete(Statement).where(
+                Statement.id == statement_id,
+                Statement.account_id.in_(select(Account.id).where(Account.user_id == user_id)),
+            ),
+            execution_options={"synchronize_session": False},
         )
-        if statement:
-            self.session.delete(statement)
-            self.session.flush()
 
     def update_transaction_statistics(self, statement_id: UUID) -> None:
         """Update statement with transaction count and date range"""
@@ -3,15 +3,20 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-import pandas as pd
-from sqlalchemy import and_, case, func, or_, over
+from sqlalchemy import and_, case, delete, func, not_, or_, over, select, update
 from sqlalchemy.orm import Session
 
 from app.common.text_normalization import normalize_description
 from app.domain.dto.statement_processing import TransactionDTO
-from app.domain.models.tag import Tag
+from app.domain.models.tag import Tag, transaction_tags
 from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
-from app.ports.repositories.transaction import TransactionRepository
+from app.ports.repositories.transaction import (
+    TRANSACTION_LIST_FIELDS,
+    RecurringCandidateRow,
+    TransactionRepository,
+)
+
+TRANSACTION_LIST_COLUMNS = tuple(getattr(Transaction, field) for field in TRANSACTION_LIST_FIELDS)
 
 
 class SQLAlchemyTransactionRepository(TransactionRepository):
@@ -99,7 +104,120 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
     ) -> Tuple[List[Transaction], int, Decimal]:
         query = self.db_session.query(Transaction).filter(Transaction.user_id == user_id)
 
-        # Apply filters
+        filters = self._build_list_filters(
+            category_ids=category_ids,
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            description_search=description_search,
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            exclude_transfers=exclude_transfers,
+            exclude_uncategorized=exclude_uncategorized,
+            transaction_type=transaction_type,
+            transaction_ids=transaction_ids,
+            tag_ids=tag_ids,
+            exclude_from_analytics=exclude_from_analytics,
+        )
+
+        if filters:
+            query = query.filter(and_(*filters))
+
+        total, total_amount = self._count_and_sum(user_id, filters)
+
+        # Apply sorting
+        order_clause = self._get_order_clause(sort_field, sort_direction)
+        query = query.order_by(*order_clause)
+
+        # Apply pagination
+        transactions = query.offset((page - 1) * page_size).limit(page_size).all()
+
+        return transactions, total, total_amount
+
+    def get_paginated_rows(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+        category_ids: Optional[List[UUID]] = None,
+        status: Optional[CategorizationStatus] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        description_search: Optional[str] = None,
+        account_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sort_field: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+        exclude_transfers: Optional[bool] = None,
+        exclude_uncategorized: Optional[bool] = None,
+        transaction_type: Optional[str] = None,
+        transaction_ids: Optional[List[UUID]] = None,
+        tag_ids: Optional[List[UUID]] = None,
+        exclude_from_analytics: Optional[bool] = None,
+    ) -> Tuple[List[tuple], int, Decimal]:
+        """Same page as get_paginated, selected as plain column tuples in TRANSACTION_LIST_FIELDS order."""
+        filters = self._build_list_filters(
+            category_ids=category_ids,
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            description_search=description_search,
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            exclude_transfers=exclude_transfers,
+            exclude_uncategorized=exclude_uncategorized,
+            transaction_type=transaction_type,
+            transaction_ids=transaction_ids,
+            tag_ids=tag_ids,
+            exclude_from_analytics=exclude_from_analytics,
+        )
+
+        query = self.db_session.query(*TRANSACTION_LIST_COLUMNS).filter(Transaction.user_id == user_id)
+        if filters:
+            query = query.filter(and_(*filters))
+
+        total, total_amount = self._count_and_sum(user_id, filters)
+
+        query = query.order_by(*self._get_order_clause(sort_field, sort_direction))
+        rows = query.offset((page - 1) * page_size).limit(page_size).all()
+
+        return [tuple(row) for row in rows], total, total_amount
+
+    def get_tag_rows_by_transaction_ids(self, transaction_ids: List[UUID]) -> Dict[UUID, List[tuple]]:
+        if not transaction_ids:
+            return {}
+        rows = (
+            self.db_session.query(transaction_tags.c.transaction_id, Tag.id, Tag.name, Tag.created_at)
+            .join(Tag, Tag.id == transaction_tags.c.tag_id)
+            .filter(transaction_tags.c.transaction_id.in_(transaction_ids))
+            .order_by(Tag.name)
+            .all()
+        )
+        tags_by_transaction: Dict[UUID, List[tuple]] = {}
+        for transaction_id, tag_id, name, created_at in rows:
+            tags_by_transaction.setdefault(transaction_id, []).append((tag_id, name, created_at))
+        return tags_by_transaction
+
+    def _build_list_filters(
+        self,
+        category_ids: Optional[List[UUID]] = None,
+        status: Optional[CategorizationStatus] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        description_search: Optional[str] = None,
+        account_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        exclude_transfers: Optional[bool] = None,
+        exclude_uncategorized: Optional[bool] = None,
+        transaction_type: Optional[str] = None,
+        transaction_ids: Optional[List[UUID]] = None,
+        tag_ids: Optional[List[UUID]] = None,
+        exclude_from_analytics: Optional[bool] = None,
+    ) -> list:
         filters = []
 
         # Multiple category filter
@@ -162,9 +280,9 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         if exclude_from_analytics is not None:
             filters.append(Transaction.exclude_from_analytics == exclude_from_analytics)
 
-        if filters:
-            query = query.filter(and_(*filters))
+        return filters
 
+    def _count_and_sum(self, user_id: UUID, filters: list) -> Tuple[int, Decimal]:
         # Get total count and total amount in a single query
         count_sum_query = self.db_session.query(
             func.count(Transaction.id),
@@ -173,15 +291,7 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         if filters:
             count_sum_query = count_sum_query.filter(and_(*filters))
         total, total_amount = count_sum_query.one()
-
-        # Apply sorting
-        order_clause = self._get_order_clause(sort_field, sort_direction)
-        query = query.order_by(*order_clause)
-
-        # Apply pagination
-        transactions = query.offset((page - 1) * page_size).limit(page_size).all()
-
-        return transactions, total, Decimal(str(total_amount)) if total_amount else Decimal("0")
+        return total, Decimal(str(total_amount)) if total_amount else Decimal("0")
 
     def get_unique_normalised_descriptions(self, user_id: UUID, limit: int = 200) -> List[str]:
         results = (
@@ -195,17 +305,90 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         )
         return [r[0] for r in results]
 
-    def delete_by_statement_id(self, statement_id: UUID) -> int:
-        """Delete all transactions associated with a statement"""
-        transactions_to_delete = self.db_session.query(Transaction).filter(Transaction.statement_id == statement_id).all()
+    def get_categorised_descriptions(self, user_id: UUID, limit: int = 20000) -> List[Tuple[str, UUID, int]]:
+        count = func.count(Transaction.id)
+        results = (
+            self.db_session.query(Transaction.normalized_description, Transaction.category_id, count)
+            .filter(Transaction.user_id == user_id)
+            .filter(Transaction.category_id.isnot(None))
+            .filter(Transaction.normalized_description.isnot(None))
+            .filter(Transaction.normalized_description != "")
+            .group_by(Transaction.normalized_description, Transaction.category_id)
+            .order_by(count.desc())
+            .limit(limit)
+            .all()
+        )
+        return [(description, category_id, total) for description, category_id, total in results]
 
-        count = len(transactions_to_delete)
+    def get_recurring_candidates(
+        self,
+        user_id: UUID,
+        start_date: Optional[date],
+        min_occurrences: int,
+    ) -> List[RecurringCandidateRow]:
+        group_size = over(
+            func.count(Transaction.id),
+            partition_by=(Transaction.normalized_description, Transaction.category_id),
+        ).label("group_size")
+        query = self.db_session.query(
+            Transaction.id,
+            Transaction.date,
+            Transaction.amount,
+            Transaction.description,
+            Transaction.normalized_description,
+            Transaction.category_id,
+            Transaction.sort_index,
+            group_size,
+        ).filter(
+            Transaction.user_id == user_id,
+            Transaction.counterparty_account_id.is_(None),
+            Transaction.amount < 0,
+        )
+        if start_date is not None:
+            query = query.filter(Transaction.date >= start_date)
 
-        for transaction in transactions_to_delete:
-            self.db_session.delete(transaction)
+        candidates = query.subquery()
+        rows = (
+            self.db_session.query(
+                candidates.c.id,
+                candidates.c.date,
+                candidates.c.amount,
+                candidates.c.description,
+                candidates.c.normalized_description,
+                candidates.c.category_id,
+            )
+            .filter(candidates.c.group_size >= min_occurrences)
+            .order_by(candidates.c.date.desc(), candidates.c.sort_index.asc())
+            .all()
+        )
+        return [RecurringCandidateRow(*row) for row in rows]
 
-        self.db_session.flush()
-        return count
+    def delete_by_statement_id(self, statement_id: UUID) -> int:
+        """Delete all transactions associated with a statement, and their split parts, without loading them"""
+        statement_rows = select(Transaction.id).where(Transaction.statement_id == statement_id)
+        deleted_ids = select(Transaction.id).where(
+            or_(
+                Transaction.statement_id == statement_id,
+                Transaction.parent_transaction_id.in_(statement_rows),
+            )
+        )
+
+        # Tag links go first in one statement instead of one cascaded delete per transaction
+        self.db_session.execute(
+            delete(transaction_tags).where(transaction_tags.c.transaction_id.in_(deleted_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        # Manual transactions positioned after a deleted one keep their place but lose the link
+        self.db_session.execute(
+            update(Transaction).where(Transaction.manual_position_after.in_(deleted_ids)).values(manual_position_after=None),
+            execution_options={"synchronize_session": False},
+        )
+        # Parents and their split parts go in the same statement, so the self-reference holds when it is checked
+        result = self.db_session.execute(
+            delete(Transaction).where(Transaction.id.in_(deleted_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount
 
     def get_category_totals(
         self,
@@ -282,7 +465,7 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         # For 'all' or None, don't add any filter
 
         if exclude_from_analytics:
-            filters.append(Transaction.exclude_from_analytics.is_(False))
+            filters.append(not_(Transaction.exclude_from_analytics))
 
         if filters:
             query = query.filter(and_(*filters))
@@ -307,7 +490,6 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
     def get_category_time_series(
         self,
         user_id: UUID,
-        category_id: Optional[UUID] = None,
         period: str = "month",
         category_ids: Optional[List[UUID]] = None,
         status: Optional[CategorizationStatus] = None,
@@ -336,21 +518,7 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
 
         filters = []
 
-        if category_id:
-            from app.adapters.repositories.category import SQLAlchemyCategoryRepository
-
-            category_repo = SQLAlchemyCategoryRepository(self.db_session)
-            category = category_repo.get_by_id(category_id)
-
-            if category and category.parent_id is None:
-                subcategories = category_repo.get_subcategories(category_id)
-                subcategory_ids = [sub.id for sub in subcategories]
-                category_filter_ids = [category_id] + subcategory_ids
-            else:
-                category_filter_ids = [category_id]
-
-            filters.append(Transaction.category_id.in_(category_filter_ids))
-        elif category_ids:
+        if category_ids:
             filters.append(Transaction.category_id.in_(category_ids))
 
         if status is not None:
@@ -390,7 +558,7 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
             filters.append(Transaction.amount > 0)
 
         if exclude_from_analytics:
-            filters.append(Transaction.exclude_from_analytics.is_(False))
+            filters.append(not_(Transaction.exclude_from_analytics))
 
         if filters:
             query = query.filter(and_(*filters))
@@ -462,7 +630,7 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         if exclude_uncategorized is True:
             filters.append(Transaction.category_id.isnot(None))
         if exclude_from_analytics:
-            filters.append(Transaction.exclude_from_analytics.is_(False))
+            filters.append(not_(Transaction.exclude_from_analytics))
         if filters:
             query = query.filter(and_(*filters))
 
@@ -549,6 +717,8 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         """
         Save a batch of transactions to the database with deduplication.
         """
+        import pandas as pd
+
         saved_count = 0
         duplicates_count = 0
         processed_tx_ids = set()  # Track transaction IDs we've already matched
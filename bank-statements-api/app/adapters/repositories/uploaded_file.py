@@ -1,8 +1,13 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import delete, exists, func, literal_column, select
+
 from app.domain.dto.uploaded_file import FileAnalysisMetadataDTO, UploadedFileDTO
 from app.domain.models.account import Account
+from app.domain.models.background_job import BackgroundJob, JobStatus
+from app.domain.models.file_blob import FileBlob
 from app.domain.models.uploaded_file import FileAnalysisMetadata, UploadedFile
 from app.ports.repositories.uploaded_file import FileAnalysisMetadataRepository, UploadedFileRepository
 
@@ -11,10 +16,10 @@ class SQLAlchemyUploadedFileRepository(UploadedFileRepository):
     def __init__(self, session):
         self.session = session
 
-    def save(self, filename: str, content: bytes, file_type: str) -> UploadedFileDTO:
+    def save(self, filename: str, blob_digest: str, file_type: str) -> UploadedFileDTO:
         uploaded_file = UploadedFile(
             filename=filename,
-            content=content,
+            blob_digest=blob_digest,
             file_type=file_type,
         )
 
@@ -22,13 +27,7 @@ class SQLAlchemyUploadedFileRepository(UploadedFileRepository):
         self.session.commit()
         self.session.refresh(uploaded_file)
 
-        return UploadedFileDTO(
-            id=str(uploaded_file.id),
-            filename=uploaded_file.filename,
-            file_type=uploaded_file.file_type,
-            created_at=uploaded_file.created_at,
-            content=None,
-        )
+        return UploadedFileDTO.from_entity(uploaded_file)
 
     def find_by_id(self, file_id: UUID) -> Optional[UploadedFileDTO]:
         uploaded_file = self.session.query(UploadedFile).filter(UploadedFile.id == file_id).first()
@@ -36,14 +35,50 @@ class SQLAlchemyUploadedFileRepository(UploadedFileRepository):
         if not uploaded_file:
             return None
 
-        return UploadedFileDTO(
-            id=str(uploaded_file.id),
-            filename=uploaded_file.filename,
-            file_type=uploaded_file.file_type,
-            content=uploaded_file.content,
-            created_at=uploaded_file.created_at,
+        return UploadedFileDTO.from_entity(uploaded_file)
+
+    def find_metadata_by_id(self, file_id: UUID) -> Optional[UploadedFileDTO]:
+        row = (
+            self.session.query(UploadedFile, FileBlob.size)
+            .join(FileBlob, UploadedFile.blob_digest == FileBlob.digest)
+            .filter(UploadedFile.id == file_id)
+            .first()
         )
 
+        if not row:
+            return None
+
+        uploaded_file, size = row
+        dto = UploadedFileDTO.from_entity(uploaded_file)
+        dto.size = size
+        return dto
+
+    def delete_orphaned(self, created_before: datetime, limit: int) -> Tuple[int, int]:
+        # Once imported, a statement keeps its own reference to the file's blob, so an
+        # upload is only needed while it is being analysed or a queued import reads it
+        in_use = exists().where(
+            BackgroundJob.uploaded_file_id == UploadedFile.id,
+            BackgroundJob.status.in_([JobStatus.PENDING, JobStatus.IN_PROGRESS]),
+        )
+        candidates = (
+            select(UploadedFile.id)
+            .where(UploadedFile.created_at < created_before, ~in_use)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        sizes = (
+            self.session.execute(
+                delete(UploadedFile)
+                .where(UploadedFile.id.in_(candidates.scalar_subquery()))
+                .returning(func.pg_column_size(literal_column(UploadedFile.__tablename__)))
+                .execution_options(synchronize_session=False)
+            )
+            .scalars()
+            .all()
+        )
+        self.session.commit()
+        return len(sizes), sum(sizes)
+
 
 class SQLAlchemyFileAnalysisMetadataRepository(FileAnalysisMetadataRepository):
     def __init__(self, session):
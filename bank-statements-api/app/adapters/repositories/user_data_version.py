@@ -0,0 +1,15 @@
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.domain.models.user_data_version import UserDataVersion
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+
+
+class SQLAlchemyUserDataVersionRepository(UserDataVersionRepository):
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def get_version(self, user_id: UUID) -> int:
+        version = self.db_session.query(UserDataVersion.version).filter(UserDataVersion.user_id == user_id).scalar()
+        return version or 0
@@ -1,7 +1,5 @@
 from typing import Any, Optional
 
-import stripe
-
 from app.ports.stripe import StripeClient
 
 
@@ -18,10 +16,18 @@ class StripeSDKClient(StripeClient):
         self.web_base_url = web_base_url
         self.price_id_basic = price_id_basic
         self.price_id_pro = price_id_pro
-        stripe.api_key = api_key
+        self.api_key = api_key
+
+    @property
+    def _stripe(self):
+        # The SDK is only imported on the first billing call, not at app start
+        import stripe
+
+        stripe.api_key = self.api_key
+        return stripe
 
     def create_customer(self, email: str, name: str, user_id: str) -> str:
-        customer = stripe.Customer.create(
+        customer = self._stripe.Customer.create(
             email=email,
             name=name,
             metadata={"user_id": user_id},
@@ -35,7 +41,7 @@ class StripeSDKClient(StripeClient):
         user_id: str,
         tier: str,
     ) -> str:
-        checkout_session = stripe.checkout.Session.create(
+        checkout_session = self._stripe.checkout.Session.create(
             customer=customer_id,
             mode="subscription",
             line_items=[{"price": price_id, "quantity": 1}],
@@ -46,19 +52,19 @@ class StripeSDKClient(StripeClient):
         return checkout_session.url
 
     def create_portal_session(self, customer_id: str) -> str:
-        portal_session = stripe.billing_portal.Session.create(
+        portal_session = self._stripe.billing_portal.Session.create(
             customer=customer_id,
             return_url=f"{self.web_base_url}/settings/billing",
         )
         return portal_session.url
 
     def retrieve_subscription(self, subscription_id: str) -> dict:
-        return stripe.Subscription.retrieve(subscription_id)
+        return self._stripe.Subscription.retrieve(subscription_id)
 
     def construct_webhook_event(self, payload: bytes, signature: str) -> Any:
         if not self.webhook_secret:
             raise ValueError("Stripe webhook secret not configured")
-        return stripe.Webhook.construct_event(payload, signature, self.webhook_secret)
+        return self._stripe.Webhook.construct_event(payload, signature, self.webhook_secret)
 
     def get_price_id_for_tier(self, tier: str) -> Optional[str]:
         if tier == "basic":
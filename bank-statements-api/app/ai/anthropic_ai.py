@@ -7,10 +7,16 @@ from typing import Any, Callable, Optional, Union, get_type_hints
 
 import anthropic
 
-from app.ai.llm_client import LLMClient
+from app.ai.llm_client import CacheablePrompt, LLMClient, LLMResponse, TokenUsage
+from app.ai.resilience import LoopLocal, RetryPolicy, call_with_retry
+from app.ai.tool_calls import ToolCallRunner
+from app.core.metrics import track_llm_call
 
 logger = logging.getLogger(__name__)
 
+# Raised by the SDK for connection failures and its own timeouts
+TRANSIENT_ERRORS = (anthropic.APIConnectionError,)
+
 
 def _is_optional(type_hint) -> bool:
     origin = getattr(type_hint, "__origin__", None)
@@ -82,12 +88,26 @@ def _coerce_args(func: Callable, args: dict | None) -> dict:
     return coerced
 
 
+def _parse_tool_input(text: str) -> dict | str:
+    """The streamed tool input as a dict, or the raw text if it is not valid JSON"""
+    if not text.strip():
+        return {}
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
 class AnthropicAI(LLMClient):
+    provider = "anthropic"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model_name: str = "claude-haiku-4-5-20251001",
         temperature: float = 0,
+        base_url: Optional[str] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
     ):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -95,23 +115,96 @@ class AnthropicAI(LLMClient):
 
         self.model_name = model_name
         self.temperature = temperature
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.retry_policy = retry_policy
+        self.client = anthropic.Anthropic(
+            api_key=self.api_key,
+            base_url=base_url,
+            timeout=retry_policy.timeout_seconds,
+            max_retries=retry_policy.max_attempts - 1,
+        )
+        # Retries are done by call_with_retry, with jitter and a per-attempt timeout
+        self.async_client = LoopLocal(
+            lambda: anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                base_url=base_url,
+                timeout=retry_policy.timeout_seconds,
+                max_retries=0,
+            )
+        )
 
     def generate(self, prompt: str) -> str:
         try:
-            response = self.client.messages.create(
-                model=self.model_name,
+            with track_llm_call("anthropic", self.model_name) as call:
+                response = self.client.messages.create(
+                    model=self.model_name,
+                    max_tokens=1024,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=self.temperature,
+                )
+                call.record_usage(response.usage.input_tokens, response.usage.output_tokens)
+            return response.content[0].text if response.content else ""
+        except Exception as e:
+            logger.error("Error generating response: %s", str(e))
+            raise Exception(f"Error generating response: {str(e)}")
+
+    async def generate_async(self, prompt: str) -> str:
+        try:
+            response = await self._create_message(
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature,
             )
             return response.content[0].text if response.content else ""
         except Exception as e:
             logger.error("Error generating response: %s", str(e))
             raise Exception(f"Error generating response: {str(e)}")
 
-    async def generate_async(self, prompt: str) -> str:
-        return self.generate(prompt)
+    async def generate_prompt_async(self, prompt: CacheablePrompt) -> LLMResponse:
+        # The prefix is marked as a cache breakpoint; Anthropic ignores it below the model's minimum cacheable length
+        try:
+            response = await self._create_message(
+                max_tokens=1024,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": prompt.prefix, "cache_control": {"type": "ephemeral"}},
+                            {"type": "text", "text": prompt.suffix},
+                        ],
+                    }
+                ],
+            )
+            text = response.content[0].text if response.content else ""
+            return LLMResponse(text, self._usage(response))
+        except Exception as e:
+            logger.error("Error generating response: %s", str(e))
+            raise Exception(f"Error generating response: {str(e)}")
+
+    async def _create_message(self, **params):
+        async def attempt():
+            with track_llm_call("anthropic", self.model_name) as call:
+                response = await self.async_client.get().messages.create(
+                    model=self.model_name,
+                    temperature=self.temperature,
+                    **params,
+                )
+                usage = self._usage(response)
+                call.record_usage(usage.input_tokens, usage.output_tokens, usage.cached_input_tokens)
+            return response
+
+        return await call_with_retry(attempt, self.retry_policy, TRANSIENT_ERRORS)
+
+    @staticmethod
+    def _usage(response) -> TokenUsage:
+        # input_tokens excludes the tokens read from or written to the prompt cache
+        usage = response.usage
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return TokenUsage(
+            input_tokens=usage.input_tokens + cache_read + cache_write,
+            output_tokens=usage.output_tokens,
+            cached_input_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
 
     async def generate_with_tools(
         self,
@@ -120,7 +213,6 @@ class AnthropicAI(LLMClient):
         system_prompt: str | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         tool_schemas = [_function_to_tool_schema(t) for t in tools]
-        tool_map = {t.__name__: t for t in tools}
 
         messages = []
         for msg in contents:
@@ -130,50 +222,94 @@ class AnthropicAI(LLMClient):
         tool_call_count = 0
 
         while tool_call_count < max_tool_calls:
-            response = self.client.messages.create(
-                model=self.model_name,
-                max_tokens=4096,
-                system=system_prompt or "",
-                messages=messages,
-                tools=tool_schemas,
-                temperature=self.temperature,
-            )
+            runner = ToolCallRunner(tools, _coerce_args)
+            content: list[dict[str, Any]] = []
+            try:
+                async for chunk in self._stream_turn(
+                    runner,
+                    content,
+                    max_tokens=4096,
+                    system=system_prompt or "",
+                    messages=messages,
+                    tools=tool_schemas,
+                ):
+                    yield chunk
+
+                if not runner:
+                    yield {"type": "done"}
+                    return
+
+                tool_call_count += len(runner)
+                messages.append({"role": "assistant", "content": content})
 
-            if response.stop_reason != "tool_use":
-                for block in response.content:
-                    if block.type == "text" and block.text:
-                        yield {"type": "text", "content": block.text}
-                yield {"type": "done"}
-                return
-
-            tool_use_blocks = [b for b in response.content if b.type == "tool_use"]
-            tool_call_count += len(tool_use_blocks)
-
-            messages.append({"role": "assistant", "content": response.content})
-
-            tool_results = []
-            for block in tool_use_blocks:
-                func = tool_map.get(block.name)
-                if func:
-                    try:
-                        args = _coerce_args(func, block.input)
-                        result = await func(**args)
-                        tool_results.append({"type": "tool_result", "tool_use_id": block.id, "content": json.dumps(result)})
-                        yield {"type": "data", "function": block.name, "data": result}
-                    except Exception as e:
-                        logger.error("Tool execution error for %s: %s", block.name, str(e))
-                        tool_results.append(
-                            {"type": "tool_result", "tool_use_id": block.id, "content": json.dumps({"error": str(e)})}
-                        )
-                else:
+                tool_results = []
+                for result in await runner.results():
+                    if result.ok:
+                        yield {"type": "data", "function": result.name, "data": result.result}
                     tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": json.dumps({"error": f"Unknown function: {block.name}"}),
-                        }
+                        {"type": "tool_result", "tool_use_id": result.call_id, "content": json.dumps(result.result)}
                     )
+            finally:
+                runner.cancel()
 
             messages.append({"role": "user", "content": tool_results})
 
         yield {"type": "error", "content": "Maximum tool calls exceeded"}
+
+    async def _stream_turn(
+        self,
+        runner: ToolCallRunner,
+        content: list[dict[str, Any]],
+        **params,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Stream one assistant turn, yielding text deltas as they arrive and
+        starting each tool call as soon as its input is complete. The turn's
+        content blocks are appended to content for the follow-up request.
+        """
+        stream = await self._open_stream(**params)
+        blocks: dict[int, dict[str, Any]] = {}
+        with track_llm_call("anthropic", self.model_name) as call:
+            async for event in stream:
+                if event.type == "message_start":
+                    usage = event.message.usage
+                    call.record_usage(usage.input_tokens, 0, getattr(usage, "cache_read_input_tokens", None))
+                elif event.type == "content_block_start":
+                    block = event.content_block
+                    if block.type == "tool_use":
+                        blocks[event.index] = {"type": "tool_use", "id": block.id, "name": block.name, "input": ""}
+                    elif block.type == "text":
+                        blocks[event.index] = {"type": "text", "text": ""}
+                elif event.type == "content_block_delta":
+                    block = blocks.get(event.index)
+                    if block is None:
+                        continue
+                    if event.delta.type == "text_delta":
+                        block["text"] += event.delta.text
+                        yield {"type": "text", "content": event.delta.text}
+                    elif event.delta.type == "input_json_delta":
+                        block["input"] += event.delta.partial_json
+                elif event.type == "content_block_stop":
+                    block = blocks.get(event.index)
+                    if block and block["type"] == "tool_use":
+                        arguments = _parse_tool_input(block["input"])
+                        block["input"] = arguments if isinstance(arguments, dict) else {}
+                        runner.start(block["id"], block["name"], arguments)
+                elif event.type == "message_delta" and getattr(event, "usage", None):
+                    call.record_usage(0, event.usage.output_tokens)
+
+        content.extend(
+            blocks[index] for index in sorted(blocks) if blocks[index]["type"] == "tool_use" or blocks[index]["text"]
+        )
+
+    async def _open_stream(self, **params):
+        # Only opening the stream is retried; once text has been forwarded a retry would repeat it
+        async def attempt():
+            return await self.async_client.get().messages.create(
+                model=self.model_name,
+                temperature=self.temperature,
+                stream=True,
+                **params,
+            )
+
+        return await call_with_retry(attempt, self.retry_policy, TRANSIENT_ERRORS)
@@ -4,21 +4,31 @@ from collections.abc import AsyncGenerator
 from typing import Any, Callable, Optional
 
 import google.generativeai as genai
+import httpx
 from google import genai as genai_new
 from google.genai import types
 
-from app.ai.llm_client import LLMClient
+from app.ai.llm_client import CacheablePrompt, LLMClient, LLMResponse, TokenUsage
+from app.ai.resilience import LoopLocal, RetryPolicy, call_with_retry
+from app.ai.tool_calls import ToolCallRunner
+from app.core.metrics import track_llm_call
 
 logger_content = logging.getLogger("app.llm.big")
 logger = logging.getLogger("app")
 
+# Connection failures surface as httpx errors; HTTP errors carry their status in APIError.code
+TRANSIENT_ERRORS = (httpx.TransportError,)
+
 
 class GeminiAI(LLMClient):
+    provider = "gemini"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model_name: str = "gemini-2.0-flash",
         temperature: float = 0,
+        retry_policy: RetryPolicy = RetryPolicy(),
     ):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
@@ -33,11 +43,20 @@ class GeminiAI(LLMClient):
             model_name=self.model_name,
         )
 
-        self.client = genai_new.Client(api_key=self.api_key)
+        self.retry_policy = retry_policy
+        # Retries are done by call_with_retry, with jitter and a per-attempt timeout
+        self.async_client = LoopLocal(
+            lambda: genai_new.Client(
+                api_key=self.api_key,
+                http_options=types.HttpOptions(timeout=int(retry_policy.timeout_seconds * 1000)),
+            ).aio
+        )
 
     def generate(self, prompt: str) -> str:
         try:
-            response = self.model.generate_content(prompt)
+            with track_llm_call("gemini", self.model_name) as call:
+                response = self.model.generate_content(prompt)
+                self._record_usage(call, response)
             return response.text
         except Exception as e:
             logger.error("Error generating response: %s", str(e))
@@ -45,7 +64,10 @@ class GeminiAI(LLMClient):
 
     async def generate_async(self, prompt: str) -> str:
         try:
-            response = await self.model.generate_content_async(prompt)
+            response = await self._generate_content(
+                contents=prompt,
+                config=types.GenerateContentConfig(temperature=self.temperature),
+            )
             return response.text
         except Exception as e:
             logger.error("Error generating response: %s", str(e))
@@ -69,45 +91,111 @@ class GeminiAI(LLMClient):
         tool_call_count = 0
 
         while tool_call_count < max_tool_calls:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
-                contents=genai_contents,
-                config=config,
-            )
-
-            candidate = response.candidates[0]
-
-            if not response.function_calls:
-                if candidate.content and candidate.content.parts:
-                    for part in candidate.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            yield {"type": "text", "content": part.text}
-                yield {"type": "done"}
-                return
-
-            tool_call_count += 1
-            genai_contents.append(candidate.content)
-
-            function_responses = []
-            for fc in response.function_calls:
-                tool_func = next((t for t in tools if t.__name__ == fc.name), None)
-                if tool_func:
-                    try:
-                        result = await tool_func(**fc.args)
-                        function_responses.append(types.Part.from_function_response(name=fc.name, response={"result": result}))
-                        yield {"type": "data", "function": fc.name, "data": result}
-                    except Exception as e:
-                        logger.error("Tool execution error for %s: %s", fc.name, str(e))
-                        function_responses.append(types.Part.from_function_response(name=fc.name, response={"error": str(e)}))
-                else:
-                    function_responses.append(
-                        types.Part.from_function_response(name=fc.name, response={"error": f"Unknown function: {fc.name}"})
-                    )
+            runner = ToolCallRunner(tools)
+            parts: list[types.Part] = []
+            try:
+                async for chunk in self._stream_turn(runner, parts, contents=genai_contents, config=config):
+                    yield chunk
+
+                if not runner:
+                    yield {"type": "done"}
+                    return
+
+                tool_call_count += 1
+                genai_contents.append(types.Content(role="model", parts=parts))
+
+                function_responses = []
+                for result in await runner.results():
+                    response = {"result": result.result} if result.ok else result.result
+                    function_responses.append(types.Part.from_function_response(name=result.name, response=response))
+                    if result.ok:
+                        yield {"type": "data", "function": result.name, "data": result.result}
+            finally:
+                runner.cancel()
 
             genai_contents.append(types.Content(role="tool", parts=function_responses))
 
         yield {"type": "error", "content": "Maximum tool calls exceeded"}
 
+    async def _stream_turn(
+        self,
+        runner: ToolCallRunner,
+        parts: list[types.Part],
+        **params,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Stream one model turn, yielding text as it arrives. Gemini sends each
+        function call whole, so it is started as soon as its chunk arrives.
+        The turn's parts are collected for the follow-up request.
+        """
+        stream = await self._open_stream(**params)
+        text = ""
+        # Each chunk reports the usage of the whole stream so far
+        usage = TokenUsage()
+        with track_llm_call("gemini", self.model_name) as call:
+            async for chunk in stream:
+                if getattr(chunk, "usage_metadata", None):
+                    usage = self._usage(chunk)
+                candidate = chunk.candidates[0] if chunk.candidates else None
+                if not candidate or not candidate.content or not candidate.content.parts:
+                    continue
+                for part in candidate.content.parts:
+                    if part.function_call:
+                        parts.append(part)
+                        fc = part.function_call
+                        runner.start(fc.id or fc.name, fc.name, dict(fc.args or {}))
+                    elif part.text:
+                        text += part.text
+                        yield {"type": "text", "content": part.text}
+            call.record_usage(usage.input_tokens, usage.output_tokens, usage.cached_input_tokens)
+
+        if text:
+            parts.insert(0, types.Part.from_text(text=text))
+
+    async def _open_stream(self, **params):
+        # Only opening the stream is retried; once text has been forwarded a retry would repeat it
+        async def attempt():
+            return await self.async_client.get().models.generate_content_stream(model=self.model_name, **params)
+
+        return await call_with_retry(attempt, self.retry_policy, TRANSIENT_ERRORS)
+
+    async def generate_prompt_async(self, prompt: CacheablePrompt) -> LLMResponse:
+        # Gemini caches repeated prompt prefixes implicitly; the prefix only has to come first
+        try:
+            response = await self._generate_content(
+                contents=prompt.text,
+                config=types.GenerateContentConfig(temperature=self.temperature),
+            )
+            return LLMResponse(response.text or "", self._usage(response))
+        except Exception as e:
+            logger.error("Error generating response: %s", str(e))
+            raise Exception(f"Error generating response: {str(e)}")
+
+    async def _generate_content(self, **params):
+        async def attempt():
+            with track_llm_call("gemini", self.model_name) as call:
+                response = await self.async_client.get().models.generate_content(model=self.model_name, **params)
+                self._record_usage(call, response)
+            return response
+
+        return await call_with_retry(attempt, self.retry_policy, TRANSIENT_ERRORS)
+
+    @staticmethod
+    def _usage(response) -> TokenUsage:
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return TokenUsage()
+        return TokenUsage(
+            input_tokens=usage.prompt_token_count or 0,
+            output_tokens=usage.candidates_token_count or 0,
+            cached_input_tokens=getattr(usage, "cached_content_token_count", None) or 0,
+        )
+
+    @classmethod
+    def _record_usage(cls, call, response) -> None:
+        usage = cls._usage(response)
+        call.record_usage(usage.input_tokens, usage.output_tokens, usage.cached_input_tokens)
+
     def _convert_contents(self, contents: list[dict[str, Any]]) -> list[types.Content]:
         result = []
         for msg in contents:
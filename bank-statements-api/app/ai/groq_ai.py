@@ -5,12 +5,19 @@ import os
 from collections.abc import AsyncGenerator
 from typing import Any, Callable, Optional, Union, get_type_hints
 
-from groq import Groq
+import groq
+from groq import AsyncGroq, Groq
 
-from app.ai.llm_client import LLMClient
+from app.ai.llm_client import CacheablePrompt, LLMClient, LLMResponse, TokenUsage
+from app.ai.resilience import LoopLocal, RetryPolicy, call_with_retry
+from app.ai.tool_calls import ToolCallRunner
+from app.core.metrics import track_llm_call
 
 logger = logging.getLogger(__name__)
 
+# Raised by the SDK for connection failures and its own timeouts
+TRANSIENT_ERRORS = (groq.APIConnectionError,)
+
 
 def _is_optional(type_hint) -> bool:
     origin = getattr(type_hint, "__origin__", None)
@@ -86,11 +93,15 @@ def _coerce_args(func: Callable, args: dict | None) -> dict:
 
 
 class GroqAI(LLMClient):
+    provider = "groq"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model_name: str = "llama-3.1-8b-instant",
         temperature: float = 0,
+        base_url: Optional[str] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
     ):
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
         if not self.api_key:
@@ -98,22 +109,83 @@ class GroqAI(LLMClient):
 
         self.model_name = model_name
         self.temperature = temperature
-        self.client = Groq(api_key=self.api_key)
+        self.retry_policy = retry_policy
+        self.client = Groq(
+            api_key=self.api_key,
+            base_url=base_url,
+            timeout=retry_policy.timeout_seconds,
+            max_retries=retry_policy.max_attempts - 1,
+        )
+        # Retries are done by call_with_retry, with jitter and a per-attempt timeout
+        self.async_client = LoopLocal(
+            lambda: AsyncGroq(
+                api_key=self.api_key,
+                base_url=base_url,
+                timeout=retry_policy.timeout_seconds,
+                max_retries=0,
+            )
+        )
 
     def generate(self, prompt: str) -> str:
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature,
-            )
+            with track_llm_call("groq", self.model_name) as call:
+                response = self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=self.temperature,
+                )
+                self._record_usage(call, response)
             return response.choices[0].message.content or ""
         except Exception as e:
             logger.error("Error generating response: %s", str(e))
             raise Exception(f"Error generating response: {str(e)}")
 
     async def generate_async(self, prompt: str) -> str:
-        return self.generate(prompt)
+        try:
+            response = await self._create_completion(messages=[{"role": "user", "content": prompt}])
+            return response.choices[0].message.content or ""
+        except Exception as e:
+            logger.error("Error generating response: %s", str(e))
+            raise Exception(f"Error generating response: {str(e)}")
+
+    async def generate_prompt_async(self, prompt: CacheablePrompt) -> LLMResponse:
+        # Groq caches matching prompt prefixes on its own on the models that support it
+        try:
+            response = await self._create_completion(messages=[{"role": "user", "content": prompt.text}])
+            return LLMResponse(response.choices[0].message.content or "", self._usage(response))
+        except Exception as e:
+            logger.error("Error generating response: %s", str(e))
+            raise Exception(f"Error generating response: {str(e)}")
+
+    async def _create_completion(self, **params):
+        async def attempt():
+            with track_llm_call("groq", self.model_name) as call:
+                response = await self.async_client.get().chat.completions.create(
+                    model=self.model_name,
+                    temperature=self.temperature,
+                    **params,
+                )
+                self._record_usage(call, response)
+            return response
+
+        return await call_with_retry(attempt, self.retry_policy, TRANSIENT_ERRORS)
+
+    @staticmethod
+    def _usage(response) -> TokenUsage:
+        usage = response.usage
+        if not usage:
+            return TokenUsage()
+        details = getattr(usage, "prompt_tokens_details", None)
+        return TokenUsage(
+            input_tokens=usage.prompt_tokens or 0,
+            output_tokens=usage.completion_tokens or 0,
+            cached_input_tokens=(getattr(details, "cached_tokens", None) or 0) if details else 0,
+        )
+
+    @classmethod
+    def _record_usage(cls, call, response) -> None:
+        usage = cls._usage(response)
+        call.record_usage(usage.input_tokens, usage.output_tokens, usage.cached_input_tokens)
 
     async def generate_with_tools(
         self,
@@ -122,7 +194,6 @@ class GroqAI(LLMClient):
         system_prompt: str | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         tool_schemas = [_function_to_tool_schema(t) for t in tools]
-        tool_map = {t.__name__: t for t in tools}
 
         messages = []
         if system_prompt:
@@ -141,50 +212,94 @@ class GroqAI(LLMClient):
             logger.info(f"Messages: {json.dumps(messages, indent=2, default=str)}")
             logger.info(f"Tools: {json.dumps(tool_schemas, indent=2)}")
 
-            response = self.client.chat.completions.create(
+            runner = ToolCallRunner(tools, _coerce_args)
+            assistant: dict[str, Any] = {"role": "assistant", "content": ""}
+            try:
+                async for chunk in self._stream_turn(runner, assistant, messages=messages, tools=tool_schemas):
+                    yield chunk
+
+                logger.info("=== GROQ RESPONSE ===")
+                logger.info(f"Content: {assistant['content']}")
+                logger.info(f"Tool calls: {assistant.get('tool_calls')}")
+
+                if not runner:
+                    yield {"type": "done"}
+                    return
+
+                tool_call_count += len(runner)
+                messages.append(assistant)
+
+                for result in await runner.results():
+                    messages.append({"role": "tool", "tool_call_id": result.call_id, "content": json.dumps(result.result)})
+                    if result.ok:
+                        yield {"type": "data", "function": result.name, "data": result.result}
+            finally:
+                runner.cancel()
+
+        yield {"type": "error", "content": "Maximum tool calls exceeded"}
+
+    async def _stream_turn(
+        self,
+        runner: ToolCallRunner,
+        assistant: dict[str, Any],
+        **params,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Stream one assistant turn, yielding text deltas as they arrive. Tool
+        call arguments stream in fragments by index; a call is started once a
+        later call begins or the stream ends. The turn is collected in assistant.
+        """
+        stream = await self._open_stream(**params)
+        calls: dict[int, dict[str, Any]] = {}
+        started: set[int] = set()
+
+        def start_calls(before: Optional[int] = None) -> None:
+            for index in sorted(calls):
+                if index not in started and (before is None or index < before):
+                    started.add(index)
+                    runner.start(calls[index]["id"], calls[index]["function"]["name"], calls[index]["function"]["arguments"])
+
+        with track_llm_call("groq", self.model_name) as call:
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None) or getattr(getattr(chunk, "x_groq", None), "usage", None)
+                if usage:
+                    call.record_usage(usage.prompt_tokens, usage.completion_tokens)
+                if not chunk.choices:
+                    continue
+
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    assistant["content"] += delta.content
+                    yield {"type": "text", "content": delta.content}
+
+                for fragment in delta.tool_calls or []:
+                    if fragment.index not in calls:
+                        start_calls(before=fragment.index)
+                        calls[fragment.index] = {
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        }
+                    entry = calls[fragment.index]
+                    if fragment.id:
+                        entry["id"] = fragment.id
+                    if fragment.function:
+                        entry["function"]["name"] += fragment.function.name or ""
+                        entry["function"]["arguments"] += fragment.function.arguments or ""
+
+        start_calls()
+        if calls:
+            assistant["tool_calls"] = [calls[index] for index in sorted(calls)]
+
+    async def _open_stream(self, **params):
+        # Only opening the stream is retried; once text has been forwarded a retry would repeat it
+        async def attempt():
+            return await self.async_client.get().chat.completions.create(
                 model=self.model_name,
-                messages=messages,
-                tools=tool_schemas,
-                tool_choice="auto",
                 temperature=self.temperature,
+                tool_choice="auto",
+                stream=True,
+                **params,
             )
 
-            choice = response.choices[0]
-            message = choice.message
-
-            logger.info("=== GROQ RESPONSE ===")
-            logger.info(f"Content: {message.content}")
-            logger.info(f"Tool calls: {message.tool_calls}")
-            logger.info(f"Finish reason: {choice.finish_reason}")
-
-            if not message.tool_calls:
-                if message.content:
-                    yield {"type": "text", "content": message.content}
-                yield {"type": "done"}
-                return
-
-            tool_call_count += len(message.tool_calls)
-            messages.append({"role": "assistant", "tool_calls": message.tool_calls, "content": message.content or ""})
-
-            for tc in message.tool_calls:
-                func = tool_map.get(tc.function.name)
-                if func:
-                    try:
-                        args = json.loads(tc.function.arguments)
-                        args = _coerce_args(func, args)
-                        result = await func(**args)
-                        messages.append({"role": "tool", "tool_call_id": tc.id, "content": json.dumps(result)})
-                        yield {"type": "data", "function": tc.function.name, "data": result}
-                    except Exception as e:
-                        logger.error("Tool execution error for %s: %s", tc.function.name, str(e))
-                        messages.append({"role": "tool", "tool_call_id": tc.id, "content": json.dumps({"error": str(e)})})
-                else:
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tc.id,
-                            "content": json.dumps({"error": f"Unknown function: {tc.function.name}"}),
-                        }
-                    )
-
-        yield {"type": "error", "content": "Maximum tool calls exceeded"}
+        return await call_with_retry(attempt, self.retry_policy, TRANSIENT_ERRORS)
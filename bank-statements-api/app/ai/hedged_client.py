@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.ai.llm_client import CacheablePrompt, LLMClient, LLMResponse
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedLLMClient(LLMClient):
+    """
+    Sends async prompts to primary and, if no answer arrives within
+    hedge_after_seconds, also to secondary, returning whichever answers
+    first and cancelling the other. Sync calls and tool loops use primary.
+    """
+
+    def __init__(self, primary: LLMClient, secondary: LLMClient, hedge_after_seconds: float):
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_after_seconds = hedge_after_seconds
+        self.provider = primary.provider
+        self.model_name = primary.model_name
+
+    def generate(self, prompt: str) -> str:
+        return self.primary.generate(prompt)
+
+    async def generate_async(self, prompt: str) -> str:
+        return await self._hedge(lambda client: client.generate_async(prompt))
+
+    async def generate_prompt_async(self, prompt: CacheablePrompt) -> LLMResponse:
+        return await self._hedge(lambda client: client.generate_prompt_async(prompt))
+
+    async def _hedge(self, call: Callable[[LLMClient], Awaitable[T]]) -> T:
+        primary = asyncio.create_task(call(self.primary))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_after_seconds)
+            if done:
+                return primary.result()
+
+            logger.info(
+                f"{self.primary.provider} has not answered after {self.hedge_after_seconds}s, "
+                f"hedging to {self.secondary.provider}"
+            )
+            pending.add(asyncio.create_task(call(self.secondary)))
+
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def generate_with_tools(
+        self,
+        contents: list[dict[str, Any]],
+        tools: list[Callable],
+        system_prompt: str | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        async for chunk in self.primary.generate_with_tools(contents, tools, system_prompt):
+            yield chunk
@@ -1,9 +1,58 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from typing import Any, Callable
 
 
+@dataclass(frozen=True)
+class CacheablePrompt:
+    """
+    A prompt split into a prefix that is identical across calls (instructions,
+    the category or account list) and the part that changes per call. Providers
+    that cache prompt prefixes can then reuse the prefix instead of reprocessing it.
+    """
+
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+
+@dataclass
+class TokenUsage:
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # Input tokens served from, and written to, the provider's prompt cache
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cached_input_tokens=self.cached_input_tokens + other.cached_input_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.input_tokens} input ({self.cached_input_tokens} cached, {self.cache_write_tokens} cache write), "
+            f"{self.output_tokens} output tokens"
+        )
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    usage: TokenUsage
+
+
 class LLMClient(ABC):
+    provider: str = "unknown"
+    model_name: str = "none"
+
     @abstractmethod
     def generate(self, prompt: str) -> str:
         pass
@@ -12,6 +61,10 @@ class LLMClient(ABC):
     async def generate_async(self, prompt: str) -> str:
         pass
 
+    async def generate_prompt_async(self, prompt: CacheablePrompt) -> LLMResponse:
+        """Answer a prompt whose prefix may be cached, reporting the tokens it used when the provider says"""
+        return LLMResponse(await self.generate_async(prompt.text), TokenUsage())
+
     async def generate_with_tools(
         self,
         contents: list[dict[str, Any]],
@@ -5,6 +5,8 @@ from app.ai.llm_client import LLMClient
 
 
 class NoopLLMClient(LLMClient):
+    provider = "noop"
+
     def generate(self, prompt: str) -> str:
         return ""
 
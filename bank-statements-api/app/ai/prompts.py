@@ -1,13 +1,16 @@
 import json
 from dataclasses import dataclass
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from uuid import UUID
 
+from app.ai.llm_client import CacheablePrompt
 from app.domain.models.account import Account
 from app.domain.models.category import Category
 from app.domain.models.transaction import Transaction
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class Subcategory:
@@ -65,7 +68,7 @@ Only return the JSON object, nothing else.
     return prompt
 
 
-def schema_detection_prompt(df: pd.DataFrame) -> str:
+def schema_detection_prompt(df: "pd.DataFrame") -> str:
     return f"""
 From this bank statement excerpt, extract the column map and header information in the following format:
 
@@ -125,65 +128,77 @@ Transaction Date,Value Date,Details,Amount,Balance
 """
 
 
-def rule_categorization_prompt(
-    rule_patterns: list[str],
-    categories: List[Category],
-) -> str:
-    root_categories_with_children = {cat.parent_id for cat in categories if cat.parent_id is not None}
+class CategoryAliases:
+    """
+    Short integer ids for the categories a rule can be put in (subcategories,
+    and root categories without children), used in prompts instead of UUIDs.
+    Categories are numbered in name order so the same tree always gets the
+    same aliases and the category block of the prompt stays byte-identical.
+    """
 
-    expanded_categories = [
-        Subcategory(str(cat.id), cat.name)
-        for cat in categories
-        if cat.parent_id is not None or cat.id not in root_categories_with_children
-    ]
+    def __init__(self, categories: List[Category]):
+        root_categories_with_children = {cat.parent_id for cat in categories if cat.parent_id is not None}
+        self.categories = sorted(
+            (cat for cat in categories if cat.parent_id is not None or cat.id not in root_categories_with_children),
+            key=lambda cat: (cat.name.lower(), str(cat.id)),
+        )
+        self._ids = {str(alias): cat.id for alias, cat in enumerate(self.categories, start=1)}
 
-    categories_info = [f"{{id: {cat.sub_category_id}, name: {cat.subcategory_name}}}" for cat in expanded_categories]
+    def items(self) -> List[Tuple[str, Category]]:
+        return [(alias, cat) for alias, cat in zip(self._ids, self.categories)]
 
-    patterns_text = "\n".join(rule_patterns)
+    def resolve(self, alias: str) -> Optional[UUID]:
+        return self._ids.get(alias.strip())
 
-    prompt = f"""
-You are a bank transaction categorization assistant. Your task is to categorize the following transaction description patterns into the most specific and appropriate categories from the provided list.
 
-These are normalized transaction description patterns (not individual transactions). Each pattern represents a merchant or type of transaction that appears regularly.
+def rule_categorization_prompt(
+    rule_patterns: list[str],
+    aliases: CategoryAliases,
+) -> CacheablePrompt:
+    categories_text = "\n".join(f"{alias}: {cat.name}" for alias, cat in aliases.items())
+    patterns_text = "\n".join(rule_patterns)
+
+    prefix = f"""
+You are a bank transaction categorization assistant. Your task is to categorize transaction description patterns into the most specific and appropriate categories from the provided list.
 
-Patterns:
-{patterns_text}
+The patterns are normalized transaction descriptions (not individual transactions). Each pattern represents a merchant or type of transaction that appears regularly.
 
-Available Categories:
-{json.dumps(categories_info, indent=2)}
+Available Categories (id: name):
+{categories_text}
 
-For each pattern, analyze the description and determine the most specific and appropriate category ID from the list above.
+For each pattern, analyze the description and determine the most specific and appropriate category id from the list above.
 Choose the category that best matches the nature of transactions matching this pattern.
 
 Return your answer as a JSON object with the following format:
 [
     {{
         "pattern": <the exact pattern from the input>,
-        "sub_category_id": <id of the selected subcategory>,
+        "sub_category_id": <id of the selected category>,
         "confidence": <a number between 0 and 1 indicating your confidence in this categorization>
     }}
 ]
 
 Only return the JSON object, nothing else.
 """
-    return prompt
+    suffix = f"""
+Patterns:
+{patterns_text}
+"""
+    return CacheablePrompt(prefix=prefix, suffix=suffix)
 
 
 def rule_counterparty_prompt(
     rule_patterns: list[str],
     accounts: List[Account],
-) -> str:
+) -> CacheablePrompt:
     accounts_info = [f"{{id: {account.id}, name: {account.name}}}" for account in accounts]
 
     patterns_text = "\n".join(rule_patterns)
 
-    prompt = f"""
+    prefix = f"""
 You are a bank transaction counterparty identification assistant. Your task is to identify the most likely counterparty account for each transaction description pattern from the provided list.
 
-These are normalized transaction description patterns (not individual transactions). Each pattern represents a merchant or type of transaction that appears regularly.
-
-Patterns:
-{patterns_text}
+The patterns are normalized transaction descriptions (not individual transactions). Each pattern represents a merchant or type of transaction that appears regularly.
 
 Available Counterparty Accounts:
 {json.dumps(accounts_info, indent=2)}
@@ -206,7 +221,11 @@ Return your answer as a JSON object with the following format:
 
 Only return the JSON object, nothing else.
 """
-    return prompt
+    suffix = f"""
+Patterns:
+{patterns_text}
+"""
+    return CacheablePrompt(prefix=prefix, suffix=suffix)
 
 
 def counterparty_identification_prompt(transactions: List[Transaction], accounts: List[Account]) -> str:
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Holds up to capacity tokens, refilled at rate_per_second.
+
+    acquire() reserves its tokens straight away, letting the balance go
+    negative, and sleeps until the refill covers the debt. Reservations are
+    served in call order without holding a lock across the sleep.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take amount tokens and return how many seconds to wait before using them"""
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    async def acquire(self, amount: float = 1) -> None:
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class ProviderRateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one LLM provider"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute / 60, requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        await self.requests.acquire(1)
+        await self.tokens.acquire(estimated_tokens)
+
+
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+) -> ProviderRateLimiter:
+    """The process-wide limiter for provider, shared by every client and job"""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            from app.core.config import settings
+
+            limiter = ProviderRateLimiter(
+                requests_per_minute or settings.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute or settings.LLM_TOKENS_PER_MINUTE,
+            )
+            _limiters[provider] = limiter
+        return limiter
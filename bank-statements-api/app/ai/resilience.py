@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import random
+import weakref
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rate limits, overload and server errors; anything else is the request's fault
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+    timeout_seconds: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter: a random delay up to the exponential cap, so clients throttled together spread out"""
+        return random.uniform(0, min(self.max_delay_seconds, self.base_delay_seconds * 2**attempt))
+
+
+def status_code_of(error: Exception) -> Optional[int]:
+    code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return code if isinstance(code, int) else None
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: Exception, transient_errors: tuple[type[Exception], ...] = ()) -> bool:
+    if isinstance(error, (asyncio.TimeoutError, *transient_errors)):
+        return True
+    code = status_code_of(error)
+    return code is not None and (code in RETRYABLE_STATUS_CODES or code >= 500)
+
+
+async def call_with_retry(
+    call: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    transient_errors: tuple[type[Exception], ...] = (),
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> T:
+    """
+    Await call(), giving each attempt policy.timeout_seconds. Timeouts,
+    connection errors and retryable status codes are retried with jittered
+    exponential backoff, waiting at least as long as a Retry-After header asks.
+    """
+    for attempt in range(policy.max_attempts):
+        try:
+            return await asyncio.wait_for(call(), timeout=policy.timeout_seconds)
+        except Exception as e:
+            if attempt + 1 >= policy.max_attempts or not is_retryable(e, transient_errors):
+                raise
+            delay = policy.backoff(attempt)
+            retry_after = retry_after_seconds(e)
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), policy.max_delay_seconds)
+            logger.warning(
+                f"LLM call failed ({type(e).__name__}: {e}), retrying in {delay:.2f}s "
+                f"(attempt {attempt + 2}/{policy.max_attempts})"
+            )
+            await sleep(delay)
+    raise AssertionError("unreachable")
+
+
+class LoopLocal(Generic[T]):
+    """
+    One lazily created instance per running event loop. Async SDK clients keep
+    their pooled connections bound to the loop that opened them, so they are
+    shared by every call on a loop but never reused from another one.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self.factory = factory
+        self._instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = weakref.WeakKeyDictionary()
+
+    def get(self) -> T:
+        loop = asyncio.get_running_loop()
+        instance = self._instances.get(loop)
+        if instance is None:
+            instance = self.factory()
+            self._instances[loop] = instance
+        return instance
@@ -0,0 +1,10 @@
+# Rough token count for budgeting prompts: about four characters per token for
+# the English text and JSON the prompts are made of. Providers count exactly;
+# this only needs to be close enough to size batches and rate limits.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ArgumentCoercer = Callable[[Callable, Optional[dict]], dict]
+
+
+@dataclass
+class ToolResult:
+    call_id: str
+    name: str
+    result: Any
+    ok: bool
+
+
+def _no_coercion(func: Callable, args: Optional[dict]) -> dict:
+    return args or {}
+
+
+class ToolCallRunner:
+    """
+    Runs the tool calls of one model turn. Each call is started as soon as its
+    arguments are complete, while the rest of the turn is still streaming, and
+    results() waits for all of them together, in the order they were started.
+    """
+
+    def __init__(self, tools: list[Callable], coerce_args: ArgumentCoercer = _no_coercion):
+        self.tool_map = {t.__name__: t for t in tools}
+        self.coerce_args = coerce_args
+        self._calls: list[tuple[str, str, asyncio.Task]] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def start(self, call_id: str, name: str, arguments: Union[dict, str, None]) -> None:
+        """Start a call; arguments may still be the raw JSON text the model streamed"""
+        self._calls.append((call_id, name, asyncio.create_task(self._execute(name, arguments))))
+
+    async def results(self) -> list[ToolResult]:
+        outcomes = await asyncio.gather(*(task for _, _, task in self._calls))
+        return [
+            ToolResult(call_id=call_id, name=name, result=result, ok=ok)
+            for (call_id, name, _), (result, ok) in zip(self._calls, outcomes)
+        ]
+
+    def cancel(self) -> None:
+        for _, _, task in self._calls:
+            task.cancel()
+
+    async def _execute(self, name: str, arguments: Union[dict, str, None]) -> tuple[Any, bool]:
+        func = self.tool_map.get(name)
+        if func is None:
+            return {"error": f"Unknown function: {name}"}, False
+        try:
+            if isinstance(arguments, str):
+                arguments = json.loads(arguments) if arguments.strip() else {}
+            return await func(**self.coerce_args(func, arguments)), True
+        except Exception as e:
+            logger.error("Tool execution error for %s: %s", name, str(e))
+            return {"error": str(e)}, False
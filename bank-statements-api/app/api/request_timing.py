@@ -0,0 +1,91 @@
+import logging
+import re
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_REQUEST_DB_QUERIES, HTTP_REQUEST_DURATION
+from app.core.query_stats import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+LOGGED_SQL_CHARS = 300
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Label requests by the matched route's template so /transactions/{transaction_id}
+    does not create a series per id.
+    """
+    route = scope.get("route")
+    if route is None or not hasattr(route, "path_regex"):
+        return "unmatched"
+    if route.path_regex.match(scope["path"]):
+        return route.path
+    # Newer FastAPI versions match the route of an included router without its prefix
+    suffix = re.search(route.path_regex.pattern.lstrip("^"), scope["path"])
+    return scope["path"][: suffix.start()] + route.path if suffix else route.path
+
+
+def logged_sql(statement: str) -> str:
+    """Statement text on one line, cut to LOGGED_SQL_CHARS"""
+    return " ".join(statement.split())[:LOGGED_SQL_CHARS]
+
+
+def server_timing_header(stats: QueryStats, app_ms: float) -> str:
+    return f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", app;dur={app_ms:.1f}'
+
+
+class RequestTimingMiddleware:
+    """
+    Measures wall time and SQL activity per request. The totals go out in a
+    Server-Timing header, a single key=value log line and the /metrics
+    histograms; statements repeated at least repeat_threshold times are logged
+    as likely N+1 loops.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 10):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing_header(stats, (time.perf_counter() - start) * 1000))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                self._record(scope, status_code, stats, duration_ms)
+                self._log(scope, status_code, stats, duration_ms)
+
+    def _record(self, scope: Scope, status_code: int, stats: QueryStats, duration_ms: float) -> None:
+        method, route = scope["method"], route_template(scope)
+        HTTP_REQUEST_DURATION.observe(duration_ms / 1000, method=method, route=route, status=str(status_code))
+        HTTP_REQUEST_DB_QUERIES.observe(stats.count, method=method, route=route)
+
+    def _log(self, scope: Scope, status_code: int, stats: QueryStats, duration_ms: float) -> None:
+        repeated = stats.repeated(self.repeat_threshold)
+        logger.info(
+            f"{scope['method']} {scope['path']} - {duration_ms:.0f}ms "
+            f"status={status_code} db_queries={stats.count} db_ms={stats.total_ms:.1f} "
+            f"db_slowest_ms={stats.slowest_ms:.1f} db_repeated={len(repeated)}"
+            + (f' db_slowest_sql="{logged_sql(stats.slowest_statement)}"' if stats.slowest_statement else "")
+        )
+        for statement, count in repeated:
+            logger.warning(f"Repeated query x{count} on {scope['method']} {scope['path']}: {logged_sql(statement)}")
@@ -0,0 +1,37 @@
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+def _encode_default(value: Any) -> Any:
+    # Mirrors Pydantic's JSON mode for the types our read models carry
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_encode_default)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Response for payloads that are already shaped like their response model.
+
+    Returning it from a route bypasses response_model validation; the content is
+    encoded directly with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, FastAPI, File, HTTPException, UploadFile
 from starlette.responses import StreamingResponse
 
 from app.api.routes.auth import require_current_user
+from app.api.routes.conditional_get import ConditionalGetRoute, not_modified_guard
 from app.api.schemas import (
     AccountCreate,
     AccountListResponse,
@@ -40,7 +41,8 @@ def register_account_routes(
     app: FastAPI,
     provide_dependencies: Callable[[], Iterator[InternalDependencies]],
 ):
-    router = APIRouter(prefix="/accounts", tags=["accounts"])
+    router = APIRouter(prefix="/accounts", tags=["accounts"], route_class=ConditionalGetRoute)
+    not_modified = not_modified_guard(provide_dependencies)
 
     @router.post(
         "",
@@ -71,7 +73,7 @@ def register_account_routes(
                 detail=f"Error creating account: {str(e)}",
             )
 
-    @router.get("", response_model=AccountListResponse)
+    @router.get("", response_model=AccountListResponse, dependencies=[Depends(not_modified)])
     async def get_all_accounts(
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
@@ -1,6 +1,6 @@
+from functools import lru_cache
 from typing import Optional
 
-from authlib.integrations.starlette_client import OAuth, OAuthError
 from fastapi import APIRouter, Cookie, Depends, FastAPI, HTTPException, Request, Response, status
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
@@ -33,10 +33,12 @@ class LoginRequest(BaseModel):
     password: str
 
 
-oauth = OAuth()
+@lru_cache(maxsize=1)
+def _get_oauth():
+    # authlib is only needed for the Google login flow, so it is imported on first use
+    from authlib.integrations.starlette_client import OAuth
 
-
-def _register_oauth_clients():
+    oauth = OAuth()
     if settings.GOOGLE_OAUTH_CLIENT_ID:
         oauth.register(
             name="google",
@@ -45,9 +47,7 @@ def _register_oauth_clients():
             server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
             client_kwargs={"scope": "openid email profile", "prompt": "select_account"},
         )
-
-
-_register_oauth_clients()
+    return oauth
 
 
 def _get_auth_service() -> AuthService:
@@ -119,12 +119,14 @@ def register_auth_routes(app: FastAPI):
         if not settings.GOOGLE_OAUTH_CLIENT_ID:
             raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Google OAuth not configured")
         redirect_uri = f"{settings.API_BASE_URL}{settings.API_V1_STR}/auth/google/callback"
-        return await oauth.google.authorize_redirect(request, redirect_uri)
+        return await _get_oauth().google.authorize_redirect(request, redirect_uri)
 
     @router.get("/google/callback")
     async def google_callback(request: Request, response: Response):
+        from authlib.integrations.starlette_client import OAuthError
+
         try:
-            token = await oauth.google.authorize_access_token(request)
+            token = await _get_oauth().google.authorize_access_token(request)
         except OAuthError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
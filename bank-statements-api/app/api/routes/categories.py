@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, FastAPI, File, HTTPException, UploadFile
 from starlette.responses import StreamingResponse
 
 from app.api.routes.auth import require_current_user
+from app.api.routes.conditional_get import ConditionalGetRoute, not_modified_guard
 from app.api.routes.feature_gate import require_feature
 from app.api.schemas import (
     CategoryCreate,
@@ -29,7 +30,8 @@ def register_category_routes(
     app: FastAPI,
     provide_dependencies: Callable[[], Iterator[InternalDependencies]],
 ):
-    router = APIRouter(prefix="/categories", tags=["categories"])
+    router = APIRouter(prefix="/categories", tags=["categories"], route_class=ConditionalGetRoute)
+    not_modified = not_modified_guard(provide_dependencies)
 
     @router.post(
         "",
@@ -48,7 +50,7 @@ def register_category_routes(
             color=category_data.color,
         )
 
-    @router.get("", response_model=CategoryListResponse)
+    @router.get("", response_model=CategoryListResponse, dependencies=[Depends(not_modified)])
     def get_categories(
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
@@ -59,7 +61,7 @@ def register_category_routes(
             total=len(categories),
         )
 
-    @router.get("/root", response_model=CategoryListResponse)
+    @router.get("/root", response_model=CategoryListResponse, dependencies=[Depends(not_modified)])
     def get_root_categories(
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
@@ -0,0 +1,85 @@
+import hashlib
+from typing import Callable, Iterator
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from starlette import status
+
+from app.api.routes.auth import require_current_user
+from app.core.dependencies import InternalDependencies
+from app.domain.models.user import User
+
+# Comma-separated id lists whose order does not change the result
+UNORDERED_LIST_PARAMS = {"category_ids", "tag_ids", "transaction_ids"}
+
+
+def normalize_query(request: Request) -> str:
+    items = []
+    for key, value in request.query_params.multi_items():
+        value = value.strip()
+        if not value:
+            continue
+        if key in UNORDERED_LIST_PARAMS:
+            value = ",".join(sorted({part.strip() for part in value.split(",") if part.strip()}))
+        items.append((key, value))
+    return "&".join(f"{key}={value}" for key, value in sorted(items))
+
+
+def build_etag(user_id: UUID, data_version: int, request: Request) -> str:
+    key = f"{user_id}:{data_version}:{request.url.path}?{normalize_query(request)}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    # Weak: the same representation may be sent gzip/br encoded or not
+    return f'W/"{data_version}-{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified_guard(
+    provide_dependencies: Callable[[], Iterator[InternalDependencies]],
+) -> Callable[..., None]:
+    """
+    Build a route dependency that answers 304 when the client already holds the
+    current representation. It only costs a data version lookup, so it runs before
+    the endpoint touches any heavy query.
+    """
+
+    def check_not_modified(
+        request: Request,
+        internal: InternalDependencies = Depends(provide_dependencies),
+        current_user: User = Depends(require_current_user),
+    ) -> None:
+        data_version = internal.user_data_version_repository.get_version(current_user.id)
+        etag = build_etag(current_user.id, data_version, request)
+        request.state.etag = etag
+        if etag_matches(request.headers.get("if-none-match", ""), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+            )
+
+    return check_not_modified
+
+
+class ConditionalGetRoute(APIRoute):
+    """Stamps the ETag computed by not_modified_guard on successful responses."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def conditional_route_handler(request: Request) -> Response:
+            response = await handler(request)
+            etag = getattr(request.state, "etag", None)
+            if etag and response.status_code == status.HTTP_200_OK:
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = "private, no-cache"
+            return response
+
+        return conditional_route_handler
@@ -1,16 +1,20 @@
-from datetime import datetime, timezone
 from typing import Callable, Iterator, List, Optional
 from uuid import UUID
 
+from anyio.from_thread import start_blocking_portal
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
 from app.api.routes.auth import require_current_user
+from app.api.routes.conditional_get import ConditionalGetRoute, not_modified_guard
 from app.api.routes.feature_gate import require_feature
 from app.api.schemas import (
     AIApplySuggestionRequest,
     AIApplySuggestionResponse,
     AISuggestCategoriesRequest,
     AISuggestCategoriesResponse,
+    AISuggestionJobResponse,
     CleanupUnusedRulesResponse,
     EnhancementRuleCreate,
     EnhancementRuleListResponse,
@@ -22,8 +26,10 @@ from app.api.schemas import (
 )
 from app.core.config import settings
 from app.core.dependencies import InternalDependencies
+from app.domain.models.background_job import JobType
 from app.domain.models.enhancement_rule import EnhancementRuleSource, MatchType
 from app.domain.models.user import User
+from app.services.ai.rule_suggestion import RuleSuggestionSummary
 from app.services.enhancement_rule_management import EnhancementRuleManagementService
 from app.services.subscription import Feature
 
@@ -35,9 +41,11 @@ def register_enhancement_rule_routes(
     router = APIRouter(
         prefix="/enhancement-rules",
         tags=["enhancement-rules"],
+        route_class=ConditionalGetRoute,
     )
+    not_modified = not_modified_guard(provide_dependencies)
 
-    @router.get("", response_model=EnhancementRuleListResponse)
+    @router.get("", response_model=EnhancementRuleListResponse, dependencies=[Depends(not_modified)])
     def list_enhancement_rules(
         page: int = Query(1, ge=1, description="Page number"),
         page_size: int = Query(
@@ -98,6 +106,7 @@ def register_enhancement_rule_routes(
     @router.get(
         "/stats",
         response_model=EnhancementRuleStatsResponse,
+        dependencies=[Depends(not_modified)],
     )
     def get_enhancement_rule_stats(
         internal: InternalDependencies = Depends(provide_dependencies),
@@ -322,94 +331,47 @@ def register_enhancement_rule_routes(
                 detail=f"Failed to delete enhancement rule: {str(e)}",
             )
 
+    def _suggestion_job_accepted(job) -> JSONResponse:
+        job_url = f"{settings.API_V1_STR}/transactions/categorization-jobs/{job.id}"
+        accepted = AISuggestionJobResponse(
+            job_id=job.id,
+            status=job.status,
+            status_url=f"{job_url}/status",
+            events_url=f"{job_url}/events",
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(accepted),
+            headers={"Location": accepted.status_url},
+        )
+
+    def _run_suggestions(suggest, user_id: UUID, request: AISuggestCategoriesRequest) -> RuleSuggestionSummary:
+        # The suggestion services interleave synchronous SQLAlchemy calls with LLM awaits, so the routes are
+        # sync (run in the threadpool) and the services get an event loop of their own instead of the server's
+        with start_blocking_portal() as portal:
+            return portal.call(suggest, user_id, request)
+
     @router.post(
         "/ai/suggest-categories",
         response_model=AISuggestCategoriesResponse,
+        responses={status.HTTP_202_ACCEPTED: {"model": AISuggestionJobResponse}},
     )
     def suggest_categories(
         request: AISuggestCategoriesRequest,
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
-    ) -> AISuggestCategoriesResponse:
+    ):
         require_feature(internal.subscription_service, current_user.id, Feature.AI_CATEGORISATION)
 
-        service = internal.enhancement_rule_management_service
-        categorizer = internal.llm_rule_categorizer
-
         try:
-            categories = internal.category_repository.get_all(current_user.id)
-            if not categories:
-                return AISuggestCategoriesResponse(
-                    processed=0,
-                    auto_applied=0,
-                    suggestions=0,
-                    failed=0,
-                    error_message="No categories available. Create categories first.",
-                )
-
-            if request.rule_ids:
-                rules = [service.get_rule(rule_id, current_user.id) for rule_id in request.rule_ids]
-                rules = [r for r in rules if r is not None]
-            else:
-                result = service.list_rules(
-                    user_id=current_user.id,
-                    limit=100,
-                    offset=0,
-                    rule_status_filter="unconfigured",
-                )
-                rules = result["rules"]
-
-            if not rules:
-                return AISuggestCategoriesResponse(
-                    processed=0,
-                    auto_applied=0,
-                    suggestions=0,
-                    failed=0,
+            if request.background:
+                job = internal.rule_suggestion_service.queue_suggestions(
+                    JobType.RULE_CATEGORY_SUGGESTION, current_user.id, request
                 )
+                return _suggestion_job_accepted(job)
 
-            suggestions = categorizer.suggest_categories(rules, current_user.id)
-
-            processed = len(suggestions)
-            auto_applied = 0
-            suggestion_count = 0
-            failed = 0
-            error_messages = set()
-
-            for suggestion in suggestions:
-                if not suggestion.is_successful:
-                    failed += 1
-                    if suggestion.error_message:
-                        error_messages.add(suggestion.error_message)
-                    continue
-
-                rule = next((r for r in rules if r.id == suggestion.rule_id), None)
-                if not rule:
-                    failed += 1
-                    continue
-
-                rule.ai_suggested_category_id = suggestion.suggested_category_id
-                rule.ai_category_confidence = suggestion.confidence
-                rule.ai_processed_at = datetime.now(timezone.utc)
-
-                if request.auto_apply and suggestion.confidence >= request.confidence_threshold:
-                    rule.category_id = suggestion.suggested_category_id
-                    auto_applied += 1
-                else:
-                    suggestion_count += 1
-
-                internal.enhancement_rule_repository.save(rule)
-
-            error_message = None
-            if failed > 0 and error_messages:
-                error_message = "; ".join(sorted(error_messages))
-
-            return AISuggestCategoriesResponse(
-                processed=processed,
-                auto_applied=auto_applied,
-                suggestions=suggestion_count,
-                failed=failed,
-                error_message=error_message,
-            )
+            summary = _run_suggestions(internal.rule_suggestion_service.suggest_categories, current_user.id, request)
+            return AISuggestCategoriesResponse(**summary.to_dict())
 
         except Exception as e:
             raise HTTPException(
@@ -420,71 +382,22 @@ def register_enhancement_rule_routes(
     @router.post(
         "/ai/suggest-counterparties",
         response_model=AISuggestCategoriesResponse,
+        responses={status.HTTP_202_ACCEPTED: {"model": AISuggestionJobResponse}},
     )
     def suggest_counterparties(
         request: AISuggestCategoriesRequest,
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
-    ) -> AISuggestCategoriesResponse:
-        service = internal.enhancement_rule_management_service
-        counterparty_suggester = internal.llm_rule_counterparty
-
+    ):
         try:
-            if request.rule_ids:
-                rules = [service.get_rule(rule_id, current_user.id) for rule_id in request.rule_ids]
-                rules = [r for r in rules if r is not None]
-            else:
-                result = service.list_rules(
-                    user_id=current_user.id,
-                    limit=100,
-                    offset=0,
-                    rule_status_filter="unconfigured",
-                )
-                rules = result["rules"]
-
-            if not rules:
-                return AISuggestCategoriesResponse(
-                    processed=0,
-                    auto_applied=0,
-                    suggestions=0,
-                    failed=0,
+            if request.background:
+                job = internal.rule_suggestion_service.queue_suggestions(
+                    JobType.RULE_COUNTERPARTY_SUGGESTION, current_user.id, request
                 )
+                return _suggestion_job_accepted(job)
 
-            suggestions = counterparty_suggester.suggest_counterparties(rules, current_user.id)
-
-            processed = len(suggestions)
-            auto_applied = 0
-            suggestion_count = 0
-            failed = 0
-
-            for suggestion in suggestions:
-                if not suggestion.is_successful:
-                    failed += 1
-                    continue
-
-                rule = next((r for r in rules if r.id == suggestion.rule_id), None)
-                if not rule:
-                    failed += 1
-                    continue
-
-                rule.ai_suggested_counterparty_id = suggestion.suggested_counterparty_id
-                rule.ai_counterparty_confidence = suggestion.confidence
-                rule.ai_processed_at = datetime.now(timezone.utc)
-
-                if request.auto_apply and suggestion.confidence >= request.confidence_threshold:
-                    rule.counterparty_account_id = suggestion.suggested_counterparty_id
-                    auto_applied += 1
-                else:
-                    suggestion_count += 1
-
-                internal.enhancement_rule_repository.save(rule)
-
-            return AISuggestCategoriesResponse(
-                processed=processed,
-                auto_applied=auto_applied,
-                suggestions=suggestion_count,
-                failed=failed,
-            )
+            summary = _run_suggestions(internal.rule_suggestion_service.suggest_counterparties, current_user.id, request)
+            return AISuggestCategoriesResponse(**summary.to_dict())
 
         except Exception as e:
             raise HTTPException(
@@ -0,0 +1,41 @@
+import secrets
+from datetime import datetime, timezone
+from typing import Callable, Iterator
+
+from fastapi import Depends, FastAPI, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.dependencies import InternalDependencies
+from app.core.metrics import BACKGROUND_JOBS_OLDEST_AGE, BACKGROUND_JOBS_QUEUE_DEPTH, REGISTRY
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def update_job_queue_metrics(internal: InternalDependencies) -> None:
+    # created_at is stored as naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    BACKGROUND_JOBS_QUEUE_DEPTH.clear()
+    BACKGROUND_JOBS_OLDEST_AGE.clear()
+    for job_type, job_status, count, oldest_created_at in internal.background_job_repository.get_queue_stats():
+        labels = {"job_type": job_type.value, "status": job_status.value}
+        BACKGROUND_JOBS_QUEUE_DEPTH.set(count, **labels)
+        age = (now - oldest_created_at.replace(tzinfo=None)).total_seconds() if oldest_created_at else 0
+        BACKGROUND_JOBS_OLDEST_AGE.set(max(age, 0), **labels)
+
+
+def register_metrics_routes(
+    app: FastAPI,
+    provide_dependencies: Callable[[], Iterator[InternalDependencies]],
+):
+    def require_metrics_token(authorization: str = Header(default="")) -> None:
+        # Route and latency data is not public: without a token the endpoint does not exist
+        if not settings.METRICS_TOKEN:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        if not secrets.compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+    def metrics(internal: InternalDependencies = Depends(provide_dependencies)):
+        update_job_queue_metrics(internal)
+        return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,8 +1,12 @@
+import json
 import logging
 from typing import Callable, Iterator, List
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, FastAPI, File, HTTPException, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.responses import StreamingResponse
 
 from app.api.errors import AppException
 from app.api.routes.auth import require_current_user
@@ -14,6 +18,7 @@ from app.api.schemas import (
     FilterPreviewResponse,
     JobStatusResponse,
     StatementAnalysisResponse,
+    StatementImportJobResponse,
     StatementResponse,
     StatementUploadRequest,
     StatementUploadResponse,
@@ -34,6 +39,11 @@ from app.services.subscription import Feature
 
 logger = logging.getLogger("app")
 
+DOWNLOAD_MEDIA_TYPES = {
+    "CSV": "text/csv",
+    "XLSX": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
 
 def register_statement_routes(
     app: FastAPI,
@@ -183,10 +193,13 @@ def register_statement_routes(
                 detail=f"Error previewing statistics: {str(e)}",
             )
 
-    @router.post("/upload", response_model=StatementUploadResponse)
+    @router.post(
+        "/upload",
+        response_model=StatementUploadResponse,
+        responses={status.HTTP_202_ACCEPTED: {"model": StatementImportJobResponse}},
+    )
     async def upload_statement(
         upload_data: StatementUploadRequest,
-        background_tasks: BackgroundTasks,
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
     ):
@@ -200,11 +213,28 @@ def register_statement_routes(
                     detail=f"Account with ID {upload_data.account_id} not found",
                 )
 
+            if upload_data.async_processing and internal.statement_upload_service.should_import_async(upload_data):
+                job = internal.statement_upload_service.queue_statement_import(
+                    user_id=current_user.id,
+                    upload_data=upload_data,
+                )
+                job_url = f"{settings.API_V1_STR}/transactions/categorization-jobs/{job.id}"
+                accepted = StatementImportJobResponse(
+                    job_id=job.id,
+                    status=job.status,
+                    uploaded_file_id=upload_data.uploaded_file_id,
+                    status_url=f"{job_url}/status",
+                    events_url=f"{job_url}/events",
+                )
+                return JSONResponse(
+                    status_code=status.HTTP_202_ACCEPTED,
+                    content=jsonable_encoder(accepted),
+                    headers={"Location": accepted.status_url},
+                )
+
             result = internal.statement_upload_service.upload_statement(
                 user_id=current_user.id,
                 upload_data=upload_data,
-                background_tasks=background_tasks,
-                internal_deps=internal,
             )
 
             dropped_rows_response = [
@@ -292,6 +322,23 @@ def register_statement_routes(
                 detail=f"Error listing statements: {str(e)}",
             )
 
+    @router.get("/{statement_id}/download")
+    def download_statement(
+        statement_id: UUID,
+        internal: InternalDependencies = Depends(provide_dependencies),
+        current_user: User = Depends(require_current_user),
+    ):
+        download = internal.statement_service.download_statement(statement_id, current_user.id)
+        filename = download.filename.replace('"', "")
+        return StreamingResponse(
+            download.chunks,
+            media_type=DOWNLOAD_MEDIA_TYPES.get(download.file_type, "application/octet-stream"),
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(download.size),
+            },
+        )
+
     @router.delete("/{statement_id}")
     async def delete_statement(
         statement_id: UUID,
@@ -319,7 +366,7 @@ def register_transaction_job_routes(
         current_user: User = Depends(require_current_user),
     ):
         try:
-            job_status = internal.background_job_service.get_job_status_for_api(job_id)
+            job_status = internal.background_job_service.get_job_status_for_api(job_id, current_user.id)
 
             if not job_status:
                 raise HTTPException(
@@ -338,4 +385,34 @@ def register_transaction_job_routes(
                 detail=f"Error retrieving job status: {str(e)}",
             )
 
+    @router.get("/categorization-jobs/{job_id}/events")
+    async def stream_job_events(
+        job_id: UUID,
+        internal: InternalDependencies = Depends(provide_dependencies),
+        current_user: User = Depends(require_current_user),
+    ):
+        if not internal.background_job_service.get_job_status_for_api(job_id, current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job with ID {job_id} not found",
+            )
+
+        async def generate():
+            try:
+                async for job_status in internal.background_job_service.stream_job_status(job_id, current_user.id):
+                    yield f"data: {JobStatusResponse.model_validate(job_status).model_dump_json()}\n\n"
+            except Exception as e:
+                log_exception("Error streaming job status: %s", str(e))
+                yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+        return StreamingResponse(
+            generate(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     app.include_router(router, prefix=settings.API_V1_STR)
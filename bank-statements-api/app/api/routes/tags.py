@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, FastAPI, status
 
 from app.api.routes.auth import require_current_user
+from app.api.routes.conditional_get import ConditionalGetRoute, not_modified_guard
 from app.api.schemas import BulkTagRequest, BulkTagResponse, TagCreate, TagListResponse, TagResponse, TransactionResponse
 from app.core.config import settings
 from app.core.dependencies import InternalDependencies
@@ -14,9 +15,10 @@ def register_tag_routes(
     app: FastAPI,
     provide_dependencies: Callable[[], Iterator[InternalDependencies]],
 ):
-    tag_router = APIRouter(prefix="/tags", tags=["tags"])
+    tag_router = APIRouter(prefix="/tags", tags=["tags"], route_class=ConditionalGetRoute)
+    not_modified = not_modified_guard(provide_dependencies)
 
-    @tag_router.get("", response_model=TagListResponse)
+    @tag_router.get("", response_model=TagListResponse, dependencies=[Depends(not_modified)])
     def get_tags(
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
@@ -7,7 +7,9 @@ from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from starlette import status as http_status
 
+from app.api.responses import FastJSONResponse
 from app.api.routes.auth import require_current_user
+from app.api.routes.conditional_get import ConditionalGetRoute, not_modified_guard
 from app.api.routes.feature_gate import require_feature
 from app.api.schemas import (
     BulkCategorizeByIdsRequest,
@@ -45,7 +47,8 @@ def register_transaction_routes(
     app: FastAPI,
     provide_dependencies: Callable[[], Iterator[InternalDependencies]],
 ):
-    router = APIRouter(prefix="/transactions", tags=["transactions"])
+    router = APIRouter(prefix="/transactions", tags=["transactions"], route_class=ConditionalGetRoute)
+    not_modified = not_modified_guard(provide_dependencies)
 
     @router.post(
         "",
@@ -75,7 +78,7 @@ def register_transaction_routes(
         )
         return transaction
 
-    @router.get("", response_model=TransactionListResponse)
+    @router.get("", response_model=TransactionListResponse, dependencies=[Depends(not_modified)])
     def get_transactions(
         page: int = Query(1, ge=1, description="Page number (1-based)"),
         page_size: int = Query(
@@ -148,6 +151,10 @@ def register_transaction_routes(
             None,
             description="Filter by exclude_from_analytics flag",
         ),
+        fast: bool = Query(
+            False,
+            description="Serialise rows directly with the fast JSON encoder, skipping model validation",
+        ),
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
     ):
@@ -211,6 +218,31 @@ def register_transaction_routes(
                     detail="Invalid tag IDs format",
                 )
 
+        if fast:
+            payload = internal.transaction_service.get_transactions_page_payload(
+                user_id=current_user.id,
+                page=page,
+                page_size=page_size,
+                category_ids=parsed_category_ids,
+                status=status,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                description_search=description_search,
+                account_id=account_id,
+                start_date=start_date,
+                end_date=end_date,
+                include_running_balance=include_running_balance,
+                sort_field=sort_field,
+                sort_direction=sort_direction,
+                exclude_transfers=exclude_transfers,
+                exclude_uncategorized=exclude_uncategorized,
+                transaction_type=transaction_type,
+                transaction_ids=parsed_transaction_ids,
+                tag_ids=parsed_tag_ids,
+                exclude_from_analytics=exclude_from_analytics,
+            )
+            return FastJSONResponse(payload)
+
         transactions = internal.transaction_service.get_transactions_paginated(
             user_id=current_user.id,
             page=page,
@@ -281,20 +313,7 @@ def register_transaction_routes(
             include_running_balance=include_running_balance,
         )
 
-        all_categories = internal.category_repository.get_all(current_user.id)
-        category_names = {c.id: c.name for c in all_categories}
-        category_parents = {c.id: c.parent_id for c in all_categories}
-
-        def get_full_category_name(category_id: UUID) -> str:
-            if category_id not in category_names:
-                return ""
-            name = category_names[category_id]
-            parent_id = category_parents.get(category_id)
-            if parent_id and parent_id in category_names:
-                return f"{category_names[parent_id]} > {name}"
-            return name
-
-        categories = {c.id: get_full_category_name(c.id) for c in all_categories}
+        category_tree = internal.category_service.get_category_tree(current_user.id)
         accounts = {a.id: a.name for a in internal.account_repository.get_all(current_user.id)}
 
         def escape_csv(value: str) -> str:
@@ -309,7 +328,7 @@ def register_transaction_routes(
             rows = ["Date,Description,Amount,Category,Account\n"]
 
         for trx in response.transactions:
-            category_name = categories.get(trx.category_id, "") if trx.category_id else ""
+            category_name = category_tree.full_name(trx.category_id)
             account_name = accounts.get(trx.account_id, "") if trx.account_id else ""
             row = (
                 f"{trx.date},{escape_csv(trx.description)},{trx.amount},{escape_csv(category_name)},{escape_csv(account_name)}"
@@ -329,6 +348,7 @@ def register_transaction_routes(
     @router.get(
         "/category-totals",
         response_model=CategoryTotalsResponse,
+        dependencies=[Depends(not_modified)],
     )
     def get_category_totals(
         category_ids: Optional[str] = Query(
@@ -366,6 +386,10 @@ def register_transaction_routes(
             None,
             description="Filter by transaction type: 'debit', 'credit', or 'all'",
         ),
+        fast: bool = Query(
+            False,
+            description="Serialise rows directly with the fast JSON encoder, skipping model validation",
+        ),
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
     ):
@@ -394,6 +418,20 @@ def register_transaction_routes(
             transaction_type=transaction_type,
         )
 
+        if fast:
+            return FastJSONResponse(
+                {
+                    "totals": [
+                        {
+                            "category_id": category_id,
+                            "total_amount": float(values["total_amount"]),
+                            "transaction_count": int(values["transaction_count"]),
+                        }
+                        for category_id, values in totals_dict.items()
+                    ]
+                }
+            )
+
         totals = [
             CategoryTotalResponse(
                 category_id=category_id,
@@ -408,6 +446,7 @@ def register_transaction_routes(
     @router.get(
         "/category-time-series",
         response_model=CategoryTimeSeriesResponse,
+        dependencies=[Depends(not_modified)],
     )
     def get_category_time_series(
         category_id: Optional[UUID] = Query(
@@ -450,6 +489,10 @@ def register_transaction_routes(
             None,
             description="Filter by transaction type: 'debit', 'credit', or 'all'",
         ),
+        fast: bool = Query(
+            False,
+            description="Serialise rows directly with the fast JSON encoder, skipping model validation",
+        ),
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
     ):
@@ -480,6 +523,21 @@ def register_transaction_routes(
             transaction_type=transaction_type,
         )
 
+        if fast:
+            return FastJSONResponse(
+                {
+                    "data_points": [
+                        {
+                            "period": dp["period"],
+                            "category_id": dp["category_id"],
+                            "total_amount": float(dp["total_amount"]),
+                            "transaction_count": dp["transaction_count"],
+                        }
+                        for dp in data_points
+                    ]
+                }
+            )
+
         response_data_points = [
             CategoryTimeSeriesDataPoint(
                 period=dp["period"],
@@ -495,6 +553,7 @@ def register_transaction_routes(
     @router.get(
         "/income-spending-time-series",
         response_model=IncomeSpendingResponse,
+        dependencies=[Depends(not_modified)],
     )
     def get_income_spending_time_series(
         period: str = Query("month", description="Time period: 'month', 'week', or 'day'"),
@@ -503,6 +562,10 @@ def register_transaction_routes(
         end_date: Optional[date] = Query(None, description="Filter to this date"),
         exclude_transfers: Optional[bool] = Query(True, description="Exclude transfers between accounts"),
         exclude_uncategorized: Optional[bool] = Query(False, description="Exclude uncategorized transactions"),
+        fast: bool = Query(
+            False,
+            description="Serialise rows directly with the fast JSON encoder, skipping model validation",
+        ),
         internal: InternalDependencies = Depends(provide_dependencies),
         current_user: User = Depends(require_current_user),
     ):
@@ -515,6 +578,21 @@ def register_transaction_routes(
             exclude_transfers=exclude_transfers,
             exclude_uncategorized=exclude_uncategorized,
         )
+        if fast:
+            return FastJSONResponse(
+                {
+                    "data_points": [
+                        {
+                            **dp,
+                            "income": float(dp["income"]),
+                            "spending": float(dp["spending"]),
+                            "net": float(dp["net"]),
+                        }
+                        for dp in data_points
+                    ]
+                }
+            )
+
         return IncomeSpendingResponse(data_points=[IncomeSpendingDataPoint(**dp) for dp in data_points])
 
     @router.get(
@@ -531,30 +609,13 @@ def register_transaction_routes(
     ):
         require_feature(internal.subscription_service, current_user.id, Feature.AI_PATTERNS)
 
-        from dateutil.relativedelta import relativedelta
-
-        lookback_start = date.today() - relativedelta(months=36)
-
-        transactions_response = internal.transaction_service.get_transactions_paginated(
-            user_id=current_user.id,
-            page=1,
-            page_size=10000,
-            start_date=lookback_start,
-            exclude_transfers=True,
-            transaction_type="debit",
-        )
-
-        result = internal.recurring_expense_analyzer.analyze_patterns(
-            transactions_response.transactions,
-            user_id=current_user.id,
-            active_only=active_only,
-        )
-
-        patterns_response = [RecurringPatternResponse(**pattern.to_dict()) for pattern in result.patterns]
+        view = internal.recurring_pattern_service.get_patterns(current_user.id, active_only=active_only)
 
         return RecurringPatternsResponse(
-            patterns=patterns_response,
-            summary=result.to_dict()["summary"],
+            patterns=[RecurringPatternResponse(**pattern) for pattern in view.patterns],
+            summary=view.summary,
+            computed_at=view.computed_at,
+            stale=view.stale,
         )
 
     @router.post(
@@ -414,6 +414,8 @@ class StatementUploadRequest(BaseModel):
     header_row_index: int
     data_start_row_index: int
     row_filters: Optional[RowFilterRequest] = None
+    # Let the server import large files in the background and answer 202 with a job
+    async_processing: bool = False
 
 
 class StatisticsPreviewRequest(BaseModel):
@@ -475,6 +477,16 @@ class StatementUploadResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class StatementImportJobResponse(BaseModel):
+    """Response for an upload queued as a background import"""
+
+    job_id: UUID
+    status: JobStatus
+    uploaded_file_id: str
+    status_url: str
+    events_url: str
+
+
 class StatementUploadResult(BaseModel):
     uploaded_file_id: str
     transactions_saved: int
@@ -557,6 +569,8 @@ class JobProgressResponse(BaseModel):
     remaining_transactions: int
     completion_percentage: float
     estimated_completion_seconds: Optional[int] = None
+    phase: Optional[str] = None
+    duplicate_transactions: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -568,6 +582,8 @@ class JobResultResponse(BaseModel):
     successfully_categorized: int
     failed_categorizations: int
     processing_time_ms: int
+    transactions_saved: Optional[int] = None
+    duplicated_transactions: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -759,6 +775,8 @@ class RecurringPatternsSummary(BaseModel):
 class RecurringPatternsResponse(BaseModel):
     patterns: List[RecurringPatternResponse]
     summary: RecurringPatternsSummary
+    computed_at: Optional[datetime] = None
+    stale: bool = False
 
 
 class DescriptionGroupMemberResponse(BaseModel):
@@ -871,6 +889,7 @@ class AISuggestCategoriesRequest(BaseModel):
     rule_ids: Optional[List[UUID]] = None
     confidence_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
     auto_apply: bool = False
+    background: bool = False
 
 
 class AISuggestCategoriesResponse(BaseModel):
@@ -883,6 +902,15 @@ class AISuggestCategoriesResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AISuggestionJobResponse(BaseModel):
+    """Response for a rule suggestion run queued as a background job"""
+
+    job_id: UUID
+    status: JobStatus
+    status_url: str
+    events_url: str
+
+
 class AIApplySuggestionRequest(BaseModel):
     apply_to_transactions: bool = False
 
@@ -9,6 +9,7 @@ from app.api.routes.chat import register_chat_routes
 from app.api.routes.description_groups import register_description_group_routes
 from app.api.routes.enhancement_rules import register_enhancement_rule_routes
 from app.api.routes.filter_presets import register_filter_preset_routes
+from app.api.routes.metrics import register_metrics_routes
 from app.api.routes.saved_filters import register_saved_filter_routes
 from app.api.routes.statements import register_statement_routes, register_transaction_job_routes
 from app.api.routes.subscription import register_subscription_routes
@@ -45,3 +46,4 @@ def register_app_routes(
     register_subscription_routes(app, provide_dependencies)
     register_chat_routes(app, provide_dependencies)
     register_tag_routes(app, provide_dependencies)
+    register_metrics_routes(app, provide_dependencies)
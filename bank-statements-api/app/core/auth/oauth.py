@@ -1,11 +1,13 @@
-from authlib.integrations.starlette_client import OAuth
+from functools import lru_cache
 
 from app.core.config import settings
 
-oauth = OAuth()
-
 
+@lru_cache(maxsize=1)
 def get_google_oauth_client():
+    from authlib.integrations.starlette_client import OAuth
+
+    oauth = OAuth()
     oauth.register(
         name="google",
         client_id=settings.GOOGLE_OAUTH_CLIENT_ID,
@@ -30,8 +30,43 @@ class Settings(BaseSettings):
     API_BASE_URL: str = os.getenv("API_BASE_URL", "http://localhost:8000")
     WEB_BASE_URL: str = os.getenv("WEB_BASE_URL", "http://localhost:5173")
 
+    # Responses at least this large are gzip/br compressed
+    RESPONSE_COMPRESSION_MIN_BYTES: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+
+    # Uploads that ask for async processing are imported by the job worker from this size up
+    STATEMENT_ASYNC_UPLOAD_MIN_BYTES: int = int(os.getenv("STATEMENT_ASYNC_UPLOAD_MIN_BYTES", "1000000"))
+
+    # Raw statement files are stored once per distinct content, zstd compressed,
+    # in the database (DATABASE) or under BLOB_STORE_PATH (FILESYSTEM)
+    BLOB_STORAGE: str = os.getenv("BLOB_STORAGE", "DATABASE")
+    BLOB_STORE_PATH: str = os.getenv("BLOB_STORE_PATH", "")
+    BLOB_COMPRESSION_LEVEL: int = int(os.getenv("BLOB_COMPRESSION_LEVEL", "3"))
+    # Unreferenced blobs are kept this long before the cleanup job deletes them
+    BLOB_CLEANUP_GRACE_HOURS: int = int(os.getenv("BLOB_CLEANUP_GRACE_HOURS", "24"))
+
+    # The storage retention job deletes uploads no pending import needs once they are
+    # this old, and finished background jobs this long after they completed
+    UPLOAD_RETENTION_HOURS: int = int(os.getenv("UPLOAD_RETENTION_HOURS", "24"))
+    JOB_RETENTION_DAYS: int = int(os.getenv("JOB_RETENTION_DAYS", "7"))
+
+    # /metrics requires "Authorization: Bearer <token>"; it answers 404 when no token is set
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+
     # LLM settings
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "")
+    # Per-provider limits shared by all LLM calls in a process
+    LLM_REQUESTS_PER_MINUTE: int = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "50"))
+    LLM_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_TOKENS_PER_MINUTE", "40000"))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+    LLM_REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "30"))
+    LLM_MAX_ATTEMPTS: int = int(os.getenv("LLM_MAX_ATTEMPTS", "4"))
+    # Send slow prompts to a second provider as well; empty disables hedging
+    LLM_HEDGE_PROVIDER: str = os.getenv("LLM_HEDGE_PROVIDER", "")
+    LLM_HEDGE_AFTER_SECONDS: float = float(os.getenv("LLM_HEDGE_AFTER_SECONDS", "8"))
+    LLM_CACHE_TTL_DAYS: int = int(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+    # Rules matched locally at or above this confidence skip the LLM
+    SIMILARITY_MIN_CONFIDENCE: float = float(os.getenv("SIMILARITY_MIN_CONFIDENCE", "0.85"))
+    SIMILARITY_TRAINING_LIMIT: int = int(os.getenv("SIMILARITY_TRAINING_LIMIT", "20000"))
 
     # API Keys
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
@@ -1,9 +1,39 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CHECKOUTS,
+    REGISTRY,
+    pool_status_collector,
+)
+from app.core.query_stats import install_query_instrumentation
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, poolclass=MeteredQueuePool)
+install_query_instrumentation(engine)
+event.listen(engine, "checkout", lambda *_: DB_POOL_CHECKOUTS.inc())
+REGISTRY.add_collector(pool_status_collector(engine))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -1,16 +1,21 @@
 import logging
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Generator, Optional
 
 from sqlalchemy.orm import Session
 
+from app.adapters.blob_store import FilesystemBlobStore
 from app.adapters.repositories.account import SQLAlchemyAccountRepository
 from app.adapters.repositories.background_job import SQLAlchemyBackgroundJobRepository
 from app.adapters.repositories.category import SQLAlchemyCategoryRepository
 from app.adapters.repositories.description_group import SQLAlchemyDescriptionGroupRepository
 from app.adapters.repositories.enhancement_rule import SQLAlchemyEnhancementRuleRepository
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository
 from app.adapters.repositories.filter_preset import SQLAlchemyFilterPresetRepository
 from app.adapters.repositories.initial_balance import SQLAlchemyInitialBalanceRepository
+from app.adapters.repositories.llm_result_cache import SQLAlchemyLLMResultCacheRepository
+from app.adapters.repositories.recurring_pattern_snapshot import SQLAlchemyRecurringPatternSnapshotRepository
 from app.adapters.repositories.saved_filter import SQLAlchemySavedFilterRepository
 from app.adapters.repositories.statement import SqlAlchemyStatementRepository
 from app.adapters.repositories.subscription import SQLAlchemySubscriptionRepository, SQLAlchemySubscriptionUsageRepository
@@ -18,21 +23,32 @@ from app.adapters.repositories.tag import SQLAlchemyTagRepository
 from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
 from app.adapters.repositories.uploaded_file import SQLAlchemyFileAnalysisMetadataRepository, SQLAlchemyUploadedFileRepository
 from app.adapters.repositories.user import SQLAlchemyUserRepository
+from app.adapters.repositories.user_data_version import SQLAlchemyUserDataVersionRepository
 from app.adapters.stripe import StripeSDKClient
+from app.ai.hedged_client import HedgedLLMClient
 from app.ai.llm_client import LLMClient
 from app.ai.noop_llm import NoopLLMClient
+from app.ai.resilience import RetryPolicy
 from app.core.config import settings
 from app.core.database import SessionLocal
+from app.domain.models.file_blob import BlobStorage
 from app.services.account import AccountService
 from app.services.ai import LLMRuleCategorizer, LLMRuleCounterparty
+from app.services.ai.llm_batch_runner import LLMBatchRunner
 from app.services.ai.llm_category_generator import LLMCategoryGenerator
+from app.services.ai.llm_result_cache import LLMResultCache
+from app.services.ai.rule_suggestion import RuleSuggestionService
+from app.services.ai.similarity_categorizer import SimilarityRuleCategorizer
 from app.services.background.background_job_service import BackgroundJobService
 from app.services.category import CategoryService
 from app.services.chat import ChatService
 from app.services.description_group import DescriptionGroupService
 from app.services.enhancement_rule_management import EnhancementRuleManagementService
+from app.services.file_blob import FileBlobService
 from app.services.initial_balance_service import InitialBalanceService
 from app.services.recurring_expense_analyzer import RecurringExpenseAnalyzer
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
+from app.services.retention import RetentionService
 from app.services.schema_detection.heuristic_schema_detector import HeuristicSchemaDetector
 from app.services.statement import StatementService
 from app.services.statement_processing.file_type_detector import StatementFileTypeDetector
@@ -50,6 +66,34 @@ from app.services.transaction_rule_enhancement import TransactionRuleEnhancement
 logger = logging.getLogger(__name__)
 
 
+_LLM_PROVIDERS = {
+    "anthropic": ("ANTHROPIC_API_KEY", "AnthropicAI", "app.ai.anthropic_ai"),
+    "groq": ("GROQ_API_KEY", "GroqAI", "app.ai.groq_ai"),
+    "gemini": ("GEMINI_API_KEY", "GeminiAI", "app.ai.gemini_ai"),
+}
+
+_shared_llm_client: Optional[LLMClient] = None
+
+
+def _provider_client(provider: str) -> LLMClient:
+    import importlib
+
+    _, class_name, module_path = _LLM_PROVIDERS[provider]
+    module = importlib.import_module(module_path)
+    cls = getattr(module, class_name)
+    logger.info("Using %s LLM client", class_name)
+    return cls(
+        retry_policy=RetryPolicy(
+            max_attempts=settings.LLM_MAX_ATTEMPTS,
+            timeout_seconds=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+        )
+    )
+
+
+def _has_api_key(provider: str) -> bool:
+    return bool(getattr(settings, _LLM_PROVIDERS[provider][0]))
+
+
 def _create_llm_client() -> LLMClient:
     if settings.E2E_TEST_MODE:
         logger.info("Using NoopLLMClient (E2E_TEST_MODE)")
@@ -57,36 +101,35 @@ def _create_llm_client() -> LLMClient:
 
     provider = settings.LLM_PROVIDER.lower()
 
-    providers = {
-        "anthropic": (settings.ANTHROPIC_API_KEY, "AnthropicAI", "app.ai.anthropic_ai"),
-        "groq": (settings.GROQ_API_KEY, "GroqAI", "app.ai.groq_ai"),
-        "gemini": (settings.GEMINI_API_KEY, "GeminiAI", "app.ai.gemini_ai"),
-    }
-
     if provider:
-        if provider not in providers:
-            raise ValueError(f"Unknown LLM_PROVIDER: {provider}. Must be one of: {', '.join(providers)}")
-        api_key, class_name, module_path = providers[provider]
-        if not api_key:
+        if provider not in _LLM_PROVIDERS:
+            raise ValueError(f"Unknown LLM_PROVIDER: {provider}. Must be one of: {', '.join(_LLM_PROVIDERS)}")
+        if not _has_api_key(provider):
             raise ValueError(f"LLM_PROVIDER is {provider} but no API key is set")
-        import importlib
+    else:
+        provider = next((name for name in _LLM_PROVIDERS if _has_api_key(name)), "")
+        if not provider:
+            logger.warning("Using NoopLLMClient (no API key set)")
+            return NoopLLMClient()
+
+    client = _provider_client(provider)
 
-        module = importlib.import_module(module_path)
-        cls = getattr(module, class_name)
-        logger.info("Using %s LLM client", class_name)
-        return cls()
+    hedge_provider = settings.LLM_HEDGE_PROVIDER.lower()
+    if hedge_provider and hedge_provider != provider:
+        if hedge_provider not in _LLM_PROVIDERS or not _has_api_key(hedge_provider):
+            raise ValueError(f"LLM_HEDGE_PROVIDER is {hedge_provider} but it is unknown or has no API key")
+        logger.info("Hedging slow %s calls to %s after %ss", provider, hedge_provider, settings.LLM_HEDGE_AFTER_SECONDS)
+        client = HedgedLLMClient(client, _provider_client(hedge_provider), settings.LLM_HEDGE_AFTER_SECONDS)
 
-    for name, (api_key, class_name, module_path) in providers.items():
-        if api_key:
-            import importlib
+    return client
 
-            module = importlib.import_module(module_path)
-            cls = getattr(module, class_name)
-            logger.info("Using %s LLM client (auto-detected)", class_name)
-            return cls()
 
-    logger.warning("Using NoopLLMClient (no API key set)")
-    return NoopLLMClient()
+def get_llm_client() -> LLMClient:
+    """The process-wide LLM client, so its HTTP connections are reused across requests and jobs"""
+    global _shared_llm_client
+    if _shared_llm_client is None:
+        _shared_llm_client = _create_llm_client()
+    return _shared_llm_client
 
 
 class ExternalDependencies:
@@ -96,7 +139,7 @@ class ExternalDependencies:
         llm_client: Optional[LLMClient] = None,
     ):
         self.db: Session = db if db is not None else SessionLocal()
-        self.llm_client: LLMClient = llm_client if llm_client is not None else _create_llm_client()
+        self.llm_client: LLMClient = llm_client if llm_client is not None else get_llm_client()
 
     def cleanup(self):
         try:
@@ -127,15 +170,20 @@ class InternalDependencies:
         category_repository: SQLAlchemyCategoryRepository,
         account_repository: SQLAlchemyAccountRepository,
         recurring_expense_analyzer: RecurringExpenseAnalyzer,
+        recurring_pattern_service: RecurringPatternSnapshotService,
         description_group_service: DescriptionGroupService,
         saved_filter_repository: SQLAlchemySavedFilterRepository,
         filter_preset_repository: SQLAlchemyFilterPresetRepository,
         llm_rule_categorizer: LLMRuleCategorizer,
         llm_rule_counterparty: LLMRuleCounterparty,
+        rule_suggestion_service: RuleSuggestionService,
         llm_category_generator: LLMCategoryGenerator,
         subscription_service: SubscriptionService,
         chat_service: ChatService,
         tag_service: TagService,
+        user_data_version_repository: SQLAlchemyUserDataVersionRepository,
+        file_blob_service: FileBlobService,
+        retention_service: RetentionService,
     ):
         self.transaction_service = transaction_service
         self.category_service = category_service
@@ -154,15 +202,20 @@ class InternalDependencies:
         self.category_repository = category_repository
         self.account_repository = account_repository
         self.recurring_expense_analyzer = recurring_expense_analyzer
+        self.recurring_pattern_service = recurring_pattern_service
         self.description_group_service = description_group_service
         self.saved_filter_repository = saved_filter_repository
         self.filter_preset_repository = filter_preset_repository
         self.llm_rule_categorizer = llm_rule_categorizer
         self.llm_rule_counterparty = llm_rule_counterparty
+        self.rule_suggestion_service = rule_suggestion_service
         self.llm_category_generator = llm_category_generator
         self.subscription_service = subscription_service
         self.chat_service = chat_service
         self.tag_service = tag_service
+        self.user_data_version_repository = user_data_version_repository
+        self.file_blob_service = file_blob_service
+        self.retention_service = retention_service
 
 
 def build_external_dependencies() -> ExternalDependencies:
@@ -188,28 +241,56 @@ def build_internal_dependencies(
     subscription_repo = SQLAlchemySubscriptionRepository(external.db)
     subscription_usage_repo = SQLAlchemySubscriptionUsageRepository(external.db)
     user_repo = SQLAlchemyUserRepository(external.db)
+    user_data_version_repo = SQLAlchemyUserDataVersionRepository(external.db)
+    llm_result_cache = LLMResultCache(
+        SQLAlchemyLLMResultCacheRepository(external.db),
+        ttl=timedelta(days=settings.LLM_CACHE_TTL_DAYS),
+    )
 
     file_type_detector = StatementFileTypeDetector()
     statement_parser = StatementParser()
     # schema_detector = LLMSchemaDetector(external.llm_client)
     schema_detector = HeuristicSchemaDetector()
     transaction_normalizer = TransactionNormalizer()
-    category_service = CategoryService(category_repo)
+    category_service = CategoryService(category_repo, llm_result_cache, user_data_version_repository=user_data_version_repo)
     account_service = AccountService(account_repo)
     initial_balance_service = InitialBalanceService(initial_balance_repo)
-    statement_service = StatementService(statement_repo, transaction_repo)
+    file_blob_service = FileBlobService(
+        SQLAlchemyFileBlobRepository(external.db),
+        storage=BlobStorage(settings.BLOB_STORAGE.upper()),
+        filesystem=FilesystemBlobStore(settings.BLOB_STORE_PATH) if settings.BLOB_STORE_PATH else None,
+        compression_level=settings.BLOB_COMPRESSION_LEVEL,
+        cleanup_grace=timedelta(hours=settings.BLOB_CLEANUP_GRACE_HOURS),
+    )
     transaction_enhancer = TransactionEnhancer()
 
+    background_job_service = BackgroundJobService(background_job_repo)
+
+    recurring_expense_analyzer = RecurringExpenseAnalyzer(description_group_repository=description_group_repo)
+    recurring_pattern_service = RecurringPatternSnapshotService(
+        snapshot_repository=SQLAlchemyRecurringPatternSnapshotRepository(external.db),
+        transaction_repository=transaction_repo,
+        analyzer=recurring_expense_analyzer,
+        user_data_version_repository=user_data_version_repo,
+        background_job_service=background_job_service,
+    )
+    statement_service = StatementService(
+        statement_repo,
+        transaction_repo,
+        file_blob_service,
+        recurring_pattern_service=recurring_pattern_service,
+    )
+
     transaction_service = TransactionService(
         transaction_repo,
         initial_balance_repo,
         enhancement_rule_repo,
         transaction_enhancer,
         category_repo,
+        recurring_pattern_service=recurring_pattern_service,
+        user_data_version_repository=user_data_version_repo,
     )
 
-    background_job_service = BackgroundJobService(background_job_repo)
-
     transaction_rule_enhancement_service = TransactionRuleEnhancementService(
         transaction_enhancer=transaction_enhancer,
         enhancement_rule_repository=enhancement_rule_repo,
@@ -233,6 +314,7 @@ def build_internal_dependencies(
         uploaded_file_repo=uploaded_file_repo,
         file_analysis_metadata_repo=file_analysis_metadata_repo,
         transaction_repo=transaction_repo,
+        file_blobs=file_blob_service,
         row_filter_service=row_filter_service,
     )
 
@@ -246,23 +328,43 @@ def build_internal_dependencies(
         statement_repo=statement_repo,
         transaction_repo=transaction_repo,
         background_job_service=background_job_service,
+        file_blobs=file_blob_service,
         row_filter_service=row_filter_service,
+        async_import_min_bytes=settings.STATEMENT_ASYNC_UPLOAD_MIN_BYTES,
+        recurring_pattern_service=recurring_pattern_service,
     )
 
-    recurring_expense_analyzer = RecurringExpenseAnalyzer(description_group_repository=description_group_repo)
-    description_group_service = DescriptionGroupService(description_group_repo)
+    description_group_service = DescriptionGroupService(description_group_repo, recurring_pattern_service)
     llm_rule_categorizer = LLMRuleCategorizer(
         categories_repository=category_repo,
         llm_client=external.llm_client,
+        batch_runner=LLMBatchRunner(external.llm_client, max_concurrency=settings.LLM_MAX_CONCURRENCY),
+        result_cache=llm_result_cache,
     )
     llm_rule_counterparty = LLMRuleCounterparty(
         account_repository=account_repo,
         llm_client=external.llm_client,
+        batch_runner=LLMBatchRunner(external.llm_client, max_concurrency=settings.LLM_MAX_CONCURRENCY),
+        result_cache=llm_result_cache,
+    )
+    rule_suggestion_service = RuleSuggestionService(
+        enhancement_rule_management_service=enhancement_rule_management_service,
+        enhancement_rule_repository=enhancement_rule_repo,
+        category_repository=category_repo,
+        llm_rule_categorizer=llm_rule_categorizer,
+        llm_rule_counterparty=llm_rule_counterparty,
+        background_job_service=background_job_service,
+        similarity_categorizer=SimilarityRuleCategorizer(
+            transaction_repo,
+            min_confidence=settings.SIMILARITY_MIN_CONFIDENCE,
+            training_limit=settings.SIMILARITY_TRAINING_LIMIT,
+        ),
     )
     llm_category_generator = LLMCategoryGenerator(
         category_repository=category_repo,
         transaction_repository=transaction_repo,
         llm_client=external.llm_client,
+        result_cache=llm_result_cache,
     )
     stripe_client = StripeSDKClient(
         api_key=settings.STRIPE_SECRET_KEY,
@@ -289,7 +391,17 @@ def build_internal_dependencies(
         transaction_service=transaction_service,
         category_service=category_service,
         account_service=account_service,
-        recurring_analyzer=recurring_expense_analyzer,
+        recurring_pattern_service=recurring_pattern_service,
+        user_data_version_repository=user_data_version_repo,
+    )
+
+    retention_service = RetentionService(
+        uploaded_file_repo,
+        background_job_repo,
+        file_blob_service,
+        llm_result_cache=llm_result_cache,
+        upload_retention=timedelta(hours=settings.UPLOAD_RETENTION_HOURS),
+        job_retention=timedelta(days=settings.JOB_RETENTION_DAYS),
     )
 
     return InternalDependencies(
@@ -310,15 +422,20 @@ def build_internal_dependencies(
         category_repository=category_repo,
         account_repository=account_repo,
         recurring_expense_analyzer=recurring_expense_analyzer,
+        recurring_pattern_service=recurring_pattern_service,
         description_group_service=description_group_service,
         saved_filter_repository=saved_filter_repo,
         filter_preset_repository=filter_preset_repo,
         llm_rule_categorizer=llm_rule_categorizer,
         llm_rule_counterparty=llm_rule_counterparty,
+        rule_suggestion_service=rule_suggestion_service,
         llm_category_generator=llm_category_generator,
         subscription_service=subscription_service,
         chat_service=chat_service,
         tag_service=tag_service,
+        user_data_version_repository=user_data_version_repo,
+        file_blob_service=file_blob_service,
+        retention_service=retention_service,
     )
 
 
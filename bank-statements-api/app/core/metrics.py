@@ -0,0 +1,292 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Counters, gauges and histograms live in a module-level registry and are
+updated from the request middleware, the database pool, the upload pipeline
+and the LLM clients. Values that are cheaper to read on demand (pool status)
+are filled in by collectors at scrape time.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.metric_type}\n"
+        return header + "".join(f"{line}\n" for line in self._samples())
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), []))
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+
+        lines = []
+        bucket_labels = self.labelnames + ("le",)
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(bucket_labels, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before rendering."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DB_QUERIES = REGISTRY.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL statements executed per HTTP request",
+        ("method", "route"),
+        buckets=(1, 2, 5, 10, 20, 50, 100, 250),
+    )
+)
+
+DB_POOL_SIZE = REGISTRY.register(Gauge("db_pool_size", "Configured size of the database connection pool"))
+DB_POOL_CHECKED_OUT = REGISTRY.register(Gauge("db_pool_checked_out", "Connections currently checked out"))
+DB_POOL_OVERFLOW = REGISTRY.register(Gauge("db_pool_overflow", "Connections open beyond the pool size"))
+DB_POOL_CHECKOUTS = REGISTRY.register(Counter("db_pool_checkouts_total", "Connection checkouts from the pool"))
+DB_POOL_CHECKOUT_TIMEOUTS = REGISTRY.register(
+    Counter("db_pool_checkout_timeouts_total", "Checkouts that timed out waiting for a connection")
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled connection",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+
+STATEMENT_UPLOADS = REGISTRY.register(Counter("statement_uploads_total", "Statement uploads processed"))
+STATEMENT_UPLOAD_ROWS = REGISTRY.register(
+    Counter("statement_upload_rows_total", "Statement rows by upload outcome", ("outcome",))
+)
+STATEMENT_UPLOAD_THROUGHPUT = REGISTRY.register(
+    Histogram(
+        "statement_upload_rows_per_second",
+        "Rows processed per second for each statement upload",
+        buckets=(10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+    )
+)
+
+BACKGROUND_JOBS_QUEUE_DEPTH = REGISTRY.register(
+    Gauge("background_jobs_queue_depth", "Background jobs waiting or running", ("job_type", "status"))
+)
+BACKGROUND_JOBS_OLDEST_AGE = REGISTRY.register(
+    Gauge(
+        "background_jobs_oldest_age_seconds",
+        "Age of the oldest waiting or running background job",
+        ("job_type", "status"),
+    )
+)
+
+BACKGROUND_JOB_DURATION = REGISTRY.register(
+    Histogram(
+        "background_job_duration_seconds",
+        "Background job run time by outcome",
+        ("job_type", "outcome"),
+        buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+    )
+)
+
+LLM_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "llm_request_duration_seconds",
+        "LLM provider call latency",
+        ("provider", "model"),
+        buckets=(0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+    )
+)
+LLM_TOKENS = REGISTRY.register(Counter("llm_tokens_total", "LLM tokens consumed", ("provider", "model", "direction")))
+LLM_FAILURES = REGISTRY.register(Counter("llm_failures_total", "LLM provider calls that raised", ("provider", "model")))
+
+
+def pool_status_collector(engine) -> Callable[[], None]:
+    def collect() -> None:
+        # Read through the engine: the pool object is replaced when it is recreated
+        pool = engine.pool
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    return collect
+
+
+def record_statement_upload(total_processed: int, saved: int, duplicated: int, dropped: int, duration_seconds: float) -> None:
+    STATEMENT_UPLOADS.inc()
+    STATEMENT_UPLOAD_ROWS.inc(saved, outcome="saved")
+    STATEMENT_UPLOAD_ROWS.inc(duplicated, outcome="duplicate")
+    STATEMENT_UPLOAD_ROWS.inc(dropped, outcome="dropped")
+    if duration_seconds > 0:
+        STATEMENT_UPLOAD_THROUGHPUT.observe(total_processed / duration_seconds)
+
+
+class LLMCall:
+    def __init__(self):
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+        self.cached_input_tokens: Optional[int] = None
+
+    def record_usage(
+        self,
+        input_tokens: Optional[int],
+        output_tokens: Optional[int],
+        cached_input_tokens: Optional[int] = None,
+    ) -> None:
+        self.input_tokens = (self.input_tokens or 0) + (input_tokens or 0)
+        self.output_tokens = (self.output_tokens or 0) + (output_tokens or 0)
+        self.cached_input_tokens = (self.cached_input_tokens or 0) + (cached_input_tokens or 0)
+
+
+@contextmanager
+def track_llm_call(provider: str, model: str) -> Iterator[LLMCall]:
+    """Time one provider call, counting it as a failure if the block raises."""
+    call = LLMCall()
+    start = time.perf_counter()
+    try:
+        yield call
+    except Exception:
+        LLM_FAILURES.inc(provider=provider, model=model)
+        raise
+    finally:
+        LLM_REQUEST_DURATION.observe(time.perf_counter() - start, provider=provider, model=model)
+        if call.input_tokens:
+            LLM_TOKENS.inc(call.input_tokens, provider=provider, model=model, direction="input")
+        if call.output_tokens:
+            LLM_TOKENS.inc(call.output_tokens, provider=provider, model=model, direction="output")
+        if call.cached_input_tokens:
+            LLM_TOKENS.inc(call.cached_input_tokens, provider=provider, model=model, direction="cached_input")
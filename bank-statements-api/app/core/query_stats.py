@@ -0,0 +1,115 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\(\w+\)s|:\w+|\$\d+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+def fingerprint(statement: str) -> str:
+    """Reduce a statement to its shape so that the same query with different values compares equal."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.fingerprints[fingerprint(statement)] += 1
+        if duration_ms >= self.slowest_ms:
+            self.slowest_ms = duration_ms
+            self.slowest_statement = statement
+
+    def repeated(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """Statements executed at least threshold times, most frequent first - the usual N+1 signature."""
+        return [(statement, count) for statement, count in self.fingerprints.most_common() if count >= threshold]
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect statistics for every statement executed while the block is active.
+    Work dispatched to the threadpool copies the context, so sync endpoints and
+    repositories record into the same QueryStats.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    stats.record(statement, (time.perf_counter() - start_times.pop()) * 1000)
+
+
+def install_query_instrumentation(target=Engine) -> None:
+    """Attach the cursor hooks to an engine, or to every engine by default. Safe to call repeatedly."""
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def capture_queries(target=Engine) -> Iterator[QueryStats]:
+    """
+    Record every statement run on target while the block is active, from any
+    thread or context. Meant for tests, where TestClient serves requests on its
+    own event loop thread.
+    """
+    stats = QueryStats()
+    start_times: List[float] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        start_times.append(time.perf_counter())
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        if start_times:
+            stats.record(statement, (time.perf_counter() - start_times.pop()) * 1000)
+
+    event.listen(target, "before_cursor_execute", before)
+    event.listen(target, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        event.remove(target, "before_cursor_execute", before)
+        event.remove(target, "after_cursor_execute", after)
@@ -9,13 +9,15 @@ class UploadedFileDTO:
         filename: str,
         file_type: str,
         created_at: datetime,
-        content: Optional[bytes] = None,
+        blob_digest: Optional[str] = None,
+        size: Optional[int] = None,
     ):
         self.id = id
         self.filename = filename
         self.file_type = file_type
         self.created_at = created_at
-        self.content = content
+        self.blob_digest = blob_digest
+        self.size = size
 
     @classmethod
     def from_entity(cls, entity):
@@ -24,7 +26,7 @@ class UploadedFileDTO:
             filename=entity.filename,
             file_type=entity.file_type,
             created_at=entity.created_at,
-            content=entity.content,
+            blob_digest=entity.blob_digest,
         )
 
 
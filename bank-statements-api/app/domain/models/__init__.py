@@ -2,7 +2,9 @@
 from .account import Account
 from .background_job import BackgroundJob, JobStatus, JobType
 from .category import Category
+from .file_blob import BlobStorage, FileBlob
 from .initial_balance import InitialBalance
+from .llm_result_cache import LLMCacheKind, LLMResultCacheEntry
 from .processing import (
     AsyncCategorizationResult,
     BackgroundJobInfo,
@@ -10,11 +12,13 @@ from .processing import (
     ProcessingProgress,
     SyncCategorizationResult,
 )
+from .recurring_pattern_snapshot import RecurringPatternSnapshot
 from .statement import Statement
 from .subscription import TIER_LIMITS, Subscription, SubscriptionStatus, SubscriptionTier, SubscriptionUsage
 from .tag import Tag, transaction_tags
 from .transaction import CategorizationStatus, Transaction
 from .uploaded_file import FileAnalysisMetadata, UploadedFile
+from .user_data_version import UserDataVersion
 
 __all__ = [
     # Background Jobs
@@ -23,8 +27,14 @@ __all__ = [
     "JobType",
     # Category
     "Category",
+    # File Blob
+    "BlobStorage",
+    "FileBlob",
     # Initial Balance
     "InitialBalance",
+    # LLM Result Cache
+    "LLMCacheKind",
+    "LLMResultCacheEntry",
     # Processing
     "AsyncCategorizationResult",
     "BackgroundJobInfo",
@@ -33,6 +43,8 @@ __all__ = [
     "SyncCategorizationResult",
     # Account
     "Account",
+    # Recurring Pattern Snapshot
+    "RecurringPatternSnapshot",
     # Tag
     "Tag",
     "transaction_tags",
@@ -50,4 +62,6 @@ __all__ = [
     # Uploaded File
     "FileAnalysisMetadata",
     "UploadedFile",
+    # User Data Version
+    "UserDataVersion",
 ]
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from uuid import uuid4
 
@@ -20,9 +20,13 @@ class JobStatus(str, Enum):
 
 
 class JobType(str, Enum):
-    # Note: No job types are currently supported
-    # Background job infrastructure is kept for future use
     PLACEHOLDER = "PLACEHOLDER"
+    STATEMENT_IMPORT = "STATEMENT_IMPORT"
+    RULE_CATEGORY_SUGGESTION = "RULE_CATEGORY_SUGGESTION"
+    RULE_COUNTERPARTY_SUGGESTION = "RULE_COUNTERPARTY_SUGGESTION"
+    RECURRING_PATTERNS_REFRESH = "RECURRING_PATTERNS_REFRESH"
+    FILE_BLOB_CLEANUP = "FILE_BLOB_CLEANUP"
+    STORAGE_RETENTION = "STORAGE_RETENTION"
 
 
 class BackgroundJob(Base):
@@ -39,12 +43,20 @@ class BackgroundJob(Base):
     # Related entities
     uploaded_file_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("uploaded_files.id"),
+        ForeignKey("uploaded_files.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
     uploaded_file = relationship("UploadedFile")
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
 
     # Job execution data
+    payload = Column(JSONB, default=dict, nullable=False)
     progress = Column(JSONB, default=dict, nullable=False)
     result = Column(JSONB, default=dict, nullable=False)
     error_message = Column(Text, nullable=True)
@@ -56,11 +68,16 @@ class BackgroundJob(Base):
         nullable=False,
     )
     started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True, index=True)
 
     # Retry mechanism
     retry_count = Column(Integer, default=0, nullable=False)
     max_retries = Column(Integer, default=3, nullable=False)
+    run_after = Column(DateTime, nullable=True)
+
+    # Worker lease: a job whose lease expires is handed back to the queue
+    locked_by = Column(Text, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
 
     def __repr__(self):
         return f"<BackgroundJob(id={self.id}, type={self.job_type}, status={self.status})>"
@@ -88,6 +105,7 @@ class BackgroundJob(Base):
         """Mark job as completed with optional result"""
         self.status = JobStatus.COMPLETED
         self.completed_at = datetime.now(timezone.utc)
+        self.lease_expires_at = None
         if result:
             self.result = result
 
@@ -95,9 +113,21 @@ class BackgroundJob(Base):
         """Mark job as failed with optional error message"""
         self.status = JobStatus.FAILED
         self.completed_at = datetime.now(timezone.utc)
+        self.lease_expires_at = None
         if error_message:
             self.error_message = error_message
 
+    def schedule_retry(self, error_message: str, delay_seconds: float) -> None:
+        """Put the job back in the queue, eligible again after delay_seconds"""
+        self.retry_count += 1
+        self.status = JobStatus.PENDING
+        self.error_message = error_message
+        self.run_after = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+        self.started_at = None
+        self.completed_at = None
+        self.locked_by = None
+        self.lease_expires_at = None
+
     def increment_retry(self) -> None:
         """Increment retry count and reset status to pending"""
         if self.can_retry:
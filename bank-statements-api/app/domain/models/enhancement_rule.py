@@ -4,7 +4,7 @@ from uuid import uuid4
 
 from sqlalchemy import Column, Date, DateTime
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -27,6 +27,17 @@ class EnhancementRuleSource(str, Enum):
 
 class EnhancementRule(Base):
     __tablename__ = "enhancement_rules"
+    __table_args__ = (
+        # Conflict target for creating unmatched rules in bulk
+        Index(
+            "uq_enhancement_rules_auto_pattern",
+            "user_id",
+            "normalized_description_pattern",
+            "match_type",
+            unique=True,
+            postgresql_where=text("source = 'AUTO'"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, LargeBinary, String, text
+from sqlalchemy.orm import deferred
+
+from app.core.database import Base
+
+
+class BlobStorage(str, Enum):
+    DATABASE = "DATABASE"
+    FILESYSTEM = "FILESYSTEM"
+
+
+class FileBlob(Base):
+    """
+    The zstd-compressed bytes of one raw file, stored once however many uploads
+    and statements refer to it. ref_count is kept up to date by triggers on
+    uploaded_files and statements; blobs nobody refers to are removed by the
+    file blob cleanup job.
+    """
+
+    __tablename__ = "file_blobs"
+    __table_args__ = (Index("ix_file_blobs_unreferenced", "last_used_at", postgresql_where=text("ref_count = 0")),)
+
+    # SHA-256 of the uncompressed bytes, hex encoded
+    digest = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    stored_size = Column(BigInteger, nullable=False)
+    storage = Column(String(16), nullable=False)
+    # The compressed bytes when storage is DATABASE; filesystem blobs live under BLOB_STORE_PATH
+    content = deferred(Column(LargeBinary, nullable=True))
+    ref_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    last_used_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"<FileBlob(digest={self.digest}, size={self.size}, storage={self.storage})>"
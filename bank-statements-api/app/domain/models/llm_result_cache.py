@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import uuid4
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.core.database import Base
+
+
+class LLMCacheKind(str, Enum):
+    RULE_CATEGORY = "RULE_CATEGORY"
+    RULE_COUNTERPARTY = "RULE_COUNTERPARTY"
+    CATEGORY_GENERATION = "CATEGORY_GENERATION"
+
+
+class LLMResultCacheEntry(Base):
+    """
+    A parsed LLM answer for one normalized pattern, valid for the context it was
+    asked in: context_hash covers the categories or accounts listed in the prompt,
+    so renaming or adding one makes earlier answers unreachable.
+    """
+
+    __tablename__ = "llm_result_cache"
+    __table_args__ = (UniqueConstraint("user_id", "kind", "pattern", "context_hash", "model", name="uq_llm_result_cache_key"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(32), nullable=False)
+    pattern = Column(Text, nullable=False)
+    context_hash = Column(String(64), nullable=False)
+    model = Column(String(100), nullable=False)
+    result = Column(JSONB, nullable=False)
+    confidence = Column(Float, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -15,6 +15,7 @@ class ProcessingProgress:
     total_transactions: int
     phase: str
     estimated_completion_seconds: Optional[int] = None
+    duplicate_transactions: int = 0
 
     @property
     def percentage(self) -> float:
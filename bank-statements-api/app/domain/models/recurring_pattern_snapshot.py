@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.core.database import Base
+
+
+class RecurringPatternSnapshot(Base):
+    """
+    The recurring patterns last found in a user's transactions, serialised as
+    RecurringPattern.to_dict(). data_version is the user's data version the
+    analysis started from, so a newer version means the snapshot may be stale.
+    """
+
+    __tablename__ = "recurring_pattern_snapshots"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    data_version = Column(BigInteger, nullable=False)
+    patterns = Column(JSONB, nullable=False, default=list)
+    computed_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,7 +19,8 @@ class Statement(Base):
     )
     filename = Column(Text, nullable=False)
     file_type = Column(String, nullable=False)
-    content = Column(LargeBinary, nullable=False)
+    # The original file, shared with the upload it was imported from
+    blob_digest = Column(String(64), ForeignKey("file_blobs.digest"), nullable=False, index=True)
     transaction_count = Column(Integer, nullable=True)
     date_from = Column(Date, nullable=True)
     date_to = Column(Date, nullable=True)
@@ -6,7 +6,7 @@ from uuid import uuid4
 
 from sqlalchemy import Boolean, Column, Date, DateTime
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import ForeignKey, Integer, Numeric, String
+from sqlalchemy import ForeignKey, Index, Integer, Numeric, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -135,6 +135,38 @@ class Transaction(Base):
         index=True,
     )
 
+    # Mirrors migrations y5t6u7v8w9x0 and b8w9x0y1z2a3; each index serves one access path of the repository
+    __table_args__ = (
+        # Transaction lists: one user's rows in a date range, newest first
+        Index("ix_transactions_user_date_sort", user_id, date.desc(), sort_index),
+        # Category totals and time series skip transfers and excluded rows and only need these columns
+        Index(
+            "ix_transactions_user_date_analytics",
+            user_id,
+            date,
+            postgresql_include=["category_id", "amount", "id"],
+            postgresql_where=text("counterparty_account_id IS NULL AND NOT exclude_from_analytics"),
+        ),
+        # Running balances: one account's top-level rows in balance order
+        Index(
+            "ix_transactions_account_date_sort",
+            account_id,
+            date,
+            sort_index,
+            postgresql_include=["id", "amount"],
+            postgresql_where=text("parent_transaction_id IS NULL"),
+        ),
+        # Duplicate detection on upload
+        Index("ix_transactions_account_date_amount", account_id, date, amount),
+        # Statement deletion, and the foreign key checks when a statement or transaction is deleted
+        Index("ix_transactions_statement_id", statement_id),
+        Index(
+            "ix_transactions_manual_position_after",
+            manual_position_after,
+            postgresql_where=text("manual_position_after IS NOT NULL"),
+        ),
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._running_balance: Optional[Decimal] = None
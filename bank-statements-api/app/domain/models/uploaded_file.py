@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String, Text, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -13,12 +13,14 @@ class UploadedFile(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     filename = Column(Text, nullable=False)
-    content = Column(LargeBinary, nullable=False)
+    # The original file, stored once per distinct content in file_blobs
+    blob_digest = Column(String(64), ForeignKey("file_blobs.digest"), nullable=False, index=True)
     file_type = Column(String, nullable=False)
     created_at = Column(
         DateTime,
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
+        index=True,
     )
 
 
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class UserDataVersion(Base):
+    """
+    Monotonic counter of changes to a user's financial data.
+
+    Bumped by database triggers on every write to user-owned tables, so it can be
+    used as a cheap validator for cached or conditional responses.
+    """
+
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -1,12 +1,13 @@
 import logging
-import time
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 
+from app.api.compression import CompressionMiddleware
 from app.api.errors import AppException, ErrorResponse
+from app.api.request_timing import RequestTimingMiddleware
 from app.app import register_app_routes
 from app.core.config import settings
 from app.core.dependencies import provide_dependencies
@@ -17,16 +18,8 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI()
 
-
-@app.middleware("http")
-async def log_request_timing(request: Request, call_next):
-    start = time.perf_counter()
-    response = await call_next(request)
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info(f"{request.method} {request.url.path} - {duration_ms:.0f}ms")
-    return response
-
-
+app.add_middleware(RequestTimingMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES)
 app.add_middleware(SessionMiddleware, secret_key=settings.JWT_SECRET_KEY)
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,14 @@
+from contextlib import AbstractContextManager
+from typing import Protocol
+
+
+class BlobStore(Protocol):
+    """Compressed file blobs kept outside the database, addressed by digest"""
+
+    def exists(self, digest: str) -> bool: ...
+
+    def write(self, digest: str, data: bytes) -> None: ...
+
+    def open(self, digest: str) -> AbstractContextManager[memoryview]: ...
+
+    def delete(self, digest: str) -> None: ...
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
@@ -21,6 +22,11 @@ class BackgroundJobRepository(ABC):
         """Get a background job by ID"""
         pass
 
+    @abstractmethod
+    def read_snapshot(self, job_id: UUID) -> Optional[BackgroundJob]:
+        """Load the current row without keeping a transaction open, for status polling"""
+        pass
+
     @abstractmethod
     def get_all(self) -> List[BackgroundJob]:
         """Get all background jobs"""
@@ -36,23 +42,55 @@ class BackgroundJobRepository(ABC):
         """Get all jobs of a specific type"""
         pass
 
+    @abstractmethod
+    def find_pending_job(self, job_type: JobType, user_id: Optional[UUID]) -> Optional[BackgroundJob]:
+        """A job of this type still waiting to run for the user, if any"""
+        pass
+
+    @abstractmethod
+    def find_job_created_since(self, job_type: JobType, user_id: Optional[UUID], since: datetime) -> Optional[BackgroundJob]:
+        """A job of this type queued for the user at or after since, whatever its status"""
+        pass
+
     @abstractmethod
     def get_pending_jobs(self, limit: int = 10) -> List[BackgroundJob]:
         """Get pending jobs ordered by creation time"""
         pass
 
     @abstractmethod
-    def claim_single_pending_job(
-        self,
-    ) -> Optional[BackgroundJob]:
+    def claim_pending_jobs(self, worker_id: str, limit: int, lease_seconds: int) -> List[BackgroundJob]:
+        """
+        Atomically claim up to limit pending jobs whose run_after has passed.
+
+        Rows locked by another worker are skipped, so any number of workers can
+        share the queue. Claimed jobs are IN_PROGRESS, owned by worker_id and
+        leased for lease_seconds.
+        """
+        pass
+
+    @abstractmethod
+    def extend_lease(self, job_id: UUID, worker_id: str, lease_seconds: int) -> bool:
+        """Push the lease of a job still owned by worker_id; False if it was lost"""
+        pass
+
+    @abstractmethod
+    def release_expired_leases(self) -> Tuple[int, int]:
+        """
+        Hand IN_PROGRESS jobs whose lease expired back to the queue, or fail them
+        when their retries are exhausted.
+
+        Returns:
+            (requeued count, failed count)
         """
-        Atomically claim a single pending job for processing.
+        pass
 
-        Uses database-level locking to prevent race conditions.
-        Returns None if no pending jobs are available.
+    @abstractmethod
+    def get_queue_stats(self) -> List[Tuple[JobType, JobStatus, int, datetime]]:
+        """
+        Count pending and in-progress jobs per type and status.
 
         Returns:
-            The claimed job with status changed to IN_PROGRESS, or None
+            (job_type, status, count, oldest created_at) for each non-empty group
         """
         pass
 
@@ -61,6 +99,26 @@ class BackgroundJobRepository(ABC):
         """Update a background job"""
         pass
 
+    @abstractmethod
+    def mark_started(self, job_id: UUID) -> Optional[BackgroundJob]:
+        """Move a PENDING job to IN_PROGRESS in one statement; None if it is missing or no longer pending"""
+        pass
+
+    @abstractmethod
+    def mark_completed(self, job_id: UUID, result: Optional[dict] = None) -> Optional[BackgroundJob]:
+        """Move an IN_PROGRESS job to COMPLETED in one statement; None if it is missing or no longer running"""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, job_id: UUID, error_message: Optional[str] = None) -> Optional[BackgroundJob]:
+        """Move a PENDING or IN_PROGRESS job to FAILED in one statement; None if it has already finished"""
+        pass
+
+    @abstractmethod
+    def merge_progress(self, job_id: UUID, delta: dict) -> bool:
+        """Merge delta into the job's progress in a single UPDATE"""
+        pass
+
     @abstractmethod
     def delete(self, job_id: UUID) -> bool:
         """Delete a background job"""
@@ -72,6 +130,9 @@ class BackgroundJobRepository(ABC):
         pass
 
     @abstractmethod
-    def cleanup_completed_jobs(self, days_old: int = 7) -> int:
-        """Clean up completed jobs older than specified days"""
+    def delete_terminal_jobs(self, completed_before: datetime, limit: int) -> Tuple[int, int]:
+        """
+        Delete up to limit completed, failed or cancelled jobs that finished before
+        completed_before. Returns how many were deleted and their size in bytes.
+        """
         pass
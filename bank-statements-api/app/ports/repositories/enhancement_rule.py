@@ -14,6 +14,10 @@ class EnhancementRuleRepository(ABC):
     def save(self, rule: EnhancementRule) -> EnhancementRule:
         pass
 
+    @abstractmethod
+    def save_all(self, rules: List[EnhancementRule]) -> None:
+        pass
+
     @abstractmethod
     def find_by_id(self, rule_id: UUID, user_id: UUID) -> Optional[EnhancementRule]:
         pass
@@ -22,6 +26,14 @@ class EnhancementRuleRepository(ABC):
     def find_by_normalized_description(self, normalized_description: str, user_id: UUID) -> List[EnhancementRule]:
         pass
 
+    @abstractmethod
+    def create_unmatched_rules(self, normalized_descriptions: List[str], user_id: UUID) -> int:
+        """
+        Create an empty AUTO exact-match rule for each description no rule of the user has as
+        its pattern yet, in one statement. Returns the number of rules created.
+        """
+        pass
+
     @abstractmethod
     def delete(self, rule: EnhancementRule) -> None:
         pass
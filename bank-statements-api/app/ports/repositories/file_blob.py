@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from app.domain.models.file_blob import FileBlob
+
+
+class FileBlobRepository(ABC):
+    @abstractmethod
+    def find(self, digest: str) -> Optional[FileBlob]:
+        """The blob's metadata, without its content"""
+        pass
+
+    @abstractmethod
+    def touch(self, digest: str) -> bool:
+        """Mark an existing blob as just used; False when there is no such blob"""
+        pass
+
+    @abstractmethod
+    def add(self, blob: FileBlob) -> None:
+        """Insert a blob, or mark it as just used if another upload stored it first"""
+        pass
+
+    @abstractmethod
+    def read_content(self, digest: str) -> Optional[bytes]:
+        """The compressed bytes of a blob stored in the database"""
+        pass
+
+    @abstractmethod
+    def delete_unreferenced(
+        self,
+        unused_before: datetime,
+        limit: int,
+        on_deleted: Callable[[List[FileBlob]], None],
+    ) -> List[FileBlob]:
+        """
+        Delete up to limit blobs that no upload or statement refers to and that
+        have not been used since unused_before. on_deleted runs before the
+        deletion is committed, so files can be removed while the rows are locked.
+        """
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.models.llm_result_cache import LLMResultCacheEntry
+
+
+class LLMResultCacheRepository(ABC):
+    @abstractmethod
+    def find_many(
+        self,
+        user_id: UUID,
+        kind: str,
+        patterns: List[str],
+        context_hash: str,
+        model: str,
+        now: datetime,
+    ) -> List[LLMResultCacheEntry]:
+        """Unexpired entries for the given patterns"""
+        pass
+
+    @abstractmethod
+    def save_many(self, entries: List[LLMResultCacheEntry]) -> None:
+        """Insert entries, replacing any with the same key"""
+        pass
+
+    @abstractmethod
+    def delete_for_user(self, user_id: UUID, kinds: Optional[List[str]] = None) -> int:
+        pass
+
+    @abstractmethod
+    def delete_expired(self, now: datetime) -> int:
+        pass
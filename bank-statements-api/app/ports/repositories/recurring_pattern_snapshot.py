@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.models.recurring_pattern_snapshot import RecurringPatternSnapshot
+
+
+class RecurringPatternSnapshotRepository(ABC):
+    @abstractmethod
+    def get(self, user_id: UUID) -> Optional[RecurringPatternSnapshot]:
+        pass
+
+    @abstractmethod
+    def save(self, snapshot: RecurringPatternSnapshot) -> None:
+        """Insert the snapshot, replacing the user's previous one"""
+        pass
+
+    @abstractmethod
+    def find_user_ids_to_refresh(self, computed_before: datetime) -> List[UUID]:
+        """
+        Users with transactions whose snapshot is missing, older than the data it
+        was computed from, or computed before computed_before
+        """
+        pass
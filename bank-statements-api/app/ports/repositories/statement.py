@@ -12,10 +12,15 @@ class StatementRepository(ABC):
         account_id: UUID,
         filename: str,
         file_type: str,
-        content: bytes,
+        blob_digest: str,
     ) -> Statement:
         pass
 
+    @abstractmethod
+    def save_from_uploaded_file(self, account_id: UUID, uploaded_file_id: UUID) -> Statement:
+        """Create a statement for an uploaded file, sharing its blob"""
+        pass
+
     @abstractmethod
     def find_by_id(self, statement_id: UUID, user_id: UUID) -> Optional[Statement]:
         pass
@@ -1,13 +1,44 @@
 from abc import ABC, abstractmethod
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from uuid import UUID
 
 from app.api.schemas import TransactionCreateRequest
 from app.domain.dto.statement_processing import TransactionDTO
 from app.domain.models.transaction import CategorizationStatus, Transaction
 
+# Column order of the plain rows returned by get_paginated_rows
+TRANSACTION_LIST_FIELDS = (
+    "id",
+    "date",
+    "description",
+    "normalized_description",
+    "amount",
+    "created_at",
+    "category_id",
+    "account_id",
+    "counterparty_account_id",
+    "categorization_status",
+    "row_index",
+    "sort_index",
+    "source_type",
+    "manual_position_after",
+    "exclude_from_analytics",
+    "parent_transaction_id",
+)
+
+
+class RecurringCandidateRow(NamedTuple):
+    """One transaction of a description group that may be recurring, without loading the ORM object"""
+
+    id: UUID
+    date: date
+    amount: Decimal
+    description: str
+    normalized_description: str
+    category_id: Optional[UUID]
+
 
 class TransactionRepository(ABC):
     """
@@ -83,6 +114,43 @@ class TransactionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_paginated_rows(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+        category_ids: Optional[List[UUID]] = None,
+        status: Optional[CategorizationStatus] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        description_search: Optional[str] = None,
+        account_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sort_field: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+        exclude_transfers: Optional[bool] = None,
+        exclude_uncategorized: Optional[bool] = None,
+        transaction_type: Optional[str] = None,
+        transaction_ids: Optional[List[UUID]] = None,
+        tag_ids: Optional[List[UUID]] = None,
+        exclude_from_analytics: Optional[bool] = None,
+    ) -> Tuple[List[tuple], int, Decimal]:
+        """
+        Same filters, ordering and paging as get_paginated, without ORM hydration.
+
+        Returns:
+            Tuple of (rows, total_count, total_amount) where each row is a plain tuple
+            ordered as TRANSACTION_LIST_FIELDS.
+        """
+        pass
+
+    @abstractmethod
+    def get_tag_rows_by_transaction_ids(self, transaction_ids: List[UUID]) -> Dict[UUID, List[tuple]]:
+        """Return (tag_id, name, created_at) tuples keyed by transaction id."""
+        pass
+
     @abstractmethod
     def get_category_totals(
         self,
@@ -106,7 +174,6 @@ class TransactionRepository(ABC):
     def get_category_time_series(
         self,
         user_id: UUID,
-        category_id: Optional[UUID] = None,
         period: str = "month",
         category_ids: Optional[List[UUID]] = None,
         status: Optional[CategorizationStatus] = None,
@@ -346,6 +413,24 @@ class TransactionRepository(ABC):
     def get_unique_normalised_descriptions(self, user_id: UUID, limit: int = 200) -> List[str]:
         pass
 
+    @abstractmethod
+    def get_categorised_descriptions(self, user_id: UUID, limit: int = 20000) -> List[Tuple[str, UUID, int]]:
+        """(normalized description, category id, transaction count), most frequent first"""
+        pass
+
+    @abstractmethod
+    def get_recurring_candidates(
+        self,
+        user_id: UUID,
+        start_date: Optional[date],
+        min_occurrences: int,
+    ) -> List[RecurringCandidateRow]:
+        """
+        Debits since start_date, transfers excluded, whose (normalized description,
+        category id) group has at least min_occurrences of them, newest first
+        """
+        pass
+
     @abstractmethod
     def count_matching_rules_batch(self, rules: List, uncategorized_only: bool = False) -> Dict[UUID, int]:
         pass
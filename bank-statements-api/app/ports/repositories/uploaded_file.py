@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 
 from app.domain.dto.uploaded_file import FileAnalysisMetadataDTO, UploadedFileDTO
@@ -7,13 +8,26 @@ from app.domain.dto.uploaded_file import FileAnalysisMetadataDTO, UploadedFileDT
 
 class UploadedFileRepository(ABC):
     @abstractmethod
-    def save(self, filename: str, content: bytes) -> UploadedFileDTO:
+    def save(self, filename: str, blob_digest: str, file_type: str) -> UploadedFileDTO:
         pass
 
     @abstractmethod
     def find_by_id(self, file_id: UUID) -> Optional[UploadedFileDTO]:
         pass
 
+    @abstractmethod
+    def find_metadata_by_id(self, file_id: UUID) -> Optional[UploadedFileDTO]:
+        """The file with the uncompressed size of its blob"""
+        pass
+
+    @abstractmethod
+    def delete_orphaned(self, created_before: datetime, limit: int) -> Tuple[int, int]:
+        """
+        Delete up to limit files uploaded before created_before that no pending or
+        running job still needs. Returns how many were deleted and their size in bytes.
+        """
+        pass
+
 
 class FileAnalysisMetadataRepository(ABC):
     @abstractmethod
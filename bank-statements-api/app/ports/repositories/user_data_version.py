@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class UserDataVersionRepository(ABC):
+    @abstractmethod
+    def get_version(self, user_id: UUID) -> int:
+        """Current data version for the user, 0 if nothing has been written yet."""
+        pass
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from typing import Callable, Generic, Optional, TypeVar
+
+from app.ai.llm_client import CacheablePrompt, LLMClient, TokenUsage
+from app.ai.rate_limiter import ProviderRateLimiter, get_rate_limiter
+from app.ai.tokens import estimate_tokens
+from app.domain.models.enhancement_rule import EnhancementRule
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Every suggestion echoes the pattern back plus an id and a confidence
+OUTPUT_TOKENS_PER_RULE = 30
+
+
+def plan_batches(
+    patterns: list[str],
+    prompt_overhead_tokens: int,
+    max_input_tokens: int,
+    max_output_tokens: int,
+) -> list[list[int]]:
+    """
+    Split patterns into batches of indexes whose estimated prompt stays under
+    max_input_tokens and whose expected answer stays under max_output_tokens.
+    Short patterns share a batch; a single oversized pattern gets its own.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    input_tokens = prompt_overhead_tokens
+    output_tokens = 0
+
+    for index, pattern in enumerate(patterns):
+        pattern_tokens = estimate_tokens(pattern)
+        rule_output_tokens = pattern_tokens + OUTPUT_TOKENS_PER_RULE
+        if current and (
+            input_tokens + pattern_tokens > max_input_tokens or output_tokens + rule_output_tokens > max_output_tokens
+        ):
+            batches.append(current)
+            current = []
+            input_tokens = prompt_overhead_tokens
+            output_tokens = 0
+        current.append(index)
+        input_tokens += pattern_tokens
+        output_tokens += rule_output_tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+class LLMBatchRunner(Generic[R]):
+    """
+    Sends rule batches to the LLM concurrently, at most max_concurrency at a
+    time and within the provider's shared request and token rate limits.
+    on_batch is called in the event loop thread as each batch completes.
+    Token usage reported by the provider is logged per call and added to usage.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        max_concurrency: int = 4,
+        max_input_tokens: int = 6000,
+        max_output_tokens: int = 1024,
+        rate_limiter: Optional[ProviderRateLimiter] = None,
+    ):
+        self.llm_client = llm_client
+        self.max_concurrency = max_concurrency
+        self.max_input_tokens = max_input_tokens
+        self.max_output_tokens = max_output_tokens
+        self.rate_limiter = rate_limiter or get_rate_limiter(llm_client.provider)
+        self.usage = TokenUsage()
+
+    async def run(
+        self,
+        rules: list[EnhancementRule],
+        build_prompt: Callable[[list[EnhancementRule]], CacheablePrompt],
+        parse_response: Callable[[list[EnhancementRule], str], list[R]],
+        on_error: Callable[[list[EnhancementRule], Exception], list[R]],
+        on_batch: Optional[Callable[[list[R]], None]] = None,
+    ) -> list[R]:
+        if not rules:
+            return []
+
+        overhead = estimate_tokens(build_prompt([]).text)
+        batches = [
+            [rules[i] for i in indexes]
+            for indexes in plan_batches(
+                [rule.normalized_description_pattern for rule in rules],
+                overhead,
+                self.max_input_tokens,
+                self.max_output_tokens,
+            )
+        ]
+        logger.info(f"Sending {len(rules)} rules to LLM in {len(batches)} batches")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        run_usage: list[TokenUsage] = []
+
+        async def process(batch: list[EnhancementRule]) -> list[R]:
+            async with semaphore:
+                prompt = build_prompt(batch)
+                expected_output = sum(
+                    estimate_tokens(rule.normalized_description_pattern) + OUTPUT_TOKENS_PER_RULE for rule in batch
+                )
+                await self.rate_limiter.acquire(estimate_tokens(prompt.text) + expected_output)
+                try:
+                    response = await self.llm_client.generate_prompt_async(prompt)
+                    logger.info(f"LLM batch of {len(batch)} rules used {response.usage}")
+                    run_usage.append(response.usage)
+                    results = parse_response(batch, response.text)
+                except Exception as e:
+                    logger.error(f"Error in LLM batch of {len(batch)} rules: {str(e)}", exc_info=True)
+                    results = on_error(batch, e)
+            if on_batch:
+                on_batch(results)
+            return results
+
+        batch_results = await asyncio.gather(*(process(batch) for batch in batches))
+        total = sum(run_usage, TokenUsage())
+        self.usage += total
+        logger.info(f"{len(batches)} LLM batches used {total}")
+        return [result for results in batch_results for result in results]
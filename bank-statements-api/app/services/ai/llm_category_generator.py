@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from dataclasses import dataclass, field
 from typing import Optional
@@ -8,6 +9,8 @@ from app.adapters.repositories.transaction import SQLAlchemyTransactionRepositor
 from app.ai.llm_client import LLMClient
 from app.ai.prompts import category_generation_prompt
 from app.common.json_utils import sanitize_json
+from app.domain.models.llm_result_cache import LLMCacheKind
+from app.services.ai.llm_result_cache import CachedResult, LLMResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +43,12 @@ class LLMCategoryGenerator:
         category_repository: SQLAlchemyCategoryRepository,
         transaction_repository: SQLAlchemyTransactionRepository,
         llm_client: LLMClient,
+        result_cache: Optional[LLMResultCache] = None,
     ):
         self.category_repository = category_repository
         self.transaction_repository = transaction_repository
         self.llm_client = llm_client
+        self.result_cache = result_cache
 
     def generate_suggestions(
         self,
@@ -55,16 +60,19 @@ class LLMCategoryGenerator:
         if not descriptions:
             return GenerateCategoriesResult(suggestions=[], total_descriptions_analysed=0)
 
-        prompt = category_generation_prompt(descriptions)
+        json_result = self._cached_suggestions(user_id, descriptions)
+        if json_result is None:
+            prompt = category_generation_prompt(descriptions)
 
-        logger.info(f"Sending {len(descriptions)} descriptions to LLM for category generation")
-        response = self.llm_client.generate(prompt)
-        logger.info(f"LLM response: {len(response)} chars")
+            logger.info(f"Sending {len(descriptions)} descriptions to LLM for category generation")
+            response = self.llm_client.generate(prompt)
+            logger.info(f"LLM response: {len(response)} chars")
 
-        json_result = sanitize_json(response)
-        if not json_result:
-            logger.warning(f"Invalid JSON from LLM: {response[:500] if response else 'empty'}")
-            return GenerateCategoriesResult(suggestions=[], total_descriptions_analysed=len(descriptions))
+            json_result = sanitize_json(response)
+            if not json_result:
+                logger.warning(f"Invalid JSON from LLM: {response[:500] if response else 'empty'}")
+                return GenerateCategoriesResult(suggestions=[], total_descriptions_analysed=len(descriptions))
+            self._cache_suggestions(user_id, descriptions, json_result)
 
         raw_suggestions = self._parse_llm_response(json_result)
         suggestions = self._match_existing_categories(raw_suggestions, user_id)
@@ -74,6 +82,34 @@ class LLMCategoryGenerator:
             total_descriptions_analysed=len(descriptions),
         )
 
+    @staticmethod
+    def _descriptions_key(descriptions: list[str]) -> str:
+        # The prompt only lists descriptions, so the same set always gets the same answer
+        return hashlib.sha256("\n".join(sorted(descriptions)).encode()).hexdigest()
+
+    def _cached_suggestions(self, user_id: UUID, descriptions: list[str]) -> Optional[list]:
+        if not self.result_cache:
+            return None
+        key = self._descriptions_key(descriptions)
+        hit = self.result_cache.get_many(user_id, LLMCacheKind.CATEGORY_GENERATION, [key], "", self.llm_client.model_name).get(
+            key
+        )
+        if hit is None:
+            return None
+        logger.info(f"Reusing cached category generation for {len(descriptions)} descriptions")
+        return hit.result["suggestions"]
+
+    def _cache_suggestions(self, user_id: UUID, descriptions: list[str], json_result: list) -> None:
+        if not self.result_cache:
+            return
+        self.result_cache.put_many(
+            user_id,
+            LLMCacheKind.CATEGORY_GENERATION,
+            {self._descriptions_key(descriptions): CachedResult(result={"suggestions": json_result})},
+            "",
+            self.llm_client.model_name,
+        )
+
     def _parse_llm_response(self, json_result: list) -> list[CategorySuggestion]:
         suggestions = []
 
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from app.domain.models.llm_result_cache import LLMCacheKind, LLMResultCacheEntry
+from app.ports.repositories.llm_result_cache import LLMResultCacheRepository
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[UUID, str, str, str, str]
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    result: dict
+    confidence: Optional[float] = None
+
+
+def normalize_pattern(pattern: str) -> str:
+    return pattern.strip().lower()
+
+
+def context_hash(items: Iterable[tuple]) -> str:
+    """Order-independent digest of the rows a prompt lists, e.g. (id, name, parent_id) per category"""
+    rows = sorted(json.dumps([str(value) for value in item]) for item in items)
+    return hashlib.sha256("\n".join(rows).encode()).hexdigest()
+
+
+def category_tree_hash(categories) -> str:
+    return context_hash((category.id, category.name, category.parent_id) for category in categories)
+
+
+def accounts_hash(accounts) -> str:
+    return context_hash((account.id, account.name) for account in accounts)
+
+
+class MemoryResultCache:
+    """Process-wide LRU in front of the cache table, so repeated runs skip the database too"""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, tuple[CachedResult, datetime]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, now: datetime) -> Optional[CachedResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: CacheKey, value: CachedResult, expires_at: datetime) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID, kinds: Optional[list[str]] = None) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id and (kinds is None or key[1] in kinds)]:
+                del self._entries[key]
+
+
+LLM_MEMORY_CACHE = MemoryResultCache()
+
+
+class LLMResultCache:
+    """
+    Parsed LLM answers keyed by (kind, normalized pattern, context hash, model),
+    so patterns already answered for the same categories or accounts are not
+    sent again. Lookups go to memory first, then to the cache table.
+    """
+
+    def __init__(
+        self,
+        repository: LLMResultCacheRepository,
+        ttl: timedelta = timedelta(days=30),
+        memory: MemoryResultCache = LLM_MEMORY_CACHE,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.repository = repository
+        self.ttl = ttl
+        self.memory = memory
+        self.clock = clock
+
+    def get_many(
+        self,
+        user_id: UUID,
+        kind: LLMCacheKind,
+        patterns: Iterable[str],
+        context: str,
+        model: str,
+    ) -> dict[str, CachedResult]:
+        """Cached results by normalized pattern"""
+        now = self.clock()
+        requested = {normalize_pattern(p) for p in patterns}
+        found: dict[str, CachedResult] = {}
+        missing = []
+        for pattern in requested:
+            cached = self.memory.get((user_id, kind.value, pattern, context, model), now)
+            if cached is not None:
+                found[pattern] = cached
+            else:
+                missing.append(pattern)
+
+        if missing:
+            for entry in self.repository.find_many(user_id, kind.value, missing, context, model, now):
+                cached = CachedResult(result=entry.result, confidence=entry.confidence)
+                self.memory.put((user_id, kind.value, entry.pattern, context, model), cached, entry.expires_at)
+                found[entry.pattern] = cached
+
+        logger.debug(f"LLM cache {kind.value}: {len(found)} hits, {len(requested) - len(found)} misses")
+        return found
+
+    def put_many(
+        self,
+        user_id: UUID,
+        kind: LLMCacheKind,
+        results: dict[str, CachedResult],
+        context: str,
+        model: str,
+    ) -> None:
+        if not results:
+            return
+        now = self.clock()
+        expires_at = now + self.ttl
+        entries = []
+        for pattern, cached in results.items():
+            pattern = normalize_pattern(pattern)
+            self.memory.put((user_id, kind.value, pattern, context, model), cached, expires_at)
+            entries.append(
+                LLMResultCacheEntry(
+                    user_id=user_id,
+                    kind=kind.value,
+                    pattern=pattern,
+                    context_hash=context,
+                    model=model,
+                    result=cached.result,
+                    confidence=cached.confidence,
+                    created_at=now,
+                    expires_at=expires_at,
+                )
+            )
+        self.repository.save_many(entries)
+
+    def invalidate(self, user_id: UUID, kinds: Optional[list[LLMCacheKind]] = None) -> None:
+        kind_values = [kind.value for kind in kinds] if kinds else None
+        self.memory.invalidate(user_id, kind_values)
+        deleted = self.repository.delete_for_user(user_id, kind_values)
+        logger.debug(f"Invalidated {deleted} cached LLM results for user {user_id}")
+
+    def purge_expired(self) -> int:
+        return self.repository.delete_expired(self.clock())
@@ -1,21 +1,20 @@
 import logging
-import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
 from app.adapters.repositories.category import SQLAlchemyCategoryRepository
 from app.ai.llm_client import LLMClient
-from app.ai.prompts import rule_categorization_prompt
+from app.ai.prompts import CategoryAliases, rule_categorization_prompt
 from app.common.json_utils import sanitize_json
 from app.domain.models.categorization import RuleCategorizationResult
-from app.domain.models.category import Category
 from app.domain.models.enhancement_rule import EnhancementRule
+from app.domain.models.llm_result_cache import LLMCacheKind
+from app.services.ai.llm_batch_runner import LLMBatchRunner
+from app.services.ai.llm_result_cache import CachedResult, LLMResultCache, category_tree_hash, normalize_pattern
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 10
-
 
 @dataclass
 class LLMRuleResult:
@@ -24,34 +23,31 @@ class LLMRuleResult:
     confidence: float
 
 
-@dataclass
-class RuleSuggestionSummary:
-    processed: int
-    auto_applied: int
-    suggestions: int
-    failed: int
-
-
 class LLMRuleCategorizer:
     def __init__(
         self,
         categories_repository: SQLAlchemyCategoryRepository,
         llm_client: LLMClient,
+        batch_runner: Optional[LLMBatchRunner[RuleCategorizationResult]] = None,
+        result_cache: Optional[LLMResultCache] = None,
     ):
         self.categories_repository = categories_repository
         self.llm_client = llm_client
+        self.batch_runner = batch_runner or LLMBatchRunner(llm_client)
+        self.result_cache = result_cache
 
-    def suggest_categories(
+    async def suggest_categories(
         self,
         rules: list[EnhancementRule],
         user_id: UUID,
+        on_batch: Optional[Callable[[list[RuleCategorizationResult]], None]] = None,
     ) -> list[RuleCategorizationResult]:
         if not rules:
             return []
 
         categories = self.categories_repository.get_all(user_id)
         if not categories:
-            return [
+            results = [
                 RuleCategorizationResult(
                     rule_id=rule.id,
                     suggested_category_id=None,
@@ -60,103 +56,159 @@ class LLMRuleCategorizer:
                 )
                 for rule in rules
             ]
+            if on_batch:
+                on_batch(results)
+            return results
 
-        all_results = []
-        for i in range(0, len(rules), BATCH_SIZE):
-            if i > 0:
-                time.sleep(5)
-            batch = rules[i : i + BATCH_SIZE]
-            batch_results = self._process_batch(batch, categories)
-            all_results.extend(batch_results)
+        tree_hash = category_tree_hash(categories)
+        cached = self._cached_results(rules, user_id, tree_hash)
+        if cached and on_batch:
+            on_batch(list(cached.values()))
+
+        rules_by_id = {rule.id: rule for rule in rules}
+
+        def on_answered(results: list[RuleCategorizationResult]) -> None:
+            self._cache_results(results, rules_by_id, user_id, tree_hash)
+            if on_batch:
+                on_batch(results)
+
+        aliases = CategoryAliases(categories)
+        answered = await self.batch_runner.run(
+            [rule for rule in rules if rule.id not in cached],
+            build_prompt=lambda batch: rule_categorization_prompt(
+                [rule.normalized_description_pattern for rule in batch], aliases
+            ),
+            parse_response=lambda batch, response: self._parse_response(batch, response, aliases),
+            on_error=self._error_results,
+            on_batch=on_answered,
+        )
+        results_by_id = {**cached, **{result.rule_id: result for result in answered}}
+        return [results_by_id[rule.id] for rule in rules]
+
+    def _cached_results(
+        self, rules: list[EnhancementRule], user_id: UUID, tree_hash: str
+    ) -> dict[UUID, RuleCategorizationResult]:
+        if not self.result_cache:
+            return {}
+        hits = self.result_cache.get_many(
+            user_id,
+            LLMCacheKind.RULE_CATEGORY,
+            [rule.normalized_description_pattern for rule in rules],
+            tree_hash,
+            self.llm_client.model_name,
+        )
+        results = {}
+        for rule in rules:
+            hit = hits.get(normalize_pattern(rule.normalized_description_pattern))
+            if hit:
+                results[rule.id] = RuleCategorizationResult(
+                    rule_id=rule.id,
+                    suggested_category_id=UUID(hit.result["category_id"]),
+                    confidence=hit.confidence,
+                )
+        if results:
+            logger.info(f"Reusing cached category suggestions for {len(results)} of {len(rules)} rules")
+        return results
 
-        return all_results
+    def _cache_results(
+        self,
+        results: list[RuleCategorizationResult],
+        rules_by_id: dict[UUID, EnhancementRule],
+        user_id: UUID,
+        tree_hash: str,
+    ) -> None:
+        if not self.result_cache:
+            return
+        answers = {
+            rules_by_id[result.rule_id].normalized_description_pattern: CachedResult(
+                result={"category_id": str(result.suggested_category_id)},
+                confidence=result.confidence,
+            )
+            for result in results
+            if result.is_successful and result.rule_id in rules_by_id
+        }
+        self.result_cache.put_many(user_id, LLMCacheKind.RULE_CATEGORY, answers, tree_hash, self.llm_client.model_name)
 
-    def _process_batch(
+    def _parse_response(
         self,
         rules: list[EnhancementRule],
-        categories: list[Category],
+        response: str,
+        aliases: CategoryAliases,
     ) -> list[RuleCategorizationResult]:
-        try:
-            patterns = [rule.normalized_description_pattern for rule in rules]
-            prompt = rule_categorization_prompt(patterns, categories)
+        logger.info(f"LLM response: {len(response)} chars")
 
-            logger.info(f"Sending batch of {len(rules)} rules to LLM")
-            response = self.llm_client.generate(prompt)
-            logger.info(f"LLM response: {len(response)} chars")
+        json_result = sanitize_json(response)
+        if not json_result:
+            logger.warning(f"Invalid JSON from LLM: {response[:500] if response else 'empty'}")
+            return [
+                RuleCategorizationResult(
+                    rule_id=rule.id,
+                    suggested_category_id=None,
+                    confidence=None,
+                    error_message="Invalid JSON response from LLM",
+                )
+                for rule in rules
+            ]
 
-            json_result = sanitize_json(response)
-            if not json_result:
-                logger.warning(f"Invalid JSON from LLM: {response[:500] if response else 'empty'}")
-                return [
-                    RuleCategorizationResult(
-                        rule_id=rule.id,
-                        suggested_category_id=None,
-                        confidence=None,
-                        error_message="Invalid JSON response from LLM",
-                    )
-                    for rule in rules
-                ]
+        logger.info(f"LLM returned {len(json_result)} results for {len(rules)} rules")
 
-            logger.info(f"LLM returned {len(json_result)} results for {len(rules)} rules")
+        llm_results = [
+            LLMRuleResult(
+                pattern=str(result.get("pattern", "")).strip(),
+                sub_category_id=str(result.get("sub_category_id", "")),
+                confidence=float(result.get("confidence", 0.0)),
+            )
+            for result in json_result
+            if isinstance(result, dict)
+        ]
 
-            llm_results = [
-                LLMRuleResult(
-                    pattern=str(result.get("pattern", "")).strip(),
-                    sub_category_id=str(result.get("sub_category_id", "")),
-                    confidence=float(result.get("confidence", 0.0)),
-                )
-                for result in json_result
-                if isinstance(result, dict)
-            ]
+        results = []
+        for rule in rules:
+            matching_result = self._find_matching_result(rule.normalized_description_pattern, llm_results)
 
-            results = []
-            for rule in rules:
-                matching_result = self._find_matching_result(rule.normalized_description_pattern, llm_results)
-
-                if matching_result:
-                    category_id = self._resolve_category_id(matching_result.sub_category_id, categories)
-                    if category_id:
-                        results.append(
-                            RuleCategorizationResult(
-                                rule_id=rule.id,
-                                suggested_category_id=category_id,
-                                confidence=matching_result.confidence,
-                            )
-                        )
-                    else:
-                        logger.warning(f"Category not found: {matching_result.sub_category_id}")
-                        results.append(
-                            RuleCategorizationResult(
-                                rule_id=rule.id,
-                                suggested_category_id=None,
-                                confidence=None,
-                                error_message=f"Category {matching_result.sub_category_id} not found",
-                            )
+            if matching_result:
+                category_id = self._resolve_category_id(matching_result.sub_category_id, aliases)
+                if category_id:
+                    results.append(
+                        RuleCategorizationResult(
+                            rule_id=rule.id,
+                            suggested_category_id=category_id,
+                            confidence=matching_result.confidence,
                         )
+                    )
                 else:
-                    logger.debug(f"No LLM result for pattern: {rule.normalized_description_pattern[:50]}")
+                    logger.warning(f"Category not found: {matching_result.sub_category_id}")
                     results.append(
                         RuleCategorizationResult(
                             rule_id=rule.id,
                             suggested_category_id=None,
                             confidence=None,
-                            error_message="No matching result from LLM",
+                            error_message=f"Category {matching_result.sub_category_id} not found",
                         )
                     )
+            else:
+                logger.debug(f"No LLM result for pattern: {rule.normalized_description_pattern[:50]}")
+                results.append(
+                    RuleCategorizationResult(
+                        rule_id=rule.id,
+                        suggested_category_id=None,
+                        confidence=None,
+                        error_message="No matching result from LLM",
+                    )
+                )
 
-            return results
+        return results
 
-        except Exception as e:
-            logger.error(f"Error in LLM batch categorization: {str(e)}", exc_info=True)
-            return [
-                RuleCategorizationResult(
-                    rule_id=rule.id,
-                    suggested_category_id=None,
-                    confidence=None,
-                    error_message=f"LLM error: {str(e)}",
-                )
-                for rule in rules
-            ]
+    def _error_results(self, rules: list[EnhancementRule], error: Exception) -> list[RuleCategorizationResult]:
+        return [
+            RuleCategorizationResult(
+                rule_id=rule.id,
+                suggested_category_id=None,
+                confidence=None,
+                error_message=f"LLM error: {str(error)}",
+            )
+            for rule in rules
+        ]
 
     def _find_matching_result(self, pattern: str, llm_results: list[LLMRuleResult]) -> Optional[LLMRuleResult]:
         pattern_normalized = pattern.strip().lower()
@@ -165,17 +217,13 @@ class LLMRuleCategorizer:
                 return result
         return None
 
-    def _resolve_category_id(self, sub_category_id: str, categories: list[Category]) -> Optional[UUID]:
+    def _resolve_category_id(self, sub_category_id: str, aliases: CategoryAliases) -> Optional[UUID]:
+        category_id = aliases.resolve(sub_category_id)
+        if category_id:
+            return category_id
+        # Models occasionally answer with a full id instead of the alias
         try:
             category_uuid = UUID(sub_category_id)
-            category = next(
-                (cat for cat in categories if cat.id == category_uuid),
-                None,
-            )
-            return category.id if category else None
         except ValueError:
-            category = next(
-                (cat for cat in categories if str(cat.id) == sub_category_id),
-                None,
-            )
-            return category.id if category else None
+            return None
+        return next((cat.id for cat in aliases.categories if cat.id == category_uuid), None)
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
 from app.adapters.repositories.account import SQLAlchemyAccountRepository
@@ -9,6 +9,9 @@ from app.ai.prompts import rule_counterparty_prompt
 from app.common.json_utils import sanitize_json
 from app.domain.models.categorization import RuleCounterpartyResult
 from app.domain.models.enhancement_rule import EnhancementRule
+from app.domain.models.llm_result_cache import LLMCacheKind
+from app.services.ai.llm_batch_runner import LLMBatchRunner
+from app.services.ai.llm_result_cache import CachedResult, LLMResultCache, accounts_hash, normalize_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +28,26 @@ class LLMRuleCounterparty:
         self,
         account_repository: SQLAlchemyAccountRepository,
         llm_client: LLMClient,
+        batch_runner: Optional[LLMBatchRunner[RuleCounterpartyResult]] = None,
+        result_cache: Optional[LLMResultCache] = None,
     ):
         self.account_repository = account_repository
         self.llm_client = llm_client
+        self.batch_runner = batch_runner or LLMBatchRunner(llm_client)
+        self.result_cache = result_cache
 
-    def suggest_counterparties(
+    async def suggest_counterparties(
         self,
         rules: list[EnhancementRule],
         user_id: UUID,
+        on_batch: Optional[Callable[[list[RuleCounterpartyResult]], None]] = None,
     ) -> list[RuleCounterpartyResult]:
         if not rules:
             return []
 
         accounts = self.account_repository.get_all(user_id)
         if not accounts:
-            return [
+            results = [
                 RuleCounterpartyResult(
                     rule_id=rule.id,
                     suggested_counterparty_id=None,
@@ -48,82 +56,142 @@ class LLMRuleCounterparty:
                 )
                 for rule in rules
             ]
+            if on_batch:
+                on_batch(results)
+            return results
 
-        try:
-            patterns = [rule.normalized_description_pattern for rule in rules]
-            prompt = rule_counterparty_prompt(patterns, accounts)
-
-            logger.debug(f"Sending {len(rules)} rules to LLM for counterparty identification")
-            response = self.llm_client.generate(prompt)
+        context = accounts_hash(accounts)
+        cached = self._cached_results(rules, user_id, context)
+        if cached and on_batch:
+            on_batch(list(cached.values()))
+
+        rules_by_id = {rule.id: rule for rule in rules}
+
+        def on_answered(results: list[RuleCounterpartyResult]) -> None:
+            self._cache_results(results, rules_by_id, user_id, context)
+            if on_batch:
+                on_batch(results)
+
+        answered = await self.batch_runner.run(
+            [rule for rule in rules if rule.id not in cached],
+            build_prompt=lambda batch: rule_counterparty_prompt(
+                [rule.normalized_description_pattern for rule in batch], accounts
+            ),
+            parse_response=lambda batch, response: self._parse_response(batch, response, accounts),
+            on_error=self._error_results,
+            on_batch=on_answered,
+        )
+        results_by_id = {**cached, **{result.rule_id: result for result in answered}}
+        return [results_by_id[rule.id] for rule in rules]
+
+    def _cached_results(self, rules: list[EnhancementRule], user_id: UUID, context: str) -> dict[UUID, RuleCounterpartyResult]:
+        if not self.result_cache:
+            return {}
+        hits = self.result_cache.get_many(
+            user_id,
+            LLMCacheKind.RULE_COUNTERPARTY,
+            [rule.normalized_description_pattern for rule in rules],
+            context,
+            self.llm_client.model_name,
+        )
+        results = {}
+        for rule in rules:
+            hit = hits.get(normalize_pattern(rule.normalized_description_pattern))
+            if hit:
+                results[rule.id] = RuleCounterpartyResult(
+                    rule_id=rule.id,
+                    suggested_counterparty_id=UUID(hit.result["account_id"]),
+                    confidence=hit.confidence,
+                )
+        return results
 
-            json_result = sanitize_json(response)
-            if not json_result:
-                return [
-                    RuleCounterpartyResult(
-                        rule_id=rule.id,
-                        suggested_counterparty_id=None,
-                        confidence=None,
-                        error_message="Invalid JSON response from LLM",
-                    )
-                    for rule in rules
-                ]
-
-            llm_results = [
-                LLMCounterpartyResult(
-                    pattern=str(result.get("pattern", "")),
-                    counterparty_account_id=result.get("counterparty_account_id"),
-                    confidence=float(result.get("confidence", 0.0)),
+    def _cache_results(
+        self,
+        results: list[RuleCounterpartyResult],
+        rules_by_id: dict[UUID, EnhancementRule],
+        user_id: UUID,
+        context: str,
+    ) -> None:
+        if not self.result_cache:
+            return
+        answers = {
+            rules_by_id[result.rule_id].normalized_description_pattern: CachedResult(
+                result={"account_id": str(result.suggested_counterparty_id)},
+                confidence=result.confidence,
+            )
+            for result in results
+            if result.is_successful and result.rule_id in rules_by_id
+        }
+        self.result_cache.put_many(user_id, LLMCacheKind.RULE_COUNTERPARTY, answers, context, self.llm_client.model_name)
+
+    def _parse_response(self, rules: list[EnhancementRule], response: str, accounts: list) -> list[RuleCounterpartyResult]:
+        json_result = sanitize_json(response)
+        if not json_result:
+            return [
+                RuleCounterpartyResult(
+                    rule_id=rule.id,
+                    suggested_counterparty_id=None,
+                    confidence=None,
+                    error_message="Invalid JSON response from LLM",
                 )
-                for result in json_result
-                if isinstance(result, dict)
+                for rule in rules
             ]
 
-            results = []
-            for rule in rules:
-                matching_result = self._find_matching_result(rule.normalized_description_pattern, llm_results)
-
-                if matching_result and matching_result.counterparty_account_id:
-                    account_id = self._resolve_account_id(matching_result.counterparty_account_id, accounts)
-                    if account_id:
-                        results.append(
-                            RuleCounterpartyResult(
-                                rule_id=rule.id,
-                                suggested_counterparty_id=account_id,
-                                confidence=matching_result.confidence,
-                            )
-                        )
-                    else:
-                        results.append(
-                            RuleCounterpartyResult(
-                                rule_id=rule.id,
-                                suggested_counterparty_id=None,
-                                confidence=None,
-                                error_message=f"Account {matching_result.counterparty_account_id} not found",
-                            )
+        llm_results = [
+            LLMCounterpartyResult(
+                pattern=str(result.get("pattern", "")),
+                counterparty_account_id=result.get("counterparty_account_id"),
+                confidence=float(result.get("confidence", 0.0)),
+            )
+            for result in json_result
+            if isinstance(result, dict)
+        ]
+
+        results = []
+        for rule in rules:
+            matching_result = self._find_matching_result(rule.normalized_description_pattern, llm_results)
+
+            if matching_result and matching_result.counterparty_account_id:
+                account_id = self._resolve_account_id(matching_result.counterparty_account_id, accounts)
+                if account_id:
+                    results.append(
+                        RuleCounterpartyResult(
+                            rule_id=rule.id,
+                            suggested_counterparty_id=account_id,
+                            confidence=matching_result.confidence,
                         )
+                    )
                 else:
                     results.append(
                         RuleCounterpartyResult(
                             rule_id=rule.id,
                             suggested_counterparty_id=None,
                             confidence=None,
-                            error_message="No counterparty identified by LLM",
+                            error_message=f"Account {matching_result.counterparty_account_id} not found",
                         )
                     )
+            else:
+                results.append(
+                    RuleCounterpartyResult(
+                        rule_id=rule.id,
+                        suggested_counterparty_id=None,
+                        confidence=None,
+                        error_message="No counterparty identified by LLM",
+                    )
+                )
 
-            return results
+        return results
 
-        except Exception as e:
-            logger.error(f"Error in LLM rule counterparty identification: {str(e)}")
-            return [
-                RuleCounterpartyResult(
-                    rule_id=rule.id,
-                    suggested_counterparty_id=None,
-                    confidence=None,
-                    error_message=f"LLM error: {str(e)}",
-                )
-                for rule in rules
-            ]
+    def _error_results(self, rules: list[EnhancementRule], error: Exception) -> list[RuleCounterpartyResult]:
+        return [
+            RuleCounterpartyResult(
+                rule_id=rule.id,
+                suggested_counterparty_id=None,
+                confidence=None,
+                error_message=f"LLM error: {str(error)}",
+            )
+            for rule in rules
+        ]
 
     def _find_matching_result(self, pattern: str, llm_results: list[LLMCounterpartyResult]) -> Optional[LLMCounterpartyResult]:
         for result in llm_results:
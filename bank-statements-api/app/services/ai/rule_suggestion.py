@@ -0,0 +1,208 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Optional, Union
+from uuid import UUID
+
+from app.api.schemas import AISuggestCategoriesRequest
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.domain.models.categorization import RuleCategorizationResult, RuleCounterpartyResult
+from app.domain.models.enhancement_rule import EnhancementRule
+from app.domain.models.processing import ProcessingProgress
+from app.ports.repositories.category import CategoryRepository
+from app.ports.repositories.enhancement_rule import EnhancementRuleRepository
+from app.services.ai.llm_rule_categorizer import LLMRuleCategorizer
+from app.services.ai.llm_rule_counterparty import LLMRuleCounterparty
+from app.services.ai.similarity_categorizer import SimilarityRuleCategorizer
+from app.services.background.background_job_service import BackgroundJobService
+from app.services.enhancement_rule_management import EnhancementRuleManagementService
+
+logger = logging.getLogger(__name__)
+
+SuggestionResult = Union[RuleCategorizationResult, RuleCounterpartyResult]
+ProgressCallback = Callable[[ProcessingProgress], None]
+
+# Rules picked when the request names none
+UNCONFIGURED_RULES_LIMIT = 100
+
+
+@dataclass
+class RuleSuggestionSummary:
+    processed: int = 0
+    auto_applied: int = 0
+    suggestions: int = 0
+    failed: int = 0
+    error_messages: set[str] = field(default_factory=set)
+
+    @property
+    def error_message(self) -> Optional[str]:
+        return "; ".join(sorted(self.error_messages)) or None
+
+    def to_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "auto_applied": self.auto_applied,
+            "suggestions": self.suggestions,
+            "failed": self.failed,
+            "error_message": self.error_message,
+        }
+
+
+class RuleSuggestionService:
+    """
+    Asks the LLM for category and counterparty suggestions on enhancement
+    rules and stores them as each batch comes back, so a long run keeps what
+    it has done if it is interrupted. Runs in the request or as a background job.
+    Categories the similarity categorizer is confident about never reach the LLM.
+    """
+
+    def __init__(
+        self,
+        enhancement_rule_management_service: EnhancementRuleManagementService,
+        enhancement_rule_repository: EnhancementRuleRepository,
+        category_repository: CategoryRepository,
+        llm_rule_categorizer: LLMRuleCategorizer,
+        llm_rule_counterparty: LLMRuleCounterparty,
+        background_job_service: BackgroundJobService,
+        similarity_categorizer: Optional[SimilarityRuleCategorizer] = None,
+    ):
+        self.enhancement_rule_management_service = enhancement_rule_management_service
+        self.enhancement_rule_repository = enhancement_rule_repository
+        self.category_repository = category_repository
+        self.llm_rule_categorizer = llm_rule_categorizer
+        self.llm_rule_counterparty = llm_rule_counterparty
+        self.background_job_service = background_job_service
+        self.similarity_categorizer = similarity_categorizer
+
+    def select_rules(self, user_id: UUID, rule_ids: Optional[list[UUID]] = None) -> list[EnhancementRule]:
+        if rule_ids:
+            rules = [self.enhancement_rule_management_service.get_rule(rule_id, user_id) for rule_id in rule_ids]
+            return [rule for rule in rules if rule is not None]
+
+        result = self.enhancement_rule_management_service.list_rules(
+            user_id=user_id,
+            limit=UNCONFIGURED_RULES_LIMIT,
+            offset=0,
+            rule_status_filter="unconfigured",
+        )
+        return result["rules"]
+
+    async def suggest_categories(
+        self,
+        user_id: UUID,
+        request: AISuggestCategoriesRequest,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> RuleSuggestionSummary:
+        categories = self.category_repository.get_all(user_id)
+        if not categories:
+            return RuleSuggestionSummary(error_messages={"No categories available. Create categories first."})
+
+        rules = self.select_rules(user_id, request.rule_ids)
+
+        def apply(rule: EnhancementRule, result: RuleCategorizationResult, auto_apply: bool) -> None:
+            rule.ai_suggested_category_id = result.suggested_category_id
+            rule.ai_category_confidence = result.confidence
+            if auto_apply:
+                rule.category_id = result.suggested_category_id
+                if self.similarity_categorizer:
+                    self.similarity_categorizer.learn(
+                        user_id, rule.normalized_description_pattern, result.suggested_category_id
+                    )
+
+        async def suggest(on_batch) -> None:
+            remaining = rules
+            if self.similarity_categorizer:
+                local_results, remaining = self.similarity_categorizer.suggest_categories(
+                    rules, user_id, {category.id for category in categories}
+                )
+                if local_results:
+                    on_batch(local_results)
+            if remaining:
+                await self.llm_rule_categorizer.suggest_categories(remaining, user_id, on_batch=on_batch)
+
+        return await self._run(rules, request, suggest, apply, on_progress)
+
+    async def suggest_counterparties(
+        self,
+        user_id: UUID,
+        request: AISuggestCategoriesRequest,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> RuleSuggestionSummary:
+        rules = self.select_rules(user_id, request.rule_ids)
+
+        def apply(rule: EnhancementRule, result: RuleCounterpartyResult, auto_apply: bool) -> None:
+            rule.ai_suggested_counterparty_id = result.suggested_counterparty_id
+            rule.ai_counterparty_confidence = result.confidence
+            if auto_apply:
+                rule.counterparty_account_id = result.suggested_counterparty_id
+
+        return await self._run(
+            rules,
+            request,
+            lambda on_batch: self.llm_rule_counterparty.suggest_counterparties(rules, user_id, on_batch=on_batch),
+            apply,
+            on_progress,
+        )
+
+    def queue_suggestions(self, job_type: JobType, user_id: UUID, request: AISuggestCategoriesRequest) -> BackgroundJob:
+        """Queue a rule suggestion job; the rules are selected when the worker runs it"""
+        return self.background_job_service.queue_job(
+            job_type,
+            user_id=user_id,
+            payload={"request": request.model_dump(mode="json", exclude={"background"})},
+        )
+
+    async def _run(
+        self,
+        rules: list[EnhancementRule],
+        request: AISuggestCategoriesRequest,
+        suggest,
+        apply: Callable[[EnhancementRule, SuggestionResult, bool], None],
+        on_progress: Optional[ProgressCallback],
+    ) -> RuleSuggestionSummary:
+        summary = RuleSuggestionSummary()
+        if not rules:
+            return summary
+
+        rules_by_id = {rule.id: rule for rule in rules}
+
+        def on_batch(results: list[SuggestionResult]) -> None:
+            processed_at = datetime.now(timezone.utc)
+            updated = []
+            for result in results:
+                summary.processed += 1
+                rule = rules_by_id.get(result.rule_id)
+                if not result.is_successful or rule is None:
+                    summary.failed += 1
+                    if result.error_message:
+                        summary.error_messages.add(result.error_message)
+                    continue
+
+                auto_apply = request.auto_apply and result.confidence >= request.confidence_threshold
+                apply(rule, result, auto_apply)
+                rule.ai_processed_at = processed_at
+                if auto_apply:
+                    summary.auto_applied += 1
+                else:
+                    summary.suggestions += 1
+                updated.append(rule)
+
+            if updated:
+                self.enhancement_rule_repository.save_all(updated)
+            if on_progress:
+                on_progress(
+                    ProcessingProgress(
+                        current_batch=summary.processed,
+                        total_batches=len(rules),
+                        processed_transactions=summary.processed,
+                        total_transactions=len(rules),
+                        phase="suggesting",
+                    )
+                )
+
+        await suggest(on_batch)
+        logger.info(
+            f"Rule suggestions: {summary.processed} processed, {summary.auto_applied} auto-applied, "
+            f"{summary.suggestions} suggested, {summary.failed} failed"
+        )
+        return summary
@@ -0,0 +1,239 @@
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from app.domain.models.categorization import RuleCategorizationResult
+from app.domain.models.enhancement_rule import EnhancementRule
+from app.ports.repositories.transaction import TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+# Votes are weighted by similarity to this power, so near-duplicates outvote loose matches
+VOTE_SHARPNESS = 3
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> Counter:
+    padded = f" {text.strip().lower()} "
+    if len(padded) <= n:
+        return Counter([padded])
+    return Counter(padded[i : i + n] for i in range(len(padded) - n + 1))
+
+
+@dataclass
+class _Document:
+    grams: Counter
+    categories: Counter = field(default_factory=Counter)
+
+
+@dataclass(frozen=True)
+class SimilarityPrediction:
+    category_id: UUID
+    confidence: float
+    similarity: float
+
+
+class CharNgramIndex:
+    """
+    TF-IDF vectors over character trigrams of categorised descriptions, with
+    an inverted index from trigram to description for nearest-neighbour
+    lookups. Descriptions can be added at any time; IDF weights and vector
+    norms are recomputed lazily on the next lookup.
+    """
+
+    def __init__(self):
+        self._documents: dict[str, _Document] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._document_frequency: Counter = Counter()
+        self._norms: Optional[dict[str, float]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, description: str, category_id: UUID, count: int = 1) -> None:
+        key = description.strip().lower()
+        if not key:
+            return
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                document = _Document(grams=char_ngrams(key))
+                self._documents[key] = document
+                for gram in document.grams:
+                    self._postings.setdefault(gram, set()).add(key)
+                    self._document_frequency[gram] += 1
+                self._norms = None
+            document.categories[category_id] += count
+
+    def nearest(self, description: str, k: int = 5) -> list[tuple[str, float]]:
+        """Up to k (description, cosine similarity) pairs, most similar first"""
+        with self._lock:
+            if not self._documents:
+                return []
+            norms = self._ensure_norms()
+            query = {gram: tf * self._idf(gram) for gram, tf in char_ngrams(description).items()}
+            query_norm = math.sqrt(sum(weight * weight for weight in query.values()))
+            if query_norm == 0:
+                return []
+
+            scores: Counter = Counter()
+            for gram, query_weight in query.items():
+                for key in self._postings.get(gram, ()):
+                    scores[key] += query_weight * self._documents[key].grams[gram] * self._idf(gram)
+
+            return [(key, score / (query_norm * norms[key])) for key, score in scores.most_common(k)]
+
+    def predict(
+        self,
+        description: str,
+        k: int = 5,
+        min_similarity: float = 0.3,
+        allowed_categories: Optional[set[UUID]] = None,
+    ) -> Optional[SimilarityPrediction]:
+        """
+        Vote among the k nearest descriptions, each weighted by its similarity
+        (raised to VOTE_SHARPNESS) and split across the categories its transactions were given. Confidence
+        is the winning category's share of the vote times the similarity of its
+        closest supporter, so an exact unanimous match scores close to 1.0 and a close
+        but contested one scores well below it.
+        """
+        votes: Counter = Counter()
+        best_similarity: dict[UUID, float] = {}
+        for key, similarity in self.nearest(description, k):
+            if similarity < min_similarity:
+                continue
+            categories = self._documents[key].categories
+            total = sum(categories.values())
+            for category_id, count in categories.items():
+                if allowed_categories is not None and category_id not in allowed_categories:
+                    continue
+                votes[category_id] += similarity**VOTE_SHARPNESS * count / total
+                best_similarity[category_id] = max(best_similarity.get(category_id, 0.0), similarity)
+
+        if not votes:
+            return None
+        category_id, score = votes.most_common(1)[0]
+        similarity = min(best_similarity[category_id], 1.0)
+        return SimilarityPrediction(
+            category_id=category_id,
+            confidence=similarity * score / sum(votes.values()),
+            similarity=similarity,
+        )
+
+    def _idf(self, gram: str) -> float:
+        return math.log((1 + len(self._documents)) / (1 + self._document_frequency[gram])) + 1
+
+    def _ensure_norms(self) -> dict[str, float]:
+        if self._norms is None:
+            self._norms = {
+                key: math.sqrt(sum((tf * self._idf(gram)) ** 2 for gram, tf in document.grams.items()))
+                for key, document in self._documents.items()
+            }
+        return self._norms
+
+
+class SimilarityIndexRegistry:
+    """Per-user indexes shared by the process, rebuilt from the database after max_age_seconds"""
+
+    def __init__(self, max_age_seconds: float = 900, clock: Callable[[], float] = time.monotonic):
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock
+        self._indexes: dict[UUID, tuple[CharNgramIndex, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID, load: Callable[[], Iterable[tuple[str, UUID, int]]]) -> CharNgramIndex:
+        with self._lock:
+            cached = self._indexes.get(user_id)
+            if cached and self.clock() - cached[1] < self.max_age_seconds:
+                return cached[0]
+
+        started = time.perf_counter()
+        index = CharNgramIndex()
+        for description, category_id, count in load():
+            index.add(description, category_id, count)
+        logger.info(
+            f"Built similarity index for user {user_id}: {len(index)} descriptions "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        with self._lock:
+            self._indexes[user_id] = (index, self.clock())
+        return index
+
+    def peek(self, user_id: UUID) -> Optional[CharNgramIndex]:
+        with self._lock:
+            cached = self._indexes.get(user_id)
+            return cached[0] if cached else None
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._indexes.pop(user_id, None)
+
+
+SIMILARITY_INDEXES = SimilarityIndexRegistry()
+
+
+class SimilarityRuleCategorizer:
+    """
+    Proposes categories for rules from the user's own categorised transactions,
+    in process and without an LLM call. Only predictions at or above
+    min_confidence are returned; the other rules are left for the LLM.
+    """
+
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        registry: SimilarityIndexRegistry = SIMILARITY_INDEXES,
+        min_confidence: float = 0.85,
+        training_limit: int = 20_000,
+    ):
+        self.transaction_repository = transaction_repository
+        self.registry = registry
+        self.min_confidence = min_confidence
+        self.training_limit = training_limit
+
+    def suggest_categories(
+        self,
+        rules: list[EnhancementRule],
+        user_id: UUID,
+        category_ids: set[UUID],
+    ) -> tuple[list[RuleCategorizationResult], list[EnhancementRule]]:
+        """Confident suggestions, and the rules that still need the LLM"""
+        if not rules:
+            return [], []
+
+        index = self.registry.get(
+            user_id,
+            lambda: self.transaction_repository.get_categorised_descriptions(user_id, self.training_limit),
+        )
+        if not len(index):
+            return [], rules
+
+        results = []
+        remaining = []
+        for rule in rules:
+            prediction = index.predict(rule.normalized_description_pattern, allowed_categories=category_ids)
+            if prediction and prediction.confidence >= self.min_confidence:
+                results.append(
+                    RuleCategorizationResult(
+                        rule_id=rule.id,
+                        suggested_category_id=prediction.category_id,
+                        confidence=round(prediction.confidence, 4),
+                    )
+                )
+            else:
+                remaining.append(rule)
+
+        logger.info(f"Similarity categorizer answered {len(results)} of {len(rules)} rules locally")
+        return results, remaining
+
+    def learn(self, user_id: UUID, description: str, category_id: UUID) -> None:
+        """Add a newly categorised description to the user's index, if one is loaded"""
+        index = self.registry.peek(user_id)
+        if index is not None:
+            index.add(description, category_id)
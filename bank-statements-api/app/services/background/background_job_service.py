@@ -1,10 +1,14 @@
+import asyncio
 import logging
-from typing import Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from app.domain.models.background_job import BackgroundJob, JobStatus
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
 from app.domain.models.processing import BackgroundJobInfo, ProcessingProgress
 from app.ports.repositories.background_job import BackgroundJobRepository
+from app.services.background.progress_reporter import JOB_THROUGHPUT, ProgressReporter, ThroughputEstimator
 
 logger = logging.getLogger(__name__)
 
@@ -16,83 +20,94 @@ class BackgroundJobService:
     Handles queuing, status tracking, and lifecycle management of background jobs.
     """
 
-    def __init__(self, repository: BackgroundJobRepository):
+    def __init__(self, repository: BackgroundJobRepository, throughput: ThroughputEstimator = JOB_THROUGHPUT):
         self.repository = repository
+        self.throughput = throughput
+
+    def queue_job(
+        self,
+        job_type: JobType,
+        user_id: Optional[UUID] = None,
+        uploaded_file_id: Optional[UUID] = None,
+        payload: Optional[dict] = None,
+    ) -> BackgroundJob:
+        """Create a pending job for the worker to pick up"""
+        job = BackgroundJob(
+            job_type=job_type,
+            status=JobStatus.PENDING,
+            user_id=user_id,
+            uploaded_file_id=uploaded_file_id,
+            payload=payload or {},
+            progress={},
+        )
+        created_job = self.repository.create(job)
+        logger.info(f"Queued {job_type.value} job {created_job.id}")
+
+        return created_job
+
+    def queue_job_once(self, job_type: JobType, user_id: Optional[UUID] = None) -> BackgroundJob:
+        """Queue a job unless one of the same type is already waiting to run for the user"""
+        pending = self.repository.find_pending_job(job_type, user_id)
+        if pending:
+            return pending
+        return self.queue_job(job_type, user_id=user_id)
+
+    def queue_job_if_due(
+        self, job_type: JobType, interval: timedelta, user_id: Optional[UUID] = None
+    ) -> Optional[BackgroundJob]:
+        """Queue a periodic job unless one of the same type was queued within the interval. Returns the new job."""
+        if self.repository.find_job_created_since(job_type, user_id, datetime.now(timezone.utc) - interval):
+            return None
+        return self.queue_job(job_type, user_id=user_id)
 
     def get_job_status(self, job_id: UUID) -> Optional[BackgroundJob]:
         """Get job status by ID"""
         return self.repository.get_by_id(job_id)
 
-    def update_job_progress(self, job_id: UUID, progress: ProcessingProgress) -> Optional[BackgroundJob]:
-        """Update job progress"""
-        job = self.repository.get_by_id(job_id)
-        if not job:
-            return None
-
-        # Update progress data
-        job.progress.update(
-            {
-                "current_batch": progress.current_batch,
-                "total_batches": progress.total_batches,
-                "processed_transactions": progress.processed_transactions,
-                "total_transactions": progress.total_transactions,
-                "phase": progress.phase,
-            }
-        )
-
+    def update_job_progress(self, job_id: UUID, progress: ProcessingProgress) -> bool:
+        """Write progress immediately. Jobs reporting often should use progress_reporter instead."""
+        delta = {
+            "current_batch": progress.current_batch,
+            "total_batches": progress.total_batches,
+            "processed_transactions": progress.processed_transactions,
+            "total_transactions": progress.total_transactions,
+            "phase": progress.phase,
+            "duplicate_transactions": progress.duplicate_transactions,
+        }
         if progress.estimated_completion_seconds:
-            job.progress["estimated_completion_seconds"] = progress.estimated_completion_seconds
+            delta["estimated_completion_seconds"] = progress.estimated_completion_seconds
 
-        # Save updated job
-        updated_job = self.repository.update(job)
+        updated = self.repository.merge_progress(job_id, delta)
         logger.debug(f"Updated progress for job {job_id}: {progress.percentage:.1f}% complete")
 
-        return updated_job
+        return updated
 
-    def mark_job_started(self, job_id: UUID) -> Optional[BackgroundJob]:
-        """Mark job as started"""
-        job = self.repository.get_by_id(job_id)
-        if not job:
-            return None
+    def progress_reporter(self, job_id: UUID, job_type: JobType, **options) -> ProgressReporter:
+        """Throttled progress writer for a running job; see ProgressReporter for options"""
+        return ProgressReporter(self.repository, job_id, job_type, throughput=self.throughput, **options)
 
-        # Use the model's built-in method
-        job.mark_started()
-
-        # Save updated job
-        updated_job = self.repository.update(job)
-        logger.info(f"Marked job {job_id} as started")
-
-        return updated_job
+    def mark_job_started(self, job_id: UUID) -> Optional[BackgroundJob]:
+        """Mark job as started, unless it is missing or no longer pending"""
+        job = self.repository.mark_started(job_id)
+        if job:
+            logger.info(f"Marked job {job_id} as started")
+        return job
 
     def mark_job_completed(self, job_id: UUID, result: dict = None) -> Optional[BackgroundJob]:
-        """Mark job as completed with results"""
-        job = self.repository.get_by_id(job_id)
-        if not job:
-            return None
-
-        # Use the model's built-in method
-        job.mark_completed(result)
-
-        # Save updated job
-        updated_job = self.repository.update(job)
-        logger.info(f"Marked job {job_id} as completed")
-
-        return updated_job
+        """Mark job as completed with results, unless it is missing or no longer running"""
+        job = self.repository.mark_completed(job_id, result)
+        if job:
+            logger.info(f"Marked job {job_id} as completed")
+        else:
+            logger.warning(f"Job {job_id} was not running when it completed; its lease may have expired")
+        return job
 
     def mark_job_failed(self, job_id: UUID, error_message: str = None) -> Optional[BackgroundJob]:
-        """Mark job as failed with error message"""
-        job = self.repository.get_by_id(job_id)
-        if not job:
-            return None
-
-        # Use the model's built-in method
-        job.mark_failed(error_message)
-
-        # Save updated job
-        updated_job = self.repository.update(job)
-        logger.warning(f"Marked job {job_id} as failed: {error_message}")
-
-        return updated_job
+        """Mark job as failed with error message, unless it is missing or already finished"""
+        job = self.repository.mark_failed(job_id, error_message)
+        if job:
+            logger.warning(f"Marked job {job_id} as failed: {error_message}")
+        return job
 
     def retry_failed_job(self, job_id: UUID) -> BackgroundJob:
         """Retry a failed job"""
@@ -131,11 +146,7 @@ class BackgroundJobService:
         # Estimate completion time if job is in progress
         estimated_completion_seconds = None
         if job.status == JobStatus.IN_PROGRESS:
-            processed = job.progress.get("processed_transactions", 0)
-            total = job.progress.get("total_transactions", 0)
-            if total > processed:
-                # Simple estimation: assume 0.5 seconds per transaction
-                estimated_completion_seconds = self.estimate_completion_time(total - processed, 0.5)
+            estimated_completion_seconds = self.estimate_completion_time(job)
 
         return BackgroundJobInfo(
             job_id=job_id,
@@ -145,23 +156,64 @@ class BackgroundJobService:
             status_url=status_url,
         )
 
-    def estimate_completion_time(
-        self,
-        remaining_transactions: int,
-        avg_processing_time_per_transaction: float,
-    ) -> int:
-        """Estimate completion time in seconds"""
+    def estimate_completion_time(self, job: BackgroundJob) -> Optional[int]:
+        """
+        Estimate the seconds left from measured throughput: the rate the job's
+        worker last recorded, else this process's average for the job type.
+        None until some throughput has been measured.
+        """
+        remaining_transactions = job.progress.get("total_transactions", 0) - job.progress.get("processed_transactions", 0)
         if remaining_transactions <= 0:
             return 0
 
-        return int(remaining_transactions * avg_processing_time_per_transaction)
+        rows_per_second = job.progress.get("rows_per_second") or self.throughput.rate(job.job_type)
+        if not rows_per_second:
+            return None
+
+        return int(remaining_transactions / rows_per_second)
 
-    def get_job_status_for_api(self, job_id: UUID) -> Optional[dict]:
+    def get_job_status_for_api(self, job_id: UUID, user_id: Optional[UUID] = None) -> Optional[dict]:
         """Get detailed job status information formatted for API responses"""
         job = self.repository.get_by_id(job_id)
-        if not job:
+        if not job or not self._is_visible_to(job, user_id):
             return None
 
+        return self._format_job_status(job)
+
+    async def stream_job_status(
+        self,
+        job_id: UUID,
+        user_id: Optional[UUID] = None,
+        poll_interval_seconds: float = 1.0,
+        heartbeat_seconds: float = 15.0,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield the job status whenever it changes, until the job reaches a terminal state.
+        An unchanged status is repeated every heartbeat_seconds to keep idle connections open.
+        """
+        previous = None
+        last_sent = 0.0
+        while True:
+            job = await asyncio.to_thread(self.repository.read_snapshot, job_id)
+            if not job or not self._is_visible_to(job, user_id):
+                return
+
+            status = self._format_job_status(job)
+            now = time.monotonic()
+            if status != previous or now - last_sent >= heartbeat_seconds:
+                yield status
+                previous = status
+                last_sent = now
+
+            if job.is_terminal:
+                return
+            await asyncio.sleep(poll_interval_seconds)
+
+    @staticmethod
+    def _is_visible_to(job: BackgroundJob, user_id: Optional[UUID]) -> bool:
+        return user_id is None or job.user_id is None or job.user_id == user_id
+
+    def _format_job_status(self, job: BackgroundJob) -> dict:
         # Extract progress information
         total_transactions = job.progress.get("total_transactions", 0)
         processed_transactions = job.progress.get("processed_transactions", 0)
@@ -171,7 +223,7 @@ class BackgroundJobService:
         # Estimate completion time if job is in progress
         estimated_completion_seconds = None
         if job.status == JobStatus.IN_PROGRESS and remaining_transactions > 0:
-            estimated_completion_seconds = self.estimate_completion_time(remaining_transactions, 0.5)
+            estimated_completion_seconds = self.estimate_completion_time(job)
 
         # Build progress object
         progress_data = {
@@ -180,6 +232,8 @@ class BackgroundJobService:
             "remaining_transactions": remaining_transactions,
             "completion_percentage": round(completion_percentage, 1),
             "estimated_completion_seconds": estimated_completion_seconds,
+            "phase": job.progress.get("phase"),
+            "duplicate_transactions": job.progress.get("duplicate_transactions"),
         }
 
         # Build result object if job is completed
@@ -190,6 +244,8 @@ class BackgroundJobService:
                 "successfully_categorized": job.result.get("successfully_categorized", 0),
                 "failed_categorizations": job.result.get("failed_categorizations", 0),
                 "processing_time_ms": job.result.get("processing_time_ms", 0),
+                "transactions_saved": job.result.get("transactions_saved"),
+                "duplicated_transactions": job.result.get("duplicated_transactions"),
             }
 
         return {
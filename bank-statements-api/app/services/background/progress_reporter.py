@@ -0,0 +1,135 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from app.domain.models.background_job import JobType
+from app.domain.models.processing import ProcessingProgress
+from app.ports.repositories.background_job import BackgroundJobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ThroughputEstimator:
+    """
+    Exponentially weighted moving average of rows per second, per job type.
+
+    Each flush of a running job contributes one sample, so the estimate follows
+    recent jobs and is available before a new job has measured anything itself.
+    """
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self._rates: Dict[JobType, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, job_type: JobType, rows: int, seconds: float) -> Optional[float]:
+        if rows <= 0 or seconds <= 0:
+            return self.rate(job_type)
+        sample = rows / seconds
+        with self._lock:
+            previous = self._rates.get(job_type)
+            rate = sample if previous is None else self.alpha * sample + (1 - self.alpha) * previous
+            self._rates[job_type] = rate
+        return rate
+
+    def rate(self, job_type: JobType) -> Optional[float]:
+        return self._rates.get(job_type)
+
+    def estimate_seconds(self, job_type: JobType, remaining_rows: int) -> Optional[int]:
+        rate = self.rate(job_type)
+        if remaining_rows <= 0:
+            return 0
+        if not rate:
+            return None
+        return int(remaining_rows / rate)
+
+
+JOB_THROUGHPUT = ThroughputEstimator()
+
+
+class ProgressReporter:
+    """
+    Buffers progress updates for one job and writes them with a single
+    progress || delta UPDATE, at most every min_interval_ms unless the
+    completion percentage moved by min_percent_change or the phase changed.
+    Only keys that changed since the last write are sent.
+    """
+
+    def __init__(
+        self,
+        repository: BackgroundJobRepository,
+        job_id: UUID,
+        job_type: JobType,
+        min_interval_ms: int = 500,
+        min_percent_change: float = 5.0,
+        throughput: ThroughputEstimator = JOB_THROUGHPUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.repository = repository
+        self.job_id = job_id
+        self.job_type = job_type
+        self.min_interval_ms = min_interval_ms
+        self.min_percent_change = min_percent_change
+        self.throughput = throughput
+        self.clock = clock
+
+        self._pending: Optional[ProcessingProgress] = None
+        self._written: dict = {}
+        self._written_at: Optional[float] = None
+        self._written_percentage = 0.0
+        self._written_rows = 0
+
+    def report(self, progress: ProcessingProgress) -> None:
+        self._pending = progress
+        if self._is_due(progress):
+            self.flush()
+
+    def flush(self) -> None:
+        progress = self._pending
+        if progress is None:
+            return
+        self._pending = None
+
+        now = self.clock()
+        rows_per_second = self._record_throughput(progress, now)
+        state = {
+            "phase": progress.phase,
+            "current_batch": progress.current_batch,
+            "total_batches": progress.total_batches,
+            "processed_transactions": progress.processed_transactions,
+            "total_transactions": progress.total_transactions,
+            "duplicate_transactions": progress.duplicate_transactions,
+            "estimated_completion_seconds": self.throughput.estimate_seconds(
+                self.job_type, progress.total_transactions - progress.processed_transactions
+            ),
+        }
+        if rows_per_second:
+            state["rows_per_second"] = round(rows_per_second, 2)
+
+        delta = {key: value for key, value in state.items() if self._written.get(key, object()) != value}
+        self._written_at = now
+        self._written_percentage = progress.percentage
+        self._written_rows = progress.processed_transactions
+        if not delta:
+            return
+
+        self.repository.merge_progress(self.job_id, delta)
+        self._written.update(delta)
+        logger.debug(f"Flushed progress for job {self.job_id}: {progress.percentage:.1f}% ({progress.phase})")
+
+    def _is_due(self, progress: ProcessingProgress) -> bool:
+        if self._written_at is None or progress.phase != self._written.get("phase"):
+            return True
+        if progress.total_transactions and progress.processed_transactions >= progress.total_transactions:
+            return True
+        if abs(progress.percentage - self._written_percentage) >= self.min_percent_change:
+            return True
+        return (self.clock() - self._written_at) * 1000 >= self.min_interval_ms
+
+    def _record_throughput(self, progress: ProcessingProgress, now: float) -> Optional[float]:
+        if self._written_at is None:
+            return None
+        rows = progress.processed_transactions - self._written_rows
+        return self.throughput.record(self.job_type, rows, now - self._written_at)
@@ -5,12 +5,25 @@ from uuid import UUID
 
 from app.api.errors import ConflictError, NotFoundError, ValidationError
 from app.domain.models.category import Category
+from app.domain.models.llm_result_cache import LLMCacheKind
 from app.ports.repositories.category import CategoryRepository
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.ai.llm_result_cache import LLMResultCache
+from app.services.category_tree import CATEGORY_TREES, CategoryTree, CategoryTreeCache
 
 
 class CategoryService:
-    def __init__(self, category_repository: CategoryRepository):
+    def __init__(
+        self,
+        category_repository: CategoryRepository,
+        llm_result_cache: Optional[LLMResultCache] = None,
+        category_trees: CategoryTreeCache = CATEGORY_TREES,
+        user_data_version_repository: Optional[UserDataVersionRepository] = None,
+    ):
         self.category_repository = category_repository
+        self.llm_result_cache = llm_result_cache
+        self.category_trees = category_trees
+        self.user_data_version_repository = user_data_version_repository
 
     def create_category(
         self, name: str, user_id: UUID, parent_id: Optional[UUID] = None, color: Optional[str] = None
@@ -24,7 +37,9 @@ class CategoryService:
                 raise ValidationError("Cannot create more than 2 levels of categories")
 
         category = Category(name=name, user_id=user_id, parent_id=parent_id, color=color)
-        return self.category_repository.create(category)
+        created = self.category_repository.create(category)
+        self._categories_changed(user_id)
+        return created
 
     def get_category(self, category_id: UUID, user_id: UUID) -> Optional[Category]:
         return self.category_repository.get_by_id(category_id, user_id)
@@ -32,6 +47,10 @@ class CategoryService:
     def get_all_categories(self, user_id: UUID) -> List[Category]:
         return self.category_repository.get_all(user_id)
 
+    def get_category_tree(self, user_id: UUID) -> CategoryTree:
+        version = self.user_data_version_repository.get_version(user_id) if self.user_data_version_repository else None
+        return self.category_trees.get(user_id, version, lambda: self.category_repository.get_all(user_id))
+
     def get_root_categories(self, user_id: UUID) -> List[Category]:
         return self.category_repository.get_root_categories(user_id)
 
@@ -65,18 +84,25 @@ class CategoryService:
             if parent.parent_id:
                 raise ValidationError("Cannot create more than 2 levels of categories")
 
+        renamed_or_moved = category.name != name or category.parent_id != parent_id
         category.name = name
         category.parent_id = parent_id
         category.color = color
 
-        return self.category_repository.update(category)
+        updated = self.category_repository.update(category)
+        if renamed_or_moved:
+            self._categories_changed(user_id)
+        return updated
 
     def delete_category(self, category_id: UUID, user_id: UUID) -> bool:
         subcategories = self.category_repository.get_subcategories(category_id, user_id)
         if subcategories:
             raise ConflictError("Cannot delete a category that has subcategories")
 
-        return self.category_repository.delete(category_id, user_id)
+        deleted = self.category_repository.delete(category_id, user_id)
+        if deleted:
+            self._categories_changed(user_id)
+        return deleted
 
     def upsert_category(
         self, name: str, user_id: UUID, parent_id: Optional[UUID] = None, color: Optional[str] = None
@@ -97,7 +123,9 @@ class CategoryService:
             return existing_category
 
         category = Category(name=name, user_id=user_id, parent_id=parent_id, color=color)
-        return self.category_repository.create(category)
+        created = self.category_repository.create(category)
+        self._categories_changed(user_id)
+        return created
 
     def upsert_categories_from_csv(self, csv_content: str, user_id: UUID) -> List[Category]:
         categories = []
@@ -140,3 +168,8 @@ class CategoryService:
             raise
         except Exception as e:
             raise ValidationError(f"Error processing CSV: {str(e)}")
+
+    def _categories_changed(self, user_id: UUID) -> None:
+        # Suggestions were made against the old category list and would reference missing or renamed categories
+        if self.llm_result_cache:
+            self.llm_result_cache.invalidate(user_id, [LLMCacheKind.RULE_CATEGORY])
@@ -0,0 +1,135 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from app.domain.models.category import Category
+
+logger = logging.getLogger(__name__)
+
+FULL_NAME_SEPARATOR = " > "
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    id: UUID
+    name: str
+    parent_id: Optional[UUID]
+
+
+class CategoryTree:
+    """
+    A user's categories as plain values, with each category's descendants and
+    full-path name worked out once, so lookups don't touch the database and
+    the tree outlives the session that loaded it.
+    """
+
+    def __init__(self, categories: Iterable[Category]):
+        self._nodes: dict[UUID, CategoryNode] = {
+            c.id: CategoryNode(id=c.id, name=c.name, parent_id=c.parent_id) for c in categories
+        }
+        self._children: dict[UUID, list[UUID]] = {}
+        for node in self._nodes.values():
+            if node.parent_id in self._nodes:
+                self._children.setdefault(node.parent_id, []).append(node.id)
+
+        self._descendants: dict[UUID, frozenset[UUID]] = {}
+        self._full_names: dict[UUID, str] = {}
+        for node in self._nodes.values():
+            self._descendants[node.id] = self._collect_descendants(node.id)
+            self._full_names[node.id] = self._build_full_name(node)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, category_id: UUID) -> bool:
+        return category_id in self._nodes
+
+    def get(self, category_id: UUID) -> Optional[CategoryNode]:
+        return self._nodes.get(category_id)
+
+    def parent_id(self, category_id: UUID) -> Optional[UUID]:
+        node = self._nodes.get(category_id)
+        return node.parent_id if node else None
+
+    def children(self, category_id: UUID) -> list[UUID]:
+        return list(self._children.get(category_id, ()))
+
+    def descendant_ids(self, category_id: UUID) -> frozenset[UUID]:
+        """The category and every category below it; unknown ids map to themselves"""
+        return self._descendants.get(category_id, frozenset((category_id,)))
+
+    def expand(self, category_ids: Iterable[UUID]) -> list[UUID]:
+        """The given categories together with all their descendants"""
+        expanded: set[UUID] = set()
+        for category_id in category_ids:
+            expanded |= self.descendant_ids(category_id)
+        return list(expanded)
+
+    def full_name(self, category_id: Optional[UUID]) -> str:
+        """'Parent > Child' for subcategories, the name for root categories and '' for unknown ids"""
+        if category_id is None:
+            return ""
+        return self._full_names.get(category_id, "")
+
+    def _collect_descendants(self, category_id: UUID) -> frozenset[UUID]:
+        collected = {category_id}
+        pending = [category_id]
+        while pending:
+            for child_id in self._children.get(pending.pop(), ()):
+                if child_id not in collected:
+                    collected.add(child_id)
+                    pending.append(child_id)
+        return frozenset(collected)
+
+    def _build_full_name(self, node: CategoryNode) -> str:
+        names = [node.name]
+        seen = {node.id}
+        parent = self._nodes.get(node.parent_id)
+        while parent is not None and parent.id not in seen:
+            names.append(parent.name)
+            seen.add(parent.id)
+            parent = self._nodes.get(parent.parent_id)
+        return FULL_NAME_SEPARATOR.join(reversed(names))
+
+
+class CategoryTreeCache:
+    """
+    Per-user category trees shared by the process, keyed on the user's data
+    version so a category created, renamed, moved or deleted by any process
+    is seen by the next request. Without a version the tree is built for the
+    caller and not kept.
+    """
+
+    def __init__(self, max_users: int = 1024):
+        self.max_users = max_users
+        self._trees: "OrderedDict[UUID, tuple[int, CategoryTree]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID, version: Optional[int], load: Callable[[], Iterable[Category]]) -> CategoryTree:
+        if version is not None:
+            with self._lock:
+                cached = self._trees.get(user_id)
+                if cached and cached[0] == version:
+                    self._trees.move_to_end(user_id)
+                    return cached[1]
+
+        tree = CategoryTree(load())
+        logger.debug(f"Built category tree for user {user_id} at version {version}: {len(tree)} categories")
+        if version is None:
+            return tree
+        with self._lock:
+            cached = self._trees.get(user_id)
+            # A request still on an older snapshot must not replace a newer tree
+            if cached and cached[0] > version:
+                return tree
+            self._trees[user_id] = (version, tree)
+            self._trees.move_to_end(user_id)
+            while len(self._trees) > self.max_users:
+                self._trees.popitem(last=False)
+        return tree
+
+
+CATEGORY_TREES = CategoryTreeCache()
@@ -4,11 +4,13 @@ from typing import Any
 from uuid import UUID
 
 from app.ai.llm_client import LLMClient
+from app.ports.repositories.user_data_version import UserDataVersionRepository
 from app.services.account import AccountService
 from app.services.category import CategoryService
+from app.services.chat.data_context import CHAT_DATA, ChatDataCache, ChatDataContext
 from app.services.chat.data_functions import create_chat_functions
 from app.services.chat.prompts import CHAT_SYSTEM_PROMPT
-from app.services.recurring_expense_analyzer import RecurringExpenseAnalyzer
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
 from app.services.transaction import TransactionService
 
 
@@ -19,13 +21,17 @@ class ChatService:
         transaction_service: TransactionService,
         category_service: CategoryService,
         account_service: AccountService,
-        recurring_analyzer: RecurringExpenseAnalyzer,
+        recurring_pattern_service: RecurringPatternSnapshotService,
+        user_data_version_repository: UserDataVersionRepository,
+        chat_data: ChatDataCache = CHAT_DATA,
     ):
         self.llm_client = llm_client
         self.transaction_service = transaction_service
         self.category_service = category_service
         self.account_service = account_service
-        self.recurring_analyzer = recurring_analyzer
+        self.recurring_pattern_service = recurring_pattern_service
+        self.user_data_version_repository = user_data_version_repository
+        self.chat_data = chat_data
 
     async def process_message(
         self,
@@ -33,15 +39,21 @@ class ChatService:
         message: str,
         history: list[dict[str, Any]],
     ) -> AsyncGenerator[dict[str, Any], None]:
+        # Lookups and tool results are reused across the turns of a conversation until the user's data changes
+        context = ChatDataContext(
+            user_id,
+            self.chat_data.get(user_id, self.user_data_version_repository.get_version(user_id)),
+            self.category_service,
+            self.account_service,
+        )
         tools = create_chat_functions(
             user_id=user_id,
             transaction_service=self.transaction_service,
-            category_service=self.category_service,
-            account_service=self.account_service,
-            recurring_analyzer=self.recurring_analyzer,
+            context=context,
+            recurring_pattern_service=self.recurring_pattern_service,
         )
 
-        accounts = self.account_service.get_all_accounts(user_id)
+        accounts = context.accounts()
         currencies = {acc.currency for acc in accounts if acc.currency}
         currency = currencies.pop() if len(currencies) == 1 else "EUR"
 
@@ -0,0 +1,134 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Optional, TypeVar
+from uuid import UUID
+
+from app.services.account import AccountService
+from app.services.category import CategoryService
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ChatCategory:
+    id: UUID
+    name: str
+    parent_id: Optional[UUID]
+
+
+@dataclass(frozen=True)
+class ChatAccount:
+    id: UUID
+    name: str
+    currency: Optional[str]
+
+
+@dataclass
+class ChatData:
+    """
+    What the chat tools have looked up for one user at one data version.
+    Holds plain values only, never ORM objects, so it outlives the session
+    that loaded it.
+    """
+
+    version: int
+    day: date
+    categories: Optional[list[ChatCategory]] = None
+    categories_by_id: dict[UUID, ChatCategory] = field(default_factory=dict)
+    accounts: Optional[list[ChatAccount]] = None
+    results: "OrderedDict[tuple, Any]" = field(default_factory=OrderedDict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ChatDataCache:
+    """
+    Per-user ChatData shared by the process, replaced when the user's data
+    version moves (any write to their transactions, categories or accounts)
+    or the day changes, so follow-up questions in a conversation reuse it.
+    """
+
+    def __init__(self, max_users: int = 256, clock: Callable[[], date] = date.today):
+        self.max_users = max_users
+        self.clock = clock
+        self._entries: "OrderedDict[UUID, ChatData]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID, version: int) -> ChatData:
+        today = self.clock()
+        with self._lock:
+            data = self._entries.get(user_id)
+            if data is None or data.version != version or data.day != today:
+                data = ChatData(version=version, day=today)
+                self._entries[user_id] = data
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+            return data
+
+
+CHAT_DATA = ChatDataCache()
+
+
+class ChatDataContext:
+    """Read-through access to a user's ChatData for the chat tools of one turn"""
+
+    def __init__(
+        self,
+        user_id: UUID,
+        data: ChatData,
+        category_service: CategoryService,
+        account_service: AccountService,
+        max_results: int = 64,
+    ):
+        self.user_id = user_id
+        self.data = data
+        self.category_service = category_service
+        self.account_service = account_service
+        self.max_results = max_results
+
+    def categories(self) -> list[ChatCategory]:
+        if self.data.categories is None:
+            categories = [
+                ChatCategory(id=c.id, name=c.name, parent_id=c.parent_id)
+                for c in self.category_service.get_all_categories(self.user_id)
+            ]
+            self.data.categories_by_id = {c.id: c for c in categories}
+            self.data.categories = categories
+        return self.data.categories
+
+    def category_map(self) -> dict[UUID, ChatCategory]:
+        self.categories()
+        return self.data.categories_by_id
+
+    def find_category(self, name: str) -> Optional[ChatCategory]:
+        name = name.lower()
+        return next((c for c in self.categories() if c.name.lower() == name), None)
+
+    def parent_name(self, category: ChatCategory) -> Optional[str]:
+        if not category.parent_id:
+            return None
+        parent = self.category_map().get(category.parent_id)
+        return parent.name if parent else None
+
+    def accounts(self) -> list[ChatAccount]:
+        if self.data.accounts is None:
+            self.data.accounts = [
+                ChatAccount(id=a.id, name=a.name, currency=a.currency)
+                for a in self.account_service.get_all_accounts(self.user_id)
+            ]
+        return self.data.accounts
+
+    def memoize(self, key: tuple, compute: Callable[[], T]) -> T:
+        """compute() once per key for as long as the data version holds, keeping the latest max_results"""
+        with self.data.lock:
+            if key in self.data.results:
+                self.data.results.move_to_end(key)
+                return self.data.results[key]
+        result = compute()
+        with self.data.lock:
+            self.data.results[key] = result
+            while len(self.data.results) > self.max_results:
+                self.data.results.popitem(last=False)
+        return result
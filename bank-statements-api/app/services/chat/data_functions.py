@@ -3,18 +3,16 @@ from decimal import Decimal
 from typing import Any, Callable, Optional
 from uuid import UUID
 
-from app.services.account import AccountService
-from app.services.category import CategoryService
-from app.services.recurring_expense_analyzer import RecurringExpenseAnalyzer
+from app.services.chat.data_context import ChatDataContext
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
 from app.services.transaction import TransactionService
 
 
 def create_chat_functions(
     user_id: UUID,
     transaction_service: TransactionService,
-    category_service: CategoryService,
-    account_service: AccountService,
-    recurring_analyzer: RecurringExpenseAnalyzer,
+    context: ChatDataContext,
+    recurring_pattern_service: RecurringPatternSnapshotService,
 ) -> list[Callable]:
 
     async def get_category_totals(
@@ -33,6 +31,12 @@ def create_chat_functions(
         Use 'debit' for spending questions, 'credit' for income questions.
         IMPORTANT: Do NOT pass dates unless the user specifically asks for a time period.
         """
+        return context.memoize(
+            ("category_totals", start_date, end_date, transaction_type),
+            lambda: _category_totals(start_date, end_date, transaction_type),
+        )
+
+    def _category_totals(start_date: Optional[str], end_date: Optional[str], transaction_type: str) -> dict[str, Any]:
         parsed_start = date.fromisoformat(start_date) if start_date else None
         parsed_end = date.fromisoformat(end_date) if end_date else None
 
@@ -44,17 +48,13 @@ def create_chat_functions(
             transaction_type=transaction_type,
         )
 
-        categories = category_service.get_all_categories(user_id)
-        category_map = {c.id: c for c in categories}
+        category_map = context.category_map()
 
         result = []
         for cat_id, data in totals.items():
             cat = category_map.get(cat_id) if cat_id else None
             cat_name = cat.name if cat else "Uncategorised"
-            parent_name = None
-            if cat and cat.parent_id:
-                parent = category_map.get(cat.parent_id)
-                parent_name = parent.name if parent else None
+            parent_name = context.parent_name(cat) if cat else None
 
             result.append(
                 {
@@ -96,10 +96,9 @@ def create_chat_functions(
 
         category_ids = None
         if category_name:
-            categories = category_service.get_all_categories(user_id)
-            matching = [c for c in categories if c.name.lower() == category_name.lower()]
+            matching = context.find_category(category_name)
             if matching:
-                category_ids = [matching[0].id]
+                category_ids = [matching.id]
 
         response = transaction_service.get_transactions_paginated(
             user_id=user_id,
@@ -116,8 +115,7 @@ def create_chat_functions(
             sort_direction="desc",
         )
 
-        categories = category_service.get_all_categories(user_id)
-        category_map = {c.id: c.name for c in categories}
+        category_map = {c.id: c.name for c in context.categories()}
 
         transactions = []
         for t in response.transactions:
@@ -146,51 +144,36 @@ def create_chat_functions(
             pattern_type: Filter by pattern type: 'monthly', 'quarterly', or 'yearly'
             active_only: Only show patterns with recent transactions (default True)
         """
-        from datetime import timedelta
-
-        cutoff_date = date.today() - timedelta(days=36 * 30)
-        response = transaction_service.get_transactions_paginated(
-            user_id=user_id,
-            page=1,
-            page_size=5000,
-            start_date=cutoff_date,
-            exclude_transfers=True,
-            transaction_type="debit",
-        )
+        view = recurring_pattern_service.get_patterns(user_id, active_only=active_only)
 
-        analysis = recurring_analyzer.analyze_patterns(
-            transactions=response.transactions,  # type: ignore[arg-type]
-            user_id=user_id,
-            active_only=active_only,
-        )
-
-        patterns = analysis.patterns
+        patterns = view.patterns
         if pattern_type:
-            patterns = [p for p in patterns if p.pattern_type == pattern_type]
+            patterns = [p for p in patterns if p["pattern_type"] == pattern_type]
 
-        categories = category_service.get_all_categories(user_id)
-        category_map = {c.id: c.name for c in categories}
+        category_map = {str(c.id): c.name for c in context.categories()}
 
         result = []
         for p in patterns[:20]:
             result.append(
                 {
-                    "description": p.description,
-                    "pattern_type": p.pattern_type,
-                    "average_amount": float(p.average_amount),
-                    "transaction_count": p.transaction_count,
-                    "category": category_map.get(p.category_id, "Uncategorised"),
-                    "annual_cost": float(p.total_annual_cost),
+                    "description": p["description"],
+                    "pattern_type": p["pattern_type"],
+                    "average_amount": p["average_amount"],
+                    "transaction_count": p["transaction_count"],
+                    "category": category_map.get(p["category_id"], "Uncategorised"),
+                    "annual_cost": p["total_annual_cost"],
                 }
             )
 
         return {
             "patterns": result,
             "summary": {
-                "monthly_total": float(analysis.total_monthly_recurring),
-                "quarterly_total": float(analysis.total_quarterly_recurring),
-                "yearly_total": float(analysis.total_yearly_recurring),
+                "monthly_total": view.summary["total_monthly_recurring"],
+                "quarterly_total": view.summary["total_quarterly_recurring"],
+                "yearly_total": view.summary["total_yearly_recurring"],
             },
+            "as_of": view.computed_at.isoformat(),
+            "may_be_outdated": view.stale,
         }
 
     async def get_time_series(
@@ -207,15 +190,25 @@ def create_chat_functions(
             start_date: Start date in ISO format (YYYY-MM-DD)
             end_date: End date in ISO format (YYYY-MM-DD)
         """
+        return context.memoize(
+            ("time_series", period, category_name and category_name.lower(), start_date, end_date),
+            lambda: _time_series(period, category_name, start_date, end_date),
+        )
+
+    def _time_series(
+        period: str,
+        category_name: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> dict[str, Any]:
         parsed_start = date.fromisoformat(start_date) if start_date else None
         parsed_end = date.fromisoformat(end_date) if end_date else None
 
         category_id = None
         if category_name:
-            categories = category_service.get_all_categories(user_id)
-            matching = [c for c in categories if c.name.lower() == category_name.lower()]
+            matching = context.find_category(category_name)
             if matching:
-                category_id = matching[0].id
+                category_id = matching.id
 
         data_points = transaction_service.get_category_time_series(
             user_id=user_id,
@@ -241,19 +234,12 @@ def create_chat_functions(
 
     async def get_categories() -> dict[str, Any]:
         """List all available spending categories."""
-        categories = category_service.get_all_categories(user_id)
-
         result = []
-        for cat in categories:
-            parent_name = None
-            if cat.parent_id:
-                parent = next((c for c in categories if c.id == cat.parent_id), None)
-                parent_name = parent.name if parent else None
-
+        for cat in context.categories():
             result.append(
                 {
                     "name": cat.name,
-                    "parent": parent_name,
+                    "parent": context.parent_name(cat),
                 }
             )
 
@@ -261,10 +247,8 @@ def create_chat_functions(
 
     async def get_accounts() -> dict[str, Any]:
         """List user's bank accounts."""
-        accounts = account_service.get_all_accounts(user_id)
-
         result = []
-        for acc in accounts:
+        for acc in context.accounts():
             result.append(
                 {
                     "name": acc.name,
@@ -3,18 +3,31 @@ from uuid import UUID
 
 from app.domain.models.description_group import DescriptionGroup, DescriptionGroupMember
 from app.ports.repositories.description_group import DescriptionGroupRepository
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
 
 
 class DescriptionGroupService:
-    def __init__(self, description_group_repository: DescriptionGroupRepository):
+    def __init__(
+        self,
+        description_group_repository: DescriptionGroupRepository,
+        recurring_pattern_service: Optional[RecurringPatternSnapshotService] = None,
+    ):
         self.description_group_repository = description_group_repository
+        self.recurring_pattern_service = recurring_pattern_service
+
+    def _groups_changed(self, user_id: UUID) -> None:
+        # Recurring patterns are merged across the descriptions of a group
+        if self.recurring_pattern_service:
+            self.recurring_pattern_service.request_refresh(user_id)
 
     def create_group(self, user_id: UUID, name: str, normalized_descriptions: List[str]) -> DescriptionGroup:
         group = DescriptionGroup(name=name, user_id=user_id)
         for desc in normalized_descriptions:
             member = DescriptionGroupMember(normalized_description=desc)
             group.members.append(member)
-        return self.description_group_repository.create(group)
+        created = self.description_group_repository.create(group)
+        self._groups_changed(user_id)
+        return created
 
     def get_group_by_id(self, group_id: UUID, user_id: UUID) -> Optional[DescriptionGroup]:
         return self.description_group_repository.get_by_id(group_id, user_id)
@@ -35,11 +48,14 @@ class DescriptionGroupService:
             member = DescriptionGroupMember(normalized_description=desc)
             group.members.append(member)
 
-        return self.description_group_repository.update(group)
+        updated = self.description_group_repository.update(group)
+        self._groups_changed(user_id)
+        return updated
 
     def delete_group(self, group_id: UUID, user_id: UUID) -> bool:
         group = self.description_group_repository.get_by_id(group_id, user_id)
         if group:
             self.description_group_repository.delete(group_id, user_id)
+            self._groups_changed(user_id)
             return True
         return False
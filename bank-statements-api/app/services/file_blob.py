@@ -0,0 +1,148 @@
+import hashlib
+import logging
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, ContextManager, Iterator, List, Optional
+
+import zstandard
+
+from app.api.errors import NotFoundError
+from app.domain.models.file_blob import BlobStorage, FileBlob
+from app.ports.blob_store import BlobStore
+from app.ports.repositories.file_blob import FileBlobRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSION_LEVEL = 3
+CLEANUP_BATCH_SIZE = 500
+DEFAULT_CLEANUP_GRACE = timedelta(hours=24)
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class BlobCleanupResult:
+    deleted: int = 0
+    reclaimed_bytes: int = 0
+
+
+class FileBlobService:
+    """
+    Content-addressed store for raw statement files. Each distinct file is
+    compressed with zstd and kept once, in the database or on the filesystem,
+    however many uploads and statements refer to it; storing bytes that are
+    already there only marks the blob as used.
+    """
+
+    def __init__(
+        self,
+        file_blob_repository: FileBlobRepository,
+        storage: BlobStorage = BlobStorage.DATABASE,
+        filesystem: Optional[BlobStore] = None,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        cleanup_grace: timedelta = DEFAULT_CLEANUP_GRACE,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        if storage == BlobStorage.FILESYSTEM and filesystem is None:
+            raise ValueError("Filesystem blob storage needs a filesystem blob store")
+        self.file_blob_repository = file_blob_repository
+        self.storage = storage
+        self.filesystem = filesystem
+        self.compression_level = compression_level
+        self.cleanup_grace = cleanup_grace
+        self.clock = clock
+
+    def store(self, content: bytes) -> str:
+        """Store the file if it is not stored yet and return its digest"""
+        digest = content_digest(content)
+        if self.file_blob_repository.touch(digest):
+            self._restore_missing_file(digest, content)
+            return digest
+
+        compressed = zstandard.ZstdCompressor(level=self.compression_level).compress(content)
+        in_database = self.storage == BlobStorage.DATABASE
+        self.file_blob_repository.add(
+            FileBlob(
+                digest=digest,
+                size=len(content),
+                stored_size=len(compressed),
+                storage=self.storage.value,
+                content=compressed if in_database else None,
+            )
+        )
+        # Written after the row, so a cleanup deleting the same digest has finished with the file
+        if not in_database:
+            self.filesystem.write(digest, compressed)
+        logger.debug(f"Stored blob {digest}: {len(content)} bytes, {len(compressed)} compressed")
+        return digest
+
+    def find(self, digest: str) -> FileBlob:
+        blob = self.file_blob_repository.find(digest)
+        if blob is None:
+            raise NotFoundError("File not found", {"digest": digest})
+        return blob
+
+    def read(self, digest: str) -> bytes:
+        with self._open(self.find(digest)) as compressed:
+            return zstandard.ZstdDecompressor().decompress(compressed)
+
+    def iter_chunks(self, blob: FileBlob, chunk_bytes: int) -> Iterator[bytes]:
+        """
+        The uncompressed file, decompressed chunk_bytes at a time as it is consumed.
+        Compressed bytes kept in the database are read now, so consuming the chunks
+        after the session has been closed, as a streamed response does, runs no query.
+        """
+        if blob.storage == BlobStorage.FILESYSTEM:
+            source = self._open(blob)
+        else:
+            source = nullcontext(self.file_blob_repository.read_content(blob.digest))
+        return self._decompress(source, chunk_bytes)
+
+    def delete_unreferenced(self, batch_size: int = CLEANUP_BATCH_SIZE, max_batches: Optional[int] = None) -> BlobCleanupResult:
+        """Delete blobs with no references that have not been stored again within cleanup_grace"""
+        result = BlobCleanupResult()
+        unused_before = self.clock() - self.cleanup_grace
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            deleted = self.file_blob_repository.delete_unreferenced(unused_before, batch_size, self._remove_files)
+            batches += 1
+            result.deleted += len(deleted)
+            result.reclaimed_bytes += sum(blob.stored_size for blob in deleted)
+            if len(deleted) < batch_size:
+                break
+        logger.info(f"Deleted {result.deleted} unreferenced file blobs, {result.reclaimed_bytes} bytes reclaimed")
+        return result
+
+    @staticmethod
+    def _decompress(source: ContextManager[bytes], chunk_bytes: int) -> Iterator[bytes]:
+        with source as compressed:
+            yield from zstandard.ZstdDecompressor().read_to_iter(compressed, write_size=chunk_bytes)
+
+    @contextmanager
+    def _open(self, blob: FileBlob) -> Iterator[bytes]:
+        if blob.storage == BlobStorage.FILESYSTEM:
+            if self.filesystem is None:
+                raise RuntimeError(f"Blob {blob.digest} is on the filesystem but no blob store path is configured")
+            with self.filesystem.open(blob.digest) as mapped:
+                yield mapped
+        else:
+            yield self.file_blob_repository.read_content(blob.digest)
+
+    def _restore_missing_file(self, digest: str, content: bytes) -> None:
+        # A failed cleanup can leave a row whose file was removed; the caller has the bytes
+        if self.filesystem is None or self.filesystem.exists(digest):
+            return
+        blob = self.file_blob_repository.find(digest)
+        if blob is not None and blob.storage == BlobStorage.FILESYSTEM:
+            logger.warning(f"Rewriting missing file for blob {digest}")
+            self.filesystem.write(digest, zstandard.ZstdCompressor(level=self.compression_level).compress(content))
+
+    def _remove_files(self, blobs: List[FileBlob]) -> None:
+        on_filesystem = [blob.digest for blob in blobs if blob.storage == BlobStorage.FILESYSTEM]
+        if on_filesystem and self.filesystem is None:
+            raise RuntimeError("Cannot delete filesystem blobs without a blob store path")
+        for digest in on_filesystem:
+            self.filesystem.delete(digest)
@@ -2,14 +2,50 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 from app.domain.models.transaction import Transaction
 from app.ports.repositories.description_group import DescriptionGroupRepository
+from app.ports.repositories.transaction import RecurringCandidateRow
 
 ACTIVE_PATTERNS_DAYS = 365
 
+RecurringTransaction = Union[Transaction, RecurringCandidateRow]
+
+
+def longest_interval_sequence(ordinals: Sequence[int], min_days: int, max_days: int) -> List[int]:
+    """
+    Indices of the longest chain through sorted day ordinals in which each
+    step is min_days to max_days long. A chain always steps to the earliest
+    day at least min_days on, so every index has one successor, found with a
+    binary search, and chain lengths fill in right to left. On equal lengths
+    the earliest start wins.
+    """
+    import numpy as np
+
+    days = np.asarray(ordinals, dtype=np.int64)
+    count = len(days)
+    if count < 2:
+        return list(range(count))
+
+    successors = np.searchsorted(days, days + min_days, side="left")
+    reachable = successors < count
+    reachable[reachable] = days[successors[reachable]] <= days[reachable] + max_days
+    successors = np.where(reachable, successors, -1).tolist()
+
+    lengths = [1] * count
+    for i in range(count - 1, -1, -1):
+        if successors[i] >= 0:
+            lengths[i] = lengths[successors[i]] + 1
+
+    index = max(range(count), key=lengths.__getitem__)
+    chain = [index]
+    while successors[index] >= 0:
+        index = successors[index]
+        chain.append(index)
+    return chain
+
 
 @dataclass
 class RecurringPattern:
@@ -19,7 +55,7 @@ class RecurringPattern:
     average_amount: Decimal
     amount_variance: float
     transaction_count: int
-    transactions: List[Transaction]
+    transactions: List[RecurringTransaction]
     category_id: Optional[UUID]
     first_transaction_date: date
     last_transaction_date: date
@@ -70,6 +106,9 @@ class RecurringAnalysisResult:
 
 
 class RecurringExpenseAnalyzer:
+    MONTHLY_INTERVAL_DAYS = (25, 38)
+    QUARTERLY_INTERVAL_DAYS = (80, 100)
+    YEARLY_INTERVAL_DAYS = (350, 380)
     QUARTERLY_MIN_OCCURRENCES = 3
     QUARTERLY_VARIANCE_THRESHOLD = 0.10
     YEARLY_MIN_OCCURRENCES = 2
@@ -85,9 +124,14 @@ class RecurringExpenseAnalyzer:
         self.min_occurrences = min_occurrences
         self.amount_variance_threshold = amount_variance_threshold
 
+    @property
+    def min_group_size(self) -> int:
+        """The fewest transactions a (description, category) group needs to be any kind of pattern"""
+        return min(self.min_occurrences, self.QUARTERLY_MIN_OCCURRENCES, self.YEARLY_MIN_OCCURRENCES)
+
     def analyze_patterns(
         self,
-        transactions: List[Transaction],
+        transactions: List[RecurringTransaction],
         user_id: UUID,
         active_only: bool = False,
     ) -> RecurringAnalysisResult:
@@ -134,7 +178,7 @@ class RecurringExpenseAnalyzer:
             pattern_count=len(all_patterns),
         )
 
-    def _find_monthly_patterns(self, transactions: List[Transaction]) -> List[RecurringPattern]:
+    def _find_monthly_patterns(self, transactions: List[RecurringTransaction]) -> List[RecurringPattern]:
         groups = self._group_by_normalized_description(transactions)
         patterns = []
 
@@ -143,7 +187,7 @@ class RecurringExpenseAnalyzer:
                 continue
 
             sorted_transactions = sorted(group_transactions, key=lambda t: t.date)
-            monthly_transactions = self._filter_to_monthly_sequence(sorted_transactions)
+            monthly_transactions = self._filter_to_interval_sequence(sorted_transactions, self.MONTHLY_INTERVAL_DAYS)
 
             if len(monthly_transactions) < self.min_occurrences:
                 continue
@@ -191,7 +235,7 @@ class RecurringExpenseAnalyzer:
 
         return patterns
 
-    def _find_yearly_patterns(self, transactions: List[Transaction]) -> List[RecurringPattern]:
+    def _find_yearly_patterns(self, transactions: List[RecurringTransaction]) -> List[RecurringPattern]:
         groups = self._group_by_normalized_description(transactions, min_occurrences=self.YEARLY_MIN_OCCURRENCES)
         patterns = []
 
@@ -200,7 +244,7 @@ class RecurringExpenseAnalyzer:
                 continue
 
             sorted_transactions = sorted(group_transactions, key=lambda t: t.date)
-            yearly_transactions = self._filter_to_yearly_sequence(sorted_transactions)
+            yearly_transactions = self._filter_to_interval_sequence(sorted_transactions, self.YEARLY_INTERVAL_DAYS)
 
             if len(yearly_transactions) < self.YEARLY_MIN_OCCURRENCES:
                 continue
@@ -243,7 +287,7 @@ class RecurringExpenseAnalyzer:
 
         return patterns
 
-    def _find_quarterly_patterns(self, transactions: List[Transaction]) -> List[RecurringPattern]:
+    def _find_quarterly_patterns(self, transactions: List[RecurringTransaction]) -> List[RecurringPattern]:
         groups = self._group_by_normalized_description(transactions, min_occurrences=self.QUARTERLY_MIN_OCCURRENCES)
         patterns = []
 
@@ -252,7 +296,7 @@ class RecurringExpenseAnalyzer:
                 continue
 
             sorted_transactions = sorted(group_transactions, key=lambda t: t.date)
-            quarterly_transactions = self._filter_to_quarterly_sequence(sorted_transactions)
+            quarterly_transactions = self._filter_to_interval_sequence(sorted_transactions, self.QUARTERLY_INTERVAL_DAYS)
 
             if len(quarterly_transactions) < self.QUARTERLY_MIN_OCCURRENCES:
                 continue
@@ -298,8 +342,8 @@ class RecurringExpenseAnalyzer:
         return patterns
 
     def _group_by_normalized_description(
-        self, transactions: List[Transaction], min_occurrences: Optional[int] = None
-    ) -> Dict[tuple, List[Transaction]]:
+        self, transactions: List[RecurringTransaction], min_occurrences: Optional[int] = None
+    ) -> Dict[tuple, List[RecurringTransaction]]:
         threshold = min_occurrences if min_occurrences is not None else self.min_occurrences
         groups = defaultdict(list)
         for transaction in transactions:
@@ -307,64 +351,16 @@ class RecurringExpenseAnalyzer:
             groups[key].append(transaction)
         return {k: v for k, v in groups.items() if len(v) >= threshold}
 
-    def _filter_to_monthly_sequence(self, sorted_transactions: List[Transaction]) -> List[Transaction]:
-        if len(sorted_transactions) < 2:
-            return sorted_transactions
-
-        best_sequence: List[Transaction] = []
-
-        for start_idx in range(len(sorted_transactions)):
-            sequence = [sorted_transactions[start_idx]]
-
-            for i in range(start_idx + 1, len(sorted_transactions)):
-                days = (sorted_transactions[i].date - sequence[-1].date).days
-                if 25 <= days <= 38:
-                    sequence.append(sorted_transactions[i])
-
-            if len(sequence) > len(best_sequence):
-                best_sequence = sequence
-
-        return best_sequence
-
-    def _filter_to_yearly_sequence(self, sorted_transactions: List[Transaction]) -> List[Transaction]:
-        if len(sorted_transactions) < 2:
-            return sorted_transactions
-
-        best_sequence: List[Transaction] = []
-
-        for start_idx in range(len(sorted_transactions)):
-            sequence = [sorted_transactions[start_idx]]
-
-            for i in range(start_idx + 1, len(sorted_transactions)):
-                days = (sorted_transactions[i].date - sequence[-1].date).days
-                if 350 <= days <= 380:
-                    sequence.append(sorted_transactions[i])
-
-            if len(sequence) > len(best_sequence):
-                best_sequence = sequence
-
-        return best_sequence
-
-    def _filter_to_quarterly_sequence(self, sorted_transactions: List[Transaction]) -> List[Transaction]:
+    def _filter_to_interval_sequence(
+        self, sorted_transactions: List[RecurringTransaction], interval_days: Tuple[int, int]
+    ) -> List[RecurringTransaction]:
         if len(sorted_transactions) < 2:
             return sorted_transactions
 
-        best_sequence: List[Transaction] = []
-
-        for start_idx in range(len(sorted_transactions)):
-            sequence = [sorted_transactions[start_idx]]
-
-            for i in range(start_idx + 1, len(sorted_transactions)):
-                days = (sorted_transactions[i].date - sequence[-1].date).days
-                if 80 <= days <= 100:
-                    sequence.append(sorted_transactions[i])
-
-            if len(sequence) > len(best_sequence):
-                best_sequence = sequence
-
-        return best_sequence
+        ordinals = [t.date.toordinal() for t in sorted_transactions]
+        return [sorted_transactions[i] for i in longest_interval_sequence(ordinals, *interval_days)]
 
-    def _calculate_intervals(self, sorted_transactions: List[Transaction]) -> List[float]:
+    def _calculate_intervals(self, sorted_transactions: List[RecurringTransaction]) -> List[float]:
         intervals = []
         for i in range(1, len(sorted_transactions)):
             days = (sorted_transactions[i].date - sorted_transactions[i - 1].date).days
@@ -0,0 +1,128 @@
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Dict, List
+from uuid import UUID
+
+from app.domain.models.background_job import JobType
+from app.domain.models.recurring_pattern_snapshot import RecurringPatternSnapshot
+from app.ports.repositories.recurring_pattern_snapshot import RecurringPatternSnapshotRepository
+from app.ports.repositories.transaction import TransactionRepository
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.background.background_job_service import BackgroundJobService
+from app.services.recurring_expense_analyzer import ACTIVE_PATTERNS_DAYS, RecurringExpenseAnalyzer
+
+logger = logging.getLogger(__name__)
+
+LOOKBACK_MONTHS = 36
+
+
+def summarize_patterns(patterns: List[dict]) -> Dict:
+    """The summary of RecurringAnalysisResult.to_dict(), for serialised patterns"""
+    totals = {"monthly": 0.0, "quarterly": 0.0, "yearly": 0.0}
+    counts = {"monthly": 0, "quarterly": 0, "yearly": 0}
+    for pattern in patterns:
+        pattern_type = pattern["pattern_type"]
+        totals[pattern_type] += pattern["average_amount"]
+        counts[pattern_type] += 1
+    return {
+        "total_monthly_recurring": round(totals["monthly"], 2),
+        "total_quarterly_recurring": round(totals["quarterly"], 2),
+        "total_yearly_recurring": round(totals["yearly"], 2),
+        "monthly_pattern_count": counts["monthly"],
+        "quarterly_pattern_count": counts["quarterly"],
+        "yearly_pattern_count": counts["yearly"],
+        "pattern_count": len(patterns),
+    }
+
+
+@dataclass
+class RecurringPatternsView:
+    patterns: List[dict]
+    summary: Dict
+    computed_at: datetime
+    stale: bool
+
+
+class RecurringPatternSnapshotService:
+    """
+    Keeps one snapshot of each user's recurring patterns, so reading them does
+    not rerun the analysis. Snapshots are recomputed by a background job when
+    transactions are uploaded or recategorised or description groups change,
+    and by the nightly sweep. A snapshot older than the user's data, or than
+    max_age, is still served but flagged as stale, and a refresh is queued.
+    """
+
+    def __init__(
+        self,
+        snapshot_repository: RecurringPatternSnapshotRepository,
+        transaction_repository: TransactionRepository,
+        analyzer: RecurringExpenseAnalyzer,
+        user_data_version_repository: UserDataVersionRepository,
+        background_job_service: BackgroundJobService,
+        max_age: timedelta = timedelta(days=1),
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.snapshot_repository = snapshot_repository
+        self.transaction_repository = transaction_repository
+        self.analyzer = analyzer
+        self.user_data_version_repository = user_data_version_repository
+        self.background_job_service = background_job_service
+        self.max_age = max_age
+        self.clock = clock
+
+    def refresh(self, user_id: UUID) -> RecurringPatternSnapshot:
+        from dateutil.relativedelta import relativedelta
+
+        # Read the version first: writes made during the analysis leave the snapshot stale
+        version = self.user_data_version_repository.get_version(user_id)
+        candidates = self.transaction_repository.get_recurring_candidates(
+            user_id=user_id,
+            start_date=date.today() - relativedelta(months=LOOKBACK_MONTHS),
+            min_occurrences=self.analyzer.min_group_size,
+        )
+        analysis = self.analyzer.analyze_patterns(candidates, user_id=user_id)
+
+        snapshot = RecurringPatternSnapshot(
+            user_id=user_id,
+            data_version=version,
+            patterns=[pattern.to_dict() for pattern in analysis.patterns],
+            computed_at=self.clock(),
+        )
+        self.snapshot_repository.save(snapshot)
+        logger.info(f"Recurring patterns for user {user_id}: {len(snapshot.patterns)} at version {version}")
+        return snapshot
+
+    def request_refresh(self, user_id: UUID) -> None:
+        self.background_job_service.queue_job_once(JobType.RECURRING_PATTERNS_REFRESH, user_id=user_id)
+
+    def get_patterns(self, user_id: UUID, active_only: bool = True) -> RecurringPatternsView:
+        snapshot = self.snapshot_repository.get(user_id)
+        stale = False
+        if snapshot is None:
+            snapshot = self.refresh(user_id)
+        elif self._is_stale(snapshot, user_id):
+            stale = True
+            self.request_refresh(user_id)
+
+        patterns = snapshot.patterns
+        if active_only:
+            cutoff = (date.today() - timedelta(days=ACTIVE_PATTERNS_DAYS)).isoformat()
+            patterns = [p for p in patterns if p["last_transaction_date"] >= cutoff]
+
+        return RecurringPatternsView(
+            patterns=patterns,
+            summary=summarize_patterns(patterns),
+            computed_at=snapshot.computed_at,
+            stale=stale,
+        )
+
+    def find_users_to_refresh(self) -> List[UUID]:
+        """Users whose snapshot is missing, stale or not computed today, for the nightly sweep"""
+        start_of_today = datetime.combine(self.clock().date(), time.min, tzinfo=timezone.utc)
+        return self.snapshot_repository.find_user_ids_to_refresh(computed_before=start_of_today)
+
+    def _is_stale(self, snapshot: RecurringPatternSnapshot, user_id: UUID) -> bool:
+        if snapshot.computed_at < self.clock() - self.max_age:
+            return True
+        return snapshot.data_version < self.user_data_version_repository.get_version(user_id)
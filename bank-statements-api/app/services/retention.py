@@ -0,0 +1,96 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Tuple
+
+from app.ports.repositories.background_job import BackgroundJobRepository
+from app.ports.repositories.uploaded_file import UploadedFileRepository
+from app.services.ai.llm_result_cache import LLMResultCache
+from app.services.file_blob import FileBlobService
+
+logger = logging.getLogger(__name__)
+
+RETENTION_BATCH_SIZE = 500
+DEFAULT_UPLOAD_RETENTION = timedelta(hours=24)
+DEFAULT_JOB_RETENTION = timedelta(days=7)
+
+
+@dataclass
+class RetentionResult:
+    uploads_deleted: int = 0
+    jobs_deleted: int = 0
+    blobs_deleted: int = 0
+    cache_entries_deleted: int = 0
+    reclaimed_bytes: int = 0
+
+
+class RetentionService:
+    """
+    Deletes stored data nothing needs any more: uploads that were analysed but
+    never imported or whose import has finished, finished background jobs, and
+    then the file blobs that only those uploads referred to. Each kind is deleted
+    in batches of one DELETE ... RETURNING statement, so no transaction holds many
+    rows and nothing is loaded into memory. Expired LLM result cache entries are
+    purged in the same run.
+    """
+
+    def __init__(
+        self,
+        uploaded_file_repository: UploadedFileRepository,
+        background_job_repository: BackgroundJobRepository,
+        file_blobs: FileBlobService,
+        llm_result_cache: Optional[LLMResultCache] = None,
+        upload_retention: timedelta = DEFAULT_UPLOAD_RETENTION,
+        job_retention: timedelta = DEFAULT_JOB_RETENTION,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.uploaded_file_repository = uploaded_file_repository
+        self.background_job_repository = background_job_repository
+        self.file_blobs = file_blobs
+        self.llm_result_cache = llm_result_cache
+        self.upload_retention = upload_retention
+        self.job_retention = job_retention
+        self.clock = clock
+
+    def run(self, batch_size: int = RETENTION_BATCH_SIZE, max_batches: Optional[int] = None) -> RetentionResult:
+        now = self.clock()
+        uploads_before = now - self.upload_retention
+        jobs_before = now - self.job_retention
+
+        uploads, upload_bytes = self._delete_in_batches(
+            lambda: self.uploaded_file_repository.delete_orphaned(uploads_before, batch_size), batch_size, max_batches
+        )
+        jobs, job_bytes = self._delete_in_batches(
+            lambda: self.background_job_repository.delete_terminal_jobs(jobs_before, batch_size), batch_size, max_batches
+        )
+        # Deleting uploads drops their blobs' reference counts, so blobs only they used go in the same run
+        blobs = self.file_blobs.delete_unreferenced(batch_size, max_batches)
+        cache_entries = self.llm_result_cache.purge_expired() if self.llm_result_cache else 0
+
+        result = RetentionResult(
+            uploads_deleted=uploads,
+            jobs_deleted=jobs,
+            blobs_deleted=blobs.deleted,
+            cache_entries_deleted=cache_entries,
+            reclaimed_bytes=upload_bytes + job_bytes + blobs.reclaimed_bytes,
+        )
+        logger.info(
+            f"Retention deleted {result.uploads_deleted} uploads, {result.jobs_deleted} jobs and "
+            f"{result.blobs_deleted} file blobs, {result.cache_entries_deleted} expired LLM results, "
+            f"{result.reclaimed_bytes} bytes reclaimed"
+        )
+        return result
+
+    @staticmethod
+    def _delete_in_batches(
+        delete_batch: Callable[[], Tuple[int, int]], batch_size: int, max_batches: Optional[int]
+    ) -> Tuple[int, int]:
+        deleted = reclaimed = batches = 0
+        while max_batches is None or batches < max_batches:
+            count, size = delete_batch()
+            batches += 1
+            deleted += count
+            reclaimed += size
+            if count < batch_size:
+                break
+        return deleted, reclaimed
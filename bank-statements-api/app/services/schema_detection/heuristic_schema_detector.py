@@ -1,13 +1,16 @@
 from collections import Counter
-from typing import Dict, Optional
-
-import pandas as pd
-from dateutil.parser import parse
+from typing import TYPE_CHECKING, Dict, Optional
 
 from app.services.schema_detection.schema_detector import ConversionModel, SchemaDetectorProtocol
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def is_probable_date(val) -> bool:
+    import pandas as pd
+    from dateutil.parser import parse
+
     if pd.isna(val):
         return False
     if not isinstance(val, str):
@@ -20,6 +23,8 @@ def is_probable_date(val) -> bool:
 
 
 def is_probable_amount(val) -> bool:
+    import pandas as pd
+
     if pd.isna(val):
         return False
     if not isinstance(val, str):
@@ -33,6 +38,8 @@ def is_probable_amount(val) -> bool:
 
 
 def is_probable_description(val) -> bool:
+    import pandas as pd
+
     if pd.isna(val):
         return False
     if not isinstance(val, str):
@@ -41,7 +48,7 @@ def is_probable_description(val) -> bool:
     return len(stripped) >= 5 and not is_probable_date(stripped) and not is_probable_amount(stripped)
 
 
-def find_first_valid_streak(series: pd.Series, predicate, streak_length: int = 2) -> Optional[int]:
+def find_first_valid_streak(series: "pd.Series", predicate, streak_length: int = 2) -> Optional[int]:
     values = series.tolist()
     max_index = len(values) - streak_length + 1
     if max_index <= 0:
@@ -54,7 +61,7 @@ def find_first_valid_streak(series: pd.Series, predicate, streak_length: int = 2
 
 
 class HeuristicSchemaDetector(SchemaDetectorProtocol):
-    def detect_schema(self, df: pd.DataFrame) -> ConversionModel:
+    def detect_schema(self, df: "pd.DataFrame") -> ConversionModel:
         if df.empty:
             raise ValueError("Cannot detect schema from an empty DataFrame")
 
@@ -77,7 +84,7 @@ class HeuristicSchemaDetector(SchemaDetectorProtocol):
             data_start_row_index=start_row,
         )
 
-    def _infer_data_start_row(self, df: pd.DataFrame) -> int:
+    def _infer_data_start_row(self, df: "pd.DataFrame") -> int:
         first_data_rows = []
 
         for col in df.columns:
@@ -97,7 +104,7 @@ class HeuristicSchemaDetector(SchemaDetectorProtocol):
         most_common_row, _ = Counter(first_data_rows).most_common(1)[0]
         return most_common_row
 
-    def _infer_standard_columns(self, df: pd.DataFrame) -> Dict[str, str]:
+    def _infer_standard_columns(self, df: "pd.DataFrame") -> Dict[str, str]:
         candidates = {
             "date": None,
             "description": None,
@@ -1,13 +1,15 @@
 import json
 import logging
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from app.ai.llm_client import LLMClient
 from app.ai.prompts import schema_detection_prompt
 from app.common.json_utils import sanitize_json
 from app.services.schema_detection.schema_detector import ConversionModel, SchemaDetectorProtocol
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger_content = logging.getLogger("app.llm.big")
 
 
@@ -15,7 +17,7 @@ class LLMSchemaDetector(SchemaDetectorProtocol):
     def __init__(self, llm_client: LLMClient):
         self.llm_client = llm_client
 
-    def detect_schema(self, df: pd.DataFrame) -> ConversionModel:
+    def detect_schema(self, df: "pd.DataFrame") -> ConversionModel:
         prompt = schema_detection_prompt(df)
         logger_content.debug(
             prompt,
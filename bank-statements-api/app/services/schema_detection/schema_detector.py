@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -12,5 +13,5 @@ class ConversionModel:
 
 
 class SchemaDetectorProtocol:
-    def detect_schema(self, df: pd.DataFrame) -> ConversionModel:
+    def detect_schema(self, df: "pd.DataFrame") -> ConversionModel:
         pass
@@ -1,10 +1,23 @@
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from app.api.errors import NotFoundError
 from app.domain.models.statement import Statement
 from app.ports.repositories.statement import StatementRepository
 from app.ports.repositories.transaction import TransactionRepository
+from app.services.file_blob import FileBlobService
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
+
+DOWNLOAD_CHUNK_BYTES = 256 * 1024
+
+
+@dataclass
+class StatementDownload:
+    filename: str
+    file_type: str
+    size: int
+    chunks: Iterator[bytes]
 
 
 class StatementService:
@@ -12,9 +25,13 @@ class StatementService:
         self,
         statement_repository: StatementRepository,
         transaction_repository: TransactionRepository,
+        file_blobs: FileBlobService,
+        recurring_pattern_service: Optional[RecurringPatternSnapshotService] = None,
     ):
         self.statement_repository = statement_repository
         self.transaction_repository = transaction_repository
+        self.file_blobs = file_blobs
+        self.recurring_pattern_service = recurring_pattern_service
 
     def get_all_statements(self, user_id: UUID) -> List[Statement]:
         return self.statement_repository.find_all(user_id)
@@ -22,13 +39,37 @@ class StatementService:
     def get_statement_by_id(self, statement_id: UUID, user_id: UUID) -> Optional[Statement]:
         return self.statement_repository.find_by_id(statement_id, user_id)
 
+    def download_statement(
+        self, statement_id: UUID, user_id: UUID, chunk_bytes: int = DOWNLOAD_CHUNK_BYTES
+    ) -> StatementDownload:
+        """
+        The original file, decompressed one chunk at a time as it is sent. The chunks are
+        consumed after the request's session has been closed, so everything they need from
+        the database is read here.
+        """
+        statement = self.statement_repository.find_by_id(statement_id, user_id)
+        if not statement:
+            raise NotFoundError("Statement not found", {"statement_id": str(statement_id)})
+
+        blob = self.file_blobs.find(statement.blob_digest)
+        return StatementDownload(
+            filename=statement.filename,
+            file_type=statement.file_type,
+            size=blob.size,
+            chunks=self.file_blobs.iter_chunks(blob, chunk_bytes),
+        )
+
     def delete_statement_with_transactions(self, statement_id: UUID, user_id: UUID) -> dict:
         statement = self.statement_repository.find_by_id(statement_id, user_id)
         if not statement:
             raise NotFoundError("Statement not found", {"statement_id": str(statement_id)})
 
+        # Tag links, transactions with their split parts, then the statement, all in the request's transaction.
+        # Triggers bump the user's data version and release the statement's file blob in the same transaction.
         transaction_count = self.transaction_repository.delete_by_statement_id(statement_id)
         self.statement_repository.delete(statement_id, user_id)
+        if transaction_count and self.recurring_pattern_service:
+            self.recurring_pattern_service.request_refresh(user_id)
 
         return {
             "message": f"Statement deleted successfully. {transaction_count} transactions were also deleted.",
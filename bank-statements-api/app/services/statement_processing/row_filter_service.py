@@ -1,19 +1,22 @@
 import logging
 import re
-from typing import Dict, List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from app.domain.dto.statement_processing import FilterCondition, FilterOperator, FilterPreview, LogicalOperator, RowFilter
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger("app")
 
 
 class RowFilterService:
     """Service for applying row filters to dataframes during statement processing"""
 
-    def apply_filters(self, df: pd.DataFrame, row_filter: RowFilter) -> pd.DataFrame:
+    def apply_filters(self, df: "pd.DataFrame", row_filter: RowFilter) -> "pd.DataFrame":
         """Apply row filters to a DataFrame and return the filtered DataFrame"""
+        import pandas as pd
+
         if not row_filter or not row_filter.conditions:
             return df
 
@@ -44,8 +47,10 @@ class RowFilterService:
             # Return original dataframe if filtering fails
             return df
 
-    def preview_filters(self, df: pd.DataFrame, row_filter: RowFilter) -> FilterPreview:
+    def preview_filters(self, df: "pd.DataFrame", row_filter: RowFilter) -> FilterPreview:
         """Preview the effect of row filters without applying them"""
+        import pandas as pd
+
         if not row_filter or not row_filter.conditions:
             all_indices = list(range(len(df)))
             return FilterPreview(
@@ -97,8 +102,10 @@ class RowFilterService:
                 excluded_row_indices=[],
             )
 
-    def _evaluate_condition(self, df: pd.DataFrame, condition: FilterCondition) -> pd.Series:
+    def _evaluate_condition(self, df: "pd.DataFrame", condition: FilterCondition) -> "pd.Series":
         """Evaluate a single filter condition and return a boolean mask"""
+        import pandas as pd
+
         if condition.column_name not in df.columns:
             # If column doesn't exist, return all False
             return pd.Series([False] * len(df))
@@ -166,8 +173,10 @@ class RowFilterService:
         # Default: return all False
         return pd.Series([False] * len(df))
 
-    def suggest_common_filters(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> List[FilterCondition]:
+    def suggest_common_filters(self, df: "pd.DataFrame", column_mapping: Dict[str, str]) -> List[FilterCondition]:
         """Suggest common filter patterns based on the data"""
+        import pandas as pd
+
         suggestions = []
 
         try:
@@ -1,9 +1,7 @@
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-import pandas as pd
-
 from app.domain.dto.statement_processing import (
     AnalysisResultDTO,
     FilterCondition,
@@ -16,6 +14,9 @@ from app.services.common import compute_hash, process_dataframe
 from app.services.schema_detection.schema_detector import ConversionModel
 from app.services.statement_processing.row_filter_service import RowFilterService
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger_content = logging.getLogger("app.llm.big")
 logger = logging.getLogger("app")
 
@@ -30,6 +31,7 @@ class StatementAnalyzerService:
         uploaded_file_repo,
         file_analysis_metadata_repo,
         transaction_repo,
+        file_blobs,
         row_filter_service: RowFilterService = None,
     ):
         self.file_type_detector = file_type_detector
@@ -39,6 +41,7 @@ class StatementAnalyzerService:
         self.uploaded_file_repo = uploaded_file_repo
         self.file_analysis_metadata_repo = file_analysis_metadata_repo
         self.transaction_repo = transaction_repo
+        self.file_blobs = file_blobs
         self.row_filter_service = row_filter_service or RowFilterService()
 
     def analyze(self, user_id: UUID, filename: str, file_content: bytes) -> AnalysisResultDTO:
@@ -57,7 +60,8 @@ class StatementAnalyzerService:
         else:
             conversion_model = self.schema_detector.detect_schema(raw_df)
 
-        saved_file = self.uploaded_file_repo.save(filename, file_content, file_type)
+        blob_digest = self.file_blobs.store(file_content)
+        saved_file = self.uploaded_file_repo.save(filename, blob_digest, file_type)
         uploaded_file_id = saved_file.id
 
         sample_data = self._generate_sample_data(raw_df)
@@ -101,11 +105,13 @@ class StatementAnalyzerService:
         row_filter: Optional[RowFilter] = None,
         account_id: Optional[str] = None,
     ) -> StatisticsPreviewDTO:
+        import pandas as pd
+
         uploaded_file = self.uploaded_file_repo.find_by_id(UUID(uploaded_file_id))
-        if not uploaded_file or not uploaded_file.content:
+        if not uploaded_file:
             raise ValueError(f"Uploaded file not found: {uploaded_file_id}")
 
-        raw_df = self.statement_parser.parse(uploaded_file.content, uploaded_file.file_type)
+        raw_df = self.statement_parser.parse(self.file_blobs.read(uploaded_file.blob_digest), uploaded_file.file_type)
 
         processed_df = process_dataframe(raw_df, header_row_index, data_start_row_index)
 
@@ -173,6 +179,8 @@ class StatementAnalyzerService:
         )
 
     def _generate_sample_data(self, raw_df):
+        import pandas as pd
+
         rows_as_lists = []
 
         column_names_row = [str(col) for col in raw_df.columns.tolist()]
@@ -191,13 +199,15 @@ class StatementAnalyzerService:
 
     def _calculate_transaction_statistics(
         self,
-        raw_df: pd.DataFrame,
+        raw_df: "pd.DataFrame",
         column_mapping: dict,
         header_row_index: int,
         data_start_row_index: int,
         account_id: Optional[str] = None,
         saved_row_filters: Optional[list] = None,
     ) -> dict:
+        import pandas as pd
+
         try:
             processed_df = process_dataframe(
                 raw_df,
@@ -277,6 +287,8 @@ class StatementAnalyzerService:
             }
 
     def _count_duplicates(self, normalized_df, account_id):
+        import pandas as pd
+
         processed_tx_ids = set()  # Track transaction IDs we've already matched as duplicates
         duplicate_count = 0
 
@@ -1,10 +1,14 @@
 import io
+from typing import TYPE_CHECKING
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class StatementParser:
-    def parse(self, file_content: bytes, file_type: str) -> pd.DataFrame:
+    def parse(self, file_content: bytes, file_type: str) -> "pd.DataFrame":
+        import pandas as pd
+
         if file_type == "CSV":
             # Use dtype=None to allow pandas to infer the data types
             return pd.read_csv(io.BytesIO(file_content), dtype=str)
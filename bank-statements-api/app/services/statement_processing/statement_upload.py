@@ -1,16 +1,48 @@
 import logging
-from typing import List, Optional
+import time
+from typing import Callable, List, Optional
 from uuid import UUID
 
 from app.api.schemas import StatementUploadRequest
+from app.core.metrics import record_statement_upload
 from app.domain.dto.statement_processing import DroppedRowInfo, FilterCondition, RowFilter, TransactionDTO
 from app.domain.dto.statement_upload import EnhancedTransactions, ParsedStatement, SavedStatement, ScheduledJobs
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.domain.models.processing import ProcessingProgress
 from app.domain.models.transaction import SourceType
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
 from app.services.statement_processing.row_filter_service import RowFilterService
+from app.services.transaction import duplicate_signature
 from app.services.transaction_rule_enhancement import TransactionRuleEnhancementService
 
 logger = logging.getLogger("app")
 
+ProgressCallback = Callable[[ProcessingProgress], None]
+
+# Rows saved per round trip when an import reports progress
+IMPORT_CHUNK_SIZE = 500
+
+
+def chunk_for_persistence(dtos: List[TransactionDTO], chunk_size: int) -> List[List[TransactionDTO]]:
+    """
+    Split DTOs into chunks of roughly chunk_size rows. Duplicates are counted per
+    (date, amount, account) group, so a group is never split across chunks.
+    """
+    groups = {}
+    for dto in dtos:
+        groups.setdefault(duplicate_signature(dto), []).append(dto)
+
+    chunks: List[List[TransactionDTO]] = []
+    current: List[TransactionDTO] = []
+    for group in groups.values():
+        if current and len(current) + len(group) > chunk_size:
+            chunks.append(current)
+            current = []
+        current.extend(group)
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class StatementUploadResult:
     def __init__(
@@ -48,7 +80,10 @@ class StatementUploadService:
         statement_repo,
         transaction_repo,
         background_job_service,
+        file_blobs,
         row_filter_service: RowFilterService = None,
+        async_import_min_bytes: int = 1_000_000,
+        recurring_pattern_service: Optional[RecurringPatternSnapshotService] = None,
     ):
         self.statement_parser = statement_parser
         self.transaction_normalizer = transaction_normalizer
@@ -59,24 +94,59 @@ class StatementUploadService:
         self.statement_repo = statement_repo
         self.transaction_repo = transaction_repo
         self.background_job_service = background_job_service
+        self.file_blobs = file_blobs
         self.row_filter_service = row_filter_service or RowFilterService()
+        self.async_import_min_bytes = async_import_min_bytes
+        self.recurring_pattern_service = recurring_pattern_service
 
     def upload_statement(
         self,
         user_id: UUID,
         upload_data: StatementUploadRequest,
-        background_tasks=None,
-        internal_deps=None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> StatementUploadResult:
+        start = time.perf_counter()
+        report = on_progress or (lambda progress: None)
+
+        report(ProcessingProgress(0, 0, 0, 0, phase="parsing"))
         parsed = self.parse_statement(user_id, upload_data)
+        total = len(parsed.transaction_dtos)
+
+        report(ProcessingProgress(0, 0, 0, total, phase="enhancing"))
         enhanced = self.enhance_transactions(user_id, parsed)
-        saved = self.save_statement(user_id, enhanced, upload_data)
+        saved = self.save_statement(user_id, enhanced, upload_data, on_progress=on_progress)
         jobs = self.schedule_jobs(saved, enhanced)
+        if saved.transactions_saved and self.recurring_pattern_service:
+            self.recurring_pattern_service.request_refresh(user_id)
+
+        result = self._build_result(enhanced, saved, jobs, parsed.dropped_rows)
+        record_statement_upload(
+            total_processed=result.total_processed,
+            saved=result.transactions_saved,
+            duplicated=result.duplicated_transactions,
+            dropped=len(result.dropped_rows),
+            duration_seconds=time.perf_counter() - start,
+        )
+        return result
 
-        if background_tasks and internal_deps:
-            self._trigger_immediate_processing(background_tasks, internal_deps)
+    def should_import_async(self, upload_data: StatementUploadRequest) -> bool:
+        """Files at or above async_import_min_bytes are imported by the job worker"""
+        uploaded_file = self.uploaded_file_repo.find_metadata_by_id(upload_data.uploaded_file_id)
+        return uploaded_file is not None and uploaded_file.size >= self.async_import_min_bytes
 
-        return self._build_result(enhanced, saved, jobs, parsed.dropped_rows)
+    def queue_statement_import(self, user_id: UUID, upload_data: StatementUploadRequest) -> BackgroundJob:
+        """
+        Queue a STATEMENT_IMPORT job that runs upload_statement with progress reporting.
+        The insert notifies the job workers, which claim it under a lease.
+        """
+        job = self.background_job_service.queue_job(
+            JobType.STATEMENT_IMPORT,
+            user_id=user_id,
+            uploaded_file_id=UUID(upload_data.uploaded_file_id),
+            payload={"upload": upload_data.model_dump(mode="json")},
+        )
+        logger.info(f"Queued statement import job {job.id} for file {upload_data.uploaded_file_id}")
+        return job
 
     def parse_statement(self, user_id: UUID, upload_request: StatementUploadRequest) -> ParsedStatement:
         """Step 1: Parse uploaded file to transaction DTOs"""
@@ -84,7 +154,7 @@ class StatementUploadService:
 
         # Get uploaded file
         uploaded_file = self.uploaded_file_repo.find_by_id(upload_request.uploaded_file_id)
-        file_content = uploaded_file.content
+        file_content = self.file_blobs.read(uploaded_file.blob_digest)
         file_type = uploaded_file.file_type
 
         # Parse file to dataframe
@@ -200,8 +270,14 @@ class StatementUploadService:
         user_id: UUID,
         enhanced: EnhancedTransactions,
         upload_request: StatementUploadRequest,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> SavedStatement:
-        """Step 3: Save statement and transactions to database"""
+        """
+        Step 3: Save statement and transactions to database.
+
+        With on_progress, transactions are saved in chunks of IMPORT_CHUNK_SIZE
+        and progress is reported after each chunk.
+        """
         logger.info(f"Saving {len(enhanced.enhanced_dtos)} transactions to database")
 
         # Create statement from uploaded file if transactions need to be saved
@@ -210,13 +286,9 @@ class StatementUploadService:
         duplicated_transactions = 0
 
         if enhanced.enhanced_dtos:
-            # Get uploaded file and create statement
-            uploaded_file = self.uploaded_file_repo.find_by_id(upload_request.uploaded_file_id)
-            statement = self.statement_repo.save(
+            statement = self.statement_repo.save_from_uploaded_file(
                 account_id=UUID(upload_request.account_id),
-                filename=uploaded_file.filename,
-                file_type=uploaded_file.file_type,
-                content=uploaded_file.content,
+                uploaded_file_id=UUID(upload_request.uploaded_file_id),
             )
 
             # Enrich DTOs with required fields
@@ -232,10 +304,29 @@ class StatementUploadService:
                 # Set statement_id on all DTOs
                 dto.statement_id = str(statement.id)
 
-            # Save the batch of DTOs using the transaction service
-            persistence_result = self.transaction_service.save_transactions_from_dtos(enhanced.enhanced_dtos)
-            transactions_saved = persistence_result.transactions_saved
-            duplicated_transactions = persistence_result.duplicates_found
+            if on_progress:
+                chunks = chunk_for_persistence(enhanced.enhanced_dtos, IMPORT_CHUNK_SIZE)
+            else:
+                chunks = [enhanced.enhanced_dtos]
+
+            total = len(enhanced.enhanced_dtos)
+            processed = 0
+            for index, chunk in enumerate(chunks, start=1):
+                persistence_result = self.transaction_service.save_transactions_from_dtos(chunk)
+                transactions_saved += persistence_result.transactions_saved
+                duplicated_transactions += persistence_result.duplicates_found
+                processed += len(chunk)
+                if on_progress:
+                    on_progress(
+                        ProcessingProgress(
+                            current_batch=index,
+                            total_batches=len(chunks),
+                            processed_transactions=processed,
+                            total_transactions=total,
+                            phase="saving",
+                            duplicate_transactions=duplicated_transactions,
+                        )
+                    )
 
             if transactions_saved == 0:
                 self.statement_repo.delete(statement.id, user_id)
@@ -306,25 +397,6 @@ class StatementUploadService:
             dropped_rows=dropped_rows or [],
         )
 
-    def _trigger_immediate_processing(self, background_tasks, internal_deps):
-        """
-        Trigger immediate background job processing using FastAPI BackgroundTasks.
-
-        This provides faster user experience by processing jobs immediately
-        instead of waiting for the cron job.
-        """
-        try:
-            from app.workers.job_processor import process_pending_jobs
-
-            # Add the async job processor to FastAPI's background tasks
-            background_tasks.add_task(process_pending_jobs, internal_deps)
-            logger.info("Background job processing triggered immediately")
-
-        except Exception as e:
-            # Don't fail the upload if immediate processing fails
-            logger.warning(f"Failed to trigger immediate background processing: {e}")
-            logger.info("Background jobs will be processed by cron worker")
-
     def _save_file_analysis_metadata(
         self,
         uploaded_file_id: str,
@@ -339,7 +411,7 @@ class StatementUploadService:
 
         from app.services.common import compute_hash
 
-        raw_df = self.statement_parser.parse(uploaded_file.content, uploaded_file.file_type)
+        raw_df = self.statement_parser.parse(self.file_blobs.read(uploaded_file.blob_digest), uploaded_file.file_type)
         file_hash = compute_hash(uploaded_file.file_type, raw_df)
 
         existing_metadata = self.file_analysis_metadata_repo.find_by_hash_and_account(file_hash, account_id)
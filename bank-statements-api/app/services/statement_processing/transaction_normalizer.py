@@ -1,12 +1,12 @@
 import logging
 import re
-from typing import Tuple
-
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Tuple
 
 from app.domain.dto.statement_processing import DroppedRowInfo
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger_content = logging.getLogger("app.llm.big")
 logger = logging.getLogger("app")
 
@@ -14,10 +14,12 @@ logger = logging.getLogger("app")
 class TransactionNormalizer:
     def normalize(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         column_mapping: dict,
         data_start_row_index: int = 0,
-    ) -> Tuple[pd.DataFrame, list[DroppedRowInfo]]:
+    ) -> Tuple["pd.DataFrame", list[DroppedRowInfo]]:
+        import pandas as pd
+
         result_df = pd.DataFrame()
         dropped_rows: list[DroppedRowInfo] = []
 
@@ -148,7 +150,9 @@ class TransactionNormalizer:
 
         return result_df, dropped_rows
 
-    def _normalize_dates(self, date_series: pd.Series) -> pd.Series:
+    def _normalize_dates(self, date_series: "pd.Series") -> "pd.Series":
+        import pandas as pd
+
         first_valid = date_series.dropna().iloc[0] if not date_series.dropna().empty else None
         is_iso_format = (
             first_valid is not None
@@ -169,7 +173,10 @@ class TransactionNormalizer:
 
         return normalized
 
-    def _normalize_amounts(self, amount_series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    def _normalize_amounts(self, amount_series: "pd.Series") -> Tuple["pd.Series", "pd.Series"]:
+        import numpy as np
+        import pandas as pd
+
         invalid_mask = pd.Series([False] * len(amount_series), index=amount_series.index)
 
         def clean_value(idx, val):
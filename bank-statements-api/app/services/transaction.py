@@ -1,17 +1,23 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from app.api.schemas import TransactionCreateRequest, TransactionListResponse
 from app.common.text_normalization import normalize_description
 from app.domain.dto.statement_processing import TransactionDTO
-from app.domain.models.enhancement_rule import EnhancementRule, EnhancementRuleSource, MatchType
 from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
 from app.ports.repositories.category import CategoryRepository
 from app.ports.repositories.enhancement_rule import EnhancementRuleRepository
 from app.ports.repositories.initial_balance import InitialBalanceRepository
-from app.ports.repositories.transaction import TransactionRepository
+from app.ports.repositories.transaction import (
+    TRANSACTION_LIST_FIELDS,
+    RecurringCandidateRow,
+    TransactionRepository,
+)
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.category_tree import CATEGORY_TREES, CategoryTreeCache
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
 from app.services.transaction_enhancement import TransactionEnhancer
 
 
@@ -28,6 +34,15 @@ class TransactionPersistenceResult:
         self.duplicates_found = duplicates_found
 
 
+def duplicate_signature(dto: TransactionDTO) -> tuple:
+    """The (date, amount, account_id) key that save_transactions_from_dtos counts duplicates by"""
+    if not dto.account_id:
+        raise ValueError("Transaction DTO must have an account_id for deduplication")
+    date_str = dto.date if isinstance(dto.date, str) else dto.date.strftime("%Y-%m-%d")
+    account_id = str(dto.account_id) if isinstance(dto.account_id, UUID) else dto.account_id
+    return (date_str, float(dto.amount), account_id)
+
+
 class TransactionService:
     """
     Application service for transaction operations.
@@ -41,17 +56,29 @@ class TransactionService:
         enhancement_rule_repository: EnhancementRuleRepository,
         transaction_enhancer: TransactionEnhancer,
         category_repository: Optional[CategoryRepository] = None,
+        recurring_pattern_service: Optional[RecurringPatternSnapshotService] = None,
+        category_trees: CategoryTreeCache = CATEGORY_TREES,
+        user_data_version_repository: Optional[UserDataVersionRepository] = None,
     ):
         self.transaction_repository = transaction_repository
         self.initial_balance_repository = initial_balance_repository
         self.enhancement_rule_repository = enhancement_rule_repository
         self.transaction_enhancer = transaction_enhancer
         self.category_repository = category_repository
+        self.recurring_pattern_service = recurring_pattern_service
+        self.category_trees = category_trees
+        self.user_data_version_repository = user_data_version_repository
+
+    def _categories_changed(self, user_id: UUID) -> None:
+        if self.recurring_pattern_service:
+            self.recurring_pattern_service.request_refresh(user_id)
 
     def _expand_category_ids(self, category_ids: Optional[List[UUID]], user_id: UUID) -> Optional[List[UUID]]:
         if not category_ids or not self.category_repository:
             return category_ids
-        return self.category_repository.get_all_descendant_ids(category_ids, user_id)
+        version = self.user_data_version_repository.get_version(user_id) if self.user_data_version_repository else None
+        tree = self.category_trees.get(user_id, version, lambda: self.category_repository.get_all(user_id))
+        return tree.expand(category_ids)
 
     def create_transaction(
         self,
@@ -96,9 +123,9 @@ class TransactionService:
                         after_transaction_id=transaction_data.after_transaction_id,
                     )
                 else:
-                    self._create_unmatched_rule(user_id, normalized_description)
+                    self.enhancement_rule_repository.create_unmatched_rules([normalized_description], user_id)
             else:
-                self._create_unmatched_rule(user_id, normalized_description)
+                self.enhancement_rule_repository.create_unmatched_rules([normalized_description], user_id)
 
         return self.transaction_repository.create_transaction(
             user_id=user_id,
@@ -106,26 +133,6 @@ class TransactionService:
             after_transaction_id=after_transaction_id,
         )
 
-    def _create_unmatched_rule(self, user_id: UUID, normalized_description: str) -> None:
-        existing_rule = self.enhancement_rule_repository.find_by_normalized_description(normalized_description, user_id)
-
-        if existing_rule:
-            return
-
-        rule = EnhancementRule(
-            id=uuid4(),
-            user_id=user_id,
-            normalized_description_pattern=normalized_description,
-            match_type=MatchType.EXACT,
-            category_id=None,
-            counterparty_account_id=None,
-            source=EnhancementRuleSource.AUTO,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-        self.enhancement_rule_repository.save(rule)
-
     def get_transaction(self, transaction_id: UUID, user_id: UUID) -> Optional[Transaction]:
         transaction = self.transaction_repository.get_by_id(transaction_id, user_id)
         if transaction is not None:
@@ -218,6 +225,93 @@ class TransactionService:
             total_amount=total_amount,
         )
 
+    def get_transactions_page_payload(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+        category_ids: Optional[List[UUID]] = None,
+        status: Optional[CategorizationStatus] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        description_search: Optional[str] = None,
+        account_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        include_running_balance: bool = False,
+        sort_field: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+        exclude_transfers: Optional[bool] = None,
+        exclude_uncategorized: Optional[bool] = None,
+        transaction_type: Optional[str] = None,
+        transaction_ids: Optional[List[UUID]] = None,
+        tag_ids: Optional[List[UUID]] = None,
+        exclude_from_analytics: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Read-only counterpart of get_transactions_paginated for the fast response path.
+
+        Builds a dict shaped like TransactionListResponse straight from column rows,
+        so no Transaction objects are hydrated and no Pydantic validation runs.
+        """
+        expanded_category_ids = self._expand_category_ids(category_ids, user_id)
+        rows, total, total_amount = self.transaction_repository.get_paginated_rows(
+            user_id=user_id,
+            page=page,
+            page_size=page_size,
+            category_ids=expanded_category_ids,
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            description_search=description_search,
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            sort_field=sort_field,
+            sort_direction=sort_direction,
+            exclude_transfers=exclude_transfers,
+            exclude_uncategorized=exclude_uncategorized,
+            transaction_type=transaction_type,
+            transaction_ids=transaction_ids,
+            tag_ids=tag_ids,
+            exclude_from_analytics=exclude_from_analytics,
+        )
+
+        page_ids = [row[0] for row in rows]
+        balances: Dict[UUID, Decimal] = {}
+        split_parent_ids: set = set()
+        tags_by_transaction: Dict[UUID, List[tuple]] = {}
+        if page_ids:
+            if include_running_balance and account_id is not None:
+                balances = self._get_running_balances(page_ids, account_id)
+            split_parent_ids = self.transaction_repository.get_split_parent_ids(page_ids)
+            tags_by_transaction = self.transaction_repository.get_tag_rows_by_transaction_ids(page_ids)
+
+        transactions = []
+        for row in rows:
+            item = dict(zip(TRANSACTION_LIST_FIELDS, row))
+            transaction_id = item["id"]
+            created_at = item["created_at"]
+            item["created_at"] = created_at.date() if isinstance(created_at, datetime) else created_at
+            item["running_balance"] = balances.get(transaction_id)
+            item["tags"] = [
+                {"id": tag_id, "name": name, "created_at": tag_created_at}
+                for tag_id, name, tag_created_at in tags_by_transaction.get(transaction_id, [])
+            ]
+            item["is_split_parent"] = transaction_id in split_parent_ids
+            item["is_split_child"] = item["parent_transaction_id"] is not None
+            transactions.append(item)
+
+        return {
+            "transactions": transactions,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size if total > 0 else 1,
+            "total_amount": float(total_amount) if total_amount is not None else None,
+            "enhancement_rule": None,
+        }
+
     def get_transactions_matching_rule_paginated(
         self,
         user_id: UUID,
@@ -273,19 +367,21 @@ class TransactionService:
         if not transactions:
             return
 
+        balances = self._get_running_balances([t.id for t in transactions], account_id)
+
+        for transaction in transactions:
+            transaction.running_balance = balances.get(transaction.id)
+
+    def _get_running_balances(self, transaction_ids: List[UUID], account_id: UUID) -> Dict[UUID, Decimal]:
         latest_balance = self.initial_balance_repository.get_latest_by_account_id(account_id)
         starting_balance = latest_balance.balance_amount if latest_balance else Decimal("0.00")
 
-        transaction_ids = [t.id for t in transactions]
-        balances = self.transaction_repository.get_running_balances(
+        return self.transaction_repository.get_running_balances(
             account_id=account_id,
             transaction_ids=transaction_ids,
             initial_balance=starting_balance,
         )
 
-        for transaction in transactions:
-            transaction.running_balance = balances.get(transaction.id)
-
     def get_category_totals(
         self,
         user_id: UUID,
@@ -318,6 +414,18 @@ class TransactionService:
             exclude_from_analytics=True,
         )
 
+    def get_recurring_candidates(
+        self,
+        user_id: UUID,
+        start_date: Optional[date],
+        min_occurrences: int,
+    ) -> List[RecurringCandidateRow]:
+        return self.transaction_repository.get_recurring_candidates(
+            user_id=user_id,
+            start_date=start_date,
+            min_occurrences=min_occurrences,
+        )
+
     def get_category_time_series(
         self,
         user_id: UUID,
@@ -335,10 +443,10 @@ class TransactionService:
         exclude_uncategorized: Optional[bool] = None,
         transaction_type: Optional[str] = None,
     ) -> List[Dict]:
-        expanded_category_ids = self._expand_category_ids(category_ids, user_id)
+        # A single category_id takes precedence over category_ids
+        expanded_category_ids = self._expand_category_ids([category_id] if category_id else category_ids, user_id)
         return self.transaction_repository.get_category_time_series(
             user_id=user_id,
-            category_id=category_id,
             period=period,
             category_ids=expanded_category_ids,
             status=status,
@@ -398,7 +506,9 @@ class TransactionService:
             )
             transaction.account_id = account_id  # type: ignore
             transaction.counterparty_account_id = counterparty_account_id  # type: ignore
-            return self.transaction_repository.update(transaction)
+            updated = self.transaction_repository.update(transaction)
+            self._categories_changed(user_id)
+            return updated
         return None
 
     def get_split_children(self, transaction_id: UUID, user_id: UUID) -> List[Transaction]:
@@ -489,7 +599,9 @@ class TransactionService:
         transaction.category_id = category_id
         transaction.categorization_status = CategorizationStatus.MANUAL if category_id else CategorizationStatus.UNCATEGORIZED
 
-        return self.transaction_repository.update(transaction)
+        updated = self.transaction_repository.update(transaction)
+        self._categories_changed(user_id)
+        return updated
 
     def mark_categorization_failure(self, transaction_id: UUID, user_id: UUID) -> Optional[Transaction]:
         transaction = self.transaction_repository.get_by_id(transaction_id, user_id)
@@ -517,7 +629,7 @@ class TransactionService:
             if not rule:
                 raise ValueError(f"Enhancement rule with ID {enhancement_rule_id} not found")
 
-        return self.transaction_repository.bulk_update_category_by_normalized_description(
+        updated = self.transaction_repository.bulk_update_category_by_normalized_description(
             user_id=user_id,
             normalized_description=normalized_description,
             category_id=category_id,
@@ -527,6 +639,9 @@ class TransactionService:
             exclude_transfers=exclude_transfers,
             rule=rule,
         )
+        if updated:
+            self._categories_changed(user_id)
+        return updated
 
     def bulk_categorize_by_ids(
         self,
@@ -538,11 +653,14 @@ class TransactionService:
         if not owned_ids:
             return 0
 
-        return self.transaction_repository.bulk_update_category_by_ids(
+        updated = self.transaction_repository.bulk_update_category_by_ids(
             transaction_ids=owned_ids,
             category_id=category_id,
             user_id=user_id,
         )
+        if updated:
+            self._categories_changed(user_id)
+        return updated
 
     def count_by_normalized_description(
         self,
@@ -598,7 +716,7 @@ class TransactionService:
         end_date: Optional[date] = None,
         exclude_transfers: Optional[bool] = None,
     ) -> int:
-        return self.transaction_repository.bulk_update_by_category_id(
+        updated = self.transaction_repository.bulk_update_by_category_id(
             user_id=user_id,
             from_category_id=from_category_id,
             to_category_id=to_category_id,
@@ -607,6 +725,9 @@ class TransactionService:
             end_date=end_date,
             exclude_transfers=exclude_transfers,
         )
+        if updated:
+            self._categories_changed(user_id)
+        return updated
 
     def save_transactions_from_dtos(
         self,
@@ -657,12 +778,7 @@ class TransactionService:
 
         groups = defaultdict(list)
         for dto in dtos:
-            if not dto.account_id:
-                raise ValueError("Transaction DTO must have an account_id for deduplication")
-            date_str = dto.date if isinstance(dto.date, str) else dto.date.strftime("%Y-%m-%d")
-            account_id = str(dto.account_id) if isinstance(dto.account_id, UUID) else dto.account_id
-            key = (date_str, float(dto.amount), account_id)
-            groups[key].append(dto)
+            groups[duplicate_signature(dto)].append(dto)
         return dict(groups)
 
     def _get_db_counts_for_groups(
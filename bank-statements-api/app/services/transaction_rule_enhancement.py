@@ -1,13 +1,12 @@
 import logging
 import time
-from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List
 from uuid import UUID, uuid4
 
 from app.common.text_normalization import normalize_description
 from app.domain.dto.statement_processing import TransactionDTO
-from app.domain.models.enhancement_rule import EnhancementRule, EnhancementRuleSource, MatchType
+from app.domain.models.enhancement_rule import EnhancementRule
 from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
 from app.ports.repositories.enhancement_rule import EnhancementRuleRepository
 from app.services.transaction_enhancement import TransactionEnhancer
@@ -97,9 +96,7 @@ class TransactionRuleEnhancementService:
             else:
                 unmatched_transactions.append(transaction)
 
-        unique_normalized_descriptions = {t.normalized_description for t in unmatched_transactions if t.normalized_description}
-        for normalized_description in unique_normalized_descriptions:
-            self._create_unmatched_rule(user_id, normalized_description)
+        created_rules = self._create_unmatched_rules(user_id, unmatched_transactions)
 
         total_processed = len(transaction_dtos)
         match_rate_percentage = round((matched_count / total_processed) * 100, 1) if total_processed > 0 else 0.0
@@ -117,7 +114,7 @@ class TransactionRuleEnhancementService:
 
         logger.info(
             f"Enhancement complete: {matched_count}/{total_processed} matched by rules "
-            f"({match_rate_percentage}%), {len(unmatched_transactions)} unmatched rules created"
+            f"({match_rate_percentage}%), {len(unmatched_transactions)} unmatched, {created_rules} new unmatched rules"
         )
 
         return result
@@ -145,31 +142,16 @@ class TransactionRuleEnhancementService:
         )
         return transaction
 
-    def _create_unmatched_rule(self, user_id: UUID, normalized_description: str) -> None:
-        try:
-            existing_rule = self.enhancement_rule_repository.find_by_normalized_description(normalized_description, user_id)
-
-            if existing_rule:
-                logger.debug(f"Rule already exists for normalized description: {normalized_description}")
-                return
-
-            rule = EnhancementRule(
-                id=uuid4(),
-                user_id=user_id,
-                normalized_description_pattern=normalized_description,
-                match_type=MatchType.EXACT,
-                category_id=None,
-                counterparty_account_id=None,
-                source=EnhancementRuleSource.AUTO,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
-            )
-
-            self.enhancement_rule_repository.save(rule)
-            logger.debug(f"Created unmatched rule for: {normalized_description}")
+    def _create_unmatched_rules(self, user_id: UUID, unmatched_transactions: List[Transaction]) -> int:
+        normalized_descriptions = sorted({t.normalized_description for t in unmatched_transactions if t.normalized_description})
+        if not normalized_descriptions:
+            return 0
 
+        try:
+            return self.enhancement_rule_repository.create_unmatched_rules(normalized_descriptions, user_id)
         except Exception as e:
-            logger.warning(f"Failed to create unmatched rule for {normalized_description}: {e}")
+            logger.warning(f"Failed to create {len(normalized_descriptions)} unmatched rules: {e}")
+            return 0
 
     def _build_rules_map(self, transactions: List[Transaction], rules: List[EnhancementRule]) -> dict:
         """
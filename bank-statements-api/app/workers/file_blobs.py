@@ -0,0 +1,43 @@
+"""
+File blob cleanup.
+
+FILE_BLOB_CLEANUP jobs delete the stored statement files that no upload or
+statement refers to any more, once they have gone unused for
+BLOB_CLEANUP_GRACE_HOURS. The job worker queues one a day (see
+SCHEDULED_JOBS in app.workers.job_worker); the same cleanup can be run from cron:
+
+Usage:
+    python -m app.workers.file_blobs
+
+Cron example (every night at 04:00):
+    0 4 * * * cd /path/to/project && .venv/bin/python -m app.workers.file_blobs
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict
+
+from app.core.dependencies import InternalDependencies, get_dependencies
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.workers.handlers import job_handler
+
+logger = logging.getLogger(__name__)
+
+
+@job_handler(JobType.FILE_BLOB_CLEANUP)
+async def cleanup_file_blobs(job: BackgroundJob, internal: InternalDependencies) -> dict:
+    """Delete unreferenced file blobs in batches"""
+    result = await asyncio.to_thread(internal.file_blob_service.delete_unreferenced)
+    return asdict(result)
+
+
+def main() -> None:
+    from app.logging.config import init_logging
+
+    init_logging()
+    with get_dependencies() as (_, internal):
+        internal.file_blob_service.delete_unreferenced()
+
+
+if __name__ == "__main__":
+    main()
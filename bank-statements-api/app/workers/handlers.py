@@ -0,0 +1,44 @@
+import importlib
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.dependencies import InternalDependencies
+from app.domain.models.background_job import BackgroundJob, JobType
+
+# A handler receives the claimed job and a dependency scope of its own, and
+# returns the result to store on the job.
+JobHandler = Callable[[BackgroundJob, InternalDependencies], Awaitable[Optional[dict]]]
+
+JOB_HANDLERS: Dict[JobType, JobHandler] = {}
+
+# Modules whose handlers register themselves on import
+HANDLER_MODULES = (
+    "app.workers.statement_import",
+    "app.workers.rule_suggestions",
+    "app.workers.recurring_patterns",
+    "app.workers.file_blobs",
+    "app.workers.retention",
+)
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler for failures that retrying cannot fix"""
+
+
+def job_handler(job_type: JobType) -> Callable[[JobHandler], JobHandler]:
+    """Register the decorated coroutine as the handler for job_type"""
+
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[job_type] = handler
+        return handler
+
+    return register
+
+
+def load_job_handlers() -> Dict[JobType, JobHandler]:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+    return JOB_HANDLERS
+
+
+def get_job_handler(job_type: JobType) -> Optional[JobHandler]:
+    return load_job_handlers().get(job_type)
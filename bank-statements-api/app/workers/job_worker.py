@@ -0,0 +1,349 @@
+"""
+Standalone background job worker.
+
+Claims batches of pending jobs with FOR UPDATE SKIP LOCKED, runs them with
+bounded asyncio concurrency and sleeps on Postgres LISTEN/NOTIFY between
+batches instead of polling. Claimed jobs hold a lease that is renewed while
+they run; jobs whose worker died are handed back to the queue once the lease
+expires. Failures are retried with jittered exponential backoff until
+max_retries is reached.
+
+Periodic maintenance jobs (see SCHEDULED_JOBS) are queued by the worker
+itself once the last one of their type is older than its interval.
+
+Any number of worker processes, on any number of machines, can share the queue.
+
+Usage:
+    python -m app.workers.job_worker --concurrency 4
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, ContextManager, Dict, Iterator, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.dependencies import InternalDependencies, get_dependencies
+from app.core.metrics import BACKGROUND_JOB_DURATION
+from app.domain.models.background_job import JobType
+from app.workers.handlers import JobHandler, PermanentJobError, load_job_handlers
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "background_jobs"
+
+
+@dataclass
+class WorkerConfig:
+    concurrency: int = 4
+    lease_seconds: int = 300
+    poll_interval_seconds: float = 30.0
+    reap_interval_seconds: float = 60.0
+    schedule_check_seconds: float = 300.0
+    retry_base_seconds: float = 5.0
+    retry_max_seconds: float = 900.0
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """A job the worker queues again once the last one of its type is older than interval"""
+
+    job_type: JobType
+    interval: timedelta
+
+
+SCHEDULED_JOBS = (
+    ScheduledJob(JobType.STORAGE_RETENTION, timedelta(days=1)),
+    ScheduledJob(JobType.FILE_BLOB_CLEANUP, timedelta(days=1)),
+    # Without a user, a refresh job is the sweep that queues one for every stale snapshot
+    ScheduledJob(JobType.RECURRING_PATTERNS_REFRESH, timedelta(days=1)),
+)
+
+
+def retry_delay_seconds(
+    retry_count: int,
+    base_seconds: float,
+    max_seconds: float,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Exponential backoff capped at max_seconds, jittered into [50%, 100%] so retries spread out"""
+    delay = min(max_seconds, base_seconds * (2**retry_count))
+    return delay * (0.5 + rng() / 2)
+
+
+@contextmanager
+def _internal_dependencies() -> Iterator[InternalDependencies]:
+    with get_dependencies() as (_, internal):
+        yield internal
+
+
+def _listen_dsn(database_url: str) -> str:
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class PostgresJobListener:
+    """Calls on_notify whenever a NOTIFY arrives on the job channel, reconnecting on failure"""
+
+    def __init__(self, dsn: str, on_notify: Callable[[], None], channel: str = NOTIFY_CHANNEL):
+        self.dsn = dsn
+        self.on_notify = on_notify
+        self.channel = channel
+
+    async def run(self, stop: asyncio.Event) -> None:
+        import psycopg
+
+        backoff = 1.0
+        while not stop.is_set():
+            try:
+                async with await psycopg.AsyncConnection.connect(self.dsn, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {self.channel}")
+                    logger.info(f"Listening for jobs on channel {self.channel}")
+                    backoff = 1.0
+                    # Anything queued while we were disconnected is picked up by this wake-up
+                    self.on_notify()
+                    while not stop.is_set():
+                        async for _ in conn.notifies(timeout=1.0):
+                            self.on_notify()
+            except Exception as e:
+                logger.warning(f"Job listener connection failed, retrying in {backoff:.0f}s: {e}")
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=backoff)
+                except asyncio.TimeoutError:
+                    pass
+                backoff = min(backoff * 2, 30.0)
+
+
+class JobWorker:
+    def __init__(
+        self,
+        dependencies_factory: Callable[[], ContextManager[InternalDependencies]] = _internal_dependencies,
+        handlers: Optional[Dict[JobType, JobHandler]] = None,
+        config: Optional[WorkerConfig] = None,
+        worker_id: Optional[str] = None,
+        listener_dsn: Optional[str] = None,
+        schedule: Sequence[ScheduledJob] = SCHEDULED_JOBS,
+    ):
+        self.dependencies_factory = dependencies_factory
+        self.handlers = handlers if handlers is not None else load_job_handlers()
+        self.config = config or WorkerConfig()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.listener_dsn = listener_dsn
+        self.schedule = schedule
+        self._running: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._last_reap = 0.0
+        self._last_schedule_check = 0.0
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        logger.info(f"Worker {self.worker_id} started with concurrency {self.config.concurrency}")
+        listener_task = None
+        if self.listener_dsn:
+            listener = PostgresJobListener(self.listener_dsn, self.wake)
+            listener_task = asyncio.create_task(listener.run(stop))
+
+        try:
+            while not stop.is_set():
+                await self.reap_expired_leases()
+                await self.queue_scheduled_jobs()
+                await self.run_once()
+                await self._wait_for_work(stop)
+        finally:
+            if self._running:
+                logger.info(f"Waiting for {len(self._running)} running jobs to finish")
+                await asyncio.gather(*self._running, return_exceptions=True)
+            if listener_task:
+                listener_task.cancel()
+                await asyncio.gather(listener_task, return_exceptions=True)
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    async def run_once(self) -> int:
+        """Claim as many jobs as there are free slots and start them. Returns the number claimed."""
+        free_slots = self.config.concurrency - len(self._running)
+        if free_slots <= 0:
+            return 0
+
+        jobs = await asyncio.to_thread(self._claim, free_slots)
+        for job_id, job_type in jobs:
+            task = asyncio.create_task(self._execute(job_id, job_type))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        return len(jobs)
+
+    async def run_until_idle(self) -> int:
+        """Run jobs until none are ready, for one-off and cron runs. Returns the number run."""
+        await self.reap_expired_leases(force=True)
+        await self.queue_scheduled_jobs(force=True)
+        processed = 0
+        while True:
+            claimed = await self.run_once()
+            if not claimed and not self._running:
+                return processed
+            processed += claimed
+            await asyncio.wait(list(self._running), return_when=asyncio.FIRST_COMPLETED)
+
+    async def drain(self) -> None:
+        """Wait for every job started so far"""
+        while self._running:
+            await asyncio.gather(*list(self._running), return_exceptions=True)
+
+    async def reap_expired_leases(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_reap < self.config.reap_interval_seconds:
+            return
+        self._last_reap = now
+        try:
+            requeued, failed = await asyncio.to_thread(self._release_expired_leases)
+            if requeued or failed:
+                logger.warning(f"Expired job leases: {requeued} requeued, {failed} failed")
+        except Exception as e:
+            logger.error(f"Failed to reap expired job leases: {e}")
+
+    async def queue_scheduled_jobs(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not self.schedule or (not force and now - self._last_schedule_check < self.config.schedule_check_seconds):
+            return
+        self._last_schedule_check = now
+        try:
+            await asyncio.to_thread(self._queue_due_jobs)
+        except Exception as e:
+            logger.error(f"Failed to queue scheduled jobs: {e}")
+
+    async def _wait_for_work(self, stop: asyncio.Event) -> None:
+        waiters = [asyncio.create_task(self._wakeup.wait()), asyncio.create_task(stop.wait())]
+        try:
+            await asyncio.wait(
+                waiters + list(self._running),
+                timeout=self.config.poll_interval_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            self._wakeup.clear()
+
+    def _claim(self, limit: int) -> list:
+        with self.dependencies_factory() as internal:
+            jobs = internal.background_job_repository.claim_pending_jobs(
+                self.worker_id,
+                limit,
+                self.config.lease_seconds,
+            )
+            # Plain values only: the session is gone once this scope closes
+            return [(job.id, job.job_type) for job in jobs]
+
+    def _release_expired_leases(self):
+        with self.dependencies_factory() as internal:
+            return internal.background_job_repository.release_expired_leases()
+
+    def _queue_due_jobs(self) -> None:
+        with self.dependencies_factory() as internal:
+            for scheduled in self.schedule:
+                internal.background_job_service.queue_job_if_due(scheduled.job_type, scheduled.interval)
+
+    async def _execute(self, job_id: UUID, job_type: JobType) -> None:
+        start = time.perf_counter()
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        outcome = "completed"
+        try:
+            handler = self.handlers.get(job_type)
+            if handler is None:
+                raise PermanentJobError(f"No handler registered for job type: {job_type}")
+
+            logger.info(f"Processing job {job_id} (type: {job_type})")
+            with self.dependencies_factory() as internal:
+                job = await asyncio.to_thread(internal.background_job_repository.get_by_id, job_id)
+                result = await handler(job, internal)
+                await asyncio.to_thread(internal.background_job_service.mark_job_completed, job_id, result)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            outcome = await asyncio.to_thread(self._fail_or_retry, job_id, e)
+        finally:
+            heartbeat.cancel()
+            BACKGROUND_JOB_DURATION.observe(time.perf_counter() - start, job_type=job_type.value, outcome=outcome)
+
+    def _fail_or_retry(self, job_id: UUID, error: Exception) -> str:
+        try:
+            with self.dependencies_factory() as internal:
+                job = internal.background_job_repository.get_by_id(job_id)
+                if job is None:
+                    return "failed"
+                if isinstance(error, PermanentJobError) or job.retry_count >= job.max_retries:
+                    job.mark_failed(str(error))
+                    internal.background_job_repository.update(job)
+                    return "failed"
+
+                delay = retry_delay_seconds(
+                    job.retry_count,
+                    self.config.retry_base_seconds,
+                    self.config.retry_max_seconds,
+                )
+                job.schedule_retry(str(error), delay)
+                internal.background_job_repository.update(job)
+                logger.info(f"Retrying job {job_id} in {delay:.0f}s (attempt {job.retry_count}/{job.max_retries})")
+                return "retried"
+        except Exception as e:
+            # The lease will expire and the reaper will pick the job up again
+            logger.error(f"Failed to record failure of job {job_id}: {e}")
+            return "failed"
+
+    async def _heartbeat(self, job_id: UUID) -> None:
+        interval = max(self.config.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                owned = await asyncio.to_thread(self._extend_lease, job_id)
+                if not owned:
+                    logger.warning(f"Worker {self.worker_id} lost the lease on job {job_id}")
+                    return
+            except Exception as e:
+                logger.error(f"Failed to extend lease on job {job_id}: {e}")
+
+    def _extend_lease(self, job_id: UUID) -> bool:
+        with self.dependencies_factory() as internal:
+            return internal.background_job_repository.extend_lease(job_id, self.worker_id, self.config.lease_seconds)
+
+
+async def _run_worker(config: WorkerConfig) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker = JobWorker(config=config, listener_dsn=_listen_dsn(settings.DATABASE_URL))
+    await worker.run(stop)
+
+
+def main() -> None:
+    from app.logging.config import init_logging
+
+    parser = argparse.ArgumentParser(description="Run the background job worker")
+    parser.add_argument("--concurrency", type=int, default=WorkerConfig.concurrency)
+    parser.add_argument("--lease-seconds", type=int, default=WorkerConfig.lease_seconds)
+    parser.add_argument("--poll-interval", type=float, default=WorkerConfig.poll_interval_seconds)
+    args = parser.parse_args()
+
+    init_logging()
+    config = WorkerConfig(
+        concurrency=args.concurrency,
+        lease_seconds=args.lease_seconds,
+        poll_interval_seconds=args.poll_interval,
+    )
+    asyncio.run(_run_worker(config))
+
+
+if __name__ == "__main__":
+    main()
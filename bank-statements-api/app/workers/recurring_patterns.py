@@ -0,0 +1,96 @@
+"""
+Recurring pattern snapshot refreshes.
+
+RECURRING_PATTERNS_REFRESH jobs recompute one user's snapshot after their data
+changes. A refresh job without a user is the nightly sweep: it queues a refresh
+for every user whose snapshot is missing or stale, and the job worker queues
+one a day (see SCHEDULED_JOBS in app.workers.job_worker). The sweep can also be
+run from cron, spread over a pool of processes since the analysis is CPU bound:
+
+Usage:
+    python -m app.workers.recurring_patterns --processes 4
+
+Cron example (every night at 03:00):
+    0 3 * * * cd /path/to/project && .venv/bin/python -m app.workers.recurring_patterns
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+from uuid import UUID
+
+from app.core.dependencies import InternalDependencies, get_dependencies
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.workers.handlers import job_handler
+
+logger = logging.getLogger(__name__)
+
+
+@job_handler(JobType.RECURRING_PATTERNS_REFRESH)
+async def refresh_recurring_patterns(job: BackgroundJob, internal: InternalDependencies) -> dict:
+    """Recompute the user's recurring pattern snapshot, or queue a refresh for every stale one without a user"""
+    if job.user_id is None:
+        queued = await asyncio.to_thread(_queue_refreshes, internal)
+        return {"queued": queued}
+
+    # The analysis is synchronous; keep it off the event loop so other jobs keep running
+    snapshot = await asyncio.to_thread(internal.recurring_pattern_service.refresh, job.user_id)
+    return {"pattern_count": len(snapshot.patterns), "data_version": snapshot.data_version}
+
+
+def _queue_refreshes(internal: InternalDependencies) -> int:
+    user_ids = internal.recurring_pattern_service.find_users_to_refresh()
+    for user_id in user_ids:
+        internal.background_job_service.queue_job_once(JobType.RECURRING_PATTERNS_REFRESH, user_id)
+    logger.info(f"Queued recurring pattern refreshes for {len(user_ids)} users")
+    return len(user_ids)
+
+
+def _refresh_user(user_id: UUID) -> Tuple[UUID, bool]:
+    try:
+        with get_dependencies() as (_, internal):
+            internal.recurring_pattern_service.refresh(user_id)
+        return user_id, True
+    except Exception as e:
+        logger.error(f"Failed to refresh recurring patterns for user {user_id}: {e}")
+        return user_id, False
+
+
+def sweep(processes: int) -> Tuple[int, int]:
+    """Refresh every missing or stale snapshot. Returns (refreshed, failed)."""
+    with get_dependencies() as (_, internal):
+        user_ids: List[UUID] = internal.recurring_pattern_service.find_users_to_refresh()
+    logger.info(f"Refreshing recurring patterns for {len(user_ids)} users with {processes} processes")
+    if not user_ids:
+        return 0, 0
+
+    if processes <= 1:
+        outcomes = [_refresh_user(user_id) for user_id in user_ids]
+    else:
+        # Spawned, not forked, so no process inherits the parent's pooled connections
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            outcomes = list(pool.map(_refresh_user, user_ids, chunksize=8))
+
+    refreshed = sum(1 for _, ok in outcomes if ok)
+    return refreshed, len(outcomes) - refreshed
+
+
+def main() -> None:
+    from app.logging.config import init_logging
+
+    parser = argparse.ArgumentParser(description="Refresh missing and stale recurring pattern snapshots")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    init_logging()
+    refreshed, failed = sweep(args.processes)
+    logger.info(f"Recurring pattern sweep refreshed {refreshed} users, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Storage retention.
+
+STORAGE_RETENTION jobs delete uploads older than UPLOAD_RETENTION_HOURS that
+no pending import needs, background jobs that finished more than
+JOB_RETENTION_DAYS ago, the file blobs left without references and expired
+LLM result cache entries, and report the bytes reclaimed. The job worker
+queues one a day (see SCHEDULED_JOBS in app.workers.job_worker); the same run
+can be started from cron:
+
+Usage:
+    python -m app.workers.retention
+
+Cron example (every night at 03:30):
+    30 3 * * * cd /path/to/project && .venv/bin/python -m app.workers.retention
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict
+
+from app.core.dependencies import InternalDependencies, get_dependencies
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.workers.handlers import job_handler
+
+logger = logging.getLogger(__name__)
+
+
+@job_handler(JobType.STORAGE_RETENTION)
+async def apply_retention(job: BackgroundJob, internal: InternalDependencies) -> dict:
+    """Delete expired uploads, jobs and file blobs in batches"""
+    result = await asyncio.to_thread(internal.retention_service.run)
+    return asdict(result)
+
+
+def main() -> None:
+    from app.logging.config import init_logging
+
+    init_logging()
+    with get_dependencies() as (_, internal):
+        internal.retention_service.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import logging
+
+from pydantic import ValidationError
+
+from app.api.schemas import AISuggestCategoriesRequest
+from app.core.dependencies import InternalDependencies
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.workers.handlers import PermanentJobError, job_handler
+
+logger = logging.getLogger(__name__)
+
+
+def _suggestion_request(job: BackgroundJob) -> AISuggestCategoriesRequest:
+    try:
+        return AISuggestCategoriesRequest.model_validate(job.payload.get("request") or {})
+    except ValidationError as e:
+        raise PermanentJobError(f"Invalid rule suggestion payload: {e}") from e
+
+
+@job_handler(JobType.RULE_CATEGORY_SUGGESTION)
+async def suggest_rule_categories(job: BackgroundJob, internal: InternalDependencies) -> dict:
+    """Suggest categories for the requested rules, saving each batch as the LLM answers it"""
+    request = _suggestion_request(job)
+    reporter = internal.background_job_service.progress_reporter(job.id, JobType.RULE_CATEGORY_SUGGESTION)
+    summary = await internal.rule_suggestion_service.suggest_categories(job.user_id, request, on_progress=reporter.report)
+    # Not in a finally block: after a database error the session is unusable and the flush would mask it
+    reporter.flush()
+
+    logger.info(f"Rule category suggestion job {job.id} processed {summary.processed} rules")
+    return summary.to_dict()
+
+
+@job_handler(JobType.RULE_COUNTERPARTY_SUGGESTION)
+async def suggest_rule_counterparties(job: BackgroundJob, internal: InternalDependencies) -> dict:
+    """Suggest counterparties for the requested rules, saving each batch as the LLM answers it"""
+    request = _suggestion_request(job)
+    reporter = internal.background_job_service.progress_reporter(job.id, JobType.RULE_COUNTERPARTY_SUGGESTION)
+    summary = await internal.rule_suggestion_service.suggest_counterparties(job.user_id, request, on_progress=reporter.report)
+    reporter.flush()
+
+    logger.info(f"Rule counterparty suggestion job {job.id} processed {summary.processed} rules")
+    return summary.to_dict()
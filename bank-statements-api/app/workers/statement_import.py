@@ -0,0 +1,57 @@
+import asyncio
+import logging
+
+from pydantic import ValidationError
+
+from app.api.schemas import StatementUploadRequest
+from app.core.dependencies import InternalDependencies
+from app.domain.models.background_job import BackgroundJob, JobType
+from app.workers.handlers import PermanentJobError, job_handler
+
+logger = logging.getLogger(__name__)
+
+
+@job_handler(JobType.STATEMENT_IMPORT)
+async def import_statement(job: BackgroundJob, internal: InternalDependencies) -> dict:
+    """Run a queued statement upload, reporting phase and saved chunks through a throttled progress writer"""
+    job_id = job.id
+    user_id = job.user_id
+
+    try:
+        upload_data = StatementUploadRequest.model_validate(job.payload.get("upload"))
+    except ValidationError as e:
+        raise PermanentJobError(f"Invalid statement import payload: {e}") from e
+
+    reporter = internal.background_job_service.progress_reporter(job_id, JobType.STATEMENT_IMPORT)
+
+    try:
+        # Parsing and saving are synchronous; keep them off the event loop so other jobs keep running
+        result = await asyncio.to_thread(
+            internal.statement_upload_service.upload_statement,
+            user_id=user_id,
+            upload_data=upload_data,
+            on_progress=reporter.report,
+        )
+    except ValueError as e:
+        # Bad column mappings or unparseable files fail the same way on every attempt
+        raise PermanentJobError(str(e)) from e
+    # Only on success: after a database error the session is unusable and flushing would hide the error
+    reporter.flush()
+
+    if result.transactions_saved > 0:
+        internal.subscription_service.increment_statement_usage(user_id)
+
+    logger.info(
+        f"Statement import job {job_id} saved {result.transactions_saved} transactions, "
+        f"{result.duplicated_transactions} duplicates"
+    )
+    return {
+        "uploaded_file_id": str(result.uploaded_file_id),
+        "total_processed": result.total_processed,
+        "transactions_saved": result.transactions_saved,
+        "duplicated_transactions": result.duplicated_transactions,
+        "rule_based_matches": result.rule_based_matches,
+        "match_rate_percentage": result.match_rate_percentage,
+        "processing_time_ms": result.processing_time_ms,
+        "dropped_rows_count": len(result.dropped_rows),
+    }
@@ -0,0 +1,57 @@
+"""Add STORAGE_RETENTION job type, let uploads be deleted under finished jobs and index the retention queries
+
+Revision ID: a7v8w9x0y1z2
+Revises: z6u7v8w9x0y1
+Create Date: 2026-03-14 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "a7v8w9x0y1z2"
+down_revision: Union[str, None] = "z6u7v8w9x0y1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_uploaded_files_created_at", "uploaded_files", ["created_at"]),
+    ("ix_background_jobs_uploaded_file_id", "background_jobs", ["uploaded_file_id"]),
+    ("ix_background_jobs_completed_at", "background_jobs", ["completed_at"]),
+)
+
+
+def upgrade() -> None:
+    # ADD VALUE cannot be used in the transaction that adds it, and the indexes
+    # are built concurrently so uploads and workers are not blocked meanwhile
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'STORAGE_RETENTION'")
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+    op.drop_constraint("background_jobs_uploaded_file_id_fkey", "background_jobs", type_="foreignkey")
+    op.create_foreign_key(
+        "background_jobs_uploaded_file_id_fkey",
+        "background_jobs",
+        "uploaded_files",
+        ["uploaded_file_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("background_jobs_uploaded_file_id_fkey", "background_jobs", type_="foreignkey")
+    op.create_foreign_key(
+        "background_jobs_uploaded_file_id_fkey",
+        "background_jobs",
+        "uploaded_files",
+        ["uploaded_file_id"],
+        ["id"],
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    # PostgreSQL cannot drop enum values; STORAGE_RETENTION stays in jobtype
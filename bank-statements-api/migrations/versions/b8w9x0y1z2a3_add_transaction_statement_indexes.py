@@ -0,0 +1,44 @@
+"""Index transactions by statement and by the manual row they follow, for set-based statement deletion
+
+Revision ID: b8w9x0y1z2a3
+Revises: a7v8w9x0y1z2
+Create Date: 2026-03-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b8w9x0y1z2a3"
+down_revision: Union[str, None] = "a7v8w9x0y1z2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so uploads are not blocked while the indexes are created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transactions_statement_id",
+            "transactions",
+            ["statement_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Deleting any transaction checks for rows positioned after it; without this
+        # index each check scans the whole table
+        op.create_index(
+            "ix_transactions_manual_position_after",
+            "transactions",
+            ["manual_position_after"],
+            postgresql_where=sa.text("manual_position_after IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_manual_position_after", table_name="transactions")
+    op.drop_index("ix_transactions_statement_id", table_name="transactions")
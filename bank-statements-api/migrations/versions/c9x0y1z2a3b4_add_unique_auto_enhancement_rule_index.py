@@ -0,0 +1,61 @@
+"""Allow one auto-generated enhancement rule per user, pattern and match type
+
+Revision ID: c9x0y1z2a3b4
+Revises: b8w9x0y1z2a3
+Create Date: 2026-03-22 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "c9x0y1z2a3b4"
+down_revision: Union[str, None] = "b8w9x0y1z2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Concurrent uploads could each create the same unmatched rule; keep the one that
+    # has been categorised or reviewed by the AI, otherwise the oldest
+    op.execute(
+        """
+        DELETE FROM enhancement_rules
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT
+                    id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY user_id, normalized_description_pattern, match_type
+                        ORDER BY
+                            (category_id IS NOT NULL OR counterparty_account_id IS NOT NULL) DESC,
+                            (ai_processed_at IS NOT NULL) DESC,
+                            created_at,
+                            id
+                    ) AS position
+                FROM enhancement_rules
+                WHERE source = 'AUTO'
+            ) ranked
+            WHERE position > 1
+        )
+        """
+    )
+
+    # Manual rules may share a pattern with different amount or date constraints,
+    # so only auto-generated rules are unique
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_enhancement_rules_auto_pattern",
+            "enhancement_rules",
+            ["user_id", "normalized_description_pattern", "match_type"],
+            unique=True,
+            postgresql_where=sa.text("source = 'AUTO'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_enhancement_rules_auto_pattern", table_name="enhancement_rules")
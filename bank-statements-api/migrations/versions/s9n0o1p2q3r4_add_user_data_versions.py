@@ -0,0 +1,120 @@
+"""Add user_data_versions table maintained by triggers
+
+Revision ID: s9n0o1p2q3r4
+Revises: r8m9n0o1p2q3
+Create Date: 2026-03-02 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "s9n0o1p2q3r4"
+down_revision: Union[str, None] = "r8m9n0o1p2q3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose rows carry user_id directly
+USER_OWNED_TABLES = (
+    "transactions",
+    "categories",
+    "accounts",
+    "tags",
+    "enhancement_rules",
+    "description_groups",
+)
+
+# Tables that reach the user through a parent row: (table, function, user lookup)
+INDIRECT_TABLES = (
+    (
+        "initial_balances",
+        "bump_user_data_version_via_account",
+        "SELECT DISTINCT a.user_id FROM changed_rows c JOIN accounts a ON a.id = c.account_id",
+    ),
+    (
+        "transaction_tags",
+        "bump_user_data_version_via_tag",
+        "SELECT DISTINCT t.user_id FROM changed_rows c JOIN tags t ON t.id = c.tag_id",
+    ),
+)
+
+EVENTS = (
+    ("insert", "INSERT", "NEW TABLE AS changed_rows"),
+    ("update", "UPDATE", "NEW TABLE AS changed_rows"),
+    ("delete", "DELETE", "OLD TABLE AS changed_rows"),
+)
+
+
+def _bump_function(name: str, user_ids_query: str) -> str:
+    # Statement-level: one upsert per statement regardless of how many rows it touched.
+    # The join on users skips rows deleted by a cascade from the user itself.
+    return f"""
+        CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO user_data_versions (user_id, version, updated_at)
+            SELECT changed.user_id, 1, now()
+            FROM ({user_ids_query}) AS changed
+            JOIN users u ON u.id = changed.user_id
+            ON CONFLICT (user_id) DO UPDATE
+                SET version = user_data_versions.version + 1,
+                    updated_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+
+
+def _create_triggers(table: str, function: str) -> None:
+    for suffix, event, referencing in EVENTS:
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_data_version_{suffix}
+            AFTER {event} ON {table}
+            REFERENCING {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+            """
+        )
+
+
+def _drop_triggers(table: str) -> None:
+    for suffix, _, _ in EVENTS:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_data_version_{suffix} ON {table}")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_data_versions",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    op.execute(_bump_function("bump_user_data_version", "SELECT DISTINCT user_id FROM changed_rows"))
+    for table in USER_OWNED_TABLES:
+        _create_triggers(table, "bump_user_data_version")
+
+    for table, function, user_ids_query in INDIRECT_TABLES:
+        op.execute(_bump_function(function, user_ids_query))
+        _create_triggers(table, function)
+
+
+def downgrade() -> None:
+    for table, function, _ in INDIRECT_TABLES:
+        _drop_triggers(table)
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+
+    for table in USER_OWNED_TABLES:
+        _drop_triggers(table)
+    op.execute("DROP FUNCTION IF EXISTS bump_user_data_version()")
+
+    op.drop_table("user_data_versions")
@@ -0,0 +1,67 @@
+"""Add lease and retry scheduling columns to background_jobs
+
+Revision ID: t0o1p2q3r4s5
+Revises: s9n0o1p2q3r4
+Create Date: 2026-03-04 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "t0o1p2q3r4s5"
+down_revision: Union[str, None] = "s9n0o1p2q3r4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("background_jobs", sa.Column("run_after", sa.DateTime(), nullable=True))
+    op.add_column("background_jobs", sa.Column("locked_by", sa.Text(), nullable=True))
+    op.add_column("background_jobs", sa.Column("lease_expires_at", sa.DateTime(), nullable=True))
+
+    # Claim queries only ever look at pending jobs, oldest first
+    op.create_index(
+        "ix_background_jobs_pending_created_at",
+        "background_jobs",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_background_jobs_in_progress_lease",
+        "background_jobs",
+        ["lease_expires_at"],
+        postgresql_where=sa.text("status = 'IN_PROGRESS'"),
+    )
+
+    # Wake idle workers as soon as a job becomes claimable
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_background_job_pending() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('background_jobs', NEW.job_type::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_background_jobs_notify
+        AFTER INSERT OR UPDATE OF status ON background_jobs
+        FOR EACH ROW WHEN (NEW.status = 'PENDING')
+        EXECUTE FUNCTION notify_background_job_pending()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_background_jobs_notify ON background_jobs")
+    op.execute("DROP FUNCTION IF EXISTS notify_background_job_pending()")
+    op.drop_index("ix_background_jobs_in_progress_lease", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_pending_created_at", table_name="background_jobs")
+    op.drop_column("background_jobs", "lease_expires_at")
+    op.drop_column("background_jobs", "locked_by")
+    op.drop_column("background_jobs", "run_after")
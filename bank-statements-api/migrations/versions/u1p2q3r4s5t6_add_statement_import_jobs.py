@@ -0,0 +1,50 @@
+"""Add STATEMENT_IMPORT job type with user and payload columns on background_jobs
+
+Revision ID: u1p2q3r4s5t6
+Revises: t0o1p2q3r4s5
+Create Date: 2026-03-06 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "u1p2q3r4s5t6"
+down_revision: Union[str, None] = "t0o1p2q3r4s5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ADD VALUE cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'STATEMENT_IMPORT'")
+
+    op.add_column(
+        "background_jobs",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_background_jobs_user_id",
+        "background_jobs",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index("ix_background_jobs_user_id", "background_jobs", ["user_id"])
+    op.add_column(
+        "background_jobs",
+        sa.Column("payload", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("background_jobs", "payload")
+    op.drop_index("ix_background_jobs_user_id", table_name="background_jobs")
+    op.drop_constraint("fk_background_jobs_user_id", "background_jobs", type_="foreignkey")
+    op.drop_column("background_jobs", "user_id")
+    # PostgreSQL cannot drop enum values; STATEMENT_IMPORT stays in jobtype
@@ -0,0 +1,28 @@
+"""Add RULE_CATEGORY_SUGGESTION and RULE_COUNTERPARTY_SUGGESTION job types
+
+Revision ID: v2q3r4s5t6u7
+Revises: u1p2q3r4s5t6
+Create Date: 2026-03-09 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "v2q3r4s5t6u7"
+down_revision: Union[str, None] = "u1p2q3r4s5t6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ADD VALUE cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'RULE_CATEGORY_SUGGESTION'")
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'RULE_COUNTERPARTY_SUGGESTION'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop enum values; the suggestion job types stay in jobtype
+    pass
@@ -0,0 +1,43 @@
+"""Add llm_result_cache table
+
+Revision ID: w3r4s5t6u7v8
+Revises: v2q3r4s5t6u7
+Create Date: 2026-03-10 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "w3r4s5t6u7v8"
+down_revision: Union[str, None] = "v2q3r4s5t6u7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_result_cache",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("pattern", sa.Text(), nullable=False),
+        sa.Column("context_hash", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("result", postgresql.JSONB(), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "kind", "pattern", "context_hash", "model", name="uq_llm_result_cache_key"),
+    )
+    op.create_index("ix_llm_result_cache_expires_at", "llm_result_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_result_cache_expires_at", table_name="llm_result_cache")
+    op.drop_table("llm_result_cache")
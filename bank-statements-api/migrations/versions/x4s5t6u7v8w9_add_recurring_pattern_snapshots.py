@@ -0,0 +1,39 @@
+"""Add recurring_pattern_snapshots table and RECURRING_PATTERNS_REFRESH job type
+
+Revision ID: x4s5t6u7v8w9
+Revises: w3r4s5t6u7v8
+Create Date: 2026-03-11 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "x4s5t6u7v8w9"
+down_revision: Union[str, None] = "w3r4s5t6u7v8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ADD VALUE cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'RECURRING_PATTERNS_REFRESH'")
+
+    op.create_table(
+        "recurring_pattern_snapshots",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("data_version", sa.BigInteger(), nullable=False),
+        sa.Column("patterns", postgresql.JSONB(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("recurring_pattern_snapshots")
+    # PostgreSQL cannot drop enum values; RECURRING_PATTERNS_REFRESH stays in jobtype
@@ -0,0 +1,77 @@
+"""Add composite and partial transaction indexes for the list, analytics, balance and dedup queries
+
+Revision ID: y5t6u7v8w9x0
+Revises: x4s5t6u7v8w9
+Create Date: 2026-03-12 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "y5t6u7v8w9x0"
+down_revision: Union[str, None] = "x4s5t6u7v8w9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so uploads are not blocked while the indexes are created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transactions_user_date_sort",
+            "transactions",
+            ["user_id", sa.text("date DESC"), "sort_index"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transactions_user_date_analytics",
+            "transactions",
+            ["user_id", "date"],
+            postgresql_include=["category_id", "amount", "id"],
+            postgresql_where=sa.text("counterparty_account_id IS NULL AND NOT exclude_from_analytics"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transactions_account_date_sort",
+            "transactions",
+            ["account_id", "date", "sort_index"],
+            postgresql_include=["id", "amount"],
+            postgresql_where=sa.text("parent_transaction_id IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transactions_account_date_amount",
+            "transactions",
+            ["account_id", "date", "amount"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Both are leading prefixes of the indexes above
+        op.drop_index(
+            "ix_transactions_user_id_date",
+            table_name="transactions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_transactions_account_id_date",
+            table_name="transactions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_transactions_account_id_date", "transactions", ["account_id", "date"])
+    op.create_index("ix_transactions_user_id_date", "transactions", ["user_id", "date"])
+    op.drop_index("ix_transactions_account_date_amount", table_name="transactions")
+    op.drop_index("ix_transactions_account_date_sort", table_name="transactions")
+    op.drop_index("ix_transactions_user_date_analytics", table_name="transactions")
+    op.drop_index("ix_transactions_user_date_sort", table_name="transactions")
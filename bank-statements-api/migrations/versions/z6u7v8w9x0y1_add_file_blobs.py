@@ -0,0 +1,243 @@
+"""Move raw statement files into content-addressed, zstd compressed file_blobs and add FILE_BLOB_CLEANUP job type
+
+Revision ID: z6u7v8w9x0y1
+Revises: y5t6u7v8w9x0
+Create Date: 2026-03-13 09:00:00.000000
+
+"""
+
+import os
+from pathlib import Path
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import zstandard
+from alembic import op
+
+revision: str = "z6u7v8w9x0y1"
+down_revision: Union[str, None] = "y5t6u7v8w9x0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REFERENCING_TABLES = ("uploaded_files", "statements")
+
+# Digests are moved this many at a time, so only one batch of files is in memory
+BATCH_SIZE = 100
+
+COMPRESSION_LEVEL = 3
+
+# Statement-level, so a bulk insert or delete updates each blob once
+REF_COUNT_FUNCTIONS = {
+    "file_blob_refs_added": """
+        UPDATE file_blobs b
+        SET ref_count = b.ref_count + added.refs
+        FROM (SELECT blob_digest, count(*) AS refs FROM new_rows GROUP BY blob_digest) AS added
+        WHERE b.digest = added.blob_digest;
+    """,
+    "file_blob_refs_removed": """
+        UPDATE file_blobs b
+        SET ref_count = b.ref_count - removed.refs
+        FROM (SELECT blob_digest, count(*) AS refs FROM old_rows GROUP BY blob_digest) AS removed
+        WHERE b.digest = removed.blob_digest;
+    """,
+    "file_blob_refs_changed": """
+        UPDATE file_blobs b
+        SET ref_count = b.ref_count + changed.delta
+        FROM (
+            SELECT blob_digest, sum(delta) AS delta
+            FROM (
+                SELECT blob_digest, 1 AS delta FROM new_rows
+                UNION ALL
+                SELECT blob_digest, -1 AS delta FROM old_rows
+            ) AS refs
+            GROUP BY blob_digest
+            HAVING sum(delta) <> 0
+        ) AS changed
+        WHERE b.digest = changed.blob_digest;
+    """,
+}
+
+EVENTS = (
+    ("insert", "INSERT", "NEW TABLE AS new_rows", "file_blob_refs_added"),
+    ("update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows", "file_blob_refs_changed"),
+    ("delete", "DELETE", "OLD TABLE AS old_rows", "file_blob_refs_removed"),
+)
+
+
+def _batches(items: list) -> list:
+    return [items[i : i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+
+
+def _move_contents_to_blobs(connection) -> None:
+    for table in REFERENCING_TABLES:
+        connection.execute(sa.text(f"UPDATE {table} SET blob_digest = encode(sha256(content), 'hex')"))
+
+    digests = (
+        connection.execute(
+            sa.text(
+                """
+                SELECT blob_digest FROM uploaded_files
+                UNION
+                SELECT blob_digest FROM statements
+                """
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+    for batch in _batches(digests):
+        rows = connection.execute(
+            sa.text(
+                """
+                SELECT DISTINCT ON (blob_digest) blob_digest, content
+                FROM (
+                    SELECT blob_digest, content FROM uploaded_files WHERE blob_digest = ANY(:digests)
+                    UNION ALL
+                    SELECT blob_digest, content FROM statements WHERE blob_digest = ANY(:digests)
+                ) AS files
+                """
+            ),
+            {"digests": batch},
+        ).all()
+        blobs = []
+        for digest, content in rows:
+            compressed = compressor.compress(bytes(content))
+            blobs.append(
+                {
+                    "digest": digest,
+                    "size": len(content),
+                    "stored_size": len(compressed),
+                    "content": compressed,
+                }
+            )
+        connection.execute(
+            sa.text(
+                """
+                INSERT INTO file_blobs (digest, size, stored_size, storage, content)
+                VALUES (:digest, :size, :stored_size, 'DATABASE', :content)
+                ON CONFLICT (digest) DO NOTHING
+                """
+            ),
+            blobs,
+        )
+
+    connection.execute(
+        sa.text(
+            """
+            UPDATE file_blobs b
+            SET ref_count = refs.count
+            FROM (
+                SELECT blob_digest, count(*) AS count
+                FROM (SELECT blob_digest FROM uploaded_files UNION ALL SELECT blob_digest FROM statements) AS all_refs
+                GROUP BY blob_digest
+            ) AS refs
+            WHERE b.digest = refs.blob_digest
+            """
+        )
+    )
+
+
+def upgrade() -> None:
+    # ADD VALUE cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'FILE_BLOB_CLEANUP'")
+
+    op.create_table(
+        "file_blobs",
+        sa.Column("digest", sa.String(64), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("stored_size", sa.BigInteger(), nullable=False),
+        sa.Column("storage", sa.String(16), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=True),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("digest"),
+    )
+    op.create_index(
+        "ix_file_blobs_unreferenced",
+        "file_blobs",
+        ["last_used_at"],
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+    for table in REFERENCING_TABLES:
+        op.add_column(table, sa.Column("blob_digest", sa.String(64), nullable=True))
+
+    _move_contents_to_blobs(op.get_bind())
+
+    for table in REFERENCING_TABLES:
+        op.alter_column(table, "blob_digest", nullable=False)
+        op.create_foreign_key(f"{table}_blob_digest_fkey", table, "file_blobs", ["blob_digest"], ["digest"])
+        op.create_index(f"ix_{table}_blob_digest", table, ["blob_digest"])
+        op.drop_column(table, "content")
+
+    for function, body in REF_COUNT_FUNCTIONS.items():
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+            BEGIN
+                {body}
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            """
+        )
+    for table in REFERENCING_TABLES:
+        for suffix, event, referencing, function in EVENTS:
+            op.execute(
+                f"""
+                CREATE TRIGGER trg_{table}_blob_refs_{suffix}
+                AFTER {event} ON {table}
+                REFERENCING {referencing}
+                FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+                """
+            )
+
+
+def _read_blob(storage: str, digest: str, content) -> bytes:
+    if storage == "DATABASE":
+        return bytes(content)
+    root = os.getenv("BLOB_STORE_PATH")
+    if not root:
+        raise RuntimeError("BLOB_STORE_PATH must be set to downgrade filesystem blobs")
+    return (Path(root) / digest[:2] / digest[2:4] / f"{digest}.zst").read_bytes()
+
+
+def downgrade() -> None:
+    for table in REFERENCING_TABLES:
+        for suffix, _, _, _ in EVENTS:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_blob_refs_{suffix} ON {table}")
+    for function in REF_COUNT_FUNCTIONS:
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+
+    for table in REFERENCING_TABLES:
+        op.add_column(table, sa.Column("content", sa.LargeBinary(), nullable=True))
+
+    connection = op.get_bind()
+    decompressor = zstandard.ZstdDecompressor()
+    digests = connection.execute(sa.text("SELECT digest FROM file_blobs")).scalars().all()
+    for batch in _batches(digests):
+        rows = connection.execute(
+            sa.text("SELECT digest, storage, content FROM file_blobs WHERE digest = ANY(:digests)"),
+            {"digests": batch},
+        ).all()
+        for digest, storage, content in rows:
+            original = decompressor.decompress(_read_blob(storage, digest, content))
+            for table in REFERENCING_TABLES:
+                connection.execute(
+                    sa.text(f"UPDATE {table} SET content = :content WHERE blob_digest = :digest"),
+                    {"content": original, "digest": digest},
+                )
+
+    for table in REFERENCING_TABLES:
+        op.alter_column(table, "content", nullable=False)
+        op.drop_index(f"ix_{table}_blob_digest", table_name=table)
+        op.drop_constraint(f"{table}_blob_digest_fkey", table, type_="foreignkey")
+        op.drop_column(table, "blob_digest")
+
+    op.drop_index("ix_file_blobs_unreferenced", table_name="file_blobs")
+    op.drop_table("file_blobs")
+    # PostgreSQL cannot drop enum values; FILE_BLOB_CLEANUP stays in jobtype
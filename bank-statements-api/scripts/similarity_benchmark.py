@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Similarity categorizer benchmark.
+
+Trains the character n-gram index on a transactions export (GET
+/transactions/export) and categorises descriptions held out from it, reporting
+build time, query latency, and for each confidence threshold how many
+descriptions would be answered locally instead of by the LLM and how many of
+those answers match the category the user gave.
+
+Descriptions are held out whole, so a test description never has an exact
+match in the index.
+
+Usage:
+    python scripts/similarity_benchmark.py transactions.csv
+    python scripts/similarity_benchmark.py transactions.csv --test-share 0.3 --seed 7
+    python scripts/similarity_benchmark.py transactions.csv --thresholds 0.7 0.8 0.9
+"""
+
+import argparse
+import csv
+import random
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.common.text_normalization import normalize_description  # noqa: E402
+from app.services.ai.similarity_categorizer import CharNgramIndex  # noqa: E402
+
+
+def load_export(path: Path) -> Dict[str, Counter]:
+    """{normalized description: Counter(category path -> transactions)} for categorised rows"""
+    descriptions: Dict[str, Counter] = defaultdict(Counter)
+    with path.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            category = (row.get("Category") or "").strip()
+            description = normalize_description(row.get("Description") or "")
+            if category and description:
+                descriptions[description][category] += 1
+    return descriptions
+
+
+def percentile(values: List[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("export", type=Path, help="CSV from GET /transactions/export")
+    parser.add_argument("--test-share", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.6, 0.7, 0.8, 0.85, 0.9, 0.95])
+    args = parser.parse_args()
+
+    descriptions = load_export(args.export)
+    if len(descriptions) < 2:
+        print("Need at least two distinct categorised descriptions")
+        return 1
+
+    keys = sorted(descriptions)
+    random.Random(args.seed).shuffle(keys)
+    test_count = max(1, int(len(keys) * args.test_share))
+    test_keys, train_keys = keys[:test_count], keys[test_count:]
+
+    started = time.perf_counter()
+    index = CharNgramIndex()
+    for key in train_keys:
+        for category, count in descriptions[key].items():
+            # The index takes category ids; the benchmark uses category paths as stand-ins
+            index.add(key, category, count)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    latencies_ms = []
+    predictions: List[Tuple[float, bool]] = []
+    for key in test_keys:
+        started = time.perf_counter()
+        prediction = index.predict(key)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        if prediction is not None:
+            expected = descriptions[key].most_common(1)[0][0]
+            predictions.append((prediction.confidence, prediction.category_id == expected))
+
+    print(f"{len(train_keys)} training and {len(test_keys)} test descriptions from {args.export}")
+    print(f"Index build: {build_ms:.0f}ms")
+    print(
+        f"Query latency: p50 {statistics.median(latencies_ms):.2f}ms "
+        f"p95 {percentile(latencies_ms, 0.95):.2f}ms max {max(latencies_ms):.2f}ms"
+    )
+
+    print(f"\n{'threshold':>9} {'answered':>9} {'coverage':>9} {'precision':>10}")
+    for threshold in sorted(args.thresholds):
+        answered = [correct for confidence, correct in predictions if confidence >= threshold]
+        coverage = len(answered) / len(test_keys)
+        precision = sum(answered) / len(answered) if answered else 0.0
+        print(f"{threshold:>9.2f} {len(answered):>9} {coverage:>8.1%} {precision:>9.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
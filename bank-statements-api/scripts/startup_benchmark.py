@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Startup import-time benchmark.
+
+Runs `python -X importtime -c "import app.main"` in fresh interpreters and
+reports the median cumulative import time plus the slowest modules, so cold
+start regressions (an SDK imported at module level again) show up in numbers.
+
+Usage:
+    python scripts/startup_benchmark.py
+    python scripts/startup_benchmark.py --runs 10 --top 30
+    python scripts/startup_benchmark.py --budget-ms 3000   # exit 1 when over budget
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Imported only inside the code paths that need them; loading any of these at
+# startup is a regression.
+LAZY_MODULES = (
+    "pandas",
+    "numpy",
+    "openpyxl",
+    "dateutil",
+    "stripe",
+    "authlib",
+    "anthropic",
+    "groq",
+    "google.generativeai",
+    "google.genai",
+)
+
+
+def measure_import(module: str = "app.main") -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """
+    Import module in a fresh interpreter.
+
+    Returns:
+        ({module: (self_us, cumulative_us)}, lazy modules that ended up loaded)
+    """
+    probe = f"import sys, {module}\n" f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    output = completed.stdout.strip().splitlines()
+    loaded = [name for name in output[-1].split(",") if name] if output else []
+    return timings, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="number of slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    totals_ms = []
+    timings: Dict[str, Tuple[int, int]] = {}
+    loaded: List[str] = []
+    for _ in range(args.runs):
+        timings, loaded = measure_import(args.module)
+        totals_ms.append(timings[args.module][1] / 1000)
+
+    median_ms = statistics.median(totals_ms)
+    print(f"import {args.module}: median {median_ms:.0f}ms over {args.runs} runs (min {min(totals_ms):.0f}ms)")
+
+    print(f"\nSlowest {args.top} modules by self time (last run):")
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[: args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"  {self_us / 1000:8.1f}ms self {cumulative_us / 1000:8.1f}ms cumulative  {name}")
+
+    failed = False
+    if loaded:
+        print(f"\nLazy modules imported at startup: {', '.join(loaded)}")
+        failed = True
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"\nOver budget: {median_ms:.0f}ms > {args.budget_ms:.0f}ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Statement deletion benchmark.
+
+Seeds a statement with N transactions, a share of them tagged, and times
+deleting it the old way (load every transaction and its tags into the session,
+then session.delete each one) against the set-based path used by
+DELETE /statements/{id}. Every run happens in a transaction that is rolled
+back, so the database is left as it was.
+
+Needs a migrated database; DATABASE_URL is used unless --database-url is given.
+
+Usage:
+    python scripts/statement_delete_benchmark.py
+    python scripts/statement_delete_benchmark.py --transactions 30000 --tagged-share 0.2 --runs 3
+    python scripts/statement_delete_benchmark.py --database-url postgresql+psycopg://localhost/bank_statements_bench
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import app.domain.models  # noqa: E402, F401
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository  # noqa: E402
+from app.adapters.repositories.statement import SqlAlchemyStatementRepository  # noqa: E402
+from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.domain.models.account import Account  # noqa: E402
+from app.domain.models.refresh_token import RefreshToken  # noqa: E402, F401
+from app.domain.models.statement import Statement  # noqa: E402
+from app.domain.models.tag import Tag, transaction_tags  # noqa: E402
+from app.domain.models.transaction import Transaction  # noqa: E402
+from app.domain.models.user import User  # noqa: E402
+from app.services.file_blob import FileBlobService  # noqa: E402
+
+INSERT_BATCH = 5000
+
+
+def seed(session: Session, transactions: int, tagged_share: float) -> Tuple[UUID, UUID]:
+    """Create a user with one statement of `transactions` rows; returns (user id, statement id)"""
+    user = User(email=f"delete-benchmark-{uuid4()}@example.com")
+    session.add(user)
+    session.flush()
+    account = Account(user_id=user.id, name="Benchmark", currency="EUR")
+    tag = Tag(user_id=user.id, name="benchmark")
+    session.add_all([account, tag])
+    session.flush()
+    blob_digest = FileBlobService(SQLAlchemyFileBlobRepository(session)).store(f"benchmark {uuid4()}".encode())
+    statement = Statement(account_id=account.id, filename="benchmark.csv", file_type="CSV", blob_digest=blob_digest)
+    session.add(statement)
+    session.flush()
+
+    tag_every = round(1 / tagged_share) if tagged_share > 0 else 0
+    start = date(2024, 1, 1)
+    for offset in range(0, transactions, INSERT_BATCH):
+        rows = []
+        links = []
+        for i in range(offset, min(offset + INSERT_BATCH, transactions)):
+            transaction_id = uuid4()
+            rows.append(
+                {
+                    "id": transaction_id,
+                    "user_id": user.id,
+                    "date": start + timedelta(days=i % 365),
+                    "description": f"Card payment {i % 500}",
+                    "normalized_description": f"card payment {i % 500}",
+                    "amount": Decimal("-12.34"),
+                    "account_id": account.id,
+                    "statement_id": statement.id,
+                    "row_index": i,
+                    "sort_index": i,
+                }
+            )
+            if tag_every and i % tag_every == 0:
+                links.append({"transaction_id": transaction_id, "tag_id": tag.id})
+        session.execute(insert(Transaction), rows)
+        if links:
+            session.execute(insert(transaction_tags), links)
+    session.flush()
+    return user.id, statement.id
+
+
+def delete_loading_rows(session: Session, user_id: UUID, statement_id: UUID) -> int:
+    """The previous implementation: every transaction and its tags loaded, then deleted one by one"""
+    transactions = session.query(Transaction).filter(Transaction.statement_id == statement_id).all()
+    for transaction in transactions:
+        session.delete(transaction)
+    session.flush()
+    session.delete(session.get(Statement, statement_id))
+    session.flush()
+    return len(transactions)
+
+
+def delete_set_based(session: Session, user_id: UUID, statement_id: UUID) -> int:
+    deleted = SQLAlchemyTransactionRepository(session).delete_by_statement_id(statement_id)
+    SqlAlchemyStatementRepository(session).delete(statement_id, user_id)
+    return deleted
+
+
+def time_delete(engine, delete: Callable[[Session, UUID, UUID], int], args) -> float:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection)
+        try:
+            user_id, statement_id = seed(session, args.transactions, args.tagged_share)
+            session.expunge_all()
+            started = time.perf_counter()
+            deleted = delete(session, user_id, statement_id)
+            elapsed = time.perf_counter() - started
+            if deleted != args.transactions:
+                raise RuntimeError(f"{delete.__name__} deleted {deleted} of {args.transactions} transactions")
+            return elapsed
+        finally:
+            session.close()
+            transaction.rollback()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--transactions", type=int, default=30000)
+    parser.add_argument("--tagged-share", type=float, default=0.1)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    results: Dict[str, List[float]] = {}
+    for delete in (delete_loading_rows, delete_set_based):
+        results[delete.__name__] = [time_delete(engine, delete, args) for _ in range(args.runs)]
+
+    print(f"Deleting a statement of {args.transactions} transactions, {args.tagged_share:.0%} tagged, {args.runs} runs")
+    print(f"\n{'path':<20} {'median':>10} {'min':>10} {'max':>10}")
+    for name, timings in results.items():
+        print(
+            f"{name:<20} {statistics.median(timings) * 1000:>8.0f}ms "
+            f"{min(timings) * 1000:>8.0f}ms {max(timings) * 1000:>8.0f}ms"
+        )
+    speedup = statistics.median(results["delete_loading_rows"]) / statistics.median(results["delete_set_based"])
+    print(f"\nSet-based deletion is {speedup:.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
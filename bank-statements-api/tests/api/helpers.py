@@ -13,6 +13,7 @@ from app.adapters.repositories.filter_preset import SQLAlchemyFilterPresetReposi
 from app.adapters.repositories.saved_filter import SQLAlchemySavedFilterRepository
 from app.adapters.repositories.statement import SqlAlchemyStatementRepository
 from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
+from app.adapters.repositories.user_data_version import SQLAlchemyUserDataVersionRepository
 from app.api.routes.auth import require_current_user
 from app.app import register_app_routes
 from app.core.dependencies import InternalDependencies
@@ -20,13 +21,17 @@ from app.domain.models.user import User
 from app.services.account import AccountService
 from app.services.ai import LLMRuleCategorizer, LLMRuleCounterparty
 from app.services.ai.llm_category_generator import LLMCategoryGenerator
+from app.services.ai.rule_suggestion import RuleSuggestionService
 from app.services.background.background_job_service import BackgroundJobService
 from app.services.category import CategoryService
 from app.services.chat import ChatService
 from app.services.description_group import DescriptionGroupService
 from app.services.enhancement_rule_management import EnhancementRuleManagementService
+from app.services.file_blob import FileBlobService
 from app.services.initial_balance_service import InitialBalanceService
 from app.services.recurring_expense_analyzer import RecurringExpenseAnalyzer
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
+from app.services.retention import RetentionService
 from app.services.statement import StatementService
 from app.services.statement_processing.statement_analyzer import StatementAnalyzerService
 from app.services.statement_processing.statement_upload import StatementUploadService
@@ -66,21 +71,32 @@ def mocked_dependencies(
     category_repository: SQLAlchemyCategoryRepository = None,
     account_repository: SQLAlchemyAccountRepository = None,
     recurring_expense_analyzer: RecurringExpenseAnalyzer = None,
+    recurring_pattern_service: RecurringPatternSnapshotService = None,
     description_group_service: DescriptionGroupService = None,
     saved_filter_repository: SQLAlchemySavedFilterRepository = None,
     filter_preset_repository: SQLAlchemyFilterPresetRepository = None,
     llm_rule_categorizer: LLMRuleCategorizer = None,
     llm_rule_counterparty: LLMRuleCounterparty = None,
+    rule_suggestion_service: RuleSuggestionService = None,
     llm_category_generator: LLMCategoryGenerator = None,
     subscription_service: SubscriptionService = None,
     chat_service: ChatService = None,
     tag_service: TagService = None,
+    user_data_version_repository: SQLAlchemyUserDataVersionRepository = None,
+    file_blob_service: FileBlobService = None,
+    retention_service: RetentionService = None,
 ) -> InternalDependencies:
     if transaction_service is None:
         transaction_service = MagicMock(spec=TransactionService)
         transaction_service.transaction_repository = MagicMock()
     if initial_balance_service is None:
         initial_balance_service = MagicMock(spec=InitialBalanceService)
+    if background_job_repository is None:
+        background_job_repository = MagicMock(spec=SQLAlchemyBackgroundJobRepository)
+        background_job_repository.get_queue_stats.return_value = []
+    if user_data_version_repository is None:
+        user_data_version_repository = MagicMock(spec=SQLAlchemyUserDataVersionRepository)
+        user_data_version_repository.get_version.return_value = 0
 
     return InternalDependencies(
         transaction_service=transaction_service,
@@ -93,7 +109,7 @@ def mocked_dependencies(
         enhancement_rule_management_service=enhancement_rule_management_service
         or MagicMock(spec=EnhancementRuleManagementService),
         background_job_service=background_job_service or MagicMock(spec=BackgroundJobService),
-        background_job_repository=background_job_repository or MagicMock(spec=SQLAlchemyBackgroundJobRepository),
+        background_job_repository=background_job_repository,
         statement_repo=statement_repo or MagicMock(spec=SqlAlchemyStatementRepository),
         transaction_repo=transaction_repo or MagicMock(spec=SQLAlchemyTransactionRepository),
         enhancement_rule_repository=enhancement_rule_repository or MagicMock(spec=SQLAlchemyEnhancementRuleRepository),
@@ -101,15 +117,20 @@ def mocked_dependencies(
         category_repository=category_repository or MagicMock(spec=SQLAlchemyCategoryRepository),
         account_repository=account_repository or MagicMock(spec=SQLAlchemyAccountRepository),
         recurring_expense_analyzer=recurring_expense_analyzer or MagicMock(spec=RecurringExpenseAnalyzer),
+        recurring_pattern_service=recurring_pattern_service or MagicMock(spec=RecurringPatternSnapshotService),
         description_group_service=description_group_service or MagicMock(spec=DescriptionGroupService),
         saved_filter_repository=saved_filter_repository or MagicMock(spec=SQLAlchemySavedFilterRepository),
         filter_preset_repository=filter_preset_repository or MagicMock(spec=SQLAlchemyFilterPresetRepository),
         llm_rule_categorizer=llm_rule_categorizer or MagicMock(spec=LLMRuleCategorizer),
         llm_rule_counterparty=llm_rule_counterparty or MagicMock(spec=LLMRuleCounterparty),
+        rule_suggestion_service=rule_suggestion_service or MagicMock(spec=RuleSuggestionService),
         llm_category_generator=llm_category_generator or MagicMock(spec=LLMCategoryGenerator),
         subscription_service=subscription_service or MagicMock(spec=SubscriptionService),
         chat_service=chat_service or MagicMock(spec=ChatService),
         tag_service=tag_service or MagicMock(spec=TagService),
+        user_data_version_repository=user_data_version_repository,
+        file_blob_service=file_blob_service or MagicMock(spec=FileBlobService),
+        retention_service=retention_service or MagicMock(spec=RetentionService),
     )
 
 
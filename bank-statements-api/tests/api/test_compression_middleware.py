@@ -0,0 +1,64 @@
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.compression import CompressionMiddleware
+
+
+def _client(minimum_size: int = 100) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse("x" * 1000)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"data: 1\n\n", b"data: 2\n\n"]), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_large_response_is_gzipped_when_accepted():
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.text == "x" * 1000
+
+
+def test_gzip_body_is_smaller_than_original():
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert int(response.headers["Content-Length"]) < 1000
+
+
+def test_small_response_is_not_compressed():
+    response = _client().get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "tiny"
+
+
+def test_no_compression_without_accept_encoding():
+    response = _client().get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_rejected_encoding_is_not_used():
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_streaming_response_passes_through():
+    response = _client(minimum_size=1).get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "data: 1\n\ndata: 2\n\n"
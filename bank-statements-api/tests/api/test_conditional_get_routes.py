@@ -0,0 +1,83 @@
+from decimal import Decimal
+from uuid import uuid4
+
+from app.domain.models.category import Category
+from tests.api.helpers import TEST_USER_ID, build_client, mocked_dependencies
+
+
+def _client_with_totals():
+    internal_dependencies = mocked_dependencies()
+    internal_dependencies.transaction_service.get_category_totals.return_value = {
+        uuid4(): {"total_amount": Decimal("10.00"), "transaction_count": 1},
+    }
+    return internal_dependencies, build_client(internal_dependencies)
+
+
+def test_list_response_carries_etag():
+    internal_dependencies, client = _client_with_totals()
+
+    response = client.get("/api/v1/transactions/category-totals")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"0-')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    internal_dependencies.user_data_version_repository.get_version.assert_called_with(TEST_USER_ID)
+
+
+def test_matching_if_none_match_returns_304_before_querying():
+    internal_dependencies, client = _client_with_totals()
+    etag = client.get("/api/v1/transactions/category-totals").headers["ETag"]
+    internal_dependencies.transaction_service.get_category_totals.reset_mock()
+
+    response = client.get("/api/v1/transactions/category-totals", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    internal_dependencies.transaction_service.get_category_totals.assert_not_called()
+
+
+def test_data_version_change_invalidates_etag():
+    internal_dependencies, client = _client_with_totals()
+    etag = client.get("/api/v1/transactions/category-totals").headers["ETag"]
+    internal_dependencies.user_data_version_repository.get_version.return_value = 1
+
+    response = client.get("/api/v1/transactions/category-totals", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_etag_ignores_query_parameter_order():
+    _, client = _client_with_totals()
+    first, second = uuid4(), uuid4()
+
+    a = client.get(f"/api/v1/transactions/category-totals?transaction_type=debit&category_ids={first},{second}")
+    b = client.get(f"/api/v1/transactions/category-totals?category_ids={second},{first}&transaction_type=debit")
+    c = client.get("/api/v1/transactions/category-totals?transaction_type=credit")
+
+    assert a.headers["ETag"] == b.headers["ETag"]
+    assert a.headers["ETag"] != c.headers["ETag"]
+
+
+def test_fast_path_response_carries_etag():
+    _, client = _client_with_totals()
+
+    response = client.get("/api/v1/transactions/category-totals?fast=true")
+
+    assert response.status_code == 200
+    assert "ETag" in response.headers
+
+
+def test_category_list_supports_conditional_get():
+    internal_dependencies = mocked_dependencies()
+    internal_dependencies.category_service.get_all_categories.return_value = [
+        Category(id=uuid4(), name="Food", user_id=TEST_USER_ID)
+    ]
+    client = build_client(internal_dependencies)
+    etag = client.get("/api/v1/categories").headers["ETag"]
+
+    response = client.get("/api/v1/categories", headers={"If-None-Match": f'"other", {etag}'})
+
+    assert response.status_code == 304
+    internal_dependencies.category_service.get_all_categories.assert_called_once()
@@ -0,0 +1,112 @@
+import asyncio
+from uuid import uuid4
+
+from app.api.routes.auth import require_current_user
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.services.ai.rule_suggestion import RuleSuggestionSummary
+from tests.api.helpers import TEST_USER_ID, build_client, get_test_user, mocked_dependencies
+
+
+class TestSuggestCategoriesRoute:
+    def test_runs_suggestions_in_the_request_by_default(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        service = internal_dependencies.rule_suggestion_service
+        service.suggest_categories.return_value = RuleSuggestionSummary(
+            processed=3, auto_applied=1, suggestions=1, failed=1, error_messages={"No matching result from LLM"}
+        )
+
+        response = client.post("/api/v1/enhancement-rules/ai/suggest-categories", json={"auto_apply": True})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "processed": 3,
+            "auto_applied": 1,
+            "suggestions": 1,
+            "failed": 1,
+            "error_message": "No matching result from LLM",
+        }
+        user_id, request = service.suggest_categories.call_args.args
+        assert user_id == TEST_USER_ID
+        assert request.auto_apply is True
+        service.queue_suggestions.assert_not_called()
+
+    def test_runs_suggestions_off_the_server_event_loop(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        loops = {}
+
+        async def current_user():
+            loops["server"] = asyncio.get_running_loop()
+            return get_test_user()
+
+        async def suggest_categories(user_id, request):
+            loops["suggestions"] = asyncio.get_running_loop()
+            return RuleSuggestionSummary(processed=1, suggestions=1)
+
+        client.app.dependency_overrides[require_current_user] = current_user
+        internal_dependencies.rule_suggestion_service.suggest_categories.side_effect = suggest_categories
+
+        response = client.post("/api/v1/enhancement-rules/ai/suggest-categories", json={})
+
+        assert response.status_code == 200
+        assert loops["suggestions"] is not loops["server"]
+
+    def test_queues_a_job_when_background_is_requested(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        job = BackgroundJob(id=uuid4(), job_type=JobType.RULE_CATEGORY_SUGGESTION, status=JobStatus.PENDING)
+        internal_dependencies.rule_suggestion_service.queue_suggestions.return_value = job
+
+        response = client.post("/api/v1/enhancement-rules/ai/suggest-categories", json={"background": True})
+
+        job_url = f"/api/v1/transactions/categorization-jobs/{job.id}"
+        assert response.status_code == 202
+        assert response.json() == {
+            "job_id": str(job.id),
+            "status": "PENDING",
+            "status_url": f"{job_url}/status",
+            "events_url": f"{job_url}/events",
+        }
+        assert response.headers["location"] == f"{job_url}/status"
+        job_type, user_id, request = internal_dependencies.rule_suggestion_service.queue_suggestions.call_args.args
+        assert job_type == JobType.RULE_CATEGORY_SUGGESTION
+        assert user_id == TEST_USER_ID
+        internal_dependencies.rule_suggestion_service.suggest_categories.assert_not_called()
+
+    def test_returns_500_when_suggestions_fail(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        internal_dependencies.rule_suggestion_service.suggest_categories.side_effect = RuntimeError("boom")
+
+        response = client.post("/api/v1/enhancement-rules/ai/suggest-categories", json={})
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to suggest categories: boom"
+
+
+class TestSuggestCounterpartiesRoute:
+    def test_runs_suggestions_in_the_request_by_default(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        internal_dependencies.rule_suggestion_service.suggest_counterparties.return_value = RuleSuggestionSummary(
+            processed=2, suggestions=2
+        )
+
+        response = client.post("/api/v1/enhancement-rules/ai/suggest-counterparties", json={})
+
+        assert response.status_code == 200
+        assert response.json()["suggestions"] == 2
+
+    def test_queues_a_job_when_background_is_requested(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        job = BackgroundJob(id=uuid4(), job_type=JobType.RULE_COUNTERPARTY_SUGGESTION, status=JobStatus.PENDING)
+        internal_dependencies.rule_suggestion_service.queue_suggestions.return_value = job
+
+        response = client.post("/api/v1/enhancement-rules/ai/suggest-counterparties", json={"background": True})
+
+        assert response.status_code == 202
+        assert response.json()["job_id"] == str(job.id)
+        job_type = internal_dependencies.rule_suggestion_service.queue_suggestions.call_args.args[0]
+        assert job_type == JobType.RULE_COUNTERPARTY_SUGGESTION
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.api.request_timing import RequestTimingMiddleware
+from app.core.config import settings
+from app.domain.models.background_job import JobStatus, JobType
+from tests.api.helpers import build_client, mocked_dependencies
+
+AUTHORIZATION = {"Authorization": "Bearer s3cret"}
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "s3cret")
+
+
+def test_metrics_exposes_job_queue_depth_and_age():
+    internal_dependencies = mocked_dependencies()
+    created_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=5)
+    internal_dependencies.background_job_repository.get_queue_stats.return_value = [
+        (JobType.PLACEHOLDER, JobStatus.PENDING, 4, created_at),
+    ]
+    client = build_client(internal_dependencies)
+
+    response = client.get("/metrics", headers=AUTHORIZATION)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'background_jobs_queue_depth{job_type="PLACEHOLDER",status="PENDING"} 4' in response.text
+    age_line = next(line for line in response.text.splitlines() if line.startswith("background_jobs_oldest_age_seconds{"))
+    assert 299 <= float(age_line.split()[-1]) < 360
+
+
+def test_metrics_labels_request_latency_by_route_template():
+    internal_dependencies = mocked_dependencies()
+    internal_dependencies.description_group_service.get_group_by_id.return_value = None
+    client = build_client(internal_dependencies)
+    client.app.add_middleware(RequestTimingMiddleware)
+
+    client.get("/api/v1/description-groups/00000000-0000-0000-0000-000000000001")
+    response = client.get("/metrics", headers=AUTHORIZATION)
+
+    assert 'route="/api/v1/description-groups/{group_id}"' in response.text
+    assert "00000000-0000-0000-0000-000000000001" not in response.text
+
+
+def test_metrics_requires_the_token():
+    client = build_client()
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers=AUTHORIZATION).status_code == 200
+
+
+def test_metrics_are_not_served_without_a_configured_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    client = build_client()
+
+    assert client.get("/metrics").status_code == 404
+    assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 404
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+from app.services.recurring_pattern_snapshot import RecurringPatternsView, summarize_patterns
+from tests.api.helpers import TEST_USER_ID, build_client, mocked_dependencies
+
+PATTERN = {
+    "description": "NETFLIX",
+    "normalized_description": "netflix",
+    "interval_days": 30.0,
+    "average_amount": 9.99,
+    "amount_variance": 0.0,
+    "transaction_count": 4,
+    "transaction_ids": [],
+    "category_id": None,
+    "first_transaction_date": "2024-01-05",
+    "last_transaction_date": "2024-04-04",
+    "total_annual_cost": 119.88,
+    "pattern_type": "monthly",
+}
+
+
+def test_recurring_patterns_are_read_from_the_snapshot():
+    internal_dependencies = mocked_dependencies()
+    internal_dependencies.subscription_service.check_feature_access.return_value.allowed = True
+    computed_at = datetime(2024, 4, 5, 3, 0, tzinfo=timezone.utc)
+    internal_dependencies.recurring_pattern_service.get_patterns.return_value = RecurringPatternsView(
+        patterns=[PATTERN],
+        summary=summarize_patterns([PATTERN]),
+        computed_at=computed_at,
+        stale=True,
+    )
+    client = build_client(internal_dependencies)
+
+    response = client.get("/api/v1/transactions/recurring-patterns?active_only=false")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [p["normalized_description"] for p in body["patterns"]] == ["netflix"]
+    assert body["summary"]["total_monthly_recurring"] == 9.99
+    assert body["stale"] is True
+    assert datetime.fromisoformat(body["computed_at"]) == computed_at
+    internal_dependencies.recurring_pattern_service.get_patterns.assert_called_once_with(TEST_USER_ID, active_only=False)
+    internal_dependencies.transaction_service.get_recurring_candidates.assert_not_called()
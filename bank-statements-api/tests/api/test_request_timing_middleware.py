@@ -0,0 +1,90 @@
+import logging
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.api.request_timing import LOGGED_SQL_CHARS, RequestTimingMiddleware, logged_sql, route_template
+from app.core.query_stats import install_query_instrumentation
+
+
+def _client() -> TestClient:
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    install_query_instrumentation(engine)
+
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware, repeat_threshold=3)
+
+    @app.get("/items")
+    def list_items():
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :id"), {"id": i})
+        return {"ok": True}
+
+    @app.get("/empty")
+    async def empty():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_server_timing_reports_queries_from_sync_endpoint():
+    response = _client().get("/items")
+
+    assert response.status_code == 200
+    server_timing = response.headers["Server-Timing"]
+    assert 'desc="3 queries"' in server_timing
+    assert "app;dur=" in server_timing
+
+
+def test_server_timing_without_queries():
+    response = _client().get("/empty")
+
+    assert 'db;dur=0.0;desc="0 queries"' in response.headers["Server-Timing"]
+
+
+def test_logs_summary_and_repeated_statements(caplog):
+    with caplog.at_level(logging.INFO, logger="app.api.request_timing"):
+        _client().get("/items")
+
+    summary = next(r.getMessage() for r in caplog.records if r.levelno == logging.INFO)
+    assert "GET /items" in summary
+    assert "status=200 db_queries=3" in summary
+    assert "db_repeated=1" in summary
+    assert 'db_slowest_sql="SELECT ?"' in summary
+    assert any("Repeated query x3" in r.getMessage() for r in caplog.records if r.levelno == logging.WARNING)
+
+
+def test_summary_has_no_slowest_statement_without_queries(caplog):
+    with caplog.at_level(logging.INFO, logger="app.api.request_timing"):
+        _client().get("/empty")
+
+    summary = next(r.getMessage() for r in caplog.records if r.levelno == logging.INFO)
+    assert "db_queries=0" in summary
+    assert "db_slowest_sql" not in summary
+
+
+def test_logged_sql_is_one_line_and_truncated():
+    statement = "SELECT id,\n       amount\nFROM transactions WHERE " + " AND ".join(f"c{i} = ?" for i in range(100))
+
+    logged = logged_sql(statement)
+
+    assert logged.startswith("SELECT id, amount FROM transactions WHERE c0 = ?")
+    assert "\n" not in logged
+    assert len(logged) == LOGGED_SQL_CHARS
+
+
+def test_route_template_keeps_parameters_that_share_a_value():
+    app = FastAPI()
+    router = APIRouter(prefix="/accounts")
+
+    @router.get("/{account_id}/transfers/{counterparty_id}")
+    def transfer(account_id: str, counterparty_id: str, request: Request):
+        return {"route": route_template(request.scope)}
+
+    app.include_router(router, prefix="/api")
+    response = TestClient(app).get("/api/accounts/1/transfers/1")
+
+    assert response.json() == {"route": "/api/accounts/{account_id}/transfers/{counterparty_id}"}
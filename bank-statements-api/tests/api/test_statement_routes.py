@@ -1,14 +1,33 @@
 from datetime import datetime, timezone
 from io import BytesIO
+from unittest.mock import MagicMock
 from uuid import uuid4
 
+import zstandard
+from fastapi import FastAPI
 from fastapi.encoders import jsonable_encoder
-
-from app.api.schemas import JobStatusResponse, StatementAnalysisResponse, StatementUploadRequest, StatementUploadResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository
+from app.api.routes.auth import require_current_user
+from app.api.schemas import (
+    JobStatusResponse,
+    StatementAnalysisResponse,
+    StatementImportJobResponse,
+    StatementUploadRequest,
+    StatementUploadResponse,
+)
+from app.app import register_app_routes
+from app.core.dependencies import ExternalDependencies
 from app.domain.dto.statement_processing import AnalysisResultDTO
-from app.domain.models.background_job import JobStatus
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.domain.models.file_blob import BlobStorage, FileBlob
 from app.domain.models.processing import BackgroundJobInfo
-from tests.api.helpers import TEST_USER_ID, build_client, mocked_dependencies
+from app.domain.models.statement import Statement
+from app.services.file_blob import FileBlobService
+from app.services.statement import StatementDownload, StatementService
+from tests.api.helpers import TEST_USER_ID, build_client, get_test_user, mocked_dependencies
 
 
 class TestStatementRoutes:
@@ -128,11 +147,9 @@ class TestStatementRoutes:
         assert persistence_result.processing_time_ms == 150
         assert persistence_result.background_job is None
 
-        call_args = internal_dependencies.statement_upload_service.upload_statement.call_args
-        assert call_args.kwargs["user_id"] == TEST_USER_ID
-        assert call_args.kwargs["upload_data"] == request_data
-        assert "background_tasks" in call_args.kwargs
-        assert "internal_deps" in call_args.kwargs
+        internal_dependencies.statement_upload_service.upload_statement.assert_called_once_with(
+            user_id=TEST_USER_ID, upload_data=request_data
+        )
 
     def test_upload_statement_error(self):
         internal_dependencies = mocked_dependencies()
@@ -193,9 +210,6 @@ class TestStatementRoutes:
         )
         internal_dependencies.statement_upload_service.upload_statement.return_value = upload_result
 
-        # Mock background job repository to prevent hanging when process_pending_jobs is called
-        internal_dependencies.background_job_repository.claim_single_pending_job.return_value = None
-
         request_data = StatementUploadRequest(
             uploaded_file_id=uploaded_file_id,
             column_mapping={
@@ -262,6 +276,70 @@ class TestStatementRoutes:
         assert response.status_code == 400
         assert "Service failed" in response.json()["detail"]
 
+    def test_async_upload_of_large_file_queues_import_job(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        uploaded_file_id = str(uuid4())
+        job = BackgroundJob(id=uuid4(), job_type=JobType.STATEMENT_IMPORT, status=JobStatus.PENDING)
+        internal_dependencies.statement_upload_service.should_import_async.return_value = True
+        internal_dependencies.statement_upload_service.queue_statement_import.return_value = job
+
+        request_data = StatementUploadRequest(
+            uploaded_file_id=uploaded_file_id,
+            column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+            header_row_index=0,
+            data_start_row_index=1,
+            account_id=str(uuid4()),
+            async_processing=True,
+        )
+
+        response = client.post("/api/v1/statements/upload", json=jsonable_encoder(request_data))
+
+        accepted = StatementImportJobResponse.model_validate(response.json())
+        assert response.status_code == 202
+        assert accepted.job_id == job.id
+        assert accepted.status == JobStatus.PENDING
+        assert accepted.status_url == f"/api/v1/transactions/categorization-jobs/{job.id}/status"
+        assert accepted.events_url == f"/api/v1/transactions/categorization-jobs/{job.id}/events"
+        assert response.headers["location"] == accepted.status_url
+        internal_dependencies.statement_upload_service.upload_statement.assert_not_called()
+        internal_dependencies.statement_upload_service.queue_statement_import.assert_called_once_with(
+            user_id=TEST_USER_ID, upload_data=request_data
+        )
+
+    def test_async_upload_of_small_file_is_processed_synchronously(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        uploaded_file_id = str(uuid4())
+        internal_dependencies.statement_upload_service.should_import_async.return_value = False
+
+        from app.services.statement_processing.statement_upload import StatementUploadResult
+
+        internal_dependencies.statement_upload_service.upload_statement.return_value = StatementUploadResult(
+            uploaded_file_id=uploaded_file_id,
+            transactions_saved=3,
+            duplicated_transactions=0,
+            total_processed=3,
+            rule_based_matches=3,
+            match_rate_percentage=100.0,
+            processing_time_ms=20,
+        )
+
+        request_data = StatementUploadRequest(
+            uploaded_file_id=uploaded_file_id,
+            column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+            header_row_index=0,
+            data_start_row_index=1,
+            account_id=str(uuid4()),
+            async_processing=True,
+        )
+
+        response = client.post("/api/v1/statements/upload", json=jsonable_encoder(request_data))
+
+        assert response.status_code == 200
+        assert response.json()["transactions_saved"] == 3
+        internal_dependencies.statement_upload_service.queue_statement_import.assert_not_called()
+
 
 class TestJobStatusRoutes:
     """Tests for job status endpoints"""
@@ -359,3 +437,123 @@ class TestJobStatusRoutes:
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
+
+    def test_job_status_is_scoped_to_current_user(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        job_id = uuid4()
+        internal_dependencies.background_job_service.get_job_status_for_api.return_value = None
+
+        client.get(f"/api/v1/transactions/categorization-jobs/{job_id}/status")
+
+        internal_dependencies.background_job_service.get_job_status_for_api.assert_called_once_with(job_id, TEST_USER_ID)
+
+    def test_job_events_stream_status_updates(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        job_id = uuid4()
+
+        def status(job_status, phase, processed):
+            return {
+                "job_id": job_id,
+                "status": job_status,
+                "progress": {
+                    "total_transactions": 1000,
+                    "processed_transactions": processed,
+                    "remaining_transactions": 1000 - processed,
+                    "completion_percentage": processed / 10,
+                    "phase": phase,
+                    "duplicate_transactions": 2,
+                },
+                "result": None,
+                "error_message": None,
+                "created_at": datetime.now(timezone.utc),
+            }
+
+        async def stream(job_id, user_id):
+            yield status(JobStatus.IN_PROGRESS, "saving", 500)
+            yield status(JobStatus.COMPLETED, "saving", 1000)
+
+        internal_dependencies.background_job_service.get_job_status_for_api.return_value = status(JobStatus.PENDING, None, 0)
+        internal_dependencies.background_job_service.stream_job_status.side_effect = stream
+
+        response = client.get(f"/api/v1/transactions/categorization-jobs/{job_id}/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            JobStatusResponse.model_validate_json(line[len("data: ") :])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert [event.status for event in events] == [JobStatus.IN_PROGRESS, JobStatus.COMPLETED]
+        assert events[0].progress.phase == "saving"
+        assert events[0].progress.processed_transactions == 500
+        assert events[0].progress.duplicate_transactions == 2
+
+    def test_job_events_not_found(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        internal_dependencies.background_job_service.get_job_status_for_api.return_value = None
+
+        response = client.get(f"/api/v1/transactions/categorization-jobs/{uuid4()}/events")
+
+        assert response.status_code == 404
+
+    def test_download_statement_streams_the_original_file(self):
+        internal_dependencies = mocked_dependencies()
+        client = build_client(internal_dependencies)
+        statement_id = uuid4()
+        internal_dependencies.statement_service.download_statement.return_value = StatementDownload(
+            filename="march.csv",
+            file_type="CSV",
+            size=12,
+            chunks=iter([b"date,amount\n", b""]),
+        )
+
+        response = client.get(f"/api/v1/statements/{statement_id}/download")
+
+        assert response.status_code == 200
+        assert response.content == b"date,amount\n"
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.headers["content-length"] == "12"
+        assert response.headers["content-disposition"] == 'attachment; filename="march.csv"'
+        internal_dependencies.statement_service.download_statement.assert_called_once_with(statement_id, TEST_USER_ID)
+
+    def test_download_statement_reads_the_file_before_the_session_is_closed(self):
+        # Streamed bodies are sent after FastAPI has run the dependency's cleanup, which closes the session
+        content = b"date,amount\n" * 50000
+        compressed = zstandard.ZstdCompressor().compress(content)
+        blob = FileBlob(digest="abc", size=len(content), stored_size=len(compressed), storage=BlobStorage.DATABASE.value)
+        db = MagicMock(spec=Session)
+        db.get.return_value = blob
+
+        def execute(*args, **kwargs):
+            assert not db.close.called, "query run after the session was closed"
+            return MagicMock(scalar=MagicMock(return_value=compressed))
+
+        db.execute.side_effect = execute
+        external = ExternalDependencies(db=db, llm_client=MagicMock())
+        statement_repo = MagicMock()
+        statement_repo.find_by_id.return_value = Statement(
+            id=uuid4(), filename="march.csv", file_type="CSV", blob_digest=blob.digest, account_id=uuid4()
+        )
+        file_blobs = FileBlobService(SQLAlchemyFileBlobRepository(db))
+        internal_dependencies = mocked_dependencies(statement_service=StatementService(statement_repo, MagicMock(), file_blobs))
+
+        def provide_dependencies():
+            try:
+                yield internal_dependencies
+            finally:
+                external.cleanup()
+
+        app = FastAPI()
+        register_app_routes(app, provide_dependencies)
+        app.dependency_overrides[require_current_user] = get_test_user
+
+        response = TestClient(app).get(f"/api/v1/statements/{uuid4()}/download")
+
+        assert response.status_code == 200
+        assert response.content == content
+        db.commit.assert_called_once()
+        db.close.assert_called_once()
@@ -0,0 +1,167 @@
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import orjson
+
+from app.api import responses
+from app.api.schemas import CategoryTotalsResponse, IncomeSpendingResponse, TransactionListResponse
+from app.domain.models.tag import Tag
+from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
+from app.ports.repositories.enhancement_rule import EnhancementRuleRepository
+from app.ports.repositories.initial_balance import InitialBalanceRepository
+from app.ports.repositories.transaction import TRANSACTION_LIST_FIELDS, TransactionRepository
+from app.services.transaction import TransactionService
+from app.services.transaction_enhancement import TransactionEnhancer
+from tests.api.helpers import build_client, mocked_dependencies
+
+
+def _transactions(account_id, tag):
+    parent = Transaction(
+        id=uuid4(),
+        date=date(2024, 3, 1),
+        description="Supermarket",
+        normalized_description="supermarket",
+        amount=Decimal("-42.10"),
+        created_at=datetime(2024, 3, 2, 9, 30),
+        category_id=uuid4(),
+        account_id=account_id,
+        categorization_status=CategorizationStatus.RULE_BASED,
+        row_index=0,
+        sort_index=0,
+        source_type=SourceType.UPLOAD,
+        exclude_from_analytics=False,
+    )
+    parent.tags = [tag]
+    child = Transaction(
+        id=uuid4(),
+        date=date(2024, 2, 28),
+        description="Salary",
+        normalized_description="salary",
+        amount=Decimal("1500.00"),
+        created_at=datetime(2024, 3, 1, 8, 0),
+        account_id=account_id,
+        categorization_status=CategorizationStatus.UNCATEGORIZED,
+        row_index=1,
+        sort_index=1,
+        source_type=SourceType.MANUAL,
+        exclude_from_analytics=True,
+        parent_transaction_id=uuid4(),
+    )
+    child.tags = []
+    return [parent, child]
+
+
+def _service_with(transactions, tag, account_id):
+    repository = MagicMock(spec=TransactionRepository)
+    initial_balance_repository = MagicMock(spec=InitialBalanceRepository)
+    initial_balance_repository.get_latest_by_account_id.return_value = None
+
+    total_amount = sum((t.amount for t in transactions), Decimal("0"))
+    rows = [tuple(getattr(t, field) for field in TRANSACTION_LIST_FIELDS) for t in transactions]
+    repository.get_paginated.return_value = (transactions, len(transactions), total_amount)
+    repository.get_paginated_rows.return_value = (rows, len(transactions), total_amount)
+    repository.get_split_parent_ids.return_value = {transactions[0].id}
+    repository.get_tag_rows_by_transaction_ids.return_value = {transactions[0].id: [(tag.id, tag.name, tag.created_at)]}
+    repository.get_running_balances.return_value = {
+        transactions[0].id: Decimal("957.90"),
+        transactions[1].id: Decimal("1000.00"),
+    }
+
+    return TransactionService(
+        repository,
+        initial_balance_repository,
+        MagicMock(spec=EnhancementRuleRepository),
+        MagicMock(spec=TransactionEnhancer),
+    )
+
+
+def test_fast_transaction_list_matches_response_model():
+    account_id = uuid4()
+    tag = Tag(id=uuid4(), name="groceries", created_at=datetime(2024, 1, 5, 12, 0, 0, 123456))
+    transactions = _transactions(account_id, tag)
+    internal_dependencies = mocked_dependencies(transaction_service=_service_with(transactions, tag, account_id))
+    client = build_client(internal_dependencies)
+
+    query = f"/api/v1/transactions?account_id={account_id}&include_running_balance=true"
+    regular = client.get(query)
+    fast = client.get(query + "&fast=true")
+
+    assert regular.status_code == 200
+    assert fast.status_code == 200
+    assert fast.json() == regular.json()
+    TransactionListResponse.model_validate(fast.json())
+
+
+def test_fast_transaction_list_skips_orm_hydration():
+    account_id = uuid4()
+    tag = Tag(id=uuid4(), name="groceries", created_at=datetime(2024, 1, 5))
+    transactions = _transactions(account_id, tag)
+    service = _service_with(transactions, tag, account_id)
+    client = build_client(mocked_dependencies(transaction_service=service))
+
+    response = client.get("/api/v1/transactions?fast=true")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [t["id"] for t in body["transactions"]] == [str(t.id) for t in transactions]
+    assert body["transactions"][0]["is_split_parent"] is True
+    assert body["transactions"][1]["is_split_child"] is True
+    assert body["transactions"][0]["running_balance"] is None
+    service.transaction_repository.get_paginated.assert_not_called()
+
+
+def test_fast_category_totals_match_response_model():
+    internal_dependencies = mocked_dependencies()
+    category_id = uuid4()
+    internal_dependencies.transaction_service.get_category_totals.return_value = {
+        category_id: {"total_amount": Decimal("120.55"), "transaction_count": 3},
+        None: {"total_amount": Decimal("-10.00"), "transaction_count": 1},
+    }
+    client = build_client(internal_dependencies)
+
+    regular = client.get("/api/v1/transactions/category-totals")
+    fast = client.get("/api/v1/transactions/category-totals?fast=true")
+
+    assert fast.status_code == 200
+    assert fast.json() == regular.json()
+    CategoryTotalsResponse.model_validate(fast.json())
+
+
+def test_fast_income_spending_matches_response_model():
+    internal_dependencies = mocked_dependencies()
+    internal_dependencies.transaction_service.get_income_spending_time_series.return_value = [
+        {
+            "period": "2024-03",
+            "income": Decimal("1500.00"),
+            "spending": Decimal("42.10"),
+            "net": Decimal("1457.90"),
+            "income_count": 1,
+            "spending_count": 1,
+        }
+    ]
+    client = build_client(internal_dependencies)
+
+    regular = client.get("/api/v1/transactions/income-spending-time-series")
+    fast = client.get("/api/v1/transactions/income-spending-time-series?fast=true")
+
+    assert fast.status_code == 200
+    assert fast.json() == regular.json()
+    IncomeSpendingResponse.model_validate(fast.json())
+
+
+def test_fast_responses_are_encoded_with_orjson(monkeypatch):
+    encoder = MagicMock(wraps=orjson)
+    monkeypatch.setattr(responses, "orjson", encoder)
+    internal_dependencies = mocked_dependencies()
+    internal_dependencies.transaction_service.get_category_totals.return_value = {
+        uuid4(): {"total_amount": Decimal("120.55"), "transaction_count": 3},
+    }
+    client = build_client(internal_dependencies)
+
+    response = client.get("/api/v1/transactions/category-totals?fast=true")
+
+    assert response.status_code == 200
+    encoder.dumps.assert_called_once()
+    assert response.content == orjson.dumps(encoder.dumps.call_args.args[0], default=responses._encode_default)
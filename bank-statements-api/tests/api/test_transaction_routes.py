@@ -1,5 +1,6 @@
 from datetime import date, datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from uuid import uuid4
 
 from fastapi.encoders import jsonable_encoder
@@ -9,6 +10,7 @@ from app.domain.models.account import Account
 from app.domain.models.category import Category
 from app.domain.models.enhancement_rule import EnhancementRule, EnhancementRuleSource, MatchType
 from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
+from app.services.category_tree import CategoryTree
 from tests.api.helpers import TEST_USER_ID, build_client, mocked_dependencies
 
 
@@ -550,3 +552,37 @@ def test_preview_enhancement_rule_precedence():
     assert response_data["matched"] is True
     assert response_data["category_id"] == str(category_exact_id)
     assert response_data["category_name"] == "Exact Match Category"
+
+
+def test_export_transactions_names_categories_by_full_path():
+    internal_dependencies = mocked_dependencies()
+    client = build_client(internal_dependencies)
+    account = Account(id=uuid4(), name="Current", user_id=TEST_USER_ID, currency="EUR")
+    food = Category(id=uuid4(), name="Food", user_id=TEST_USER_ID)
+    groceries = Category(id=uuid4(), name="Groceries", parent_id=food.id, user_id=TEST_USER_ID)
+    transactions = [
+        Transaction(
+            id=uuid4(),
+            date=date(2024, 3, 1),
+            description="Market, Lisbon",
+            amount=Decimal("-12.50"),
+            category_id=groceries.id,
+            account_id=account.id,
+        ),
+        Transaction(id=uuid4(), date=date(2024, 3, 2), description="ATM", amount=Decimal("-40.00"), account_id=account.id),
+    ]
+    internal_dependencies.transaction_service.get_transactions_paginated.return_value = SimpleNamespace(
+        transactions=transactions
+    )
+    internal_dependencies.category_service.get_category_tree.return_value = CategoryTree([food, groceries])
+    internal_dependencies.account_repository.get_all.return_value = [account]
+
+    response = client.get("/api/v1/transactions/export")
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "Date,Description,Amount,Category,Account",
+        '2024-03-01,"Market, Lisbon",-12.50,Food > Groceries,Current',
+        "2024-03-02,ATM,-40.00,,Current",
+    ]
+    internal_dependencies.category_service.get_category_tree.assert_called_once_with(TEST_USER_ID)
@@ -1,11 +1,14 @@
+from contextlib import contextmanager
 from datetime import date
 from decimal import Decimal
+from typing import Optional
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 from dotenv import load_dotenv
 
+from app.core.query_stats import capture_queries
 from app.domain.models.refresh_token import RefreshToken  # noqa: F401 - Required for SQLAlchemy mapper
 from app.domain.models.transaction import Transaction
 from app.domain.models.user import User
@@ -48,3 +51,30 @@ def sample_transaction(sample_transaction_data):
 @pytest.fixture
 def mock_transaction_repository():
     return MagicMock(spec=TransactionRepository)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test when the wrapped block runs more SQL statements than declared,
+    or repeats the same statement shape more than max_repeats times:
+
+        with query_budget(max_queries=5, max_repeats=2):
+            client.get("/api/v1/transactions")
+    """
+
+    @contextmanager
+    def budget(max_queries: int, max_repeats: Optional[int] = None):
+        with capture_queries() as stats:
+            yield stats
+
+        if stats.count > max_queries:
+            statements = "\n".join(f"  x{count} {statement}" for statement, count in stats.fingerprints.most_common())
+            pytest.fail(f"Query budget exceeded: {stats.count} queries > {max_queries}\n{statements}")
+        if max_repeats is not None:
+            repeated = stats.repeated(max_repeats + 1)
+            if repeated:
+                statement, count = repeated[0]
+                pytest.fail(f"Statement repeated {count} times (max {max_repeats}), likely N+1:\n  {statement}")
+
+    return budget
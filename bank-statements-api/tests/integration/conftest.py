@@ -5,12 +5,14 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository
 from app.core.database import Base
 from app.domain.models.account import Account
 from app.domain.models.category import Category
 from app.domain.models.refresh_token import RefreshToken  # noqa: F401
 from app.domain.models.uploaded_file import FileAnalysisMetadata, UploadedFile  # noqa: F401
 from app.domain.models.user import User
+from app.services.file_blob import FileBlobService
 
 TEST_DATABASE_URL = os.getenv(
     "TEST_DATABASE_URL",
@@ -44,6 +46,12 @@ def db_session(engine, tables):
     connection.close()
 
 
+@pytest.fixture
+def blob_digest(db_session):
+    """Digest of a stored file for statements that need one"""
+    return FileBlobService(SQLAlchemyFileBlobRepository(db_session)).store(b"test")
+
+
 @pytest.fixture
 def user_a(db_session):
     user = User(
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.repositories.background_job import SQLAlchemyBackgroundJobRepository
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+
+
+def _job(db_session, status: JobStatus, job_type: JobType = JobType.STATEMENT_IMPORT) -> BackgroundJob:
+    job = BackgroundJob(job_type=job_type, status=status, progress={})
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+class TestStatusTransitions:
+    def test_runs_a_job_from_pending_to_completed(self, db_session):
+        job = _job(db_session, JobStatus.PENDING)
+        repository = SQLAlchemyBackgroundJobRepository(db_session)
+
+        started = repository.mark_started(job.id)
+        completed = repository.mark_completed(job.id, {"rows": 10})
+
+        assert started.started_at is not None
+        assert completed.status == JobStatus.COMPLETED
+        assert completed.result == {"rows": 10}
+        assert completed.completed_at is not None
+
+    def test_does_not_complete_a_job_that_was_requeued(self, db_session):
+        job = _job(db_session, JobStatus.PENDING)
+        repository = SQLAlchemyBackgroundJobRepository(db_session)
+
+        assert repository.mark_completed(job.id, {"rows": 10}) is None
+        db_session.refresh(job)
+        assert job.status == JobStatus.PENDING
+        assert job.result == {}
+
+    def test_does_not_fail_a_finished_job(self, db_session):
+        job = _job(db_session, JobStatus.COMPLETED)
+        repository = SQLAlchemyBackgroundJobRepository(db_session)
+
+        assert repository.mark_failed(job.id, "late error") is None
+        assert repository.mark_started(job.id) is None
+        db_session.refresh(job)
+        assert job.status == JobStatus.COMPLETED
+        assert job.error_message is None
+
+
+class TestFindJobCreatedSince:
+    def test_finds_only_jobs_of_the_type_queued_since(self, db_session):
+        repository = SQLAlchemyBackgroundJobRepository(db_session)
+        now = datetime.now(timezone.utc)
+        old = BackgroundJob(job_type=JobType.STORAGE_RETENTION, status=JobStatus.COMPLETED, progress={})
+        old.created_at = now - timedelta(days=2)
+        db_session.add(old)
+        db_session.flush()
+
+        assert repository.find_job_created_since(JobType.STORAGE_RETENTION, None, now - timedelta(days=1)) is None
+
+        recent = _job(db_session, JobStatus.COMPLETED, JobType.STORAGE_RETENTION)
+
+        assert repository.find_job_created_since(JobType.STORAGE_RETENTION, None, now - timedelta(days=1)) is recent
+        assert repository.find_job_created_since(JobType.FILE_BLOB_CLEANUP, None, now - timedelta(days=1)) is None
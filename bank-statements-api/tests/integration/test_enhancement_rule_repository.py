@@ -0,0 +1,40 @@
+from sqlalchemy import func, select
+
+from app.adapters.repositories.enhancement_rule import SQLAlchemyEnhancementRuleRepository
+from app.domain.models.enhancement_rule import EnhancementRule, EnhancementRuleSource, MatchType
+
+
+class TestCreateUnmatchedRules:
+    def test_creates_one_auto_rule_per_new_pattern(self, db_session, user_a, user_b):
+        db_session.add_all(
+            [
+                EnhancementRule(
+                    user_id=user_a.id,
+                    normalized_description_pattern="salary",
+                    match_type=MatchType.PREFIX,
+                    source=EnhancementRuleSource.MANUAL,
+                ),
+                EnhancementRule(
+                    user_id=user_b.id,
+                    normalized_description_pattern="grocery store",
+                    match_type=MatchType.EXACT,
+                    source=EnhancementRuleSource.AUTO,
+                ),
+            ]
+        )
+        db_session.flush()
+        repository = SQLAlchemyEnhancementRuleRepository(db_session)
+
+        created = repository.create_unmatched_rules(["grocery store", "salary", "atm withdrawal"], user_a.id)
+        created_again = repository.create_unmatched_rules(["grocery store", "atm withdrawal"], user_a.id)
+
+        assert created == 2
+        assert created_again == 0
+        rules = db_session.scalars(
+            select(EnhancementRule)
+            .where(EnhancementRule.user_id == user_a.id, EnhancementRule.source == EnhancementRuleSource.AUTO)
+            .order_by(EnhancementRule.normalized_description_pattern)
+        ).all()
+        assert [rule.normalized_description_pattern for rule in rules] == ["atm withdrawal", "grocery store"]
+        assert all(rule.match_type == MatchType.EXACT and rule.category_id is None for rule in rules)
+        assert db_session.scalar(select(func.count()).select_from(EnhancementRule)) == 4
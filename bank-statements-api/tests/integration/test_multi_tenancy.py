@@ -71,20 +71,20 @@ class TestCategoryMultiTenancy:
 
 class TestTransactionMultiTenancy:
     def test_user_can_only_see_transactions_from_own_accounts(
-        self, db_session, user_a, user_b, account_for_user_a, account_for_user_b
+        self, db_session, blob_digest, user_a, user_b, account_for_user_a, account_for_user_b
     ):
         stmt_a = Statement(
             id=uuid4(),
             filename="user_a.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_a.id,
         )
         stmt_b = Statement(
             id=uuid4(),
             filename="user_b.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_b.id,
         )
         db_session.add(stmt_a)
@@ -128,13 +128,13 @@ class TestTransactionMultiTenancy:
         assert user_b_txs[0].id == tx_b.id
 
     def test_user_cannot_get_other_users_transaction_by_id(
-        self, db_session, user_a, user_b, account_for_user_a, account_for_user_b
+        self, db_session, blob_digest, user_a, user_b, account_for_user_a, account_for_user_b
     ):
         stmt_a = Statement(
             id=uuid4(),
             filename="user_a.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_a.id,
         )
         db_session.add(stmt_a)
@@ -166,20 +166,20 @@ class TestTransactionMultiTenancy:
 
 class TestStatementMultiTenancy:
     def test_user_can_only_see_statements_from_own_accounts(
-        self, db_session, user_a, user_b, account_for_user_a, account_for_user_b
+        self, db_session, blob_digest, user_a, user_b, account_for_user_a, account_for_user_b
     ):
         stmt_a = Statement(
             id=uuid4(),
             filename="user_a.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_a.id,
         )
         stmt_b = Statement(
             id=uuid4(),
             filename="user_b.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_b.id,
         )
         db_session.add(stmt_a)
@@ -197,13 +197,13 @@ class TestStatementMultiTenancy:
         assert user_b_stmts[0].id == stmt_b.id
 
     def test_user_cannot_get_other_users_statement_by_id(
-        self, db_session, user_a, user_b, account_for_user_a, account_for_user_b
+        self, db_session, blob_digest, user_a, user_b, account_for_user_a, account_for_user_b
     ):
         stmt_a = Statement(
             id=uuid4(),
             filename="user_a.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_a.id,
         )
         db_session.add(stmt_a)
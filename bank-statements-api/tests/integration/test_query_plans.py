@@ -0,0 +1,206 @@
+"""
+Plan regression tests for the hot transaction queries.
+
+Each tracked query is run through the real repository method on a seeded
+dataset; the SQL it sends is captured and re-run under EXPLAIN, and the test
+fails if any plan reads the transactions table with a sequential scan.
+"""
+
+import json
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable, Iterator, List
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository
+from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
+from app.domain.models.account import Account
+from app.domain.models.statement import Statement
+from app.domain.models.transaction import CategorizationStatus, CounterpartyStatus, SourceType, Transaction
+from app.domain.models.user import User
+from app.services.file_blob import FileBlobService
+
+USERS = 40
+ACCOUNTS_PER_USER = 2
+TRANSACTIONS_PER_ACCOUNT = 250
+FIRST_DATE = date(2023, 1, 1)
+DESCRIPTIONS = ["netflix", "supermarket", "fuel station", "salary", "rent", "coffee shop", "pharmacy", "gym"]
+
+
+@dataclass
+class SeededData:
+    session: Session
+    user_id: UUID
+    account_id: UUID
+    transaction_ids: List[UUID]
+    sample: dict
+
+
+@pytest.fixture(scope="module")
+def seeded(engine, tables) -> Iterator[SeededData]:
+    connection = engine.connect()
+    outer = connection.begin()
+    session = sessionmaker(bind=connection)()
+    rng = random.Random(42)
+
+    users = [
+        User(id=uuid4(), email=f"plans-{i}@example.com", name=f"User {i}", oauth_provider="google", oauth_id=f"plans-{i}")
+        for i in range(USERS)
+    ]
+    session.add_all(users)
+    session.flush()
+    blob_digest = FileBlobService(SQLAlchemyFileBlobRepository(session)).store(b"")
+
+    rows = []
+    accounts = []
+    for user in users:
+        for a in range(ACCOUNTS_PER_USER):
+            account = Account(id=uuid4(), name=f"Account {a}", user_id=user.id)
+            statement = Statement(
+                id=uuid4(), filename="seed.csv", file_type="CSV", blob_digest=blob_digest, account_id=account.id
+            )
+            session.add_all([account, statement])
+            accounts.append(account)
+            for i in range(TRANSACTIONS_PER_ACCOUNT):
+                description = rng.choice(DESCRIPTIONS)
+                rows.append(
+                    dict(
+                        id=uuid4(),
+                        user_id=user.id,
+                        date=FIRST_DATE + timedelta(days=rng.randrange(3 * 365)),
+                        description=description.upper(),
+                        normalized_description=description,
+                        amount=Decimal(rng.randrange(-20000, 5000)) / 100,
+                        created_at=FIRST_DATE,
+                        statement_id=statement.id,
+                        account_id=account.id,
+                        categorization_status=CategorizationStatus.UNCATEGORIZED,
+                        counterparty_status=CounterpartyStatus.UNPROCESSED,
+                        row_index=i,
+                        sort_index=i,
+                        source_type=SourceType.UPLOAD,
+                        exclude_from_analytics=rng.random() < 0.05,
+                    )
+                )
+    session.flush()
+    session.execute(insert(Transaction), rows)
+    session.execute(text("ANALYZE users, accounts, statements, transactions"))
+
+    account = accounts[0]
+    account_rows = [row for row in rows if row["account_id"] == account.id]
+    yield SeededData(
+        session=session,
+        user_id=account.user_id,
+        account_id=account.id,
+        transaction_ids=[row["id"] for row in account_rows[:20]],
+        sample=account_rows[0],
+    )
+
+    session.close()
+    outer.rollback()
+    connection.close()
+
+
+def capture_plans(session, run: Callable[[], object]) -> List[dict]:
+    """Run a repository call, then EXPLAIN every SELECT it sent"""
+    connection = session.connection()
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        run()
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+    plans = []
+    for statement, parameters in statements:
+        result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = json.loads(result) if isinstance(result, str) else result
+        plans.append(plan[0]["Plan"])
+    return plans
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def sequential_scans(plans: List[dict], relation: str = "transactions") -> List[dict]:
+    return [
+        node
+        for plan in plans
+        for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == relation
+    ]
+
+
+def index_names(plans: List[dict]) -> set:
+    return {node["Index Name"] for plan in plans for node in plan_nodes(plan) if "Index Name" in node}
+
+
+TRACKED_QUERIES = {
+    "transaction list page": lambda repo, data: repo.get_paginated_rows(
+        data.user_id, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31)
+    ),
+    "category totals": lambda repo, data: repo.get_category_totals(
+        data.user_id, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31), exclude_from_analytics=True
+    ),
+    "category time series": lambda repo, data: repo.get_category_time_series(
+        data.user_id, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31), exclude_from_analytics=True
+    ),
+    "running balances": lambda repo, data: repo.get_running_balances(data.account_id, data.transaction_ids),
+    "duplicate count": lambda repo, data: repo.count_by_date_and_amount(
+        data.sample["date"].isoformat(), float(data.sample["amount"]), data.account_id
+    ),
+    "recurring candidates": lambda repo, data: repo.get_recurring_candidates(
+        data.user_id, start_date=date(2023, 6, 1), min_occurrences=2
+    ),
+}
+
+
+@pytest.mark.parametrize("name", TRACKED_QUERIES)
+def test_tracked_query_does_not_scan_transactions(seeded, name):
+    repo = SQLAlchemyTransactionRepository(seeded.session)
+
+    plans = capture_plans(seeded.session, lambda: TRACKED_QUERIES[name](repo, seeded))
+
+    assert plans, f"{name} sent no SELECT"
+    assert not sequential_scans(plans), f"{name} fell back to a sequential scan:\n{json.dumps(plans, indent=2)}"
+
+
+# Running balances only prefer ix_transactions_account_date_sort as an index-only scan, which needs
+# pages vacuum has marked all-visible, and the seeded rows are never committed. Plain and bitmap heap
+# scans are turned off for that query, so the test checks the index that serves its order is chosen
+# over the other account indexes.
+@pytest.mark.parametrize(
+    "name, index, disabled_scans",
+    [
+        ("transaction list page", "ix_transactions_user_date_sort", ()),
+        ("running balances", "ix_transactions_account_date_sort", ("seqscan", "bitmapscan")),
+        ("duplicate count", "ix_transactions_account_date_amount", ()),
+    ],
+)
+def test_tracked_query_uses_its_index(seeded, name, index, disabled_scans):
+    repo = SQLAlchemyTransactionRepository(seeded.session)
+
+    # SET LOCAL is undone when the savepoint rolls back, so later tests plan with the defaults
+    savepoint = seeded.session.begin_nested()
+    try:
+        for scan in disabled_scans:
+            seeded.session.execute(text(f"SET LOCAL enable_{scan} = off"))
+        plans = capture_plans(seeded.session, lambda: TRACKED_QUERIES[name](repo, seeded))
+    finally:
+        savepoint.rollback()
+
+    assert index in index_names(plans)
@@ -0,0 +1,65 @@
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository
+from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
+from app.domain.models.statement import Statement
+from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
+from app.services.file_blob import FileBlobService
+
+
+def _create_transaction(db_session, account, **overrides):
+    blob_digest = FileBlobService(SQLAlchemyFileBlobRepository(db_session)).store(b"test")
+    statement = Statement(id=uuid4(), filename="test.csv", file_type="CSV", blob_digest=blob_digest, account_id=account.id)
+    db_session.add(statement)
+    defaults = dict(
+        id=uuid4(),
+        user_id=account.user_id,
+        date=date(2024, 1, 15),
+        description="Netflix",
+        normalized_description="netflix",
+        amount=Decimal("-9.99"),
+        account_id=account.id,
+        statement_id=statement.id,
+        source_type=SourceType.MANUAL,
+        categorization_status=CategorizationStatus.UNCATEGORIZED,
+        sort_index=0,
+        row_index=0,
+    )
+    defaults.update(overrides)
+    transaction = Transaction(**defaults)
+    db_session.add(transaction)
+    db_session.flush()
+    return transaction
+
+
+class TestRecurringCandidates:
+    def test_returns_only_groups_with_enough_debits(self, db_session, user_a, account_for_user_a, category_for_user_a):
+        netflix = [_create_transaction(db_session, account_for_user_a, date=date(2024, month, 15)) for month in (1, 2, 3)]
+        _create_transaction(db_session, account_for_user_a, date=date(2024, 4, 15), category_id=category_for_user_a.id)
+        _create_transaction(db_session, account_for_user_a, date=date(2024, 5, 15), amount=Decimal("9.99"))
+        _create_transaction(db_session, account_for_user_a, normalized_description="gym", description="Gym")
+
+        repo = SQLAlchemyTransactionRepository(db_session)
+        rows = repo.get_recurring_candidates(user_a.id, start_date=date(2024, 1, 1), min_occurrences=2)
+
+        assert [row.id for row in rows] == [t.id for t in reversed(netflix)]
+        assert rows[0].normalized_description == "netflix"
+        assert rows[0].category_id is None
+        assert rows[0].amount == Decimal("-9.99")
+
+    def test_excludes_transfers_and_older_rows(self, db_session, user_a, account_for_user_a, account_for_user_b):
+        for month in (1, 2):
+            _create_transaction(db_session, account_for_user_a, date=date(2023, month, 15))
+            _create_transaction(
+                db_session,
+                account_for_user_a,
+                date=date(2024, month, 15),
+                counterparty_account_id=account_for_user_b.id,
+            )
+
+        repo = SQLAlchemyTransactionRepository(db_session)
+
+        assert repo.get_recurring_candidates(user_a.id, start_date=date(2024, 1, 1), min_occurrences=2) == []
+        assert len(repo.get_recurring_candidates(user_a.id, start_date=None, min_occurrences=2)) == 2
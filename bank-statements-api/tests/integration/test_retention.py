@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.repositories.background_job import SQLAlchemyBackgroundJobRepository
+from app.adapters.repositories.uploaded_file import SQLAlchemyUploadedFileRepository
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.domain.models.uploaded_file import UploadedFile
+
+NOW = datetime.now(timezone.utc)
+
+
+def _upload(db_session, blob_digest, age: timedelta) -> UploadedFile:
+    uploaded_file = UploadedFile(filename="test.csv", blob_digest=blob_digest, file_type="CSV", created_at=NOW - age)
+    db_session.add(uploaded_file)
+    db_session.flush()
+    return uploaded_file
+
+
+def _job(db_session, status: JobStatus, uploaded_file=None, finished_ago: timedelta = None) -> BackgroundJob:
+    job = BackgroundJob(
+        job_type=JobType.STATEMENT_IMPORT,
+        status=status,
+        uploaded_file_id=uploaded_file.id if uploaded_file else None,
+        completed_at=NOW - finished_ago if finished_ago else None,
+    )
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+class TestDeleteOrphanedUploads:
+    def test_deletes_old_uploads_that_no_pending_import_needs(self, db_session, blob_digest):
+        abandoned = _upload(db_session, blob_digest, timedelta(days=2))
+        imported = _upload(db_session, blob_digest, timedelta(days=2))
+        queued = _upload(db_session, blob_digest, timedelta(days=2))
+        recent = _upload(db_session, blob_digest, timedelta(minutes=5))
+        finished_import = _job(db_session, JobStatus.COMPLETED, imported, finished_ago=timedelta(days=1))
+        _job(db_session, JobStatus.PENDING, queued)
+        # Deleted rows are expired by the repository and cannot be read afterwards
+        deleted_ids = {abandoned.id, imported.id}
+        kept_ids = {queued.id, recent.id}
+
+        deleted, reclaimed = SQLAlchemyUploadedFileRepository(db_session).delete_orphaned(NOW - timedelta(hours=24), 100)
+
+        assert deleted == 2
+        assert reclaimed > 0
+        remaining = {row.id for row in db_session.query(UploadedFile.id).all()}
+        assert not deleted_ids & remaining
+        assert kept_ids <= remaining
+        db_session.refresh(finished_import)
+        assert finished_import.uploaded_file_id is None
+
+
+class TestDeleteTerminalJobs:
+    def test_deletes_finished_jobs_past_the_cutoff_in_batches(self, db_session):
+        old = [_job(db_session, status, finished_ago=timedelta(days=10)) for status in (JobStatus.COMPLETED, JobStatus.FAILED)]
+        recent = _job(db_session, JobStatus.COMPLETED, finished_ago=timedelta(days=1))
+        running = _job(db_session, JobStatus.IN_PROGRESS)
+        old_ids = {job.id for job in old}
+        kept_ids = {recent.id, running.id}
+        repository = SQLAlchemyBackgroundJobRepository(db_session)
+
+        first = repository.delete_terminal_jobs(NOW - timedelta(days=7), 1)
+        second = repository.delete_terminal_jobs(NOW - timedelta(days=7), 1)
+        third = repository.delete_terminal_jobs(NOW - timedelta(days=7), 1)
+
+        assert [first[0], second[0], third[0]] == [1, 1, 0]
+        remaining = {row.id for row in db_session.query(BackgroundJob.id).all()}
+        assert not old_ids & remaining
+        assert kept_ids <= remaining
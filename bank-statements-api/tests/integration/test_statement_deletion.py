@@ -0,0 +1,107 @@
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from app.adapters.repositories.statement import SqlAlchemyStatementRepository
+from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
+from app.domain.models.statement import Statement
+from app.domain.models.tag import Tag, transaction_tags
+from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
+
+
+def _statement(db_session, account, blob_digest) -> Statement:
+    statement = Statement(id=uuid4(), filename="test.csv", file_type="CSV", blob_digest=blob_digest, account_id=account.id)
+    db_session.add(statement)
+    db_session.flush()
+    return statement
+
+
+def _transaction(db_session, account, statement, **overrides) -> Transaction:
+    defaults = dict(
+        id=uuid4(),
+        user_id=account.user_id,
+        date=date(2024, 3, 10),
+        description="Supermarket",
+        normalized_description="supermarket",
+        amount=Decimal("-100.00"),
+        account_id=account.id,
+        statement_id=statement.id,
+        source_type=SourceType.UPLOAD,
+        categorization_status=CategorizationStatus.UNCATEGORIZED,
+        sort_index=0,
+        row_index=0,
+    )
+    defaults.update(overrides)
+    transaction = Transaction(**defaults)
+    db_session.add(transaction)
+    db_session.flush()
+    return transaction
+
+
+@pytest.fixture
+def statement(db_session, account_for_user_a, blob_digest):
+    return _statement(db_session, account_for_user_a, blob_digest)
+
+
+@pytest.fixture
+def other_statement(db_session, account_for_user_a, blob_digest):
+    return _statement(db_session, account_for_user_a, blob_digest)
+
+
+class TestStatementDeletion:
+    def test_deletes_transactions_tag_links_and_split_parts(
+        self, db_session, user_a, account_for_user_a, statement, other_statement
+    ):
+        tag = Tag(name="groceries", user_id=user_a.id)
+        db_session.add(tag)
+        parent = _transaction(db_session, account_for_user_a, statement, exclude_from_analytics=True)
+        parent.tags.append(tag)
+        for i in range(2):
+            _transaction(
+                db_session,
+                account_for_user_a,
+                statement,
+                amount=Decimal("-50.00"),
+                row_index=i,
+                parent_transaction_id=parent.id,
+            )
+        kept = _transaction(db_session, account_for_user_a, other_statement)
+        kept.tags.append(tag)
+        db_session.flush()
+        # Deleted rows cannot be read once expired
+        statement_id = statement.id
+
+        deleted = SQLAlchemyTransactionRepository(db_session).delete_by_statement_id(statement_id)
+        SqlAlchemyStatementRepository(db_session).delete(statement_id, user_a.id)
+        db_session.expire_all()
+
+        assert deleted == 3
+        assert db_session.scalar(select(func.count()).select_from(Transaction)) == 1
+        assert db_session.scalars(select(transaction_tags.c.transaction_id)).all() == [kept.id]
+        assert db_session.get(Statement, statement_id) is None
+        assert db_session.get(Statement, other_statement.id) is not None
+
+    def test_unlinks_manual_transactions_positioned_after_a_deleted_one(
+        self, db_session, user_a, account_for_user_a, statement, other_statement
+    ):
+        anchor = _transaction(db_session, account_for_user_a, statement)
+        manual = _transaction(
+            db_session, account_for_user_a, other_statement, source_type=SourceType.MANUAL, manual_position_after=anchor.id
+        )
+
+        anchor_id = anchor.id
+
+        SQLAlchemyTransactionRepository(db_session).delete_by_statement_id(statement.id)
+        db_session.expire_all()
+
+        assert db_session.get(Transaction, anchor_id) is None
+        assert db_session.get(Transaction, manual.id).manual_position_after is None
+
+    def test_does_not_delete_another_users_statement(self, db_session, user_b, statement):
+        SqlAlchemyStatementRepository(db_session).delete(statement.id, user_b.id)
+        db_session.expire_all()
+
+        assert db_session.get(Statement, statement.id) is not None
@@ -3,6 +3,7 @@ Integration tests for statement upload that test actual service implementation
 with real component interactions. Only external dependencies like LLM are mocked.
 """
 
+import hashlib
 import os
 from unittest.mock import MagicMock
 from uuid import uuid4
@@ -16,6 +17,7 @@ from app.core.database import Base
 from app.core.dependencies import ExternalDependencies, build_internal_dependencies
 from app.domain.models.account import Account
 from app.domain.models.enhancement_rule import EnhancementRule, EnhancementRuleSource
+from app.domain.models.file_blob import FileBlob
 from app.domain.models.statement import Statement
 from app.domain.models.transaction import Transaction
 from app.domain.models.uploaded_file import UploadedFile
@@ -152,8 +154,6 @@ class TestStatementUploadIntegration:
         upload_result = dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Verify upload results
@@ -169,12 +169,15 @@ class TestStatementUploadIntegration:
         uploaded_file = db_session.query(UploadedFile).filter(UploadedFile.id == uploaded_file_id).first()
         assert uploaded_file is not None
         assert uploaded_file.filename == filename
-        assert uploaded_file.content == csv_content
+        assert uploaded_file.blob_digest == hashlib.sha256(csv_content).hexdigest()
+        assert dependencies.file_blob_service.read(uploaded_file.blob_digest) == csv_content
 
         # Check transactions were actually saved to database
         # Get the statement that was created for this account
         statement = db_session.query(Statement).filter(Statement.account_id == source.id).first()
         assert statement is not None
+        assert statement.filename == filename
+        assert statement.blob_digest == uploaded_file.blob_digest
 
         transactions = db_session.query(Transaction).filter(Transaction.statement_id == statement.id).all()
         assert len(transactions) == 4
@@ -241,8 +244,6 @@ class TestStatementUploadIntegration:
         upload_result = dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Verify processing worked
@@ -316,8 +317,6 @@ class TestStatementUploadIntegration:
         dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Check enhancement rules in database
@@ -394,8 +393,6 @@ class TestStatementUploadIntegration:
         upload_result = dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Verify upload worked and filtered correctly
@@ -462,8 +459,6 @@ class TestStatementUploadIntegration:
         dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Verify file analysis metadata has null row_filters
@@ -522,8 +517,6 @@ class TestStatementUploadIntegration:
         first_result = dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=first_upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Verify first upload: 2 transactions saved (150.00 and 300.00)
@@ -538,6 +531,13 @@ class TestStatementUploadIntegration:
             file_content=csv_content,
         )
 
+        # The same file is stored once for both uploads
+        uploads = db_session.query(UploadedFile).filter(
+            UploadedFile.id.in_([analysis_result.uploaded_file_id, second_analysis_result.uploaded_file_id])
+        )
+        assert len({upload.blob_digest for upload in uploads}) == 1
+        assert db_session.query(FileBlob).filter(FileBlob.digest == hashlib.sha256(csv_content).hexdigest()).count() == 1
+
         # Second upload WITHOUT row filters in request
         second_upload_request = StatementUploadRequest(
             uploaded_file_id=second_analysis_result.uploaded_file_id,
@@ -550,8 +550,6 @@ class TestStatementUploadIntegration:
         second_result = dependencies.statement_upload_service.upload_statement(
             user_id=test_user.id,
             upload_data=second_upload_request,
-            background_tasks=MagicMock(),
-            internal_deps=dependencies,
         )
 
         # Verify second upload: Row filters applied (total_processed=2) but transactions are duplicates (saved=0)
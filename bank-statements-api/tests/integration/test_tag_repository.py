@@ -22,7 +22,7 @@ class TestTagRepository:
         assert "holiday" in names
         assert "refund" in names
 
-    def test_tag_transaction_association(self, db_session, user_a, account_for_user_a):
+    def test_tag_transaction_association(self, db_session, blob_digest, user_a, account_for_user_a):
         tag_repo = SQLAlchemyTagRepository(db_session)
         tx_repo = SQLAlchemyTransactionRepository(db_session)
 
@@ -30,7 +30,7 @@ class TestTagRepository:
             id=uuid4(),
             filename="test.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_a.id,
         )
         db_session.add(stmt)
@@ -58,7 +58,7 @@ class TestTagRepository:
         assert len(loaded_tx.tags) == 1
         assert loaded_tx.tags[0].name == "tagged"
 
-    def test_filter_transactions_by_tag(self, db_session, user_a, account_for_user_a):
+    def test_filter_transactions_by_tag(self, db_session, blob_digest, user_a, account_for_user_a):
         tag_repo = SQLAlchemyTagRepository(db_session)
         tx_repo = SQLAlchemyTransactionRepository(db_session)
 
@@ -66,7 +66,7 @@ class TestTagRepository:
             id=uuid4(),
             filename="test.csv",
             file_type="CSV",
-            content=b"test",
+            blob_digest=blob_digest,
             account_id=account_for_user_a.id,
         )
         db_session.add(stmt)
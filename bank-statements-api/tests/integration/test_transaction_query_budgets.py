@@ -0,0 +1,126 @@
+"""
+Query budgets for the transaction list, totals and time-series endpoints.
+
+The routes are served by the real TransactionService and repositories, so a
+change that loads rows one by one fails here instead of in production.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.repositories.category import SQLAlchemyCategoryRepository
+from app.adapters.repositories.enhancement_rule import SQLAlchemyEnhancementRuleRepository
+from app.adapters.repositories.initial_balance import SQLAlchemyInitialBalanceRepository
+from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
+from app.adapters.repositories.user_data_version import SQLAlchemyUserDataVersionRepository
+from app.domain.models.category import Category
+from app.domain.models.statement import Statement
+from app.domain.models.tag import Tag
+from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
+from app.services.category_tree import CategoryTreeCache
+from app.services.transaction import TransactionService
+from app.services.transaction_enhancement import TransactionEnhancer
+from tests.api.helpers import build_client, mocked_dependencies
+
+TRANSACTIONS = 40
+
+
+@pytest.fixture
+def categories(db_session, user_a):
+    food = Category(id=uuid4(), name="Food", user_id=user_a.id)
+    db_session.add(food)
+    db_session.flush()
+    children = [Category(id=uuid4(), name=name, user_id=user_a.id, parent_id=food.id) for name in ("Groceries", "Restaurants")]
+    db_session.add_all(children)
+    db_session.flush()
+    return food, children
+
+
+@pytest.fixture
+def transactions(db_session, user_a, account_for_user_a, blob_digest, categories):
+    _, children = categories
+    statement = Statement(
+        id=uuid4(), filename="test.csv", file_type="CSV", blob_digest=blob_digest, account_id=account_for_user_a.id
+    )
+    tag = Tag(name="weekly", user_id=user_a.id)
+    db_session.add_all([statement, tag])
+    db_session.flush()
+    rows = []
+    for i in range(TRANSACTIONS):
+        transaction = Transaction(
+            id=uuid4(),
+            user_id=user_a.id,
+            date=date(2024, 1, 1) + timedelta(days=3 * i),
+            description=f"Card payment {i % 5}",
+            normalized_description=f"card payment {i % 5}",
+            amount=Decimal("-12.50"),
+            account_id=account_for_user_a.id,
+            statement_id=statement.id,
+            category_id=children[i % 2].id,
+            source_type=SourceType.UPLOAD,
+            categorization_status=CategorizationStatus.RULE_BASED,
+            sort_index=i,
+            row_index=i,
+        )
+        if i % 4 == 0:
+            transaction.tags.append(tag)
+        rows.append(transaction)
+    db_session.add_all(rows)
+    db_session.flush()
+    return rows
+
+
+@pytest.fixture
+def client(db_session, user_a):
+    transaction_service = TransactionService(
+        SQLAlchemyTransactionRepository(db_session),
+        SQLAlchemyInitialBalanceRepository(db_session),
+        SQLAlchemyEnhancementRuleRepository(db_session),
+        TransactionEnhancer(),
+        SQLAlchemyCategoryRepository(db_session),
+        category_trees=CategoryTreeCache(),
+        user_data_version_repository=SQLAlchemyUserDataVersionRepository(db_session),
+    )
+    return build_client(mocked_dependencies(transaction_service=transaction_service), user_a)
+
+
+class TestTransactionQueryBudgets:
+    def test_transaction_list_page(self, client, query_budget, account_for_user_a, categories, transactions):
+        food, _ = categories
+
+        with query_budget(max_queries=8, max_repeats=1):
+            response = client.get(
+                "/api/v1/transactions",
+                params={
+                    "page_size": 20,
+                    "category_ids": str(food.id),
+                    "account_id": str(account_for_user_a.id),
+                    "include_running_balance": True,
+                },
+            )
+
+        assert response.status_code == 200
+        assert len(response.json()["transactions"]) == 20
+
+    def test_category_totals(self, client, query_budget, categories, transactions):
+        food, _ = categories
+
+        with query_budget(max_queries=3, max_repeats=1):
+            response = client.get("/api/v1/transactions/category-totals", params={"category_ids": str(food.id)})
+
+        assert response.status_code == 200
+        assert sum(total["transaction_count"] for total in response.json()["totals"]) == TRANSACTIONS
+
+    def test_category_time_series(self, client, query_budget, categories, transactions):
+        food, _ = categories
+
+        with query_budget(max_queries=3, max_repeats=1):
+            response = client.get(
+                "/api/v1/transactions/category-time-series", params={"category_id": str(food.id), "period": "month"}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["data_points"]
@@ -10,12 +10,12 @@ from app.domain.models.transaction import CategorizationStatus, SourceType, Tran
 
 
 @pytest.fixture
-def statement_for_user_a(db_session, account_for_user_a):
+def statement_for_user_a(db_session, account_for_user_a, blob_digest):
     statement = Statement(
         id=uuid4(),
         filename="test.csv",
         file_type="CSV",
-        content=b"test",
+        blob_digest=blob_digest,
         account_id=account_for_user_a.id,
     )
     db_session.add(statement)
@@ -159,20 +159,30 @@ class TestTransactionRuleEnhancementService:
         user_id,
     ):
         mock_enhancement_rule_repository.find_matching_rules_batch.return_value = []
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = None
+        mock_enhancement_rule_repository.create_unmatched_rules.return_value = 3
 
         enhancement_service.enhance_transactions(user_id, sample_dtos)
 
-        assert mock_enhancement_rule_repository.save.call_count == 3
+        mock_enhancement_rule_repository.create_unmatched_rules.assert_called_once_with(
+            ["atm withdrawal", "grocery store purchase", "salary payment"], user_id
+        )
+        mock_enhancement_rule_repository.save.assert_not_called()
+
+    def test_enhance_transactions_survives_unmatched_rule_creation_failure(
+        self,
+        enhancement_service,
+        mock_transaction_enhancer,
+        mock_enhancement_rule_repository,
+        sample_dtos,
+        user_id,
+    ):
+        mock_enhancement_rule_repository.find_matching_rules_batch.return_value = []
+        mock_enhancement_rule_repository.create_unmatched_rules.side_effect = Exception("database unavailable")
+
+        result = enhancement_service.enhance_transactions(user_id, sample_dtos)
 
-        save_calls = mock_enhancement_rule_repository.save.call_args_list
-        for call in save_calls:
-            rule = call[0][0]
-            assert isinstance(rule, EnhancementRule)
-            assert rule.category_id is None
-            assert rule.counterparty_account_id is None
-            assert rule.source == EnhancementRuleSource.AUTO
-            assert rule.match_type == MatchType.EXACT
+        assert result.total_processed == 3
+        assert result.has_unmatched
 
     def test_enhance_transactions_handles_empty_descriptions(
         self,
@@ -199,7 +209,7 @@ class TestTransactionRuleEnhancementService:
         ]
 
         mock_enhancement_rule_repository.find_matching_rules_batch.return_value = []
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = None
+        mock_enhancement_rule_repository.create_unmatched_rules.return_value = 1
 
         result = enhancement_service.enhance_transactions(user_id, dtos)
 
@@ -209,7 +219,7 @@ class TestTransactionRuleEnhancementService:
         valid_dto = next(dto for dto in result.enhanced_dtos if dto.description == "Valid Description")
         assert valid_dto.normalized_description == "valid description"
 
-        assert mock_enhancement_rule_repository.save.call_count == 1
+        mock_enhancement_rule_repository.create_unmatched_rules.assert_called_once_with(["valid description"], user_id)
 
     def test_enhancement_result_properties(self, user_id):
         dtos = [
@@ -248,7 +258,7 @@ class TestTransactionRuleEnhancementService:
         user_id,
     ):
         mock_enhancement_rule_repository.find_matching_rules_batch.return_value = sample_enhancement_rules
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = None
+        mock_enhancement_rule_repository.create_unmatched_rules.return_value = 1
 
         result = enhancement_service.enhance_transactions(user_id, sample_dtos)
 
@@ -257,7 +267,8 @@ class TestTransactionRuleEnhancementService:
         assert result.match_rate_percentage == 66.7
         assert result.has_unmatched
 
-        assert mock_enhancement_rule_repository.save.call_count == 1
+        mock_enhancement_rule_repository.create_unmatched_rules.assert_called_once()
+        assert len(mock_enhancement_rule_repository.create_unmatched_rules.call_args[0][0]) == 1
 
     def test_enhance_transactions_creates_unique_rules_only(
         self,
@@ -305,19 +316,13 @@ class TestTransactionRuleEnhancementService:
         ]
 
         mock_enhancement_rule_repository.find_matching_rules_batch.return_value = []
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = None
+        mock_enhancement_rule_repository.create_unmatched_rules.return_value = 2
 
         result = enhancement_service.enhance_transactions(user_id, dtos)
 
-        assert mock_enhancement_rule_repository.save.call_count == 2
-
-        save_calls = mock_enhancement_rule_repository.save.call_args_list
-        created_patterns = {call[0][0].normalized_description_pattern for call in save_calls}
-        expected_patterns = {
-            "grocery store purchase",
-            "atm withdrawal",
-        }
-        assert created_patterns == expected_patterns
+        mock_enhancement_rule_repository.create_unmatched_rules.assert_called_once_with(
+            ["atm withdrawal", "grocery store purchase"], user_id
+        )
 
         assert result.total_processed == 5
         assert result.rule_based_matches == 0
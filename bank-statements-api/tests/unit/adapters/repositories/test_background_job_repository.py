@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+import app.domain.models  # noqa: F401
+from app.adapters.repositories.background_job import SQLAlchemyBackgroundJobRepository
+from app.domain.models.background_job import JobStatus
+
+
+class TestDeleteTerminalJobs:
+    def test_deletes_finished_jobs_in_one_bounded_statement(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = [300, 200, 100]
+
+        repo = SQLAlchemyBackgroundJobRepository(session)
+        deleted, reclaimed = repo.delete_terminal_jobs(datetime(2026, 3, 1, tzinfo=timezone.utc), 3)
+
+        session.execute.assert_called_once()
+        statement = session.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "DELETE FROM background_jobs" in sql
+        assert "background_jobs.status IN" in sql
+        assert "background_jobs.completed_at < " in sql
+        assert "LIMIT" in sql and "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING pg_column_size(background_jobs)" in sql
+        assert (deleted, reclaimed) == (3, 600)
+        session.query.assert_not_called()
+        session.commit.assert_called_once()
+
+    def test_reports_nothing_when_no_job_has_expired(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = []
+
+        repo = SQLAlchemyBackgroundJobRepository(session)
+
+        assert repo.delete_terminal_jobs(datetime(2026, 3, 1, tzinfo=timezone.utc), 500) == (0, 0)
+
+
+class TestStatusTransitions:
+    def _sql(self, session) -> str:
+        return str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+
+    def test_completes_a_running_job_in_one_update_returning(self):
+        session = MagicMock()
+        repo = SQLAlchemyBackgroundJobRepository(session)
+
+        job = repo.mark_completed(uuid4(), {"rows": 10})
+
+        session.execute.assert_called_once()
+        sql = self._sql(session)
+        assert sql.startswith("UPDATE background_jobs SET status=")
+        assert "result=" in sql and "lease_expires_at=" in sql
+        assert "WHERE background_jobs.id = " in sql
+        assert "background_jobs.status IN (__[POSTCOMPILE_status_1])" in sql
+        assert "RETURNING background_jobs.id" in sql
+        assert job is session.execute.return_value.scalar_one_or_none.return_value
+        session.query.assert_not_called()
+        session.commit.assert_called_once()
+
+    def test_completion_without_result_keeps_the_stored_result(self):
+        session = MagicMock()
+
+        SQLAlchemyBackgroundJobRepository(session).mark_completed(uuid4())
+
+        assert "result=" not in self._sql(session)
+
+    def test_starts_only_pending_jobs(self):
+        session = MagicMock()
+
+        SQLAlchemyBackgroundJobRepository(session).mark_started(uuid4())
+
+        statement = session.execute.call_args.args[0]
+        assert "started_at=" in self._sql(session)
+        assert statement.compile(dialect=postgresql.dialect()).params["status_1"] == [JobStatus.PENDING]
@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+import app.domain.models  # noqa: F401
+from app.adapters.repositories.enhancement_rule import SQLAlchemyEnhancementRuleRepository
+from app.domain.models.enhancement_rule import EnhancementRule
+
+
+def _compiled(session):
+    return session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+
+
+class TestCreateUnmatchedRules:
+    def test_creates_every_rule_in_one_statement(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [(uuid4(),), (uuid4(),)]
+        repo = SQLAlchemyEnhancementRuleRepository(session)
+
+        created = repo.create_unmatched_rules(["grocery store", "atm withdrawal", "grocery store"], uuid4())
+
+        compiled = _compiled(session)
+        sql = str(compiled)
+        assert sql.startswith("INSERT INTO enhancement_rules")
+        assert "FROM (SELECT unnest(" in sql
+        assert "NOT (EXISTS (SELECT" in sql
+        assert (
+            "ON CONFLICT (user_id, normalized_description_pattern, match_type) WHERE source = 'AUTO' DO NOTHING RETURNING enhancement_rules.id"
+            in sql
+        )
+        assert ["atm withdrawal", "grocery store"] in compiled.params.values()
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+        assert created == 2
+
+    def test_does_nothing_without_descriptions(self):
+        session = MagicMock()
+        repo = SQLAlchemyEnhancementRuleRepository(session)
+
+        assert repo.create_unmatched_rules(["", ""], uuid4()) == 0
+
+        session.execute.assert_not_called()
+        session.commit.assert_not_called()
+
+
+def test_auto_rules_are_unique_per_pattern():
+    index = next(index for index in EnhancementRule.__table__.indexes if index.name == "uq_enhancement_rules_auto_pattern")
+
+    assert index.unique
+    assert [column.name for column in index.columns] == ["user_id", "normalized_description_pattern", "match_type"]
+    assert str(index.dialect_options["postgresql"]["where"]) == "source = 'AUTO'"
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+import app.domain.models  # noqa: F401
+from app.adapters.repositories.file_blob import SQLAlchemyFileBlobRepository
+from app.domain.models.file_blob import FileBlob
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_blob_rows_are_loaded_without_their_content():
+    assert "file_blobs.content" not in _sql(select(FileBlob))
+
+
+class TestDeleteUnreferenced:
+    def _deleted_rows(self, session, rows):
+        session.execute.return_value.all.return_value = [
+            SimpleNamespace(digest=digest, size=100, stored_size=40, storage="DATABASE") for digest in rows
+        ]
+
+    def test_deletes_only_blobs_nothing_refers_to(self):
+        session = MagicMock()
+        self._deleted_rows(session, ["a" * 64])
+        repo = SQLAlchemyFileBlobRepository(session)
+
+        deleted = repo.delete_unreferenced(datetime(2026, 3, 1, tzinfo=timezone.utc), 10, lambda blobs: None)
+
+        sql = _sql(session.execute.call_args.args[0])
+        assert "DELETE FROM file_blobs" in sql
+        assert "file_blobs.ref_count = " in sql
+        assert "NOT (EXISTS (SELECT" in sql and "uploaded_files.blob_digest = file_blobs.digest" in sql
+        assert "statements.blob_digest = file_blobs.digest" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert [blob.digest for blob in deleted] == ["a" * 64]
+        assert deleted[0].stored_size == 40
+
+    def test_runs_on_deleted_before_committing(self):
+        session = MagicMock()
+        self._deleted_rows(session, ["a" * 64])
+        calls = []
+        session.commit.side_effect = lambda: calls.append("commit")
+        repo = SQLAlchemyFileBlobRepository(session)
+
+        repo.delete_unreferenced(datetime.now(timezone.utc), 10, lambda blobs: calls.append("on_deleted"))
+
+        assert calls == ["on_deleted", "commit"]
+
+    def test_rolls_back_when_on_deleted_fails(self):
+        session = MagicMock()
+        self._deleted_rows(session, ["a" * 64])
+        repo = SQLAlchemyFileBlobRepository(session)
+
+        def fail(blobs):
+            raise OSError("disk gone")
+
+        with pytest.raises(OSError):
+            repo.delete_unreferenced(datetime.now(timezone.utc), 10, fail)
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
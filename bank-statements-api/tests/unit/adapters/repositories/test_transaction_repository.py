@@ -3,6 +3,9 @@ from datetime import date
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+from sqlalchemy.dialects import postgresql
+
+import app.domain.models  # noqa: F401
 from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
 from app.domain.dto.statement_processing import TransactionDTO
 from app.domain.models.transaction import CategorizationStatus
@@ -163,3 +166,33 @@ class TestSQLAlchemyTransactionRepository:
         )
 
         assert result == 0
+
+
+class TestDeleteByStatementId:
+    def _sql(self, call) -> str:
+        return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+    def test_deletes_with_set_based_statements_without_loading_transactions(self):
+        session = MagicMock()
+        session.execute.return_value.rowcount = 30000
+        repo = SQLAlchemyTransactionRepository(session)
+
+        deleted = repo.delete_by_statement_id(uuid.uuid4())
+
+        assert deleted == 30000
+        session.query.assert_not_called()
+        session.delete.assert_not_called()
+        tags, unlink, transactions = [self._sql(call) for call in session.execute.call_args_list]
+        assert tags.startswith("DELETE FROM transaction_tags")
+        assert unlink.startswith("UPDATE transactions SET manual_position_after=")
+        assert transactions.startswith("DELETE FROM transactions")
+
+    def test_also_deletes_split_parts_of_the_statement_transactions(self):
+        session = MagicMock()
+        repo = SQLAlchemyTransactionRepository(session)
+
+        repo.delete_by_statement_id(uuid.uuid4())
+
+        sql = self._sql(session.execute.call_args_list[-1])
+        assert "transactions.statement_id = " in sql
+        assert "transactions.parent_transaction_id IN (SELECT transactions.id" in sql
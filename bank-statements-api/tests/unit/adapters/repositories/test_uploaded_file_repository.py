@@ -2,6 +2,8 @@ import uuid
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+from sqlalchemy.dialects import postgresql
+
 from app.adapters.repositories.uploaded_file import SQLAlchemyFileAnalysisMetadataRepository, SQLAlchemyUploadedFileRepository
 from app.domain.dto.uploaded_file import FileAnalysisMetadataDTO, UploadedFileDTO
 
@@ -20,14 +22,15 @@ class TestUploadedFileRepository:
         session.add.side_effect = side_effect
 
         filename = "test.csv"
-        content = b"test content"
+        blob_digest = "ab" * 32
 
         file_type = "CSV"
-        result = repo.save(filename, content, file_type)
+        result = repo.save(filename, blob_digest, file_type)
 
         assert isinstance(result, UploadedFileDTO)
         assert result.id is not None
         assert result.filename == filename
+        assert result.blob_digest == blob_digest
 
         session.add.assert_called_once()
         session.commit.assert_called_once()
@@ -39,7 +42,7 @@ class TestUploadedFileRepository:
         mock_file = MagicMock(
             id=file_id,
             filename="test.csv",
-            content=b"test content",
+            blob_digest="ab" * 32,
             file_type="CSV",
             created_at=datetime.now(timezone.utc),
         )
@@ -51,11 +54,41 @@ class TestUploadedFileRepository:
         assert isinstance(result, UploadedFileDTO)
         assert result.id == str(file_id)
         assert result.filename == "test.csv"
-        assert result.content == b"test content"
+        assert result.blob_digest == "ab" * 32
 
         session.query.assert_called_once()
         session.query.return_value.filter.assert_called_once()
 
+    def test_find_metadata_by_id_reads_the_size_from_the_blob(self):
+        session = MagicMock()
+        file_id = uuid.uuid4()
+        uploaded_file = MagicMock(
+            id=file_id, filename="test.csv", blob_digest="ab" * 32, file_type="CSV", created_at=datetime.now(timezone.utc)
+        )
+        session.query.return_value.join.return_value.filter.return_value.first.return_value = (uploaded_file, 2048)
+
+        repo = SQLAlchemyUploadedFileRepository(session)
+        result = repo.find_metadata_by_id(file_id)
+
+        assert result.size == 2048
+        assert result.blob_digest == "ab" * 32
+
+    def test_delete_orphaned_keeps_files_a_pending_or_running_job_needs(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = [120, 130]
+
+        repo = SQLAlchemyUploadedFileRepository(session)
+        deleted, reclaimed = repo.delete_orphaned(datetime(2026, 3, 1, tzinfo=timezone.utc), 500)
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "DELETE FROM uploaded_files" in sql
+        assert "uploaded_files.created_at < " in sql
+        assert "NOT (EXISTS (SELECT" in sql and "background_jobs.uploaded_file_id = uploaded_files.id" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING pg_column_size(uploaded_files)" in sql
+        assert (deleted, reclaimed) == (2, 250)
+        session.commit.assert_called_once()
+
 
 class TestFileAnalysisMetadataRepository:
     def test_save_metadata(self):
@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+@dataclass
+class FakeReply:
+    status: int = 200
+    text: str = "ok"
+    delay_seconds: float = 0.0
+    headers: dict = field(default_factory=dict)
+    # Sent as server-sent events, chunk_delay_seconds apart, when the request asks to stream
+    chunks: Optional[list] = None
+    chunk_delay_seconds: float = 0.0
+
+
+def anthropic_body(text: str) -> dict:
+    return {
+        "id": "msg_fake",
+        "type": "message",
+        "role": "assistant",
+        "model": "fake-model",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 12, "output_tokens": 3},
+    }
+
+
+def openai_body(text: str) -> dict:
+    return {
+        "id": "chatcmpl_fake",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "fake-model",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+    }
+
+
+def openai_chunk(delta: dict, finish_reason: Optional[str] = None, usage: Optional[dict] = None) -> dict:
+    chunk = {
+        "id": "chatcmpl_fake",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "fake-model",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    if usage:
+        chunk["x_groq"] = {"id": "req_fake", "usage": usage}
+    return chunk
+
+
+def openai_stream(*text_parts: str, tool_calls: tuple = ()) -> list:
+    """
+    Chunks streaming text_parts and then tool_calls, given as (id, name, arguments)
+    with the arguments split in two fragments like providers do.
+    """
+    chunks = [openai_chunk({"role": "assistant", "content": ""})]
+    chunks += [openai_chunk({"content": part}) for part in text_parts]
+    for index, (call_id, name, arguments) in enumerate(tool_calls):
+        half = len(arguments) // 2
+        chunks.append(
+            openai_chunk(
+                {
+                    "tool_calls": [
+                        {
+                            "index": index,
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": name, "arguments": arguments[:half]},
+                        }
+                    ]
+                }
+            )
+        )
+        chunks.append(openai_chunk({"tool_calls": [{"index": index, "function": {"arguments": arguments[half:]}}]}))
+    chunks.append(
+        openai_chunk(
+            {},
+            finish_reason="tool_calls" if tool_calls else "stop",
+            usage={"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+        )
+    )
+    return chunks
+
+
+class FakeLLMServer:
+    """
+    Answers Anthropic messages and OpenAI-style chat completion requests on
+    127.0.0.1 with scripted replies, one per request, repeating the last one.
+    OpenAI-style requests with "stream": true get the reply's chunks as
+    server-sent events.
+    """
+
+    def __init__(self, *replies: FakeReply):
+        self.replies = list(replies) or [FakeReply()]
+        self.requests: list[dict] = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                reply = server._next_reply(self.path, body)
+                time.sleep(reply.delay_seconds)
+                if body.get("stream") and reply.status == 200:
+                    self._stream(reply)
+                    return
+
+                if reply.status == 200:
+                    payload = anthropic_body(reply.text) if self.path.endswith("/messages") else openai_body(reply.text)
+                else:
+                    payload = {"type": "error", "error": {"type": "api_error", "message": f"status {reply.status}"}}
+                content = json.dumps(payload).encode()
+                try:
+                    self.send_response(reply.status)
+                    self.send_header("content-type", "application/json")
+                    self.send_header("content-length", str(len(content)))
+                    for name, value in reply.headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(content)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def _stream(self, reply: FakeReply):
+                try:
+                    self.send_response(200)
+                    self.send_header("content-type", "text/event-stream")
+                    self.end_headers()
+                    for chunk in reply.chunks or openai_stream(reply.text):
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                        self.wfile.flush()
+                        time.sleep(reply.chunk_delay_seconds)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def _next_reply(self, path: str, body: dict) -> FakeReply:
+        with self._lock:
+            self.requests.append({"path": path, "body": body})
+            return self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+
+    def __enter__(self) -> "FakeLLMServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Optional[object]) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,54 @@
+from typing import Callable, Optional
+
+from app.ai.llm_client import CacheablePrompt, LLMClient, LLMResponse, TokenUsage
+from app.ai.tokens import estimate_tokens
+
+
+def prompt_patterns(prompt: CacheablePrompt) -> list[str]:
+    """The patterns listed in a rule suggestion prompt"""
+    return [line for line in prompt.suffix.split("Patterns:\n", 1)[1].splitlines() if line]
+
+
+class RecordingLLMClient(LLMClient):
+    """
+    Records every prompt and answers with respond(prompt). Token usage is
+    estimated from the text, and the prefix counts as cached when an earlier
+    prompt had the same one, the way a provider-side prompt cache behaves.
+    """
+
+    provider = "fake"
+
+    def __init__(self, respond: Callable[[CacheablePrompt], str], fail_on: Optional[str] = None):
+        self.respond = respond
+        self.fail_on = fail_on
+        self.prompts: list[CacheablePrompt] = []
+        self._seen_prefixes: set[str] = set()
+
+    @property
+    def calls(self) -> int:
+        return len(self.prompts)
+
+    def generate(self, prompt: str) -> str:
+        raise AssertionError("rule suggestions must use generate_prompt_async")
+
+    async def generate_async(self, prompt: str) -> str:
+        return (await self.generate_prompt_async(CacheablePrompt(prefix="", suffix=prompt))).text
+
+    async def generate_prompt_async(self, prompt: CacheablePrompt) -> LLMResponse:
+        self.prompts.append(prompt)
+        if self.fail_on and self.fail_on in prompt.suffix:
+            raise Exception("Error generating response: 429")
+
+        text = self.respond(prompt)
+        prefix_tokens = estimate_tokens(prompt.prefix) if prompt.prefix else 0
+        cached = prompt.prefix in self._seen_prefixes
+        self._seen_prefixes.add(prompt.prefix)
+        return LLMResponse(
+            text,
+            TokenUsage(
+                input_tokens=estimate_tokens(prompt.text),
+                output_tokens=estimate_tokens(text),
+                cached_input_tokens=prefix_tokens if cached else 0,
+                cache_write_tokens=0 if cached else prefix_tokens,
+            ),
+        )
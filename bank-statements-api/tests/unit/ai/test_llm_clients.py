@@ -0,0 +1,264 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.ai.anthropic_ai import AnthropicAI
+from app.ai.groq_ai import GroqAI
+from app.ai.hedged_client import HedgedLLMClient
+from app.ai.llm_client import CacheablePrompt, TokenUsage
+from app.ai.resilience import RetryPolicy
+from tests.unit.ai.fake_llm_server import FakeLLMServer, FakeReply, openai_stream
+
+FAST_RETRIES = RetryPolicy(max_attempts=3, base_delay_seconds=0.01, max_delay_seconds=0.05, timeout_seconds=2.0)
+
+
+def _groq(server: FakeLLMServer, policy: RetryPolicy = FAST_RETRIES) -> GroqAI:
+    return GroqAI(api_key="test-key", model_name="fake-model", base_url=server.url, retry_policy=policy)
+
+
+class TestGroqAsyncClient:
+    def test_generates_through_the_async_api(self):
+        with FakeLLMServer(FakeReply(text="hello")) as server:
+            assert asyncio.run(_groq(server).generate_async("hi")) == "hello"
+
+        assert server.requests[0]["path"] == "/openai/v1/chat/completions"
+        assert server.requests[0]["body"]["messages"] == [{"role": "user", "content": "hi"}]
+
+    def test_sends_cacheable_prompts_prefix_first_and_reports_usage(self):
+        with FakeLLMServer(FakeReply(text="hello")) as server:
+            response = asyncio.run(_groq(server).generate_prompt_async(CacheablePrompt(prefix="rules ", suffix="data")))
+
+        assert response.text == "hello"
+        assert response.usage == TokenUsage(input_tokens=12, output_tokens=3)
+        assert server.requests[0]["body"]["messages"] == [{"role": "user", "content": "rules data"}]
+
+    def test_retries_rate_limits_and_server_errors(self):
+        with FakeLLMServer(FakeReply(status=429), FakeReply(status=503), FakeReply(text="finally")) as server:
+            assert asyncio.run(_groq(server).generate_async("hi")) == "finally"
+
+        assert len(server.requests) == 3
+
+    def test_does_not_retry_client_errors(self):
+        with FakeLLMServer(FakeReply(status=400), FakeReply(text="unreachable")) as server:
+            with pytest.raises(Exception, match="Error generating response"):
+                asyncio.run(_groq(server).generate_async("hi"))
+
+        assert len(server.requests) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        with FakeLLMServer(FakeReply(status=500)) as server:
+            with pytest.raises(Exception, match="Error generating response"):
+                asyncio.run(_groq(server).generate_async("hi"))
+
+        assert len(server.requests) == FAST_RETRIES.max_attempts
+
+    def test_times_out_slow_attempts_and_retries(self):
+        policy = RetryPolicy(max_attempts=2, base_delay_seconds=0.01, max_delay_seconds=0.05, timeout_seconds=0.3)
+
+        with FakeLLMServer(FakeReply(text="slow", delay_seconds=1.0), FakeReply(text="fast")) as server:
+            started = time.monotonic()
+            assert asyncio.run(_groq(server, policy).generate_async("hi")) == "fast"
+
+        assert time.monotonic() - started < 1.0
+
+    def test_reuses_one_async_client_per_event_loop(self):
+        with FakeLLMServer(FakeReply(text="ok")) as server:
+            client = _groq(server)
+
+            async def twice():
+                await client.generate_async("a")
+                first = client.async_client.get()
+                await client.generate_async("b")
+                return first, client.async_client.get()
+
+            first, second = asyncio.run(twice())
+            third = asyncio.run(twice())[0]
+
+        assert first is second
+        assert third is not first
+
+    def test_honours_retry_after_on_rate_limits(self):
+        with FakeLLMServer(FakeReply(status=429, headers={"retry-after": "0"}), FakeReply(text="hola")) as server:
+            assert asyncio.run(_groq(server).generate_async("hi")) == "hola"
+
+        assert len(server.requests) == 2
+
+
+class TestHedgedLLMClient:
+    def test_uses_primary_when_it_answers_in_time(self):
+        with FakeLLMServer(FakeReply(text="primary")) as primary, FakeLLMServer(FakeReply(text="secondary")) as secondary:
+            client = HedgedLLMClient(_groq(primary), _groq(secondary), hedge_after_seconds=1.0)
+
+            assert asyncio.run(client.generate_async("hi")) == "primary"
+
+        assert secondary.requests == []
+
+    def test_hedges_to_secondary_when_primary_is_slow(self):
+        with (
+            FakeLLMServer(FakeReply(text="primary", delay_seconds=1.5)) as primary,
+            FakeLLMServer(FakeReply(text="secondary")) as secondary,
+        ):
+            client = HedgedLLMClient(_groq(primary), _groq(secondary), hedge_after_seconds=0.1)
+
+            started = time.monotonic()
+            assert asyncio.run(client.generate_async("hi")) == "secondary"
+
+        assert time.monotonic() - started < 1.5
+        assert len(secondary.requests) == 1
+
+    def test_keeps_waiting_for_primary_when_secondary_fails(self):
+        with (
+            FakeLLMServer(FakeReply(text="primary", delay_seconds=0.3)) as primary,
+            FakeLLMServer(FakeReply(status=400)) as secondary,
+        ):
+            client = HedgedLLMClient(_groq(primary), _groq(secondary), hedge_after_seconds=0.05)
+
+            assert asyncio.run(client.generate_async("hi")) == "primary"
+
+
+class TestAnthropicCacheablePrompt:
+    def test_marks_the_prefix_as_a_cache_breakpoint(self):
+        client = AnthropicAI(api_key="test-key")
+        usage = SimpleNamespace(input_tokens=20, output_tokens=5, cache_read_input_tokens=1500, cache_creation_input_tokens=0)
+        create = AsyncMock(return_value=SimpleNamespace(content=[SimpleNamespace(text="[]")], usage=usage))
+        client._create_message = create
+
+        response = asyncio.run(client.generate_prompt_async(CacheablePrompt(prefix="categories", suffix="patterns")))
+
+        assert response.usage == TokenUsage(input_tokens=1520, output_tokens=5, cached_input_tokens=1500)
+        assert create.call_args.kwargs["messages"][0]["content"] == [
+            {"type": "text", "text": "categories", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "patterns"},
+        ]
+
+
+async def _collect(stream) -> list[tuple[float, dict]]:
+    started = time.perf_counter()
+    return [(time.perf_counter() - started, chunk) async for chunk in stream]
+
+
+async def get_balance(account: str) -> dict:
+    """Balance of an account"""
+    await asyncio.sleep(0.2)
+    return {"account": account, "balance": 10}
+
+
+class TestGroqStreamingTools:
+    def test_forwards_text_deltas_as_they_arrive(self):
+        reply = FakeReply(chunks=openai_stream("Hel", "lo", " there"), chunk_delay_seconds=0.15)
+        with FakeLLMServer(reply) as server:
+            events = asyncio.run(_collect(_groq(server).generate_with_tools([{"role": "user", "content": "hi"}], [])))
+
+        assert [chunk for _, chunk in events] == [
+            {"type": "text", "content": "Hel"},
+            {"type": "text", "content": "lo"},
+            {"type": "text", "content": " there"},
+            {"type": "done"},
+        ]
+        first_text, done = events[0][0], events[-1][0]
+        assert done - first_text > 0.25
+        assert server.requests[0]["body"]["stream"] is True
+
+    def test_runs_the_tool_calls_of_a_turn_concurrently(self):
+        calls = (
+            ("call_1", "get_balance", '{"account": "main"}'),
+            ("call_2", "get_balance", '{"account": "savings"}'),
+        )
+        with FakeLLMServer(
+            FakeReply(chunks=openai_stream(tool_calls=calls)),
+            FakeReply(chunks=openai_stream("Main has 10")),
+        ) as server:
+            started = time.perf_counter()
+            events = asyncio.run(
+                _collect(_groq(server).generate_with_tools([{"role": "user", "content": "balances?"}], [get_balance]))
+            )
+            elapsed = time.perf_counter() - started
+
+        assert [chunk for _, chunk in events] == [
+            {"type": "data", "function": "get_balance", "data": {"account": "main", "balance": 10}},
+            {"type": "data", "function": "get_balance", "data": {"account": "savings", "balance": 10}},
+            {"type": "text", "content": "Main has 10"},
+            {"type": "done"},
+        ]
+        assert elapsed < 0.38
+
+        follow_up = server.requests[1]["body"]["messages"]
+        assert follow_up[-3]["tool_calls"] == [
+            {"id": "call_1", "type": "function", "function": {"name": "get_balance", "arguments": '{"account": "main"}'}},
+            {
+                "id": "call_2",
+                "type": "function",
+                "function": {"name": "get_balance", "arguments": '{"account": "savings"}'},
+            },
+        ]
+        assert [m["tool_call_id"] for m in follow_up[-2:]] == ["call_1", "call_2"]
+
+
+def _event(type: str, **fields) -> SimpleNamespace:
+    return SimpleNamespace(type=type, **fields)
+
+
+async def _events(*events):
+    for event in events:
+        await asyncio.sleep(0)
+        yield event
+
+
+class TestAnthropicStreamingTools:
+    def test_starts_tool_calls_when_their_input_completes_and_streams_the_answer(self):
+        client = AnthropicAI(api_key="test-key")
+        usage = SimpleNamespace(input_tokens=10, cache_read_input_tokens=0)
+        turns = [
+            _events(
+                _event("message_start", message=SimpleNamespace(usage=usage)),
+                _event("content_block_start", index=0, content_block=SimpleNamespace(type="text")),
+                _event("content_block_delta", index=0, delta=SimpleNamespace(type="text_delta", text="Checking")),
+                _event("content_block_stop", index=0),
+                _event(
+                    "content_block_start",
+                    index=1,
+                    content_block=SimpleNamespace(type="tool_use", id="tu_1", name="get_balance"),
+                ),
+                _event("content_block_delta", index=1, delta=SimpleNamespace(type="input_json_delta", partial_json='{"acc')),
+                _event(
+                    "content_block_delta",
+                    index=1,
+                    delta=SimpleNamespace(type="input_json_delta", partial_json='ount": "main"}'),
+                ),
+                _event("content_block_stop", index=1),
+                _event("message_delta", usage=SimpleNamespace(output_tokens=7)),
+            ),
+            _events(
+                _event("message_start", message=SimpleNamespace(usage=usage)),
+                _event("content_block_start", index=0, content_block=SimpleNamespace(type="text")),
+                _event("content_block_delta", index=0, delta=SimpleNamespace(type="text_delta", text="It is 10")),
+                _event("content_block_stop", index=0),
+            ),
+        ]
+        requests = []
+
+        async def open_stream(**params):
+            requests.append(params)
+            return turns[len(requests) - 1]
+
+        client._open_stream = open_stream
+
+        events = asyncio.run(_collect(client.generate_with_tools([{"role": "user", "content": "hi"}], [get_balance])))
+
+        assert [chunk for _, chunk in events] == [
+            {"type": "text", "content": "Checking"},
+            {"type": "data", "function": "get_balance", "data": {"account": "main", "balance": 10}},
+            {"type": "text", "content": "It is 10"},
+            {"type": "done"},
+        ]
+        assert requests[1]["messages"][1] == {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": "Checking"},
+                {"type": "tool_use", "id": "tu_1", "name": "get_balance", "input": {"account": "main"}},
+            ],
+        }
+        assert requests[1]["messages"][2]["content"][0]["tool_use_id"] == "tu_1"
@@ -0,0 +1,48 @@
+from uuid import uuid4
+
+from app.ai.prompts import CategoryAliases, rule_categorization_prompt
+from app.domain.models.category import Category
+
+USER_ID = uuid4()
+
+
+def _category(name: str, parent: Category = None) -> Category:
+    return Category(id=uuid4(), name=name, user_id=USER_ID, parent_id=parent.id if parent else None)
+
+
+class TestCategoryAliases:
+    def test_numbers_assignable_categories_by_name(self):
+        food = _category("Food")
+        groceries = _category("Groceries", food)
+        restaurants = _category("Restaurants", food)
+        salary = _category("Salary")
+
+        aliases = CategoryAliases([salary, restaurants, food, groceries])
+
+        assert [(alias, cat.name) for alias, cat in aliases.items()] == [
+            ("1", "Groceries"),
+            ("2", "Restaurants"),
+            ("3", "Salary"),
+        ]
+        assert aliases.resolve("2") == restaurants.id
+        assert aliases.resolve(" 3 ") == salary.id
+
+    def test_unknown_alias_does_not_resolve(self):
+        aliases = CategoryAliases([_category("Salary")])
+
+        assert aliases.resolve("2") is None
+        assert aliases.resolve("Salary") is None
+
+
+class TestRuleCategorizationPrompt:
+    def test_category_block_is_a_stable_prefix(self):
+        categories = [_category("Transport"), _category("Groceries")]
+
+        first = rule_categorization_prompt(["uber trip"], CategoryAliases(categories))
+        second = rule_categorization_prompt(["continente", "lidl"], CategoryAliases(list(reversed(categories))))
+
+        assert first.prefix == second.prefix
+        assert "1: Groceries\n2: Transport" in first.prefix
+        assert str(categories[0].id) not in first.text
+        assert "uber trip" not in first.prefix
+        assert second.suffix.endswith("Patterns:\ncontinente\nlidl\n")
@@ -0,0 +1,76 @@
+import asyncio
+
+from app.ai.rate_limiter import ProviderRateLimiter, TokenBucket, get_rate_limiter
+from app.ai.tokens import estimate_tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_starts_full(self):
+        bucket = TokenBucket(rate_per_second=1, capacity=10, clock=FakeClock())
+
+        assert bucket.reserve(10) == 0.0
+
+    def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(rate_per_second=2, capacity=10, clock=FakeClock())
+        bucket.reserve(10)
+
+        assert bucket.reserve(4) == 2.0
+
+    def test_queues_reservations_behind_each_other(self):
+        bucket = TokenBucket(rate_per_second=1, capacity=5, clock=FakeClock())
+        bucket.reserve(5)
+
+        assert bucket.reserve(2) == 2.0
+        assert bucket.reserve(2) == 4.0
+
+    def test_refills_over_time_up_to_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=1, capacity=5, clock=clock)
+        bucket.reserve(5)
+
+        clock.now = 100.0
+
+        assert bucket.reserve(5) == 0.0
+        assert bucket.reserve(1) == 1.0
+
+    def test_caps_oversized_requests_at_capacity(self):
+        bucket = TokenBucket(rate_per_second=1, capacity=5, clock=FakeClock())
+
+        assert bucket.reserve(50) == 0.0
+
+    def test_acquire_returns_immediately_with_tokens_available(self):
+        bucket = TokenBucket(rate_per_second=1, capacity=5)
+
+        asyncio.run(bucket.acquire(3))
+
+        assert bucket.reserve(2) == 0.0
+
+
+class TestProviderRateLimiter:
+    def test_takes_a_request_and_the_estimated_tokens(self):
+        limiter = ProviderRateLimiter(requests_per_minute=60, tokens_per_minute=600)
+
+        asyncio.run(limiter.acquire(600))
+
+        assert limiter.requests.reserve(59) == 0.0
+        assert limiter.tokens.reserve(10) > 0
+
+    def test_limiters_are_shared_per_provider(self):
+        assert get_rate_limiter("test-provider", 10, 100) is get_rate_limiter("test-provider")
+        assert get_rate_limiter("test-provider") is not get_rate_limiter("other-test-provider", 10, 100)
+
+
+class TestEstimateTokens:
+    def test_empty_text_has_no_tokens(self):
+        assert estimate_tokens("") == 0
+
+    def test_counts_about_four_characters_per_token(self):
+        assert estimate_tokens("x" * 400) == 101
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.ai.resilience import RetryPolicy, call_with_retry, is_retryable
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int, headers: dict = None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+def _flaky(*errors):
+    calls = []
+    remaining = list(errors)
+
+    async def call():
+        calls.append(1)
+        if remaining:
+            raise remaining.pop(0)
+        return "ok"
+
+    return call, calls
+
+
+class TestCallWithRetry:
+    def test_retries_retryable_errors_with_backoff(self):
+        call, calls = _flaky(StatusError(429), StatusError(502))
+        delays = []
+
+        async def sleep(seconds):
+            delays.append(seconds)
+
+        result = asyncio.run(call_with_retry(call, RetryPolicy(base_delay_seconds=1, max_delay_seconds=10), sleep=sleep))
+
+        assert result == "ok"
+        assert len(calls) == 3
+        assert 0 <= delays[0] <= 1
+        assert 0 <= delays[1] <= 2
+
+    def test_waits_at_least_retry_after(self):
+        call, _ = _flaky(StatusError(429, {"retry-after": "3"}))
+        delays = []
+
+        async def sleep(seconds):
+            delays.append(seconds)
+
+        asyncio.run(call_with_retry(call, RetryPolicy(base_delay_seconds=0.1, max_delay_seconds=10), sleep=sleep))
+
+        assert delays == [3.0]
+
+    def test_raises_non_retryable_errors_immediately(self):
+        call, calls = _flaky(StatusError(401))
+
+        with pytest.raises(StatusError):
+            asyncio.run(call_with_retry(call, RetryPolicy()))
+
+        assert len(calls) == 1
+
+
+class TestIsRetryable:
+    @pytest.mark.parametrize("status_code", [408, 429, 500, 503, 529])
+    def test_retryable_status_codes(self, status_code):
+        assert is_retryable(StatusError(status_code))
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404, 422])
+    def test_client_errors_are_not_retried(self, status_code):
+        assert not is_retryable(StatusError(status_code))
+
+    def test_timeouts_and_transient_errors_are_retried(self):
+        assert is_retryable(asyncio.TimeoutError())
+        assert is_retryable(ConnectionError(), transient_errors=(ConnectionError,))
+        assert not is_retryable(ValueError())
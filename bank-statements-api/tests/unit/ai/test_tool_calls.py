@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from app.ai.tool_calls import ToolCallRunner
+
+
+async def slow_lookup(name: str) -> dict:
+    await asyncio.sleep(0.1)
+    return {"name": name}
+
+
+async def failing_lookup() -> dict:
+    raise ValueError("no data")
+
+
+class TestToolCallRunner:
+    def test_runs_calls_concurrently_and_returns_them_in_order(self):
+        async def run():
+            runner = ToolCallRunner([slow_lookup])
+            runner.start("a", "slow_lookup", {"name": "first"})
+            runner.start("b", "slow_lookup", '{"name": "second"}')
+            started = time.perf_counter()
+            results = await runner.results()
+            return results, time.perf_counter() - started
+
+        results, elapsed = asyncio.run(run())
+
+        assert [(r.call_id, r.result, r.ok) for r in results] == [
+            ("a", {"name": "first"}, True),
+            ("b", {"name": "second"}, True),
+        ]
+        assert elapsed < 0.18
+
+    def test_reports_errors_as_results(self):
+        async def run():
+            runner = ToolCallRunner([failing_lookup, slow_lookup])
+            runner.start("a", "failing_lookup", {})
+            runner.start("b", "missing", {})
+            runner.start("c", "slow_lookup", "{not json")
+            return await runner.results()
+
+        results = asyncio.run(run())
+
+        assert [(r.result, r.ok) for r in results[:2]] == [
+            ({"error": "no data"}, False),
+            ({"error": "Unknown function: missing"}, False),
+        ]
+        assert results[2].ok is False
+
+    def test_calls_start_before_results_are_awaited(self):
+        calls = []
+
+        async def record() -> dict:
+            calls.append(time.perf_counter())
+            return {}
+
+        async def run():
+            runner = ToolCallRunner([record])
+            runner.start("a", "record", None)
+            await asyncio.sleep(0.01)
+            assert calls, "the call should already be running"
+            await runner.results()
+
+        asyncio.run(run())
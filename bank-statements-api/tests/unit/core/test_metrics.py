@@ -0,0 +1,102 @@
+import pytest
+
+from app.core.metrics import (
+    LLM_FAILURES,
+    LLM_REQUEST_DURATION,
+    LLM_TOKENS,
+    STATEMENT_UPLOAD_ROWS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    record_statement_upload,
+    track_llm_call,
+)
+
+
+def test_counter_renders_labelled_samples():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("jobs_total", "Jobs", ("kind",)))
+    counter.inc(kind="a")
+    counter.inc(2, kind='b"c')
+
+    assert registry.render() == (
+        "# HELP jobs_total Jobs\n" "# TYPE jobs_total counter\n" 'jobs_total{kind="a"} 1\n' 'jobs_total{kind="b\\"c"} 2\n'
+    )
+
+
+def test_gauge_set_and_clear():
+    gauge = Gauge("depth", "Depth", ("queue",))
+    gauge.set(3, queue="x")
+    gauge.set(1.5, queue="x")
+
+    assert 'depth{queue="x"} 1.5' in gauge.render()
+
+    gauge.clear()
+    assert "depth{" not in gauge.render()
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    histogram = Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.1, route="/a")
+    histogram.observe(3, route="/a")
+
+    lines = histogram.render().splitlines()
+
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="/a"} 3.15' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_wrong_labels_are_rejected():
+    counter = Counter("c_total", "C", ("a",))
+
+    with pytest.raises(ValueError):
+        counter.inc(b="x")
+
+
+def test_duplicate_registration_is_rejected():
+    registry = MetricsRegistry()
+    registry.register(Counter("c_total", "C"))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("c_total", "C"))
+
+
+def test_collectors_run_before_render():
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("g", "G"))
+    registry.add_collector(lambda: gauge.set(7))
+
+    assert "g 7" in registry.render()
+
+
+def test_track_llm_call_records_latency_and_tokens():
+    before = LLM_TOKENS.value(provider="test", model="m1", direction="output")
+
+    with track_llm_call("test", "m1") as call:
+        call.record_usage(100, 20)
+
+    assert LLM_TOKENS.value(provider="test", model="m1", direction="output") == before + 20
+    assert LLM_REQUEST_DURATION.count(provider="test", model="m1") >= 1
+
+
+def test_track_llm_call_counts_failures():
+    before = LLM_FAILURES.value(provider="test", model="m2")
+
+    with pytest.raises(RuntimeError):
+        with track_llm_call("test", "m2"):
+            raise RuntimeError("rate limited")
+
+    assert LLM_FAILURES.value(provider="test", model="m2") == before + 1
+
+
+def test_record_statement_upload_counts_row_outcomes():
+    before = STATEMENT_UPLOAD_ROWS.value(outcome="duplicate")
+
+    record_statement_upload(total_processed=10, saved=7, duplicated=3, dropped=1, duration_seconds=0.5)
+
+    assert STATEMENT_UPLOAD_ROWS.value(outcome="duplicate") == before + 3
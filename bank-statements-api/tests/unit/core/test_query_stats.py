@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.query_stats import current_query_stats, fingerprint, install_query_instrumentation, track_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    return engine
+
+
+def test_fingerprint_ignores_literal_values():
+    a = fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'foo'")
+    b = fingerprint("SELECT *  FROM t\nWHERE id = 42 AND name = 'it''s'")
+
+    assert a == b == "SELECT * FROM t WHERE id = ? AND name = ?"
+
+
+def test_fingerprint_collapses_in_lists_and_bind_params():
+    a = fingerprint("SELECT * FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s)")
+    b = fingerprint("SELECT * FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)")
+
+    assert a == b == "SELECT * FROM t WHERE id IN (?)"
+
+
+def test_tracks_queries_inside_block_only(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            for i in range(3):
+                conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i})
+            conn.execute(text("SELECT count(*) FROM items"))
+        conn.execute(text("SELECT 2"))
+
+    assert stats.count == 4
+    assert stats.total_ms >= stats.slowest_ms > 0
+    assert stats.slowest_statement is not None
+    assert stats.repeated(3) == [("SELECT name FROM items WHERE id = ?", 3)]
+    assert current_query_stats() is None
+
+
+def test_install_is_idempotent(engine):
+    install_query_instrumentation(engine)
+
+    with track_queries() as stats:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert stats.count == 1
+
+
+def test_query_budget_passes_within_budget(engine, query_budget):
+    with query_budget(max_queries=2) as stats:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert stats.count == 1
+
+
+def test_query_budget_fails_when_exceeded(engine, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="Query budget exceeded: 3 queries > 2"):
+        with query_budget(max_queries=2):
+            with engine.connect() as conn:
+                for _ in range(3):
+                    conn.execute(text("SELECT 1"))
+
+
+def test_query_budget_flags_repeated_statements(engine, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="likely N\\+1"):
+        with query_budget(max_queries=10, max_repeats=1):
+            with engine.connect() as conn:
+                for i in range(2):
+                    conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i})
@@ -0,0 +1,31 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_SCRIPT = Path(__file__).parents[3] / "scripts" / "startup_benchmark.py"
+
+# Generous enough for a cold CI runner; pulling pandas or an LLM SDK back in at
+# module level is caught by the lazy module check rather than by this number.
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+
+
+@pytest.fixture(scope="module")
+def startup_import():
+    spec = importlib.util.spec_from_file_location("startup_benchmark", BENCHMARK_SCRIPT)
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+    return benchmark.measure_import("app.main")
+
+
+def test_app_main_does_not_import_heavy_sdks(startup_import):
+    _, loaded = startup_import
+
+    assert loaded == []
+
+
+def test_app_main_imports_within_budget(startup_import):
+    timings, _ = startup_import
+
+    assert timings["app.main"][1] / 1000 < IMPORT_BUDGET_MS
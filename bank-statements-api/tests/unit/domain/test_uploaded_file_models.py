@@ -10,13 +10,13 @@ class TestUploadedFileModel:
         file = UploadedFile(
             id=uuid.uuid4(),
             filename="test.csv",
-            content=b"test content",
+            blob_digest="ab" * 32,
             created_at=datetime.now(timezone.utc),
         )
 
         assert isinstance(file.id, UUID)
         assert file.filename == "test.csv"
-        assert file.content == b"test content"
+        assert file.blob_digest == "ab" * 32
         assert isinstance(file.created_at, datetime)
         assert file.__tablename__ == "uploaded_files"
 
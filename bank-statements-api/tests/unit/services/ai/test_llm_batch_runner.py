@@ -0,0 +1,163 @@
+import asyncio
+import json
+from uuid import uuid4
+
+from app.ai.llm_client import CacheablePrompt, LLMClient
+from app.ai.rate_limiter import ProviderRateLimiter
+from app.domain.models.enhancement_rule import EnhancementRule, MatchType
+from app.services.ai.llm_batch_runner import OUTPUT_TOKENS_PER_RULE, LLMBatchRunner, plan_batches
+from tests.unit.ai.recording_llm_client import RecordingLLMClient
+
+
+class FakeLLMClient(LLMClient):
+    provider = "fake"
+
+    def __init__(self, fail_on: str = None, delay: float = 0.01):
+        self.prompts = []
+        self.fail_on = fail_on
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def generate(self, prompt: str) -> str:
+        raise AssertionError("rule suggestions must use generate_async")
+
+    async def generate_async(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.fail_on and self.fail_on in prompt:
+            raise Exception("rate limited")
+        return prompt
+
+
+def _rule(pattern: str) -> EnhancementRule:
+    return EnhancementRule(
+        id=uuid4(),
+        user_id=uuid4(),
+        normalized_description_pattern=pattern,
+        match_type=MatchType.EXACT,
+    )
+
+
+def _runner(client: LLMClient, **options) -> LLMBatchRunner:
+    limiter = ProviderRateLimiter(requests_per_minute=10_000, tokens_per_minute=10_000_000)
+    return LLMBatchRunner(client, rate_limiter=limiter, **options)
+
+
+def _build_prompt(rules):
+    return CacheablePrompt(prefix="", suffix=json.dumps([rule.normalized_description_pattern for rule in rules]))
+
+
+def _parse(rules, response):
+    returned = json.loads(response)
+    return [(rule.normalized_description_pattern, rule.normalized_description_pattern in returned) for rule in rules]
+
+
+def _on_error(rules, error):
+    return [(rule.normalized_description_pattern, False) for rule in rules]
+
+
+class TestPlanBatches:
+    def test_keeps_everything_in_one_batch_when_it_fits(self):
+        assert plan_batches(["a", "b", "c"], 100, 10_000, 10_000) == [[0, 1, 2]]
+
+    def test_splits_on_output_budget(self):
+        per_rule = 1 + OUTPUT_TOKENS_PER_RULE
+
+        batches = plan_batches(["a"] * 5, 0, 10_000, per_rule * 2)
+
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_splits_on_input_budget(self):
+        patterns = ["x" * 396] * 3  # 100 tokens each
+
+        batches = plan_batches(patterns, 50, 260, 10_000)
+
+        assert batches == [[0, 1], [2]]
+
+    def test_long_patterns_get_smaller_batches_than_short_ones(self):
+        short = plan_batches(["coffee"] * 100, 500, 6000, 1024)
+        long = plan_batches(["card payment at a very long merchant name " * 3] * 100, 500, 6000, 1024)
+
+        assert len(long) > len(short)
+
+    def test_oversized_pattern_gets_its_own_batch(self):
+        assert plan_batches(["a", "x" * 10_000, "b"], 0, 100, 10_000) == [[0], [1], [2]]
+
+    def test_no_patterns_no_batches(self):
+        assert plan_batches([], 100, 1000, 1000) == []
+
+
+class TestLLMBatchRunner:
+    def test_returns_results_in_rule_order(self):
+        client = FakeLLMClient()
+        rules = [_rule(f"pattern {i}") for i in range(20)]
+
+        results = asyncio.run(
+            _runner(client, max_output_tokens=(5 + OUTPUT_TOKENS_PER_RULE) * 3).run(rules, _build_prompt, _parse, _on_error)
+        )
+
+        assert [pattern for pattern, _ in results] == [rule.normalized_description_pattern for rule in rules]
+        assert all(found for _, found in results)
+        assert len(client.prompts) == 7
+
+    def test_runs_batches_concurrently_up_to_the_limit(self):
+        client = FakeLLMClient(delay=0.05)
+        rules = [_rule(f"p{i}") for i in range(10)]
+
+        asyncio.run(
+            _runner(client, max_concurrency=3, max_output_tokens=2 + OUTPUT_TOKENS_PER_RULE).run(
+                rules, _build_prompt, _parse, _on_error
+            )
+        )
+
+        assert len(client.prompts) == 10
+        assert client.max_in_flight == 3
+
+    def test_failed_batch_does_not_affect_the_others(self):
+        client = FakeLLMClient(fail_on="p1")
+        rules = [_rule(f"p{i}") for i in range(3)]
+
+        results = asyncio.run(
+            _runner(client, max_output_tokens=2 + OUTPUT_TOKENS_PER_RULE).run(rules, _build_prompt, _parse, _on_error)
+        )
+
+        assert results == [("p0", True), ("p1", False), ("p2", True)]
+
+    def test_calls_on_batch_as_each_batch_completes(self):
+        client = FakeLLMClient()
+        rules = [_rule(f"p{i}") for i in range(4)]
+        completed = []
+
+        asyncio.run(
+            _runner(client, max_output_tokens=(2 + OUTPUT_TOKENS_PER_RULE) * 2).run(
+                rules, _build_prompt, _parse, _on_error, on_batch=completed.append
+            )
+        )
+
+        assert sorted(len(batch) for batch in completed) == [2, 2]
+
+    def test_no_rules_no_calls(self):
+        client = FakeLLMClient()
+
+        assert asyncio.run(_runner(client).run([], _build_prompt, _parse, _on_error)) == []
+        assert client.prompts == []
+
+    def test_adds_up_token_usage_across_batches(self):
+        client = RecordingLLMClient(lambda prompt: prompt.suffix)
+        rules = [_rule(f"p{i}") for i in range(3)]
+
+        def build_prompt(batch):
+            return CacheablePrompt(prefix="x" * 400, suffix=_build_prompt(batch).suffix)
+
+        runner = _runner(client, max_concurrency=1, max_output_tokens=2 + OUTPUT_TOKENS_PER_RULE)
+        asyncio.run(runner.run(rules, build_prompt, _parse, _on_error))
+
+        assert runner.usage.input_tokens == sum(len(prompt.text) // 4 + 1 for prompt in client.prompts)
+        assert runner.usage.cache_write_tokens == 101
+        assert runner.usage.cached_input_tokens == 2 * 101
@@ -0,0 +1,49 @@
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.adapters.repositories.category import SQLAlchemyCategoryRepository
+from app.adapters.repositories.transaction import SQLAlchemyTransactionRepository
+from app.ai.llm_client import LLMClient
+from app.services.ai.llm_category_generator import LLMCategoryGenerator
+from app.services.ai.llm_result_cache import LLMResultCache, MemoryResultCache
+from tests.unit.services.ai.test_llm_result_cache import InMemoryLLMResultCacheRepository
+
+ANSWER = json.dumps(
+    [{"parent": "Entertainment", "subcategories": ["Streaming"], "confidence": 0.9, "matched_descriptions": ["netflix"]}]
+)
+
+
+def _generator(descriptions: list[str]) -> LLMCategoryGenerator:
+    categories = MagicMock(spec=SQLAlchemyCategoryRepository)
+    categories.get_all.return_value = []
+    transactions = MagicMock(spec=SQLAlchemyTransactionRepository)
+    transactions.get_unique_normalised_descriptions.return_value = descriptions
+    client = MagicMock(spec=LLMClient)
+    client.model_name = "fake-model"
+    client.generate.return_value = ANSWER
+    cache = LLMResultCache(InMemoryLLMResultCacheRepository(), memory=MemoryResultCache())
+    return LLMCategoryGenerator(categories, transactions, client, result_cache=cache)
+
+
+class TestLLMCategoryGeneratorCache:
+    def test_reuses_the_answer_for_the_same_descriptions(self):
+        generator = _generator(["netflix", "spotify"])
+        user_id = uuid4()
+
+        first = generator.generate_suggestions(user_id)
+        generator.transaction_repository.get_unique_normalised_descriptions.return_value = ["spotify", "netflix"]
+        second = generator.generate_suggestions(user_id)
+
+        assert generator.llm_client.generate.call_count == 1
+        assert first.suggestions[0].parent_name == second.suggestions[0].parent_name == "Entertainment"
+
+    def test_asks_again_when_descriptions_change(self):
+        generator = _generator(["netflix"])
+        user_id = uuid4()
+
+        generator.generate_suggestions(user_id)
+        generator.transaction_repository.get_unique_normalised_descriptions.return_value = ["netflix", "uber trip"]
+        generator.generate_suggestions(user_id)
+
+        assert generator.llm_client.generate.call_count == 2
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.domain.models.category import Category
+from app.domain.models.llm_result_cache import LLMCacheKind
+from app.ports.repositories.llm_result_cache import LLMResultCacheRepository
+from app.services.ai.llm_result_cache import CachedResult, LLMResultCache, MemoryResultCache, category_tree_hash
+
+
+class InMemoryLLMResultCacheRepository(LLMResultCacheRepository):
+    def __init__(self):
+        self.entries = {}
+        self.find_calls = 0
+
+    def find_many(self, user_id, kind, patterns, context_hash, model, now):
+        self.find_calls += 1
+        return [
+            entry
+            for pattern in patterns
+            if (entry := self.entries.get((user_id, kind, pattern, context_hash, model))) and entry.expires_at > now
+        ]
+
+    def save_many(self, entries):
+        for entry in entries:
+            self.entries[(entry.user_id, entry.kind, entry.pattern, entry.context_hash, entry.model)] = entry
+
+    def delete_for_user(self, user_id, kinds=None):
+        keys = [key for key in self.entries if key[0] == user_id and (kinds is None or key[1] in kinds)]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+    def delete_expired(self, now):
+        keys = [key for key, entry in self.entries.items() if entry.expires_at <= now]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(repository=None, clock=None) -> LLMResultCache:
+    return LLMResultCache(
+        repository or InMemoryLLMResultCacheRepository(),
+        ttl=timedelta(days=1),
+        memory=MemoryResultCache(),
+        clock=clock or FakeClock(),
+    )
+
+
+USER_ID = uuid4()
+NETFLIX = CachedResult(result={"category_id": "c1"}, confidence=0.9)
+
+
+class TestLLMResultCache:
+    def test_returns_stored_results_by_normalized_pattern(self):
+        cache = _cache()
+        cache.put_many(USER_ID, LLMCacheKind.RULE_CATEGORY, {"Netflix Com ": NETFLIX}, "tree", "model")
+
+        hits = cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com", "uber trip"], "tree", "model")
+
+        assert hits == {"netflix com": NETFLIX}
+
+    def test_misses_on_other_context_model_or_kind(self):
+        cache = _cache()
+        cache.put_many(USER_ID, LLMCacheKind.RULE_CATEGORY, {"netflix com": NETFLIX}, "tree", "model")
+
+        assert cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "other tree", "model") == {}
+        assert cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "other model") == {}
+        assert cache.get_many(USER_ID, LLMCacheKind.RULE_COUNTERPARTY, ["netflix com"], "tree", "model") == {}
+        assert cache.get_many(uuid4(), LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "model") == {}
+
+    def test_memory_front_skips_the_database(self):
+        repository = InMemoryLLMResultCacheRepository()
+        cache = _cache(repository)
+        cache.put_many(USER_ID, LLMCacheKind.RULE_CATEGORY, {"netflix com": NETFLIX}, "tree", "model")
+
+        cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "model")
+
+        assert repository.find_calls == 0
+
+    def test_loads_from_the_database_into_memory(self):
+        repository = InMemoryLLMResultCacheRepository()
+        _cache(repository).put_many(USER_ID, LLMCacheKind.RULE_CATEGORY, {"netflix com": NETFLIX}, "tree", "model")
+        cache = _cache(repository)
+
+        first = cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "model")
+        second = cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "model")
+
+        assert first == second == {"netflix com": NETFLIX}
+        assert repository.find_calls == 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        repository = InMemoryLLMResultCacheRepository()
+        cache = _cache(repository, clock)
+        cache.put_many(USER_ID, LLMCacheKind.RULE_CATEGORY, {"netflix com": NETFLIX}, "tree", "model")
+
+        clock.now += timedelta(days=2)
+
+        assert cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "model") == {}
+        assert cache.purge_expired() == 1
+
+    def test_invalidate_drops_memory_and_stored_entries(self):
+        repository = InMemoryLLMResultCacheRepository()
+        cache = _cache(repository)
+        cache.put_many(USER_ID, LLMCacheKind.RULE_CATEGORY, {"netflix com": NETFLIX}, "tree", "model")
+        cache.put_many(USER_ID, LLMCacheKind.RULE_COUNTERPARTY, {"netflix com": NETFLIX}, "accounts", "model")
+
+        cache.invalidate(USER_ID, [LLMCacheKind.RULE_CATEGORY])
+
+        assert cache.get_many(USER_ID, LLMCacheKind.RULE_CATEGORY, ["netflix com"], "tree", "model") == {}
+        assert cache.get_many(USER_ID, LLMCacheKind.RULE_COUNTERPARTY, ["netflix com"], "accounts", "model") != {}
+
+
+class TestMemoryResultCache:
+    def test_evicts_least_recently_used(self):
+        memory = MemoryResultCache(max_entries=2)
+        expires_at = datetime(2100, 1, 1, tzinfo=timezone.utc)
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        keys = [(USER_ID, "RULE_CATEGORY", pattern, "tree", "model") for pattern in ("a", "b", "c")]
+
+        memory.put(keys[0], NETFLIX, expires_at)
+        memory.put(keys[1], NETFLIX, expires_at)
+        memory.get(keys[0], now)
+        memory.put(keys[2], NETFLIX, expires_at)
+
+        assert memory.get(keys[0], now) == NETFLIX
+        assert memory.get(keys[1], now) is None
+
+
+class TestCategoryTreeHash:
+    def test_ignores_order_and_changes_on_rename(self):
+        groceries = Category(id=uuid4(), name="Groceries", user_id=USER_ID)
+        rent = Category(id=uuid4(), name="Rent", user_id=USER_ID)
+
+        assert category_tree_hash([groceries, rent]) == category_tree_hash([rent, groceries])
+
+        before = category_tree_hash([groceries, rent])
+        rent.name = "Housing"
+        assert category_tree_hash([groceries, rent]) != before
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.adapters.repositories.category import SQLAlchemyCategoryRepository
+from app.ai.llm_client import LLMClient
+from app.ai.rate_limiter import ProviderRateLimiter
+from app.domain.models.category import Category
+from app.domain.models.enhancement_rule import EnhancementRule, MatchType
+from app.services.ai.llm_batch_runner import OUTPUT_TOKENS_PER_RULE, LLMBatchRunner
+from app.services.ai.llm_result_cache import LLMResultCache, MemoryResultCache
+from app.services.ai.llm_rule_categorizer import LLMRuleCategorizer
+from tests.unit.ai.recording_llm_client import RecordingLLMClient, prompt_patterns
+from tests.unit.services.ai.test_llm_result_cache import InMemoryLLMResultCacheRepository
+
+
+def _categorizing_client(sub_category_id: str, fail_on: str = None) -> RecordingLLMClient:
+    """Puts every pattern from the prompt in the given category, failing batches containing fail_on"""
+    return RecordingLLMClient(
+        lambda prompt: json.dumps(
+            [{"pattern": p, "sub_category_id": sub_category_id, "confidence": 0.9} for p in prompt_patterns(prompt)]
+        ),
+        fail_on=fail_on,
+    )
+
+
+def _rule(pattern: str) -> EnhancementRule:
+    return EnhancementRule(id=uuid4(), user_id=uuid4(), normalized_description_pattern=pattern, match_type=MatchType.EXACT)
+
+
+def _categorizer(
+    client: LLMClient, categories: list[Category], rules_per_batch: int = 2, result_cache: LLMResultCache = None
+) -> LLMRuleCategorizer:
+    repository = MagicMock(spec=SQLAlchemyCategoryRepository)
+    repository.get_all.return_value = categories
+    runner = LLMBatchRunner(
+        client,
+        max_output_tokens=(3 + OUTPUT_TOKENS_PER_RULE) * rules_per_batch,
+        rate_limiter=ProviderRateLimiter(requests_per_minute=10_000, tokens_per_minute=10_000_000),
+    )
+    return LLMRuleCategorizer(repository, client, batch_runner=runner, result_cache=result_cache)
+
+
+class TestLLMRuleCategorizer:
+    def test_suggests_categories_for_all_batches(self):
+        category = Category(id=uuid4(), name="Groceries", user_id=uuid4())
+        client = _categorizing_client("1")
+        rules = [_rule(f"shop {i}") for i in range(5)]
+        batches = []
+
+        results = asyncio.run(_categorizer(client, [category]).suggest_categories(rules, uuid4(), on_batch=batches.append))
+
+        assert [result.rule_id for result in results] == [rule.id for rule in rules]
+        assert all(result.suggested_category_id == category.id for result in results)
+        assert client.calls == 3
+        assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+
+    def test_failed_batch_reports_errors_for_its_rules_only(self):
+        category = Category(id=uuid4(), name="Groceries", user_id=uuid4())
+        client = _categorizing_client("1", fail_on="shop 0")
+        rules = [_rule(f"shop {i}") for i in range(4)]
+
+        results = asyncio.run(_categorizer(client, [category]).suggest_categories(rules, uuid4()))
+
+        assert [result.is_successful for result in results] == [False, False, True, True]
+        assert results[0].error_message == "LLM error: Error generating response: 429"
+
+    def test_sends_category_aliases_in_a_shared_prefix(self):
+        user_id = uuid4()
+        categories = [Category(id=uuid4(), name=name, user_id=user_id) for name in ("Transport", "Groceries")]
+        client = _categorizing_client("2")
+        rules = [_rule(f"shop {i}") for i in range(4)]
+
+        results = asyncio.run(_categorizer(client, categories).suggest_categories(rules, user_id))
+
+        assert all(result.suggested_category_id == categories[0].id for result in results)
+        assert len({prompt.prefix for prompt in client.prompts}) == 1
+        assert "1: Groceries\n2: Transport" in client.prompts[0].prefix
+        assert not any(str(category.id) in prompt.text for category in categories for prompt in client.prompts)
+        assert [prompt_patterns(prompt) for prompt in client.prompts] == [["shop 0", "shop 1"], ["shop 2", "shop 3"]]
+
+    def test_accepts_a_full_category_id_instead_of_the_alias(self):
+        category = Category(id=uuid4(), name="Groceries", user_id=uuid4())
+        client = _categorizing_client(str(category.id))
+
+        results = asyncio.run(_categorizer(client, [category]).suggest_categories([_rule("shop")], uuid4()))
+
+        assert results[0].suggested_category_id == category.id
+
+    def test_unknown_category_is_reported(self):
+        category = Category(id=uuid4(), name="Groceries", user_id=uuid4())
+        client = _categorizing_client(str(uuid4()))
+
+        results = asyncio.run(_categorizer(client, [category]).suggest_categories([_rule("shop")], uuid4()))
+
+        assert results[0].suggested_category_id is None
+        assert "not found" in results[0].error_message
+
+    def test_without_categories_skips_the_llm(self):
+        client = _categorizing_client(str(uuid4()))
+        batches = []
+
+        results = asyncio.run(_categorizer(client, []).suggest_categories([_rule("shop")], uuid4(), on_batch=batches.append))
+
+        assert results[0].error_message == "No categories available"
+        assert client.calls == 0
+        assert batches == [results]
+
+    def test_cached_patterns_are_not_sent_again(self):
+        user_id = uuid4()
+        category = Category(id=uuid4(), name="Groceries", user_id=user_id)
+        client = _categorizing_client("1")
+        cache = LLMResultCache(InMemoryLLMResultCacheRepository(), memory=MemoryResultCache())
+        categorizer = _categorizer(client, [category], rules_per_batch=10, result_cache=cache)
+
+        asyncio.run(categorizer.suggest_categories([_rule("netflix com"), _rule("uber trip")], user_id))
+        batches = []
+        results = asyncio.run(
+            categorizer.suggest_categories(
+                [_rule("netflix com"), _rule("spotify"), _rule("uber trip")], user_id, on_batch=batches.append
+            )
+        )
+
+        assert client.calls == 2
+        assert all(result.suggested_category_id == category.id for result in results)
+        assert sorted(len(batch) for batch in batches) == [1, 2]
+
+    def test_failed_suggestions_are_not_cached(self):
+        user_id = uuid4()
+        category = Category(id=uuid4(), name="Groceries", user_id=user_id)
+        client = _categorizing_client("1", fail_on="netflix com")
+        cache = LLMResultCache(InMemoryLLMResultCacheRepository(), memory=MemoryResultCache())
+        categorizer = _categorizer(client, [category], result_cache=cache)
+
+        asyncio.run(categorizer.suggest_categories([_rule("netflix com")], user_id))
+        asyncio.run(categorizer.suggest_categories([_rule("netflix com")], user_id))
+
+        assert client.calls == 2
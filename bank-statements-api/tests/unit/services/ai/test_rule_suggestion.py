@@ -0,0 +1,155 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.api.schemas import AISuggestCategoriesRequest
+from app.domain.models.background_job import JobType
+from app.domain.models.categorization import RuleCategorizationResult, RuleCounterpartyResult
+from app.domain.models.enhancement_rule import EnhancementRule, MatchType
+from app.ports.repositories.category import CategoryRepository
+from app.ports.repositories.enhancement_rule import EnhancementRuleRepository
+from app.services.ai.llm_rule_categorizer import LLMRuleCategorizer
+from app.services.ai.llm_rule_counterparty import LLMRuleCounterparty
+from app.services.ai.rule_suggestion import RuleSuggestionService
+from app.services.ai.similarity_categorizer import SimilarityRuleCategorizer
+from app.services.background.background_job_service import BackgroundJobService
+from app.services.enhancement_rule_management import EnhancementRuleManagementService
+
+USER_ID = uuid4()
+
+
+def _rule(pattern: str) -> EnhancementRule:
+    return EnhancementRule(id=uuid4(), user_id=USER_ID, normalized_description_pattern=pattern, match_type=MatchType.EXACT)
+
+
+def _service(rules: list[EnhancementRule]) -> RuleSuggestionService:
+    management = MagicMock(spec=EnhancementRuleManagementService)
+    management.list_rules.return_value = {"rules": rules, "total": len(rules)}
+    management.get_rule.side_effect = lambda rule_id, user_id: next((r for r in rules if r.id == rule_id), None)
+    categories = MagicMock(spec=CategoryRepository)
+    categories.get_all.return_value = [MagicMock()]
+    return RuleSuggestionService(
+        enhancement_rule_management_service=management,
+        enhancement_rule_repository=MagicMock(spec=EnhancementRuleRepository),
+        category_repository=categories,
+        llm_rule_categorizer=MagicMock(spec=LLMRuleCategorizer),
+        llm_rule_counterparty=MagicMock(spec=LLMRuleCounterparty),
+        background_job_service=MagicMock(spec=BackgroundJobService),
+    )
+
+
+class TestRuleSuggestionService:
+    def test_saves_each_batch_as_it_completes(self):
+        rules = [_rule("coffee"), _rule("rent"), _rule("unknown")]
+        service = _service(rules)
+        category_id = uuid4()
+        progress = []
+
+        async def suggest_categories(rules_to_suggest, user_id, on_batch):
+            first = [
+                RuleCategorizationResult(rules[0].id, category_id, 0.95),
+                RuleCategorizationResult(rules[1].id, category_id, 0.5),
+            ]
+            on_batch(first)
+            second = [RuleCategorizationResult(rules[2].id, None, error_message="No matching result from LLM")]
+            on_batch(second)
+            return first + second
+
+        service.llm_rule_categorizer.suggest_categories.side_effect = suggest_categories
+
+        summary = asyncio.run(
+            service.suggest_categories(
+                USER_ID,
+                AISuggestCategoriesRequest(auto_apply=True, confidence_threshold=0.8),
+                on_progress=progress.append,
+            )
+        )
+
+        assert summary.to_dict() == {
+            "processed": 3,
+            "auto_applied": 1,
+            "suggestions": 1,
+            "failed": 1,
+            "error_message": "No matching result from LLM",
+        }
+        service.enhancement_rule_repository.save_all.assert_called_once_with([rules[0], rules[1]])
+        assert rules[0].category_id == category_id
+        assert rules[1].category_id is None
+        assert rules[1].ai_suggested_category_id == category_id
+        assert rules[1].ai_processed_at is not None
+        assert [p.processed_transactions for p in progress] == [2, 3]
+        assert progress[-1].total_transactions == 3
+
+    def test_uses_requested_rules(self):
+        rules = [_rule("coffee"), _rule("rent")]
+        service = _service(rules)
+        service.llm_rule_counterparty.suggest_counterparties.return_value = []
+
+        asyncio.run(service.suggest_counterparties(USER_ID, AISuggestCategoriesRequest(rule_ids=[rules[1].id])))
+
+        selected = service.llm_rule_counterparty.suggest_counterparties.call_args.args[0]
+        assert selected == [rules[1]]
+        service.enhancement_rule_management_service.list_rules.assert_not_called()
+
+    def test_applies_counterparty_suggestions(self):
+        rules = [_rule("transfer")]
+        service = _service(rules)
+        account_id = uuid4()
+
+        async def suggest_counterparties(rules_to_suggest, user_id, on_batch):
+            results = [RuleCounterpartyResult(rules[0].id, account_id, 0.9)]
+            on_batch(results)
+            return results
+
+        service.llm_rule_counterparty.suggest_counterparties.side_effect = suggest_counterparties
+
+        summary = asyncio.run(service.suggest_counterparties(USER_ID, AISuggestCategoriesRequest(auto_apply=True)))
+
+        assert summary.auto_applied == 1
+        assert rules[0].counterparty_account_id == account_id
+        assert rules[0].ai_counterparty_confidence == 0.9
+
+    def test_sends_only_rules_the_similarity_categorizer_is_unsure_of_to_the_llm(self):
+        rules = [_rule("coffee shop"), _rule("unknown")]
+        service = _service(rules)
+        category_id = uuid4()
+        similarity = MagicMock(spec=SimilarityRuleCategorizer)
+        similarity.suggest_categories.return_value = (
+            [RuleCategorizationResult(rules[0].id, category_id, 0.97)],
+            [rules[1]],
+        )
+        service.similarity_categorizer = similarity
+        service.llm_rule_categorizer.suggest_categories.return_value = []
+
+        summary = asyncio.run(service.suggest_categories(USER_ID, AISuggestCategoriesRequest(auto_apply=True)))
+
+        assert summary.auto_applied == 1
+        assert rules[0].category_id == category_id
+        assert service.llm_rule_categorizer.suggest_categories.call_args.args[0] == [rules[1]]
+        similarity.learn.assert_called_once_with(USER_ID, "coffee shop", category_id)
+
+    def test_reports_missing_categories_without_calling_the_llm(self):
+        service = _service([_rule("coffee")])
+        service.category_repository.get_all.return_value = []
+
+        summary = asyncio.run(service.suggest_categories(USER_ID, AISuggestCategoriesRequest()))
+
+        assert summary.processed == 0
+        assert summary.error_message == "No categories available. Create categories first."
+        service.llm_rule_categorizer.suggest_categories.assert_not_called()
+
+    def test_queues_request_as_job_payload(self):
+        service = _service([])
+        rule_id = uuid4()
+
+        service.queue_suggestions(
+            JobType.RULE_CATEGORY_SUGGESTION,
+            USER_ID,
+            AISuggestCategoriesRequest(rule_ids=[rule_id], auto_apply=True, background=True),
+        )
+
+        service.background_job_service.queue_job.assert_called_once_with(
+            JobType.RULE_CATEGORY_SUGGESTION,
+            user_id=USER_ID,
+            payload={"request": {"rule_ids": [str(rule_id)], "confidence_threshold": 0.8, "auto_apply": True}},
+        )
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.domain.models.enhancement_rule import EnhancementRule, MatchType
+from app.ports.repositories.transaction import TransactionRepository
+from app.services.ai.similarity_categorizer import (
+    CharNgramIndex,
+    SimilarityIndexRegistry,
+    SimilarityRuleCategorizer,
+    char_ngrams,
+)
+
+USER_ID = uuid4()
+GROCERIES = uuid4()
+TRANSPORT = uuid4()
+RESTAURANTS = uuid4()
+
+
+def _rule(pattern: str) -> EnhancementRule:
+    return EnhancementRule(id=uuid4(), user_id=USER_ID, normalized_description_pattern=pattern, match_type=MatchType.EXACT)
+
+
+def _index() -> CharNgramIndex:
+    index = CharNgramIndex()
+    index.add("continente lisboa", GROCERIES, 12)
+    index.add("pingo doce almada", GROCERIES, 4)
+    index.add("uber trip", TRANSPORT, 7)
+    index.add("metro lisboa", TRANSPORT, 3)
+    return index
+
+
+class TestCharNgramIndex:
+    def test_pads_and_lowercases_trigrams(self):
+        assert char_ngrams("Ab") == {" ab": 1, "ab ": 1}
+
+    def test_exact_match_is_highly_confident(self):
+        prediction = _index().predict("continente lisboa")
+
+        assert prediction.category_id == GROCERIES
+        assert prediction.similarity > 0.999
+        assert prediction.confidence > 0.95
+
+    def test_near_match_finds_the_same_category(self):
+        prediction = _index().predict("continente porto")
+
+        assert prediction.category_id == GROCERIES
+        assert 0.3 < prediction.confidence < 1
+
+    def test_disagreeing_neighbours_lower_confidence(self):
+        index = _index()
+        index.add("uber eats", RESTAURANTS, 5)
+        index.add("uber eats", TRANSPORT, 5)
+
+        prediction = index.predict("uber eats")
+
+        assert prediction.confidence < 0.6
+
+    def test_unrelated_description_has_no_prediction(self):
+        assert _index().predict("xyzzy") is None
+
+    def test_added_descriptions_are_found_without_rebuilding(self):
+        index = _index()
+        assert index.predict("netflix com") is None
+
+        index.add("netflix com", RESTAURANTS)
+
+        assert index.predict("netflix com").category_id == RESTAURANTS
+        assert len(index) == 5
+
+    def test_ignores_categories_that_are_not_allowed(self):
+        prediction = _index().predict("continente lisboa", allowed_categories={TRANSPORT})
+
+        assert prediction is None or prediction.category_id == TRANSPORT
+
+
+class TestSimilarityIndexRegistry:
+    def test_rebuilds_after_max_age(self):
+        now = [0.0]
+        registry = SimilarityIndexRegistry(max_age_seconds=60, clock=lambda: now[0])
+        loads = []
+
+        def load():
+            loads.append(1)
+            return [("uber trip", TRANSPORT, 1)]
+
+        first = registry.get(USER_ID, load)
+        assert registry.get(USER_ID, load) is first
+        now[0] = 61
+        assert registry.get(USER_ID, load) is not first
+        assert len(loads) == 2
+
+
+class TestSimilarityRuleCategorizer:
+    def _categorizer(self, min_confidence: float = 0.85) -> SimilarityRuleCategorizer:
+        repository = MagicMock(spec=TransactionRepository)
+        repository.get_categorised_descriptions.return_value = [
+            ("continente lisboa", GROCERIES, 12),
+            ("uber trip", TRANSPORT, 7),
+        ]
+        return SimilarityRuleCategorizer(repository, registry=SimilarityIndexRegistry(), min_confidence=min_confidence)
+
+    def test_splits_confident_rules_from_those_left_for_the_llm(self):
+        categorizer = self._categorizer()
+        rules = [_rule("continente lisboa"), _rule("farmacia central")]
+
+        results, remaining = categorizer.suggest_categories(rules, USER_ID, {GROCERIES, TRANSPORT})
+
+        assert [(r.rule_id, r.suggested_category_id) for r in results] == [(rules[0].id, GROCERIES)]
+        assert remaining == [rules[1]]
+
+    def test_skips_categories_that_no_longer_exist(self):
+        categorizer = self._categorizer()
+        rules = [_rule("continente lisboa")]
+
+        results, remaining = categorizer.suggest_categories(rules, USER_ID, {TRANSPORT})
+
+        assert results == []
+        assert remaining == rules
+
+    def test_learns_into_the_loaded_index(self):
+        categorizer = self._categorizer()
+        categorizer.suggest_categories([_rule("uber trip")], USER_ID, {GROCERIES, TRANSPORT})
+
+        categorizer.learn(USER_ID, "farmacia central", GROCERIES)
+        results, _ = categorizer.suggest_categories([_rule("farmacia central")], USER_ID, {GROCERIES, TRANSPORT})
+
+        assert results[0].suggested_category_id == GROCERIES
+        categorizer.transaction_repository.get_categorised_descriptions.assert_called_once()
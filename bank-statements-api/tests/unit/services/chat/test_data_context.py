@@ -0,0 +1,137 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.account import AccountService
+from app.services.category import CategoryService
+from app.services.chat.chat_service import ChatService
+from app.services.chat.data_context import ChatDataCache, ChatDataContext
+from app.services.chat.data_functions import create_chat_functions
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
+from app.services.transaction import TransactionService
+
+USER_ID = uuid4()
+
+
+def _services():
+    food = SimpleNamespace(id=uuid4(), name="Food", parent_id=None)
+    groceries = SimpleNamespace(id=uuid4(), name="Groceries", parent_id=food.id)
+    category_service = MagicMock(spec=CategoryService)
+    category_service.get_all_categories.return_value = [food, groceries]
+    account_service = MagicMock(spec=AccountService)
+    account_service.get_all_accounts.return_value = [SimpleNamespace(id=uuid4(), name="Main", currency="EUR")]
+    transaction_service = MagicMock(spec=TransactionService)
+    transaction_service.get_category_totals.return_value = {groceries.id: {"total_amount": 120, "count": 3}}
+    transaction_service.get_transactions_paginated.return_value = SimpleNamespace(transactions=[], total=0, total_amount=None)
+    return category_service, account_service, transaction_service, groceries
+
+
+def _tools(cache: ChatDataCache, version: int, category_service, account_service, transaction_service):
+    context = ChatDataContext(USER_ID, cache.get(USER_ID, version), category_service, account_service)
+    tools = create_chat_functions(
+        user_id=USER_ID,
+        transaction_service=transaction_service,
+        context=context,
+        recurring_pattern_service=MagicMock(spec=RecurringPatternSnapshotService),
+    )
+    return {tool.__name__: tool for tool in tools}
+
+
+class TestChatDataCache:
+    def test_keeps_data_while_the_version_holds(self):
+        cache = ChatDataCache()
+
+        first = cache.get(USER_ID, 3)
+
+        assert cache.get(USER_ID, 3) is first
+        assert cache.get(USER_ID, 4) is not first
+
+    def test_starts_afresh_on_a_new_day(self):
+        today = [date(2024, 1, 1)]
+        cache = ChatDataCache(clock=lambda: today[0])
+        first = cache.get(USER_ID, 1)
+
+        today[0] = date(2024, 1, 2)
+
+        assert cache.get(USER_ID, 1) is not first
+
+    def test_evicts_least_recently_used_users(self):
+        cache = ChatDataCache(max_users=2)
+        first = cache.get(USER_ID, 1)
+        cache.get(uuid4(), 1)
+        cache.get(USER_ID, 1)
+        cache.get(uuid4(), 1)
+
+        assert cache.get(USER_ID, 1) is first
+
+
+class TestChatTools:
+    def test_tools_share_one_category_lookup(self):
+        category_service, account_service, transaction_service, _ = _services()
+        tools = _tools(ChatDataCache(), 1, category_service, account_service, transaction_service)
+
+        async def turn():
+            await tools["get_category_totals"]()
+            await tools["get_transactions"](category_name="groceries")
+            await tools["get_categories"]()
+            await tools["get_time_series"](category_name="Groceries")
+
+        asyncio.run(turn())
+
+        category_service.get_all_categories.assert_called_once_with(USER_ID)
+
+    def test_repeated_aggregate_is_computed_once_per_data_version(self):
+        category_service, account_service, transaction_service, _ = _services()
+        cache = ChatDataCache()
+
+        first = asyncio.run(_tools(cache, 1, category_service, account_service, transaction_service)["get_category_totals"]())
+        again = asyncio.run(_tools(cache, 1, category_service, account_service, transaction_service)["get_category_totals"]())
+        asyncio.run(_tools(cache, 2, category_service, account_service, transaction_service)["get_category_totals"]())
+
+        expected = {"category": "Groceries", "parent_category": "Food", "total_amount": 120.0, "transaction_count": 3}
+        assert first == {"category_totals": [expected]}
+        assert again == first
+        assert transaction_service.get_category_totals.call_count == 2
+        assert category_service.get_all_categories.call_count == 2
+
+    def test_different_arguments_are_computed_separately(self):
+        category_service, account_service, transaction_service, _ = _services()
+        tools = _tools(ChatDataCache(), 1, category_service, account_service, transaction_service)
+
+        asyncio.run(tools["get_category_totals"](transaction_type="debit"))
+        asyncio.run(tools["get_category_totals"](transaction_type="credit"))
+
+        assert transaction_service.get_category_totals.call_count == 2
+
+
+class TestChatServiceContext:
+    def test_accounts_are_read_once_per_data_version(self):
+        category_service, account_service, transaction_service, _ = _services()
+        versions = MagicMock(spec=UserDataVersionRepository)
+        versions.get_version.return_value = 7
+        llm_client = MagicMock()
+
+        async def generate_with_tools(contents, tools, system_prompt):
+            yield {"type": "done"}
+
+        llm_client.generate_with_tools = generate_with_tools
+        service = ChatService(
+            llm_client=llm_client,
+            transaction_service=transaction_service,
+            category_service=category_service,
+            account_service=account_service,
+            recurring_pattern_service=MagicMock(spec=RecurringPatternSnapshotService),
+            user_data_version_repository=versions,
+            chat_data=ChatDataCache(),
+        )
+
+        async def send(message):
+            return [chunk async for chunk in service.process_message(USER_ID, message, [])]
+
+        asyncio.run(send("how much on groceries?"))
+        asyncio.run(send("and last month?"))
+
+        account_service.get_all_accounts.assert_called_once_with(USER_ID)
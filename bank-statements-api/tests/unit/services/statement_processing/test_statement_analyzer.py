@@ -55,6 +55,8 @@ class TestStatementAnalyzerService:
         )
 
         uploaded_file_repo = MagicMock()
+        file_blobs = MagicMock()
+        file_blobs.store.return_value = "ab" * 32
         uploaded_file_id = str(uuid.uuid4())
         uploaded_file_repo.save.return_value = UploadedFileDTO(
             id=uploaded_file_id,
@@ -77,6 +79,7 @@ class TestStatementAnalyzerService:
             uploaded_file_repo=uploaded_file_repo,
             file_analysis_metadata_repo=file_analysis_metadata_repo,
             transaction_repo=transaction_repo,
+            file_blobs=file_blobs,
         )
 
         filename = "test.csv"
@@ -112,7 +115,8 @@ class TestStatementAnalyzerService:
         statement_parser.parse.assert_called_once_with(file_content, "CSV")
         schema_detector.detect_schema.assert_called_once()
         file_analysis_metadata_repo.find_by_hash.assert_called_once()
-        uploaded_file_repo.save.assert_called_once_with(filename, file_content, "CSV")
+        file_blobs.store.assert_called_once_with(file_content)
+        uploaded_file_repo.save.assert_called_once_with(filename, "ab" * 32, "CSV")
 
     def test_duplicate_counting_logic(self, user_id):
         """Test that duplicate counting works correctly when multiple identical transactions exist in file"""
@@ -169,6 +173,8 @@ class TestStatementAnalyzerService:
         )
 
         uploaded_file_repo = MagicMock()
+        file_blobs = MagicMock()
+        file_blobs.store.return_value = "ab" * 32
         uploaded_file_id = str(uuid.uuid4())
         uploaded_file_repo.save.return_value = UploadedFileDTO(
             id=uploaded_file_id,
@@ -194,6 +200,7 @@ class TestStatementAnalyzerService:
             uploaded_file_repo=uploaded_file_repo,
             file_analysis_metadata_repo=file_analysis_metadata_repo,
             transaction_repo=transaction_repo,
+            file_blobs=file_blobs,
         )
 
         filename = "test.csv"
@@ -292,6 +299,8 @@ class TestStatementAnalyzerService:
         )
 
         uploaded_file_repo = MagicMock()
+        file_blobs = MagicMock()
+        file_blobs.store.return_value = "ab" * 32
         uploaded_file_id = str(uuid.uuid4())
         uploaded_file_repo.save.return_value = UploadedFileDTO(
             id=uploaded_file_id,
@@ -325,6 +334,7 @@ class TestStatementAnalyzerService:
             uploaded_file_repo=uploaded_file_repo,
             file_analysis_metadata_repo=file_analysis_metadata_repo,
             transaction_repo=transaction_repo,
+            file_blobs=file_blobs,
         )
 
         filename = "test.csv"
@@ -391,6 +401,8 @@ class TestStatementAnalyzerService:
         )
 
         uploaded_file_repo = MagicMock()
+        file_blobs = MagicMock()
+        file_blobs.store.return_value = "ab" * 32
         uploaded_file_id = str(uuid.uuid4())
         uploaded_file_repo.save.return_value = UploadedFileDTO(
             id=uploaded_file_id,
@@ -416,6 +428,7 @@ class TestStatementAnalyzerService:
             uploaded_file_repo=uploaded_file_repo,
             file_analysis_metadata_repo=file_analysis_metadata_repo,
             transaction_repo=transaction_repo,
+            file_blobs=file_blobs,
         )
 
         filename = "test.csv"
@@ -482,6 +495,8 @@ class TestStatementAnalyzerService:
         )
 
         uploaded_file_repo = MagicMock()
+        file_blobs = MagicMock()
+        file_blobs.store.return_value = "ab" * 32
         uploaded_file_id = str(uuid.uuid4())
         uploaded_file_repo.save.return_value = UploadedFileDTO(
             id=uploaded_file_id,
@@ -507,6 +522,7 @@ class TestStatementAnalyzerService:
             uploaded_file_repo=uploaded_file_repo,
             file_analysis_metadata_repo=file_analysis_metadata_repo,
             transaction_repo=transaction_repo,
+            file_blobs=file_blobs,
         )
 
         filename = "test.csv"
@@ -539,6 +555,8 @@ class TestStatementAnalyzerService:
 
         transaction_normalizer = MagicMock()
         uploaded_file_repo = MagicMock()
+        file_blobs = MagicMock()
+        file_blobs.store.return_value = "ab" * 32
         file_analysis_metadata_repo = MagicMock()
         file_analysis_metadata_repo.find_by_hash.return_value = None
         transaction_repo = MagicMock()
@@ -551,6 +569,7 @@ class TestStatementAnalyzerService:
             uploaded_file_repo=uploaded_file_repo,
             file_analysis_metadata_repo=file_analysis_metadata_repo,
             transaction_repo=transaction_repo,
+            file_blobs=file_blobs,
         )
 
         # Step 1: Empty DB - upload file with 1 transaction
@@ -6,7 +6,13 @@ import pytest
 from app.api.schemas import StatementUploadRequest
 from app.domain.dto.statement_processing import TransactionDTO
 from app.domain.dto.statement_upload import EnhancedTransactions, ParsedStatement, SavedStatement, ScheduledJobs
-from app.services.statement_processing.statement_upload import StatementUploadResult, StatementUploadService
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.services.statement_processing.statement_upload import (
+    StatementUploadResult,
+    StatementUploadService,
+    chunk_for_persistence,
+)
+from app.services.transaction import TransactionPersistenceResult
 from app.services.transaction_rule_enhancement import EnhancementResult
 
 
@@ -51,6 +57,10 @@ class TestStatementUploadService:
     def mock_background_job_service(self):
         return Mock()
 
+    @pytest.fixture
+    def mock_file_blobs(self):
+        return Mock()
+
     @pytest.fixture
     def statement_upload_service(
         self,
@@ -63,6 +73,7 @@ class TestStatementUploadService:
         mock_statement_repo,
         mock_transaction_repo,
         mock_background_job_service,
+        mock_file_blobs,
     ):
         return StatementUploadService(
             statement_parser=mock_statement_parser,
@@ -74,6 +85,7 @@ class TestStatementUploadService:
             statement_repo=mock_statement_repo,
             transaction_repo=mock_transaction_repo,
             background_job_service=mock_background_job_service,
+            file_blobs=mock_file_blobs,
         )
 
     @pytest.fixture
@@ -262,3 +274,96 @@ class TestStatementUploadService:
         assert not result.has_counterparty_job
         assert result.categorization_job_info is None
         assert result.counterparty_job_info is None
+
+    def test_save_statement_with_progress_saves_in_chunks(
+        self,
+        statement_upload_service,
+        mock_uploaded_file_repo,
+        mock_statement_repo,
+        mock_transaction_service,
+        sample_upload_request,
+        user_id,
+        monkeypatch,
+    ):
+        monkeypatch.setattr("app.services.statement_processing.statement_upload.IMPORT_CHUNK_SIZE", 2)
+        statement_upload_service._save_file_analysis_metadata = Mock()
+        mock_statement_repo.save_from_uploaded_file.return_value = Mock(id=uuid4())
+        mock_transaction_service.save_transactions_from_dtos.side_effect = lambda chunk: TransactionPersistenceResult(
+            transactions_saved=len(chunk) - 1, duplicates_found=1
+        )
+        dtos = [
+            TransactionDTO(date=f"2024-01-0{day}", amount=10.0, description="Shop", user_id=user_id, account_id="acc1")
+            for day in range(1, 6)
+        ]
+        enhanced = EnhancedTransactions(
+            enhanced_dtos=dtos,
+            total_processed=5,
+            rule_based_matches=0,
+            match_rate_percentage=0.0,
+            processing_time_ms=1,
+            has_unmatched=True,
+        )
+        progress_updates = []
+
+        saved = statement_upload_service.save_statement(
+            user_id, enhanced, sample_upload_request, on_progress=progress_updates.append
+        )
+
+        assert mock_transaction_service.save_transactions_from_dtos.call_count == 3
+        assert saved.transactions_saved == 2
+        assert saved.duplicated_transactions == 3
+        assert [(p.current_batch, p.processed_transactions) for p in progress_updates] == [(1, 2), (2, 4), (3, 5)]
+        assert all(p.phase == "saving" and p.total_batches == 3 for p in progress_updates)
+        assert progress_updates[-1].duplicate_transactions == 3
+
+    def test_should_import_async_compares_file_size(
+        self,
+        mock_uploaded_file_repo,
+        sample_upload_request,
+        statement_upload_service,
+    ):
+        statement_upload_service.async_import_min_bytes = 10
+        mock_uploaded_file_repo.find_metadata_by_id.return_value = Mock(size=10)
+        assert statement_upload_service.should_import_async(sample_upload_request)
+
+        mock_uploaded_file_repo.find_metadata_by_id.return_value = Mock(size=9)
+        assert not statement_upload_service.should_import_async(sample_upload_request)
+
+    def test_queue_statement_import_stores_request_on_job(
+        self,
+        statement_upload_service,
+        mock_background_job_service,
+        sample_upload_request,
+        user_id,
+    ):
+        job = BackgroundJob(id=uuid4(), job_type=JobType.STATEMENT_IMPORT, status=JobStatus.PENDING)
+        mock_background_job_service.queue_job.return_value = job
+
+        queued = statement_upload_service.queue_statement_import(user_id, sample_upload_request)
+
+        assert queued is job
+        args, kwargs = mock_background_job_service.queue_job.call_args
+        assert args == (JobType.STATEMENT_IMPORT,)
+        assert kwargs["user_id"] == user_id
+        assert str(kwargs["uploaded_file_id"]) == sample_upload_request.uploaded_file_id
+        assert StatementUploadRequest.model_validate(kwargs["payload"]["upload"]) == sample_upload_request
+
+
+class TestChunkForPersistence:
+    def _dto(self, day: int, amount: float) -> TransactionDTO:
+        return TransactionDTO(date=f"2024-01-{day:02d}", amount=amount, description="x", user_id=uuid4(), account_id="acc1")
+
+    def test_never_splits_a_duplicate_group(self):
+        dtos = [self._dto(1, 10.0), self._dto(2, 5.0), self._dto(2, 5.0), self._dto(2, 5.0), self._dto(3, 1.0)]
+
+        chunks = chunk_for_persistence(dtos, 2)
+
+        assert [len(chunk) for chunk in chunks] == [1, 3, 1]
+        assert sum(chunks, []) == [dtos[0], dtos[1], dtos[2], dtos[3], dtos[4]]
+
+    def test_packs_groups_up_to_chunk_size(self):
+        dtos = [self._dto(day, 1.0) for day in range(1, 8)]
+
+        chunks = chunk_for_persistence(dtos, 3)
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
@@ -48,6 +48,10 @@ class TestStatementUploadServiceRowFilters:
     def mock_background_job_service(self):
         return Mock()
 
+    @pytest.fixture
+    def mock_file_blobs(self):
+        return Mock()
+
     @pytest.fixture
     def statement_upload_service(
         self,
@@ -60,6 +64,7 @@ class TestStatementUploadServiceRowFilters:
         mock_statement_repo,
         mock_transaction_repo,
         mock_background_job_service,
+        mock_file_blobs,
     ):
         return StatementUploadService(
             statement_parser=mock_statement_parser,
@@ -71,6 +76,7 @@ class TestStatementUploadServiceRowFilters:
             statement_repo=mock_statement_repo,
             transaction_repo=mock_transaction_repo,
             background_job_service=mock_background_job_service,
+            file_blobs=mock_file_blobs,
         )
 
     @pytest.fixture
@@ -131,7 +137,7 @@ class TestStatementUploadServiceRowFilters:
             filename="test.csv",
             file_type="CSV",
             created_at=datetime.now(timezone.utc),
-            content=b"test,content\n1,2\n3,4",
+            blob_digest="ab" * 32,
         )
         mock_uploaded_file_repo.find_by_id.return_value = uploaded_file_dto
         mock_file_analysis_metadata_repo.find_by_hash_and_account.return_value = None
@@ -181,7 +187,7 @@ class TestStatementUploadServiceRowFilters:
             filename="test.csv",
             file_type="CSV",
             created_at=datetime.now(timezone.utc),
-            content=b"test,content\n1,2\n3,4",
+            blob_digest="ab" * 32,
         )
         mock_uploaded_file_repo.find_by_id.return_value = uploaded_file_dto
         mock_file_analysis_metadata_repo.find_by_hash_and_account.return_value = None
@@ -247,7 +253,7 @@ class TestStatementUploadServiceRowFilters:
 
         # Setup mocks
         uploaded_file_dto = Mock()
-        uploaded_file_dto.content = b"Date,Amount,Description\n2023-01-01,50.00,Small\n2023-01-02,150.00,Large"
+        uploaded_file_dto.blob_digest = "ab" * 32
         uploaded_file_dto.file_type = "CSV"
 
         mock_uploaded_file_repo.find_by_id.return_value = uploaded_file_dto
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import Mock
+from uuid import uuid4
+
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.domain.models.processing import ProcessingProgress
+from app.services.background.background_job_service import BackgroundJobService
+from app.services.background.progress_reporter import ThroughputEstimator
+
+
+def _job(status: JobStatus, processed: int, user_id=None) -> BackgroundJob:
+    return BackgroundJob(
+        id=uuid4(),
+        job_type=JobType.STATEMENT_IMPORT,
+        status=status,
+        user_id=user_id,
+        progress={"total_transactions": 10, "processed_transactions": processed, "phase": "saving"},
+        result={},
+    )
+
+
+def _collect(service: BackgroundJobService, job_id, user_id) -> list:
+    async def collect():
+        return [status async for status in service.stream_job_status(job_id, user_id, poll_interval_seconds=0)]
+
+    return asyncio.run(collect())
+
+
+class TestBackgroundJobService:
+    def test_queue_job_creates_pending_job(self):
+        repository = Mock()
+        repository.create.side_effect = lambda job: job
+        service = BackgroundJobService(repository)
+        user_id = uuid4()
+
+        job = service.queue_job(JobType.STATEMENT_IMPORT, user_id=user_id, payload={"upload": {}})
+
+        assert job.status == JobStatus.PENDING
+        assert job.user_id == user_id
+        assert job.payload == {"upload": {}}
+
+    def test_queue_job_if_due_skips_a_recent_job(self):
+        repository = Mock()
+        repository.find_job_created_since.return_value = _job(JobStatus.COMPLETED, 10)
+        service = BackgroundJobService(repository)
+
+        assert service.queue_job_if_due(JobType.STORAGE_RETENTION, timedelta(days=1)) is None
+        repository.create.assert_not_called()
+
+    def test_queue_job_if_due_queues_when_the_last_job_is_older_than_the_interval(self):
+        repository = Mock()
+        repository.find_job_created_since.return_value = None
+        repository.create.side_effect = lambda job: job
+        service = BackgroundJobService(repository)
+
+        job = service.queue_job_if_due(JobType.STORAGE_RETENTION, timedelta(days=1))
+
+        assert job.job_type == JobType.STORAGE_RETENTION
+        assert job.status == JobStatus.PENDING
+        job_type, user_id, _ = repository.find_job_created_since.call_args.args
+        assert (job_type, user_id) == (JobType.STORAGE_RETENTION, None)
+
+    def test_job_status_hidden_from_other_users(self):
+        repository = Mock()
+        repository.get_by_id.return_value = _job(JobStatus.PENDING, 0, user_id=uuid4())
+        service = BackgroundJobService(repository)
+
+        assert service.get_job_status_for_api(uuid4(), uuid4()) is None
+
+    def test_stream_yields_changes_until_terminal(self):
+        user_id = uuid4()
+        snapshots = [
+            _job(JobStatus.IN_PROGRESS, 0, user_id),
+            _job(JobStatus.IN_PROGRESS, 0, user_id),
+            _job(JobStatus.IN_PROGRESS, 5, user_id),
+            _job(JobStatus.COMPLETED, 10, user_id),
+        ]
+        for snapshot in snapshots:
+            snapshot.id = snapshots[0].id
+        repository = Mock()
+        repository.read_snapshot.side_effect = snapshots
+        service = BackgroundJobService(repository)
+
+        statuses = _collect(service, snapshots[0].id, user_id)
+
+        assert [(s["status"], s["progress"]["processed_transactions"]) for s in statuses] == [
+            (JobStatus.IN_PROGRESS, 0),
+            (JobStatus.IN_PROGRESS, 5),
+            (JobStatus.COMPLETED, 10),
+        ]
+        assert statuses[-1]["progress"]["phase"] == "saving"
+
+    def test_stream_ends_for_missing_job(self):
+        repository = Mock()
+        repository.read_snapshot.return_value = None
+        service = BackgroundJobService(repository)
+
+        assert _collect(service, uuid4(), uuid4()) == []
+
+    def test_update_job_progress_merges_in_one_write(self):
+        repository = Mock()
+        service = BackgroundJobService(repository)
+        job_id = uuid4()
+
+        service.update_job_progress(job_id, ProcessingProgress(1, 2, 5, 10, phase="saving", duplicate_transactions=1))
+
+        repository.get_by_id.assert_not_called()
+        repository.update.assert_not_called()
+        _, delta = repository.merge_progress.call_args.args
+        assert delta["processed_transactions"] == 5
+        assert delta["duplicate_transactions"] == 1
+
+    def test_status_changes_are_single_repository_writes(self):
+        repository = Mock()
+        service = BackgroundJobService(repository)
+        job_id = uuid4()
+
+        service.mark_job_started(job_id)
+        service.mark_job_completed(job_id, {"rows": 10})
+        service.mark_job_failed(job_id, "boom")
+
+        repository.get_by_id.assert_not_called()
+        repository.update.assert_not_called()
+        repository.mark_started.assert_called_once_with(job_id)
+        repository.mark_completed.assert_called_once_with(job_id, {"rows": 10})
+        repository.mark_failed.assert_called_once_with(job_id, "boom")
+
+    def test_estimate_uses_rate_recorded_by_worker(self):
+        service = BackgroundJobService(Mock(), throughput=ThroughputEstimator())
+        job = _job(JobStatus.IN_PROGRESS, 4)
+        job.progress["rows_per_second"] = 2.0
+
+        assert service.estimate_completion_time(job) == 3
+
+    def test_estimate_falls_back_to_job_type_average(self):
+        throughput = ThroughputEstimator()
+        throughput.record(JobType.STATEMENT_IMPORT, 3, 1.0)
+        service = BackgroundJobService(Mock(), throughput=throughput)
+
+        assert service.estimate_completion_time(_job(JobStatus.IN_PROGRESS, 4)) == 2
+
+    def test_estimate_is_unknown_without_measurements(self):
+        service = BackgroundJobService(Mock(), throughput=ThroughputEstimator())
+
+        assert service.estimate_completion_time(_job(JobStatus.IN_PROGRESS, 4)) is None
@@ -5,8 +5,12 @@ import pytest
 
 from app.api.errors import ValidationError
 from app.domain.models.category import Category
+from app.domain.models.llm_result_cache import LLMCacheKind
 from app.ports.repositories.category import CategoryRepository
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.ai.llm_result_cache import LLMResultCache
 from app.services.category import CategoryService
+from app.services.category_tree import CategoryTreeCache
 
 
 class TestCategoryService:
@@ -163,3 +167,100 @@ class TestCategoryService:
         assert result == expected_category
         mock_repository.get_by_id.assert_called_once_with(parent_category.id, user_id)
         mock_repository.create.assert_called_once()
+
+
+class TestCategoryServiceLLMCacheInvalidation:
+    @pytest.fixture
+    def user_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def mock_repository(self):
+        return MagicMock(spec=CategoryRepository)
+
+    @pytest.fixture
+    def llm_result_cache(self):
+        return MagicMock(spec=LLMResultCache)
+
+    @pytest.fixture
+    def service(self, mock_repository, llm_result_cache):
+        return CategoryService(mock_repository, llm_result_cache)
+
+    def test_create_invalidates_category_suggestions(self, service, llm_result_cache, user_id):
+        service.create_category("Groceries", user_id)
+
+        llm_result_cache.invalidate.assert_called_once_with(user_id, [LLMCacheKind.RULE_CATEGORY])
+
+    def test_rename_invalidates_category_suggestions(self, service, mock_repository, llm_result_cache, user_id):
+        mock_repository.get_by_id.return_value = Category(id=uuid4(), name="Food", user_id=user_id)
+
+        service.update_category(mock_repository.get_by_id.return_value.id, "Groceries", user_id)
+
+        llm_result_cache.invalidate.assert_called_once_with(user_id, [LLMCacheKind.RULE_CATEGORY])
+
+    def test_colour_change_keeps_category_suggestions(self, service, mock_repository, llm_result_cache, user_id):
+        category = Category(id=uuid4(), name="Food", user_id=user_id, color="#000000")
+        mock_repository.get_by_id.return_value = category
+
+        service.update_category(category.id, "Food", user_id, color="#ffffff")
+
+        llm_result_cache.invalidate.assert_not_called()
+
+    def test_delete_invalidates_category_suggestions(self, service, mock_repository, llm_result_cache, user_id):
+        mock_repository.get_subcategories.return_value = []
+        mock_repository.delete.return_value = True
+
+        service.delete_category(uuid4(), user_id)
+
+        llm_result_cache.invalidate.assert_called_once_with(user_id, [LLMCacheKind.RULE_CATEGORY])
+
+
+class TestCategoryServiceCategoryTree:
+    @pytest.fixture
+    def user_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def mock_repository(self):
+        return MagicMock(spec=CategoryRepository)
+
+    @pytest.fixture
+    def versions(self):
+        versions = MagicMock(spec=UserDataVersionRepository)
+        versions.get_version.return_value = 1
+        return versions
+
+    @pytest.fixture
+    def service(self, mock_repository, versions):
+        return CategoryService(mock_repository, category_trees=CategoryTreeCache(), user_data_version_repository=versions)
+
+    def test_tree_is_loaded_once(self, service, mock_repository, user_id):
+        food = Category(id=uuid4(), name="Food", user_id=user_id)
+        groceries = Category(id=uuid4(), name="Groceries", parent_id=food.id, user_id=user_id)
+        mock_repository.get_all.return_value = [food, groceries]
+
+        service.get_category_tree(user_id)
+        tree = service.get_category_tree(user_id)
+
+        assert tree.full_name(groceries.id) == "Food > Groceries"
+        mock_repository.get_all.assert_called_once_with(user_id)
+
+    def test_tree_is_rebuilt_when_the_data_version_moves(self, service, mock_repository, versions, user_id):
+        mock_repository.get_all.return_value = []
+        service.get_category_tree(user_id)
+
+        # A category written by another process bumps the version the next request reads
+        versions.get_version.return_value = 2
+        service.get_category_tree(user_id)
+        service.get_category_tree(user_id)
+
+        assert mock_repository.get_all.call_count == 2
+
+    def test_tree_is_not_cached_without_a_version_repository(self, mock_repository, user_id):
+        mock_repository.get_all.return_value = []
+        service = CategoryService(mock_repository, category_trees=CategoryTreeCache())
+
+        service.get_category_tree(user_id)
+        service.get_category_tree(user_id)
+
+        assert mock_repository.get_all.call_count == 2
@@ -0,0 +1,105 @@
+from uuid import uuid4
+
+from app.domain.models.category import Category
+from app.services.category_tree import CategoryTree, CategoryTreeCache
+
+USER_ID = uuid4()
+
+
+def _category(name, parent=None):
+    return Category(id=uuid4(), name=name, parent_id=parent.id if parent else None, user_id=USER_ID)
+
+
+class TestCategoryTree:
+    def setup_method(self):
+        self.food = _category("Food")
+        self.groceries = _category("Groceries", self.food)
+        self.restaurants = _category("Restaurants", self.food)
+        self.travel = _category("Travel")
+        self.tree = CategoryTree([self.food, self.groceries, self.restaurants, self.travel])
+
+    def test_descendants_include_the_category_itself(self):
+        assert self.tree.descendant_ids(self.food.id) == {self.food.id, self.groceries.id, self.restaurants.id}
+        assert self.tree.descendant_ids(self.groceries.id) == {self.groceries.id}
+
+    def test_unknown_categories_expand_to_themselves(self):
+        unknown = uuid4()
+
+        assert set(self.tree.expand([unknown, self.travel.id])) == {unknown, self.travel.id}
+
+    def test_expand_merges_overlapping_selections(self):
+        expanded = self.tree.expand([self.food.id, self.groceries.id])
+
+        assert sorted(expanded) == sorted([self.food.id, self.groceries.id, self.restaurants.id])
+
+    def test_full_names_include_the_parent(self):
+        assert self.tree.full_name(self.groceries.id) == "Food > Groceries"
+        assert self.tree.full_name(self.travel.id) == "Travel"
+        assert self.tree.full_name(uuid4()) == ""
+        assert self.tree.full_name(None) == ""
+
+    def test_parent_and_children_lookups(self):
+        assert self.tree.parent_id(self.restaurants.id) == self.food.id
+        assert self.tree.parent_id(self.food.id) is None
+        assert set(self.tree.children(self.food.id)) == {self.groceries.id, self.restaurants.id}
+
+    def test_parent_cycles_do_not_loop(self):
+        first = _category("First")
+        second = _category("Second", first)
+        first.parent_id = second.id
+
+        tree = CategoryTree([first, second])
+
+        assert tree.descendant_ids(first.id) == {first.id, second.id}
+        assert tree.full_name(second.id) == "First > Second"
+
+
+class TestCategoryTreeCache:
+    def setup_method(self):
+        self.cache = CategoryTreeCache()
+        self.loads = 0
+
+    def _load(self, categories=()):
+        def load():
+            self.loads += 1
+            return list(categories)
+
+        return load
+
+    def test_tree_is_loaded_once_per_user_and_version(self):
+        first = self.cache.get(USER_ID, 3, self._load([_category("Food")]))
+        second = self.cache.get(USER_ID, 3, self._load())
+
+        assert first is second
+        assert self.loads == 1
+
+    def test_new_data_version_reloads_the_tree(self):
+        self.cache.get(USER_ID, 3, self._load())
+        tree = self.cache.get(USER_ID, 4, self._load([_category("Food")]))
+        again = self.cache.get(USER_ID, 4, self._load())
+
+        assert self.loads == 2
+        assert len(tree) == 1 and again is tree
+
+    def test_older_version_does_not_replace_a_newer_tree(self):
+        newer = self.cache.get(USER_ID, 5, self._load([_category("Food")]))
+        self.cache.get(USER_ID, 4, self._load())
+
+        assert self.cache.get(USER_ID, 5, self._load()) is newer
+        assert self.loads == 2
+
+    def test_trees_without_a_version_are_not_kept(self):
+        self.cache.get(USER_ID, None, self._load())
+        self.cache.get(USER_ID, None, self._load())
+
+        assert self.loads == 2
+
+    def test_least_recently_used_users_are_evicted(self):
+        cache = CategoryTreeCache(max_users=2)
+        users = [uuid4(), uuid4(), uuid4()]
+        for user_id in users:
+            cache.get(user_id, 1, self._load())
+
+        cache.get(users[0], 1, self._load())
+
+        assert self.loads == 4
@@ -0,0 +1,190 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+import pytest
+import zstandard
+
+from app.adapters.blob_store import FilesystemBlobStore
+from app.api.errors import NotFoundError
+from app.domain.models.file_blob import BlobStorage, FileBlob
+from app.ports.repositories.file_blob import FileBlobRepository
+from app.services.file_blob import FileBlobService
+
+NOW = datetime(2026, 3, 13, 12, 0, tzinfo=timezone.utc)
+CSV = b"date,description,amount\n" + b"2026-03-01,Supermarket,-12.50\n" * 2000
+
+
+class InMemoryFileBlobRepository(FileBlobRepository):
+    def __init__(self):
+        self.blobs: Dict[str, FileBlob] = {}
+        self.references: Dict[str, int] = {}
+
+    def find(self, digest: str) -> Optional[FileBlob]:
+        return self.blobs.get(digest)
+
+    def touch(self, digest: str) -> bool:
+        if digest not in self.blobs:
+            return False
+        self.blobs[digest].last_used_at = NOW
+        return True
+
+    def add(self, blob: FileBlob) -> None:
+        blob.last_used_at = NOW
+        self.blobs.setdefault(blob.digest, blob)
+
+    def read_content(self, digest: str) -> Optional[bytes]:
+        return self.blobs[digest].content
+
+    def delete_unreferenced(
+        self, unused_before: datetime, limit: int, on_deleted: Callable[[List[FileBlob]], None]
+    ) -> List[FileBlob]:
+        deleted = [
+            blob for blob in self.blobs.values() if not self.references.get(blob.digest) and blob.last_used_at < unused_before
+        ][:limit]
+        on_deleted(deleted)
+        for blob in deleted:
+            del self.blobs[blob.digest]
+        return deleted
+
+
+@pytest.fixture
+def repository():
+    return InMemoryFileBlobRepository()
+
+
+def database_service(repository, **kwargs) -> FileBlobService:
+    return FileBlobService(repository, clock=lambda: NOW, **kwargs)
+
+
+def filesystem_service(repository, tmp_path, **kwargs) -> FileBlobService:
+    return FileBlobService(
+        repository, storage=BlobStorage.FILESYSTEM, filesystem=FilesystemBlobStore(str(tmp_path)), clock=lambda: NOW, **kwargs
+    )
+
+
+def service_for(storage, repository, tmp_path) -> FileBlobService:
+    if storage == BlobStorage.FILESYSTEM:
+        return filesystem_service(repository, tmp_path)
+    return database_service(repository)
+
+
+class TestStore:
+    def test_blobs_are_addressed_by_the_sha256_of_the_file(self, repository):
+        digest = database_service(repository).store(CSV)
+
+        assert digest == hashlib.sha256(CSV).hexdigest()
+
+    def test_database_blobs_are_compressed(self, repository):
+        digest = database_service(repository).store(CSV)
+
+        blob = repository.blobs[digest]
+        assert blob.storage == BlobStorage.DATABASE
+        assert blob.size == len(CSV)
+        assert blob.stored_size == len(blob.content) < len(CSV)
+        assert zstandard.ZstdDecompressor().decompress(blob.content) == CSV
+
+    def test_the_same_file_is_stored_once(self, repository):
+        service = database_service(repository)
+
+        first = service.store(CSV)
+        second = service.store(CSV)
+
+        assert first == second
+        assert len(repository.blobs) == 1
+
+    def test_filesystem_blobs_are_written_under_the_store_path(self, repository, tmp_path):
+        digest = filesystem_service(repository, tmp_path).store(CSV)
+
+        assert repository.blobs[digest].content is None
+        path = tmp_path / digest[:2] / digest[2:4] / f"{digest}.zst"
+        assert zstandard.ZstdDecompressor().decompress(path.read_bytes()) == CSV
+
+    def test_a_missing_file_is_rewritten_when_its_content_is_stored_again(self, repository, tmp_path):
+        service = filesystem_service(repository, tmp_path)
+        digest = service.store(CSV)
+        FilesystemBlobStore(str(tmp_path)).delete(digest)
+
+        service.store(CSV)
+
+        assert service.read(digest) == CSV
+
+    def test_filesystem_storage_needs_a_store(self, repository):
+        with pytest.raises(ValueError):
+            FileBlobService(repository, storage=BlobStorage.FILESYSTEM)
+
+
+class TestRead:
+    @pytest.mark.parametrize("storage", [BlobStorage.DATABASE, BlobStorage.FILESYSTEM])
+    def test_read_returns_the_original_file(self, repository, tmp_path, storage):
+        service = service_for(storage, repository, tmp_path)
+
+        assert service.read(service.store(CSV)) == CSV
+
+    @pytest.mark.parametrize("storage", [BlobStorage.DATABASE, BlobStorage.FILESYSTEM])
+    def test_chunks_add_up_to_the_original_file(self, repository, tmp_path, storage):
+        service = service_for(storage, repository, tmp_path)
+        blob = service.find(service.store(CSV))
+
+        chunks = list(service.iter_chunks(blob, chunk_bytes=4096))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 4096 for chunk in chunks)
+        assert b"".join(chunks) == CSV
+
+    def test_database_content_is_read_before_the_chunks_are_consumed(self, repository):
+        service = database_service(repository)
+        blob = service.find(service.store(CSV))
+
+        chunks = service.iter_chunks(blob, chunk_bytes=4096)
+        repository.read_content = None
+
+        assert b"".join(chunks) == CSV
+
+    def test_empty_files_round_trip(self, repository, tmp_path):
+        service = filesystem_service(repository, tmp_path)
+
+        assert service.read(service.store(b"")) == b""
+
+    def test_unknown_digest_is_not_found(self, repository):
+        with pytest.raises(NotFoundError):
+            database_service(repository).read("0" * 64)
+
+
+class TestDeleteUnreferenced:
+    def test_deletes_unreferenced_blobs_after_the_grace_period(self, repository, tmp_path):
+        service = filesystem_service(repository, tmp_path, cleanup_grace=timedelta(hours=1))
+        kept = service.store(b"still referenced")
+        orphan = service.store(CSV)
+        repository.references[kept] = 1
+        orphan_size = repository.blobs[orphan].stored_size
+        for blob in repository.blobs.values():
+            blob.last_used_at = NOW - timedelta(hours=2)
+
+        result = service.delete_unreferenced()
+
+        assert result.deleted == 1
+        assert result.reclaimed_bytes == orphan_size
+        assert list(repository.blobs) == [kept]
+        assert not FilesystemBlobStore(str(tmp_path)).exists(orphan)
+
+    def test_recently_stored_blobs_are_kept(self, repository):
+        service = database_service(repository, cleanup_grace=timedelta(hours=1))
+        service.store(CSV)
+
+        result = service.delete_unreferenced()
+
+        assert result.deleted == 0
+        assert len(repository.blobs) == 1
+
+    def test_deletes_in_batches_until_a_short_batch(self, repository):
+        service = database_service(repository, cleanup_grace=timedelta(hours=1))
+        for i in range(5):
+            service.store(f"file {i}".encode())
+        for blob in repository.blobs.values():
+            blob.last_used_at = NOW - timedelta(days=1)
+
+        result = service.delete_unreferenced(batch_size=2)
+
+        assert result.deleted == 5
+        assert not repository.blobs
@@ -0,0 +1,135 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from app.domain.models.background_job import JobType
+from app.domain.models.processing import ProcessingProgress
+from app.services.background.progress_reporter import ProgressReporter, ThroughputEstimator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _progress(processed: int, total: int = 1000, phase: str = "saving", duplicates: int = 0) -> ProcessingProgress:
+    return ProcessingProgress(0, 0, processed, total, phase=phase, duplicate_transactions=duplicates)
+
+
+def _reporter(repository, clock, throughput=None) -> ProgressReporter:
+    return ProgressReporter(
+        repository,
+        uuid4(),
+        JobType.STATEMENT_IMPORT,
+        min_interval_ms=500,
+        min_percent_change=5.0,
+        throughput=throughput or ThroughputEstimator(),
+        clock=clock,
+    )
+
+
+class TestThroughputEstimator:
+    def test_first_sample_sets_the_rate(self):
+        estimator = ThroughputEstimator(alpha=0.5)
+
+        assert estimator.record(JobType.STATEMENT_IMPORT, 100, 2.0) == 50.0
+
+    def test_later_samples_are_weighted(self):
+        estimator = ThroughputEstimator(alpha=0.5)
+        estimator.record(JobType.STATEMENT_IMPORT, 100, 1.0)
+
+        assert estimator.record(JobType.STATEMENT_IMPORT, 300, 1.0) == 200.0
+
+    def test_estimate_needs_a_measured_rate(self):
+        estimator = ThroughputEstimator()
+
+        assert estimator.estimate_seconds(JobType.STATEMENT_IMPORT, 100) is None
+        estimator.record(JobType.STATEMENT_IMPORT, 50, 1.0)
+        assert estimator.estimate_seconds(JobType.STATEMENT_IMPORT, 100) == 2
+
+
+class TestProgressReporter:
+    def test_first_report_is_written(self):
+        repository = Mock()
+        reporter = _reporter(repository, FakeClock())
+
+        reporter.report(_progress(0, phase="parsing"))
+
+        repository.merge_progress.assert_called_once()
+        _, delta = repository.merge_progress.call_args.args
+        assert delta["phase"] == "parsing"
+
+    def test_small_changes_within_interval_are_buffered(self):
+        repository = Mock()
+        clock = FakeClock()
+        reporter = _reporter(repository, clock)
+        reporter.report(_progress(0))
+
+        for processed in (10, 20, 30):
+            clock.now += 0.1
+            reporter.report(_progress(processed))
+
+        assert repository.merge_progress.call_count == 1
+
+    def test_writes_after_interval_with_only_changed_keys(self):
+        repository = Mock()
+        clock = FakeClock()
+        reporter = _reporter(repository, clock)
+        reporter.report(_progress(0))
+
+        clock.now += 0.6
+        reporter.report(_progress(20, duplicates=0))
+
+        assert repository.merge_progress.call_count == 2
+        _, delta = repository.merge_progress.call_args.args
+        assert delta["processed_transactions"] == 20
+        assert "phase" not in delta
+        assert "total_transactions" not in delta
+        assert "duplicate_transactions" not in delta
+
+    def test_large_percentage_change_is_written_immediately(self):
+        repository = Mock()
+        reporter = _reporter(repository, FakeClock())
+        reporter.report(_progress(0))
+
+        reporter.report(_progress(60))
+
+        assert repository.merge_progress.call_count == 2
+
+    def test_phase_change_is_written_immediately(self):
+        repository = Mock()
+        reporter = _reporter(repository, FakeClock())
+        reporter.report(_progress(0, phase="enhancing"))
+
+        reporter.report(_progress(0, phase="saving"))
+
+        assert repository.merge_progress.call_count == 2
+
+    def test_flush_writes_buffered_progress(self):
+        repository = Mock()
+        clock = FakeClock()
+        reporter = _reporter(repository, clock)
+        reporter.report(_progress(0))
+        clock.now += 0.1
+        reporter.report(_progress(10))
+
+        reporter.flush()
+
+        assert repository.merge_progress.call_count == 2
+        _, delta = repository.merge_progress.call_args.args
+        assert delta["processed_transactions"] == 10
+
+    def test_estimates_completion_from_measured_throughput(self):
+        repository = Mock()
+        clock = FakeClock()
+        reporter = _reporter(repository, clock)
+        reporter.report(_progress(0))
+
+        clock.now += 1.0
+        reporter.report(_progress(100))
+
+        _, delta = repository.merge_progress.call_args.args
+        assert delta["rows_per_second"] == 100.0
+        assert delta["estimated_completion_seconds"] == 9
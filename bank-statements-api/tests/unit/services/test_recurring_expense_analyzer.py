@@ -1,9 +1,15 @@
+import random
 import uuid
 from datetime import date, timedelta
 from decimal import Decimal
 
 from app.domain.models.transaction import CategorizationStatus, SourceType, Transaction
-from app.services.recurring_expense_analyzer import ACTIVE_PATTERNS_DAYS, RecurringExpenseAnalyzer
+from app.ports.repositories.transaction import RecurringCandidateRow
+from app.services.recurring_expense_analyzer import (
+    ACTIVE_PATTERNS_DAYS,
+    RecurringExpenseAnalyzer,
+    longest_interval_sequence,
+)
 
 
 class TestRecurringExpenseAnalyzer:
@@ -760,3 +766,62 @@ class TestRecurringExpenseAnalyzer:
         assert len(quarterly_patterns) == 1
         pattern = quarterly_patterns[0]
         assert pattern.total_annual_cost == Decimal("100.00")
+
+    def test_candidate_rows_give_the_same_patterns_as_transactions(self):
+        transactions = [
+            self.create_transaction(normalized_description="gym", transaction_date=date(2024, 1, 1) + timedelta(days=30 * i))
+            for i in range(4)
+        ] + [
+            self.create_transaction(
+                normalized_description="insurance",
+                transaction_date=date(2022, 3, 1) + timedelta(days=365 * i),
+            )
+            for i in range(2)
+        ]
+        rows = [
+            RecurringCandidateRow(t.id, t.date, t.amount, t.description, t.normalized_description, t.category_id)
+            for t in transactions
+        ]
+
+        from_transactions = self.analyzer.analyze_patterns(transactions, self.user_id).to_dict()
+        from_rows = self.analyzer.analyze_patterns(rows, self.user_id).to_dict()
+
+        assert from_rows == from_transactions
+        assert from_rows["summary"]["pattern_count"] == 2
+
+    def test_min_group_size_is_the_smallest_pattern_threshold(self):
+        assert self.analyzer.min_group_size == RecurringExpenseAnalyzer.YEARLY_MIN_OCCURRENCES
+
+
+def scan_every_start(ordinals, min_days, max_days):
+    best = []
+    for start in range(len(ordinals)):
+        sequence = [start]
+        for i in range(start + 1, len(ordinals)):
+            if min_days <= ordinals[i] - ordinals[sequence[-1]] <= max_days:
+                sequence.append(i)
+        if len(sequence) > len(best):
+            best = sequence
+    return best
+
+
+class TestLongestIntervalSequence:
+    def test_picks_monthly_chain_among_daily_purchases(self):
+        start = date(2024, 1, 1).toordinal()
+        ordinals = sorted([start + day for day in range(0, 120, 3)] + [start + 1 + 30 * month for month in range(4)])
+
+        chain = longest_interval_sequence(ordinals, 25, 38)
+
+        assert len(chain) == 5
+        assert all(25 <= ordinals[b] - ordinals[a] <= 38 for a, b in zip(chain, chain[1:]))
+
+    def test_single_transaction_is_its_own_sequence(self):
+        assert longest_interval_sequence([738000], 25, 38) == [0]
+
+    def test_matches_scanning_from_every_start(self):
+        rng = random.Random(7)
+        for interval_days in [(25, 38), (80, 100), (350, 380)]:
+            for _ in range(200):
+                size = rng.randint(0, 40)
+                ordinals = sorted(738000 + rng.randint(0, 1500) for _ in range(size))
+                assert longest_interval_sequence(ordinals, *interval_days) == scan_every_start(ordinals, *interval_days)
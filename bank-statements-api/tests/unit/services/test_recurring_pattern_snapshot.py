@@ -0,0 +1,136 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.domain.models.background_job import JobType
+from app.domain.models.recurring_pattern_snapshot import RecurringPatternSnapshot
+from app.ports.repositories.recurring_pattern_snapshot import RecurringPatternSnapshotRepository
+from app.ports.repositories.transaction import RecurringCandidateRow, TransactionRepository
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.background.background_job_service import BackgroundJobService
+from app.services.recurring_expense_analyzer import RecurringExpenseAnalyzer
+from app.services.recurring_pattern_snapshot import RecurringPatternSnapshotService
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+USER_ID = uuid4()
+
+
+def _monthly_rows(description: str, last: date, months: int = 4):
+    return [
+        RecurringCandidateRow(
+            id=uuid4(),
+            date=last - timedelta(days=30 * month),
+            amount=Decimal("-9.99"),
+            description=description.upper(),
+            normalized_description=description,
+            category_id=None,
+        )
+        for month in range(months)
+    ]
+
+
+def _pattern(description: str, last_transaction_date: date, pattern_type: str = "monthly", amount: float = 10.0):
+    return {
+        "description": description,
+        "normalized_description": description,
+        "average_amount": amount,
+        "pattern_type": pattern_type,
+        "last_transaction_date": last_transaction_date.isoformat(),
+    }
+
+
+class TestRecurringPatternSnapshotService:
+    def setup_method(self):
+        self.snapshots = MagicMock(spec=RecurringPatternSnapshotRepository)
+        self.transactions = MagicMock(spec=TransactionRepository)
+        self.versions = MagicMock(spec=UserDataVersionRepository)
+        self.versions.get_version.return_value = 5
+        self.jobs = MagicMock(spec=BackgroundJobService)
+        self.analyzer = RecurringExpenseAnalyzer()
+        self.service = RecurringPatternSnapshotService(
+            snapshot_repository=self.snapshots,
+            transaction_repository=self.transactions,
+            analyzer=self.analyzer,
+            user_data_version_repository=self.versions,
+            background_job_service=self.jobs,
+            clock=lambda: NOW,
+        )
+
+    def _snapshot(self, patterns, data_version=5, computed_at=NOW - timedelta(hours=1)):
+        return RecurringPatternSnapshot(
+            user_id=USER_ID,
+            data_version=data_version,
+            patterns=patterns,
+            computed_at=computed_at,
+        )
+
+    def test_refresh_saves_the_analysis_with_the_version_it_started_from(self):
+        self.transactions.get_recurring_candidates.return_value = _monthly_rows("netflix", date.today())
+
+        snapshot = self.service.refresh(USER_ID)
+
+        self.snapshots.save.assert_called_once_with(snapshot)
+        assert snapshot.data_version == 5
+        assert snapshot.computed_at == NOW
+        assert [p["normalized_description"] for p in snapshot.patterns] == ["netflix"]
+        call = self.transactions.get_recurring_candidates.call_args
+        assert call.kwargs["min_occurrences"] == self.analyzer.min_group_size
+
+    def test_first_read_computes_the_snapshot(self):
+        self.snapshots.get.return_value = None
+        self.transactions.get_recurring_candidates.return_value = _monthly_rows("gym", date.today())
+
+        view = self.service.get_patterns(USER_ID)
+
+        assert [p["normalized_description"] for p in view.patterns] == ["gym"]
+        assert view.stale is False
+        self.snapshots.save.assert_called_once()
+
+    def test_current_snapshot_is_served_without_recomputing(self):
+        self.snapshots.get.return_value = self._snapshot([_pattern("gym", date.today())])
+
+        view = self.service.get_patterns(USER_ID)
+
+        assert view.stale is False
+        self.transactions.get_recurring_candidates.assert_not_called()
+        self.jobs.queue_job_once.assert_not_called()
+
+    def test_snapshot_behind_the_data_is_served_as_stale_and_refreshed_in_background(self):
+        self.snapshots.get.return_value = self._snapshot([_pattern("gym", date.today())], data_version=3)
+
+        view = self.service.get_patterns(USER_ID)
+
+        assert view.stale is True
+        assert len(view.patterns) == 1
+        self.transactions.get_recurring_candidates.assert_not_called()
+        self.jobs.queue_job_once.assert_called_once_with(JobType.RECURRING_PATTERNS_REFRESH, user_id=USER_ID)
+
+    def test_snapshot_older_than_max_age_is_stale(self):
+        self.snapshots.get.return_value = self._snapshot([], computed_at=NOW - timedelta(days=2))
+
+        assert self.service.get_patterns(USER_ID).stale is True
+
+    def test_active_only_drops_old_patterns_from_patterns_and_summary(self):
+        recent = _pattern("gym", date.today(), amount=30.0)
+        old = _pattern("old gym", date.today() - timedelta(days=800), amount=25.0)
+        yearly = _pattern("insurance", date.today() - timedelta(days=10), pattern_type="yearly", amount=300.0)
+        self.snapshots.get.return_value = self._snapshot([recent, old, yearly])
+
+        active = self.service.get_patterns(USER_ID, active_only=True)
+        everything = self.service.get_patterns(USER_ID, active_only=False)
+
+        assert active.patterns == [recent, yearly]
+        assert active.summary["total_monthly_recurring"] == 30.0
+        assert active.summary["total_yearly_recurring"] == 300.0
+        assert active.summary["pattern_count"] == 2
+        assert everything.summary["total_monthly_recurring"] == 55.0
+        assert everything.summary["monthly_pattern_count"] == 2
+
+    def test_sweep_refreshes_snapshots_not_computed_today(self):
+        self.snapshots.find_user_ids_to_refresh.return_value = [USER_ID]
+
+        assert self.service.find_users_to_refresh() == [USER_ID]
+        self.snapshots.find_user_ids_to_refresh.assert_called_once_with(
+            computed_before=datetime(2026, 3, 11, tzinfo=timezone.utc)
+        )
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.ports.repositories.background_job import BackgroundJobRepository
+from app.ports.repositories.uploaded_file import UploadedFileRepository
+from app.services.ai.llm_result_cache import LLMResultCache
+from app.services.file_blob import BlobCleanupResult, FileBlobService
+from app.services.retention import RetentionService
+
+NOW = datetime(2026, 3, 14, 3, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def uploaded_files():
+    repository = MagicMock(spec=UploadedFileRepository)
+    repository.delete_orphaned.return_value = (0, 0)
+    return repository
+
+
+@pytest.fixture
+def jobs():
+    repository = MagicMock(spec=BackgroundJobRepository)
+    repository.delete_terminal_jobs.return_value = (0, 0)
+    return repository
+
+
+@pytest.fixture
+def file_blobs():
+    service = MagicMock(spec=FileBlobService)
+    service.delete_unreferenced.return_value = BlobCleanupResult()
+    return service
+
+
+@pytest.fixture
+def llm_result_cache():
+    cache = MagicMock(spec=LLMResultCache)
+    cache.purge_expired.return_value = 0
+    return cache
+
+
+@pytest.fixture
+def retention(uploaded_files, jobs, file_blobs, llm_result_cache):
+    return RetentionService(
+        uploaded_files,
+        jobs,
+        file_blobs,
+        llm_result_cache=llm_result_cache,
+        upload_retention=timedelta(hours=6),
+        job_retention=timedelta(days=7),
+        clock=lambda: NOW,
+    )
+
+
+class TestRetentionService:
+    def test_deletes_with_cutoffs_from_the_retention_periods(self, retention, uploaded_files, jobs):
+        retention.run(batch_size=100)
+
+        uploaded_files.delete_orphaned.assert_called_once_with(NOW - timedelta(hours=6), 100)
+        jobs.delete_terminal_jobs.assert_called_once_with(NOW - timedelta(days=7), 100)
+
+    def test_keeps_deleting_until_a_batch_is_not_full(self, retention, uploaded_files):
+        uploaded_files.delete_orphaned.side_effect = [(100, 1000), (100, 1000), (30, 300)]
+
+        result = retention.run(batch_size=100)
+
+        assert uploaded_files.delete_orphaned.call_count == 3
+        assert result.uploads_deleted == 230
+
+    def test_stops_after_max_batches(self, retention, uploaded_files, jobs):
+        uploaded_files.delete_orphaned.return_value = (100, 1000)
+        jobs.delete_terminal_jobs.return_value = (100, 500)
+
+        result = retention.run(batch_size=100, max_batches=2)
+
+        assert uploaded_files.delete_orphaned.call_count == 2
+        assert jobs.delete_terminal_jobs.call_count == 2
+        assert result.uploads_deleted == 200
+        assert result.jobs_deleted == 200
+
+    def test_cleans_up_blobs_after_deleting_uploads(self, retention, uploaded_files, file_blobs):
+        calls = []
+        uploaded_files.delete_orphaned.side_effect = lambda *args: calls.append("uploads") or (0, 0)
+        file_blobs.delete_unreferenced.side_effect = lambda *args: calls.append("blobs") or BlobCleanupResult()
+
+        retention.run(batch_size=50, max_batches=4)
+
+        assert calls == ["uploads", "blobs"]
+        file_blobs.delete_unreferenced.assert_called_once_with(50, 4)
+
+    def test_reports_deleted_rows_and_reclaimed_bytes(self, retention, uploaded_files, jobs, file_blobs):
+        uploaded_files.delete_orphaned.return_value = (3, 600)
+        jobs.delete_terminal_jobs.return_value = (5, 4000)
+        file_blobs.delete_unreferenced.return_value = BlobCleanupResult(deleted=2, reclaimed_bytes=1_000_000)
+
+        result = retention.run()
+
+        assert result.uploads_deleted == 3
+        assert result.jobs_deleted == 5
+        assert result.blobs_deleted == 2
+        assert result.reclaimed_bytes == 1_004_600
+
+    def test_purges_expired_llm_results(self, retention, llm_result_cache):
+        llm_result_cache.purge_expired.return_value = 12
+
+        result = retention.run()
+
+        llm_result_cache.purge_expired.assert_called_once_with()
+        assert result.cache_entries_deleted == 12
+
+    def test_runs_without_an_llm_result_cache(self, uploaded_files, jobs, file_blobs):
+        retention = RetentionService(uploaded_files, jobs, file_blobs, clock=lambda: NOW)
+
+        assert retention.run().cache_entries_deleted == 0
@@ -12,10 +12,12 @@ class TestStatementService:
     def setup_method(self):
         self.statement_repo = Mock()
         self.transaction_repo = Mock()
+        self.file_blobs = Mock()
         self.user_id = uuid4()
         self.statement_service = StatementService(
             statement_repository=self.statement_repo,
             transaction_repository=self.transaction_repo,
+            file_blobs=self.file_blobs,
         )
 
     def test_get_all_statements(self):
@@ -92,6 +94,37 @@ class TestStatementService:
         self.transaction_repo.delete_by_statement_id.assert_called_once_with(statement_id)
         self.statement_repo.delete.assert_called_once_with(statement_id, self.user_id)
 
+    def test_delete_statement_requests_a_recurring_patterns_refresh(self):
+        statement_id = uuid4()
+        recurring_pattern_service = Mock()
+        service = StatementService(
+            statement_repository=self.statement_repo,
+            transaction_repository=self.transaction_repo,
+            file_blobs=self.file_blobs,
+            recurring_pattern_service=recurring_pattern_service,
+        )
+        self.statement_repo.find_by_id.return_value = Mock(spec=Statement, id=statement_id)
+        self.transaction_repo.delete_by_statement_id.return_value = 5
+
+        service.delete_statement_with_transactions(statement_id, self.user_id)
+
+        recurring_pattern_service.request_refresh.assert_called_once_with(self.user_id)
+
+    def test_delete_empty_statement_does_not_refresh_recurring_patterns(self):
+        recurring_pattern_service = Mock()
+        service = StatementService(
+            statement_repository=self.statement_repo,
+            transaction_repository=self.transaction_repo,
+            file_blobs=self.file_blobs,
+            recurring_pattern_service=recurring_pattern_service,
+        )
+        self.statement_repo.find_by_id.return_value = Mock(spec=Statement)
+        self.transaction_repo.delete_by_statement_id.return_value = 0
+
+        service.delete_statement_with_transactions(uuid4(), self.user_id)
+
+        recurring_pattern_service.request_refresh.assert_not_called()
+
     def test_delete_statement_with_transactions_repository_error(self):
         statement_id = uuid4()
         mock_statement = Mock(spec=Statement, id=statement_id, filename="test.csv")
@@ -104,3 +137,27 @@ class TestStatementService:
         self.statement_repo.find_by_id.assert_called_once_with(statement_id, self.user_id)
         self.transaction_repo.delete_by_statement_id.assert_called_once_with(statement_id)
         self.statement_repo.delete.assert_not_called()
+
+    def test_download_statement_streams_the_statement_blob(self):
+        statement_id = uuid4()
+        self.statement_repo.find_by_id.return_value = Mock(
+            spec=Statement, filename="march.csv", file_type="CSV", blob_digest="ab" * 32
+        )
+        blob = Mock(size=240)
+        self.file_blobs.find.return_value = blob
+        self.file_blobs.iter_chunks.return_value = iter([b"a" * 100, b"b" * 100, b"c" * 40])
+
+        download = self.statement_service.download_statement(statement_id, self.user_id, chunk_bytes=100)
+
+        assert (download.filename, download.file_type, download.size) == ("march.csv", "CSV", 240)
+        assert [len(chunk) for chunk in download.chunks] == [100, 100, 40]
+        self.file_blobs.find.assert_called_once_with("ab" * 32)
+        self.file_blobs.iter_chunks.assert_called_once_with(blob, 100)
+
+    def test_download_statement_not_found(self):
+        self.statement_repo.find_by_id.return_value = None
+
+        with pytest.raises(NotFoundError, match="Statement not found"):
+            self.statement_service.download_statement(uuid4(), self.user_id)
+
+        self.file_blobs.find.assert_not_called()
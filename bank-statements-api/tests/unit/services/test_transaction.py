@@ -6,11 +6,15 @@ from uuid import uuid4
 import pytest
 
 from app.api.schemas import TransactionCreateRequest
+from app.domain.models.category import Category
 from app.domain.models.enhancement_rule import EnhancementRule, EnhancementRuleSource, MatchType
 from app.domain.models.transaction import CategorizationStatus, Transaction
+from app.ports.repositories.category import CategoryRepository
 from app.ports.repositories.enhancement_rule import EnhancementRuleRepository
 from app.ports.repositories.initial_balance import InitialBalanceRepository
 from app.ports.repositories.transaction import TransactionRepository
+from app.ports.repositories.user_data_version import UserDataVersionRepository
+from app.services.category_tree import CategoryTreeCache
 from app.services.transaction import TransactionService
 from app.services.transaction_enhancement import TransactionEnhancer
 
@@ -86,8 +90,6 @@ class TestTransactionService:
             return transactions
 
         mock_transaction_enhancer.apply_rules.side_effect = apply_rules_side_effect
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = None
-
         transaction_data = TransactionCreateRequest(
             date=transaction_date,
             description=description,
@@ -350,7 +352,6 @@ class TestTransactionService:
         account_id = uuid4()
 
         mock_enhancement_rule_repository.find_matching_rules_batch.return_value = []
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = None
 
         created_transaction = Transaction(
             id=uuid4(),
@@ -372,14 +373,8 @@ class TestTransactionService:
 
         service.create_transaction(user_id=user_id, transaction_data=transaction_data)
 
-        mock_enhancement_rule_repository.find_by_normalized_description.assert_called_once_with("new merchant", user_id)
-        mock_enhancement_rule_repository.save.assert_called_once()
-
-        saved_rule = mock_enhancement_rule_repository.save.call_args[0][0]
-        assert saved_rule.normalized_description_pattern == "new merchant"
-        assert saved_rule.match_type == MatchType.EXACT
-        assert saved_rule.category_id is None
-        assert saved_rule.source == EnhancementRuleSource.AUTO
+        mock_enhancement_rule_repository.create_unmatched_rules.assert_called_once_with(["new merchant"], user_id)
+        mock_enhancement_rule_repository.save.assert_not_called()
 
     def test_create_transaction_no_duplicate_ai_rule(
         self,
@@ -399,8 +394,7 @@ class TestTransactionService:
             source=EnhancementRuleSource.AUTO,
         )
 
-        mock_enhancement_rule_repository.get_all.return_value = []
-        mock_enhancement_rule_repository.find_by_normalized_description.return_value = existing_rule
+        mock_enhancement_rule_repository.find_matching_rules_batch.return_value = [existing_rule]
 
         def apply_rules_side_effect(transactions, _rules):
             return transactions
@@ -427,6 +421,7 @@ class TestTransactionService:
 
         service.create_transaction(user_id=user_id, transaction_data=transaction_data)
 
+        mock_enhancement_rule_repository.create_unmatched_rules.assert_not_called()
         mock_enhancement_rule_repository.save.assert_not_called()
 
     def test_create_transaction_user_category_takes_precedence(
@@ -685,3 +680,85 @@ class TestSaveTransactionsFromDtos:
 
         with pytest.raises(ValueError, match="account_id"):
             service.save_transactions_from_dtos(dtos)
+
+
+class TestCategoryExpansion:
+    @pytest.fixture
+    def user_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def categories(self, user_id):
+        food = Category(id=uuid4(), name="Food", user_id=user_id)
+        groceries = Category(id=uuid4(), name="Groceries", parent_id=food.id, user_id=user_id)
+        return food, groceries
+
+    @pytest.fixture
+    def category_repository(self, categories):
+        repository = MagicMock(spec=CategoryRepository)
+        repository.get_all.return_value = list(categories)
+        return repository
+
+    @pytest.fixture
+    def mock_repository(self):
+        return MagicMock(spec=TransactionRepository)
+
+    @pytest.fixture
+    def versions(self):
+        versions = MagicMock(spec=UserDataVersionRepository)
+        versions.get_version.return_value = 1
+        return versions
+
+    @pytest.fixture
+    def service(self, mock_repository, category_repository, versions):
+        return TransactionService(
+            mock_repository,
+            MagicMock(spec=InitialBalanceRepository),
+            MagicMock(spec=EnhancementRuleRepository),
+            MagicMock(spec=TransactionEnhancer),
+            category_repository=category_repository,
+            category_trees=CategoryTreeCache(),
+            user_data_version_repository=versions,
+        )
+
+    def test_category_filters_include_subcategories_from_one_cached_tree(
+        self, service, mock_repository, category_repository, categories, user_id
+    ):
+        food, groceries = categories
+        mock_repository.get_category_totals.return_value = {}
+
+        service.get_category_totals(user_id=user_id, category_ids=[food.id])
+        service.get_category_totals(user_id=user_id, category_ids=[groceries.id])
+
+        calls = mock_repository.get_category_totals.call_args_list
+        assert set(calls[0].kwargs["category_ids"]) == {food.id, groceries.id}
+        assert calls[1].kwargs["category_ids"] == [groceries.id]
+        category_repository.get_all.assert_called_once_with(user_id)
+
+    def test_subcategory_added_by_another_process_is_included_once_the_version_moves(
+        self, service, mock_repository, category_repository, versions, categories, user_id
+    ):
+        food, groceries = categories
+        mock_repository.get_category_totals.return_value = {}
+        service.get_category_totals(user_id=user_id, category_ids=[food.id])
+
+        restaurants = Category(id=uuid4(), name="Restaurants", parent_id=food.id, user_id=user_id)
+        category_repository.get_all.return_value = [food, groceries, restaurants]
+        versions.get_version.return_value = 2
+        service.get_category_totals(user_id=user_id, category_ids=[food.id])
+
+        assert set(mock_repository.get_category_totals.call_args.kwargs["category_ids"]) == {
+            food.id,
+            groceries.id,
+            restaurants.id,
+        }
+
+    def test_time_series_for_one_category_includes_its_subcategories(self, service, mock_repository, categories, user_id):
+        food, groceries = categories
+        mock_repository.get_category_time_series.return_value = []
+
+        service.get_category_time_series(user_id=user_id, category_id=food.id, category_ids=[uuid4()])
+
+        call_kwargs = mock_repository.get_category_time_series.call_args.kwargs
+        assert set(call_kwargs["category_ids"]) == {food.id, groceries.id}
+        assert "category_id" not in call_kwargs
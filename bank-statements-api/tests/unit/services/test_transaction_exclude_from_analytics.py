@@ -151,7 +151,7 @@ class TestNewTransactionsDefaultIncluded:
     def mock_enhancement_rule_repository(self):
         repository = MagicMock(spec=EnhancementRuleRepository)
         repository.find_matching_rules_batch.return_value = []
-        repository.find_by_normalized_description.return_value = None
+        repository.create_unmatched_rules.return_value = 0
         return repository
 
     @pytest.fixture
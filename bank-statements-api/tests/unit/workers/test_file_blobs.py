@@ -0,0 +1,23 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.services.file_blob import BlobCleanupResult
+from app.workers.file_blobs import cleanup_file_blobs
+from app.workers.handlers import get_job_handler
+
+
+class TestCleanupFileBlobs:
+    def test_is_registered_for_cleanup_jobs(self):
+        assert get_job_handler(JobType.FILE_BLOB_CLEANUP) is cleanup_file_blobs
+
+    def test_reports_deleted_blobs_and_reclaimed_bytes(self):
+        job = BackgroundJob(id=uuid4(), job_type=JobType.FILE_BLOB_CLEANUP, status=JobStatus.IN_PROGRESS, payload={})
+        internal = MagicMock()
+        internal.file_blob_service.delete_unreferenced.return_value = BlobCleanupResult(deleted=3, reclaimed_bytes=4096)
+
+        result = asyncio.run(cleanup_file_blobs(job, internal))
+
+        internal.file_blob_service.delete_unreferenced.assert_called_once_with()
+        assert result == {"deleted": 3, "reclaimed_bytes": 4096}
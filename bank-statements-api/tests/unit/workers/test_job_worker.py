@@ -0,0 +1,294 @@
+import asyncio
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.workers.handlers import PermanentJobError
+from app.workers.job_worker import SCHEDULED_JOBS, JobWorker, ScheduledJob, WorkerConfig, retry_delay_seconds
+
+
+def _job(retry_count: int = 0, max_retries: int = 3) -> BackgroundJob:
+    job = BackgroundJob(
+        job_type=JobType.PLACEHOLDER,
+        status=JobStatus.IN_PROGRESS,
+        progress={},
+        retry_count=retry_count,
+        max_retries=max_retries,
+    )
+    job.id = uuid4()
+    return job
+
+
+class FakeQueue:
+    def __init__(self, jobs):
+        self.jobs = {job.id: job for job in jobs}
+        self.pending = list(jobs)
+        self.internal = MagicMock()
+        repository = self.internal.background_job_repository
+        repository.claim_pending_jobs.side_effect = self.claim
+        repository.get_by_id.side_effect = self.jobs.get
+        repository.extend_lease.return_value = True
+        repository.release_expired_leases.return_value = (0, 0)
+        self.claim_limits = []
+
+    def claim(self, worker_id, limit, lease_seconds):
+        self.claim_limits.append(limit)
+        claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        return claimed
+
+    @contextmanager
+    def dependencies(self):
+        yield self.internal
+
+
+def _worker(queue: FakeQueue, handler, **config) -> JobWorker:
+    return JobWorker(
+        dependencies_factory=queue.dependencies,
+        handlers={JobType.PLACEHOLDER: handler},
+        config=WorkerConfig(**config),
+        worker_id="test-worker",
+    )
+
+
+class TestRetryDelaySeconds:
+    def test_grows_exponentially_within_jitter_bounds(self):
+        assert retry_delay_seconds(0, 5, 900, rng=lambda: 1.0) == 5
+        assert retry_delay_seconds(3, 5, 900, rng=lambda: 1.0) == 40
+        assert retry_delay_seconds(3, 5, 900, rng=lambda: 0.0) == 20
+
+    def test_is_capped(self):
+        assert retry_delay_seconds(20, 5, 900, rng=lambda: 1.0) == 900
+
+
+class TestJobWorker:
+    def test_runs_at_most_concurrency_jobs_at_once(self):
+        queue = FakeQueue([_job() for _ in range(5)])
+        running = 0
+        peak = 0
+
+        async def handler(job, internal):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"ok": True}
+
+        worker = _worker(queue, handler, concurrency=2)
+
+        async def scenario():
+            while queue.pending:
+                await worker.run_once()
+                await asyncio.sleep(0)
+            await worker.drain()
+
+        asyncio.run(scenario())
+
+        assert peak == 2
+        assert all(limit <= 2 for limit in queue.claim_limits)
+        assert queue.internal.background_job_service.mark_job_completed.call_count == 5
+
+    def test_run_until_idle_runs_every_ready_job_then_returns(self):
+        queue = FakeQueue([_job() for _ in range(5)])
+
+        async def handler(job, internal):
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        worker = _worker(queue, handler, concurrency=2)
+
+        processed = asyncio.run(worker.run_until_idle())
+
+        assert processed == 5
+        assert not queue.pending
+        assert queue.internal.background_job_service.mark_job_completed.call_count == 5
+        queue.internal.background_job_repository.release_expired_leases.assert_called_once()
+
+    def test_marks_job_completed_with_handler_result(self):
+        job = _job()
+        queue = FakeQueue([job])
+
+        async def handler(job, internal):
+            return {"rows": 10}
+
+        worker = _worker(queue, handler)
+
+        async def scenario():
+            await worker.run_once()
+            await worker.drain()
+
+        asyncio.run(scenario())
+
+        queue.internal.background_job_service.mark_job_completed.assert_called_once_with(job.id, {"rows": 10})
+
+    def test_schedules_retry_with_backoff_on_failure(self):
+        job = _job(retry_count=0, max_retries=3)
+        queue = FakeQueue([job])
+
+        async def handler(job, internal):
+            raise RuntimeError("provider unavailable")
+
+        worker = _worker(queue, handler, retry_base_seconds=10, retry_max_seconds=60)
+
+        async def scenario():
+            await worker.run_once()
+            await worker.drain()
+
+        asyncio.run(scenario())
+
+        assert job.status == JobStatus.PENDING
+        assert job.retry_count == 1
+        assert job.error_message == "provider unavailable"
+        assert job.run_after is not None
+        assert job.locked_by is None
+        queue.internal.background_job_repository.update.assert_called_once_with(job)
+
+    def test_fails_job_when_retries_are_exhausted(self):
+        job = _job(retry_count=3, max_retries=3)
+        queue = FakeQueue([job])
+
+        async def handler(job, internal):
+            raise RuntimeError("still failing")
+
+        worker = _worker(queue, handler)
+
+        async def scenario():
+            await worker.run_once()
+            await worker.drain()
+
+        asyncio.run(scenario())
+
+        assert job.status == JobStatus.FAILED
+        assert job.error_message == "still failing"
+
+    def test_permanent_errors_are_not_retried(self):
+        job = _job()
+        queue = FakeQueue([job])
+
+        async def handler(job, internal):
+            raise PermanentJobError("bad input")
+
+        worker = _worker(queue, handler)
+
+        async def scenario():
+            await worker.run_once()
+            await worker.drain()
+
+        asyncio.run(scenario())
+
+        assert job.status == JobStatus.FAILED
+        assert job.retry_count == 0
+
+    def test_fails_job_without_registered_handler(self):
+        job = _job()
+        queue = FakeQueue([job])
+        worker = JobWorker(dependencies_factory=queue.dependencies, handlers={}, worker_id="test-worker")
+
+        async def scenario():
+            await worker.run_once()
+            await worker.drain()
+
+        asyncio.run(scenario())
+
+        assert job.status == JobStatus.FAILED
+        assert "No handler registered" in job.error_message
+
+    def test_wake_triggers_claim_without_waiting_for_poll_interval(self):
+        queue = FakeQueue([])
+        processed = []
+
+        async def handler(job, internal):
+            processed.append(job.id)
+
+        worker = _worker(queue, handler, poll_interval_seconds=60)
+
+        async def scenario():
+            stop = asyncio.Event()
+            run = asyncio.create_task(worker.run(stop))
+            await asyncio.sleep(0.01)
+            job = _job()
+            queue.jobs[job.id] = job
+            queue.pending.append(job)
+            worker.wake()
+            for _ in range(100):
+                if processed:
+                    break
+                await asyncio.sleep(0.01)
+            stop.set()
+            await asyncio.wait_for(run, timeout=1)
+            return job
+
+        job = asyncio.run(scenario())
+
+        assert processed == [job.id]
+
+
+class TestScheduledJobs:
+    RETENTION = ScheduledJob(JobType.STORAGE_RETENTION, timedelta(days=1))
+
+    def _worker(self, queue: FakeQueue, **config) -> JobWorker:
+        return JobWorker(
+            dependencies_factory=queue.dependencies,
+            handlers={},
+            config=WorkerConfig(**config),
+            worker_id="test-worker",
+            schedule=[self.RETENTION],
+        )
+
+    def test_storage_retention_is_scheduled_daily(self):
+        assert self.RETENTION in SCHEDULED_JOBS
+
+    def test_file_blob_cleanup_is_scheduled_daily(self):
+        assert ScheduledJob(JobType.FILE_BLOB_CLEANUP, timedelta(days=1)) in SCHEDULED_JOBS
+
+    def test_recurring_pattern_sweep_is_scheduled_daily(self):
+        assert ScheduledJob(JobType.RECURRING_PATTERNS_REFRESH, timedelta(days=1)) in SCHEDULED_JOBS
+
+    def test_queues_every_scheduled_job(self):
+        queue = FakeQueue([])
+        worker = JobWorker(dependencies_factory=queue.dependencies, handlers={}, worker_id="test-worker")
+
+        asyncio.run(worker.queue_scheduled_jobs(force=True))
+
+        queued = [c.args for c in queue.internal.background_job_service.queue_job_if_due.call_args_list]
+        assert queued == [(scheduled.job_type, scheduled.interval) for scheduled in SCHEDULED_JOBS]
+
+    def test_worker_loop_queues_due_jobs(self):
+        queue = FakeQueue([])
+        worker = self._worker(queue, poll_interval_seconds=60)
+
+        async def scenario():
+            stop = asyncio.Event()
+            run = asyncio.create_task(worker.run(stop))
+            await asyncio.sleep(0.01)
+            stop.set()
+            await asyncio.wait_for(run, timeout=1)
+
+        asyncio.run(scenario())
+
+        queue.internal.background_job_service.queue_job_if_due.assert_called_once_with(
+            JobType.STORAGE_RETENTION, timedelta(days=1)
+        )
+
+    def test_schedule_is_checked_once_per_interval(self):
+        queue = FakeQueue([])
+        worker = self._worker(queue, schedule_check_seconds=300)
+
+        async def scenario():
+            await worker.queue_scheduled_jobs()
+            await worker.queue_scheduled_jobs()
+            await worker.queue_scheduled_jobs(force=True)
+
+        asyncio.run(scenario())
+
+        assert queue.internal.background_job_service.queue_job_if_due.call_count == 2
+
+    def test_run_until_idle_queues_due_jobs_first(self):
+        queue = FakeQueue([])
+        worker = self._worker(queue)
+
+        asyncio.run(worker.run_until_idle())
+
+        queue.internal.background_job_service.queue_job_if_due.assert_called_once()
@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.domain.models.recurring_pattern_snapshot import RecurringPatternSnapshot
+from app.workers import recurring_patterns
+from app.workers.handlers import get_job_handler
+from app.workers.recurring_patterns import refresh_recurring_patterns
+
+
+def _job(user_id=None) -> BackgroundJob:
+    return BackgroundJob(
+        id=uuid4(),
+        job_type=JobType.RECURRING_PATTERNS_REFRESH,
+        status=JobStatus.IN_PROGRESS,
+        user_id=user_id,
+        payload={},
+        progress={},
+    )
+
+
+class TestRefreshRecurringPatterns:
+    def test_is_registered_for_refresh_jobs(self):
+        assert get_job_handler(JobType.RECURRING_PATTERNS_REFRESH) is refresh_recurring_patterns
+
+    def test_refreshes_the_users_snapshot(self):
+        job = _job(uuid4())
+        internal = MagicMock()
+        internal.recurring_pattern_service.refresh.return_value = RecurringPatternSnapshot(
+            user_id=job.user_id, data_version=7, patterns=[{}, {}]
+        )
+
+        result = asyncio.run(refresh_recurring_patterns(job, internal))
+
+        internal.recurring_pattern_service.refresh.assert_called_once_with(job.user_id)
+        assert result == {"pattern_count": 2, "data_version": 7}
+
+    def test_job_without_user_queues_a_refresh_for_each_stale_snapshot(self):
+        users = [uuid4(), uuid4()]
+        internal = MagicMock()
+        internal.recurring_pattern_service.find_users_to_refresh.return_value = users
+
+        result = asyncio.run(refresh_recurring_patterns(_job(), internal))
+
+        assert result == {"queued": 2}
+        assert [c.args for c in internal.background_job_service.queue_job_once.call_args_list] == [
+            (JobType.RECURRING_PATTERNS_REFRESH, user_id) for user_id in users
+        ]
+        internal.recurring_pattern_service.refresh.assert_not_called()
+
+
+class TestSweep:
+    def test_refreshes_each_user_and_counts_failures(self):
+        users = [uuid4(), uuid4(), uuid4()]
+        internal = MagicMock()
+        internal.recurring_pattern_service.find_users_to_refresh.return_value = users
+        internal.recurring_pattern_service.refresh.side_effect = [None, RuntimeError("lock timeout"), None]
+        dependencies = MagicMock()
+        dependencies.return_value.__enter__.return_value = (MagicMock(), internal)
+
+        with patch.object(recurring_patterns, "get_dependencies", dependencies):
+            refreshed, failed = recurring_patterns.sweep(processes=1)
+
+        assert (refreshed, failed) == (2, 1)
+        assert [c.args[0] for c in internal.recurring_pattern_service.refresh.call_args_list] == users
@@ -0,0 +1,31 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.services.retention import RetentionResult
+from app.workers.handlers import get_job_handler
+from app.workers.retention import apply_retention
+
+
+class TestApplyRetention:
+    def test_is_registered_for_retention_jobs(self):
+        assert get_job_handler(JobType.STORAGE_RETENTION) is apply_retention
+
+    def test_reports_what_was_deleted_and_reclaimed_bytes(self):
+        job = BackgroundJob(id=uuid4(), job_type=JobType.STORAGE_RETENTION, status=JobStatus.IN_PROGRESS, payload={})
+        internal = MagicMock()
+        internal.retention_service.run.return_value = RetentionResult(
+            uploads_deleted=4, jobs_deleted=10, blobs_deleted=2, cache_entries_deleted=3, reclaimed_bytes=8192
+        )
+
+        result = asyncio.run(apply_retention(job, internal))
+
+        internal.retention_service.run.assert_called_once_with()
+        assert result == {
+            "uploads_deleted": 4,
+            "jobs_deleted": 10,
+            "blobs_deleted": 2,
+            "cache_entries_deleted": 3,
+            "reclaimed_bytes": 8192,
+        }
@@ -0,0 +1,67 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.domain.models.processing import ProcessingProgress
+from app.services.ai.rule_suggestion import RuleSuggestionSummary
+from app.workers.handlers import PermanentJobError, get_job_handler
+from app.workers.rule_suggestions import suggest_rule_categories, suggest_rule_counterparties
+
+
+def _job(job_type: JobType, payload: dict) -> BackgroundJob:
+    return BackgroundJob(
+        id=uuid4(),
+        job_type=job_type,
+        status=JobStatus.IN_PROGRESS,
+        user_id=uuid4(),
+        payload=payload,
+        progress={},
+    )
+
+
+class TestRuleSuggestionHandlers:
+    def test_are_registered_for_rule_suggestion_jobs(self):
+        assert get_job_handler(JobType.RULE_CATEGORY_SUGGESTION) is suggest_rule_categories
+        assert get_job_handler(JobType.RULE_COUNTERPARTY_SUGGESTION) is suggest_rule_counterparties
+
+    def test_runs_category_suggestions_with_progress(self):
+        job = _job(JobType.RULE_CATEGORY_SUGGESTION, {"request": {"auto_apply": True, "confidence_threshold": 0.9}})
+        internal = MagicMock()
+        progress = ProcessingProgress(10, 20, 10, 20, phase="suggesting")
+
+        async def suggest_categories(user_id, request, on_progress):
+            assert user_id == job.user_id
+            assert request.auto_apply is True
+            assert request.confidence_threshold == 0.9
+            on_progress(progress)
+            return RuleSuggestionSummary(processed=20, auto_applied=5, suggestions=15)
+
+        internal.rule_suggestion_service.suggest_categories.side_effect = suggest_categories
+
+        result = asyncio.run(suggest_rule_categories(job, internal))
+
+        assert result == {"processed": 20, "auto_applied": 5, "suggestions": 15, "failed": 0, "error_message": None}
+        reporter = internal.background_job_service.progress_reporter.return_value
+        reporter.report.assert_called_once_with(progress)
+        reporter.flush.assert_called_once()
+
+    def test_failed_suggestions_raise_their_own_error_without_flushing_progress(self):
+        job = _job(JobType.RULE_COUNTERPARTY_SUGGESTION, {"request": {}})
+        internal = MagicMock()
+        internal.rule_suggestion_service.suggest_counterparties.side_effect = RuntimeError("database unavailable")
+        reporter = internal.background_job_service.progress_reporter.return_value
+        reporter.flush.side_effect = AssertionError("flushed on a failed session")
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            asyncio.run(suggest_rule_counterparties(job, internal))
+
+        reporter.flush.assert_not_called()
+
+    def test_invalid_payload_fails_permanently(self):
+        job = _job(JobType.RULE_CATEGORY_SUGGESTION, {"request": {"confidence_threshold": 3}})
+
+        with pytest.raises(PermanentJobError):
+            asyncio.run(suggest_rule_categories(job, MagicMock()))
@@ -0,0 +1,98 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.api.schemas import StatementUploadRequest
+from app.domain.models.background_job import BackgroundJob, JobStatus, JobType
+from app.domain.models.processing import ProcessingProgress
+from app.services.statement_processing.statement_upload import StatementUploadResult
+from app.workers.handlers import PermanentJobError, get_job_handler
+from app.workers.statement_import import import_statement
+
+
+def _import_job(payload: dict) -> BackgroundJob:
+    return BackgroundJob(
+        id=uuid4(),
+        job_type=JobType.STATEMENT_IMPORT,
+        status=JobStatus.IN_PROGRESS,
+        user_id=uuid4(),
+        payload=payload,
+        progress={},
+    )
+
+
+def _upload_request() -> StatementUploadRequest:
+    return StatementUploadRequest(
+        uploaded_file_id=str(uuid4()),
+        account_id=str(uuid4()),
+        column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+        header_row_index=0,
+        data_start_row_index=1,
+    )
+
+
+class TestStatementImportHandler:
+    def test_is_registered_for_statement_import_jobs(self):
+        assert get_job_handler(JobType.STATEMENT_IMPORT) is import_statement
+
+    def test_runs_upload_with_progress_and_returns_summary(self):
+        upload_request = _upload_request()
+        job = _import_job({"upload": upload_request.model_dump(mode="json")})
+        internal = MagicMock()
+        progress = ProcessingProgress(1, 2, 500, 1000, phase="saving", duplicate_transactions=4)
+
+        def upload_statement(user_id, upload_data, on_progress):
+            on_progress(progress)
+            return StatementUploadResult(
+                uploaded_file_id=upload_data.uploaded_file_id,
+                transactions_saved=996,
+                duplicated_transactions=4,
+                total_processed=1000,
+                rule_based_matches=800,
+                match_rate_percentage=80.0,
+                processing_time_ms=1200,
+            )
+
+        internal.statement_upload_service.upload_statement.side_effect = upload_statement
+
+        result = asyncio.run(import_statement(job, internal))
+
+        assert result["transactions_saved"] == 996
+        assert result["duplicated_transactions"] == 4
+        assert result["uploaded_file_id"] == upload_request.uploaded_file_id
+        call_kwargs = internal.statement_upload_service.upload_statement.call_args.kwargs
+        assert call_kwargs["user_id"] == job.user_id
+        assert call_kwargs["upload_data"] == upload_request
+        reporter = internal.background_job_service.progress_reporter.return_value
+        internal.background_job_service.progress_reporter.assert_called_once_with(job.id, JobType.STATEMENT_IMPORT)
+        reporter.report.assert_called_once_with(progress)
+        reporter.flush.assert_called_once()
+        internal.subscription_service.increment_statement_usage.assert_called_once_with(job.user_id)
+
+    def test_invalid_payload_is_a_permanent_error(self):
+        job = _import_job({"upload": {"account_id": "missing-fields"}})
+
+        with pytest.raises(PermanentJobError):
+            asyncio.run(import_statement(job, MagicMock()))
+
+    def test_parse_errors_are_permanent(self):
+        job = _import_job({"upload": _upload_request().model_dump(mode="json")})
+        internal = MagicMock()
+        internal.statement_upload_service.upload_statement.side_effect = ValueError("Missing column: Date")
+
+        with pytest.raises(PermanentJobError, match="Missing column"):
+            asyncio.run(import_statement(job, internal))
+
+    def test_failed_upload_raises_its_own_error_without_flushing_progress(self):
+        job = _import_job({"upload": _upload_request().model_dump(mode="json")})
+        internal = MagicMock()
+        internal.statement_upload_service.upload_statement.side_effect = RuntimeError("database unavailable")
+        reporter = internal.background_job_service.progress_reporter.return_value
+        reporter.flush.side_effect = AssertionError("flushed on a failed session")
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            asyncio.run(import_statement(job, internal))
+
+        reporter.flush.assert_not_called()